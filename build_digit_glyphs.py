@@ -0,0 +1,119 @@
+"""
+Build the digit glyph templates (Settings.DIGIT_GLYPHS_PATH) that stats, turns,
+skill points and failure % are read from before falling back to OCR.
+
+  python build_digit_glyphs.py --from-tests                  # tests/data screenshots
+  python build_digit_glyphs.py --crops debug/glyphs --merge  # labelled crops, added on top
+
+--from-tests runs the YOLO model on the lobby/training screenshots in
+tests/data and labels their stat, turns and skill-point crops with the values
+the end-to-end tests expect. --crops takes crops named "<value>_anything.png"
+(e.g. "416_spd.png", "12%_failure.png"); crops in a folder named "failure"
+are read from their bottom line, as the agent does.
+"""
+from __future__ import annotations
+
+import argparse
+from collections import Counter
+from pathlib import Path
+from typing import Iterator, List, Tuple
+
+from PIL import Image
+
+from core.perception.glyph_digits import GlyphDigitReader
+from core.settings import Settings
+from core.utils.logger import setup_uma_logging
+
+IMAGE_EXTS = (".png", ".jpg", ".jpeg")
+TEST_DATA = Path(__file__).resolve().parent / "tests" / "data"
+# (file, SPD..WIT, turns, skill pts) as asserted by tests/test_stats, test_turns, test_skill_points
+TEST_LABELS = [
+    ("lobby_stats_01_low_res.png", (385, 331, 203, 128, 167), 2, 472),
+    ("lobby_stats_01_high_res.png", (385, 331, 203, 128, 167), 2, 472),
+    ("training_stats_01.png", (796, 633, 652, 393, 461), 1, 370),
+]
+
+Sample = Tuple[str, Image.Image, str, str]  # (source, crop, text, line)
+
+
+def _test_samples(weights: str | None) -> Iterator[Sample]:
+    from core.constants import CLASS_UI_SKILLS_PTS, CLASS_UI_TURNS
+    from core.perception.extractors.state import find_best, stat_segments
+    from core.perception.yolo.yolo_local import LocalYOLOEngine
+    from core.utils.geometry import crop_pil
+
+    engine = LocalYOLOEngine(ctrl=None, weights=weights)
+    for name, stats, turns, pts in TEST_LABELS:
+        img = Image.open(TEST_DATA / name).convert("RGB")
+        _, dets = engine.detect_pil(
+            img, imgsz=Settings.YOLO_IMGSZ, conf=Settings.YOLO_CONF, iou=Settings.YOLO_IOU
+        )
+        for key, seg, val in zip(("SPD", "STA", "PWR", "GUTS", "WIT"), stat_segments(img, dets), stats):
+            yield f"{name}:{key}", seg, str(val), "tallest"
+        d = find_best(dets, CLASS_UI_TURNS, conf_min=0.20)
+        if d:
+            x1, y1, x2, y2 = d["xyxy"]
+            gap = abs(y2 - y1) * 0.20  # same band extract_turns reads
+            yield f"{name}:turns", crop_pil(img, (x1, y1 + gap, x2, y2 - gap), pad=0), str(turns), "tallest"
+        d = find_best(dets, CLASS_UI_SKILLS_PTS, conf_min=0.20)
+        if d:
+            yield f"{name}:skill_pts", crop_pil(img, d["xyxy"], pad=0), str(pts), "tallest"
+
+
+def _crop_samples(roots: List[Path]) -> Iterator[Sample]:
+    for root in roots:
+        paths = [root] if root.is_file() else sorted(root.rglob("*"))
+        for p in paths:
+            if p.suffix.lower() not in IMAGE_EXTS:
+                continue
+            text = p.stem.split("_")[0]
+            line = "last" if p.parent.name.lower() == "failure" else "tallest"
+            with Image.open(p) as im:
+                yield str(p), im.convert("RGB"), text, line
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--from-tests", action="store_true",
+                    help="Label crops of the tests/data screenshots (needs the YOLO weights)")
+    ap.add_argument("--weights", default=None, help="YOLO weights for --from-tests")
+    ap.add_argument("--crops", nargs="*", default=[], help="Dirs/files of '<value>_*.png' crops")
+    ap.add_argument("--out", default=None, help="Template file (default: DIGIT_GLYPHS_PATH)")
+    ap.add_argument("--merge", action="store_true", help="Add to the existing templates")
+    args = ap.parse_args()
+    setup_uma_logging(debug=Settings.DEBUG)
+
+    out = Path(args.out or Settings.DIGIT_GLYPHS_PATH)
+    reader = GlyphDigitReader.load(out) if args.merge and out.exists() else GlyphDigitReader.empty()
+    before = len(reader.chars)
+
+    samples: List[Iterator[Sample]] = []
+    if args.from_tests:
+        samples.append(_test_samples(args.weights))
+    if args.crops:
+        samples.append(_crop_samples([Path(p) for p in args.crops]))
+    if not samples:
+        raise SystemExit("Nothing to learn from: pass --from-tests and/or --crops")
+
+    learned, skipped = 0, []
+    for it in samples:
+        for source, crop, text, line in it:
+            if reader.learn(crop, text, line=line):
+                learned += 1
+            else:
+                skipped.append(source)
+
+    for source in skipped:
+        print(f"  skipped {source} (glyph count didn't match its label)")
+    counts = Counter(reader.chars)
+    print(f"  learned from {learned} crop(s); {len(reader.chars) - before} new glyph(s)")
+    print("  glyphs per char: " + ", ".join(f"{c}:{n}" for c, n in sorted(counts.items())))
+    missing = sorted(set("0123456789") - set(counts))
+    if missing:
+        print(f"  no exemplar yet for {' '.join(missing)}; those fields fall back to OCR")
+    reader.save(out)
+    print(f"templates -> {out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 import random
-from time import sleep
 from typing import List
 
 from core.controllers.base import IController
@@ -16,6 +15,7 @@ from core.perception.ocr.interface import OCRInterface
 from core.perception.yolo.interface import IDetector
 from core.types import DetectionDict
 from core.utils.logger import logger_uma
+from core.utils.pacer import pace
 from core.utils.waiter import Waiter
 from core.utils import nav
 
@@ -49,7 +49,7 @@ class DailyRaceFlow:
         )
         if not ok:
             return False
-        sleep(1.7)
+        pace("transition", 1.7)
         # Often need to click the 'monies' card
         self.waiter.click_when(
             classes=("race_daily_races_monies",),
@@ -78,7 +78,7 @@ class DailyRaceFlow:
         """
         NEXT -> RACE
         """
-        sleep(1.5)
+        pace("transition", 1.5)
         ok = self.waiter.click_when(
             classes=("button_green",),
             prefer_bottom=False,
@@ -99,7 +99,7 @@ class DailyRaceFlow:
                 timeout_s=2.0,
                 tag="daily_race_cancel",
             ):
-                sleep(1.5)
+                pace("transition", 1.5)
                 img, dets = nav.collect_snapshot(
                     self.waiter, self.yolo_engine, tag="daily_race_cancel"
                 )
@@ -110,10 +110,10 @@ class DailyRaceFlow:
                     timeout_s=3.0,
                     tag="daily_race_ui_home",
                 )
-                sleep(1.5)
+                pace("transition", 1.5)
                 logger_uma.debug("[DailyRace] Canceling races")
                 return False
-        sleep(1.5)
+        pace("transition", 1.5)
         if self.waiter.click_when(
             classes=("button_green",),
             prefer_bottom=True,
@@ -133,12 +133,12 @@ class DailyRaceFlow:
         finalized = False
         counter = 5
         while race_again and counter > 0:
-            sleep(3)
+            pace("animation", 3)
             if isinstance(self.ctrl, ScrcpyController) or (
                 BlueStacksController is not None
                 and isinstance(self.ctrl, BlueStacksController)
             ):
-                sleep(1.5)
+                pace("transition", 1.5)
             if self.waiter.click_when(
                 classes=("button_green",),
                 prefer_bottom=True,
@@ -149,7 +149,7 @@ class DailyRaceFlow:
             else:
                 race_again = False
                 continue
-            sleep(1.5)
+            pace("transition", 1.5)
 
             if self.waiter.click_when(
                 classes=("button_green",),
@@ -162,7 +162,7 @@ class DailyRaceFlow:
                 race_again = False
                 continue
             counter -= 1
-            sleep(2.0)
+            pace("transition", 2.0)
             # After race, click 'View Results' / proceed with white button spamming
             img, _ = nav.collect_snapshot(
                 self.waiter, self.yolo_engine, tag="daily_race_view_results"
@@ -177,11 +177,11 @@ class DailyRaceFlow:
                 clicks=random.randint(3, 4),
                 tag="daily_race_view_results_white",
             )
-            sleep(2.0)
+            pace("transition", 2.0)
             nav.random_center_tap(
                 self.ctrl, img, clicks=random.randint(3, 4), dev_frac=0.20
             )
-            sleep(2.0)
+            pace("transition", 2.0)
 
             # Then green to continue
             if self.waiter.click_when(
@@ -218,7 +218,7 @@ class DailyRaceFlow:
                     finalized = True
                     break
                 else:
-                    sleep(2.0)
+                    pace("transition", 2.0)
                     if self.waiter.seen(
                         classes=("button_green",),
                         texts=("OK",),
@@ -232,7 +232,7 @@ class DailyRaceFlow:
                             timeout_s=2.0,
                             tag="daily_race_ok",
                         )
-                        sleep(2)
+                        pace("transition", 2)
                         # Click in button_advance using the waiter
                         self.waiter.click_when(
                             classes=("button_advance",),
@@ -240,12 +240,12 @@ class DailyRaceFlow:
                             timeout_s=4,
                             tag="daily_race_advance",
                         )
-                        sleep(2)
+                        pace("transition", 2)
                         if isinstance(self.ctrl, ScrcpyController) or (
                             BlueStacksController is not None
                             and isinstance(self.ctrl, BlueStacksController)
                         ):
-                            sleep(4.0)
+                            pace("animation", 4.0)
                         # Click object with class ui_home
                         self.waiter.click_when(
                             classes=("ui_home",),
@@ -1,7 +1,6 @@
 # core/actions/events.py
 from __future__ import annotations
 
-import time
 from dataclasses import dataclass, replace
 from typing import List, Optional, Tuple, Dict, Any, Set
 
@@ -10,11 +9,13 @@ import cv2
 
 from PIL import Image
 
+from core.constants import ROI_EVENT_CHOICES
 from core.types import DetectionDict
 from core.controllers.base import IController
 from core.perception.ocr.interface import OCRInterface  # your interface type
 from core.perception.yolo.interface import IDetector
 from core.utils.logger import logger_uma
+from core.utils.pacer import pace
 from core.utils.waiter import Waiter
 from core.utils.text import fuzzy_contains
 
@@ -433,9 +434,14 @@ class EventFlow:
                     expected_n,
                 )
                 # Retry: wait for UI to finish rendering and recapture
-                time.sleep(0.8)  # Increased wait time for slow-rendering options
+                pace("ui", 0.8)  # Increased wait time for slow-rendering options
                 retry_frame, _, retry_parsed = self.yolo_engine.recognize(
-                    imgsz=832, conf=0.60, iou=0.45, tag="event_retry"
+                    imgsz=832,
+                    conf=0.60,
+                    iou=0.45,
+                    tag="event_retry",
+                    roi=ROI_EVENT_CHOICES,
+                    classes=("event_choice",),
                 )
                 retry_choices = _choices(retry_parsed, conf_min=self.conf_min_choice)
                 retry_choices_sorted = _sort_top_to_bottom(retry_choices)
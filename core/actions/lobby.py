@@ -5,7 +5,6 @@ from abc import ABC, abstractmethod
 from collections import deque
 import random
 import statistics
-import time
 from dataclasses import dataclass
 from typing import Any, Dict, Literal, Optional, Tuple
 
@@ -20,11 +19,13 @@ from core.actions.training_check import (
 )
 from core.utils.geometry import calculate_jitter
 from core.utils.logger import logger_uma
+from core.utils.pacer import pace
 from core.utils.race_index import RaceIndex, date_key_from_dateinfo
+from core.utils.settle import wait_for_settle
 from core.utils.text import fuzzy_contains, fuzzy_best_match, normalize_ocr_text
 from core.utils.waiter import Waiter
 from core.utils.yolo_objects import collect
-from core.constants import CLASS_UI_TURNS, CLASS_UI_GOAL
+from core.constants import CLASS_UI_TURNS, CLASS_UI_GOAL, ROI_LOBBY_BUTTON_BAR
 from core.utils.pal_memory import PalMemoryManager
 from core.actions.events import _count_chain_steps
 from core.utils.event_processor import predict_next_chain_has_energy_from_raw
@@ -491,7 +492,7 @@ class LobbyFlow(ABC):
             logger_uma.debug(
                 "[Optimization] Reusing previously calculated stats until new refresh interval"
             )
-            time.sleep(1.2)
+            pace("transition", 1.2)
 
         # advance counter
         self._stats_refresh_counter += 1
@@ -1172,9 +1173,10 @@ class LobbyFlow(ABC):
             prefer_bottom=True,
             timeout_s=2.5,
             tag="lobby_rest",
+            roi=ROI_LOBBY_BUTTON_BAR,
         )
         if click:
-            time.sleep(3)
+            wait_for_settle(self.ctrl, timeout_s=3.0, min_wait_s=0.5, tag="lobby_rest")
         return click
 
     def _go_recreate(self, *, reason: str = "Mood is low, recreating") -> bool:
@@ -1184,9 +1186,10 @@ class LobbyFlow(ABC):
             prefer_bottom=True,
             timeout_s=2.5,
             tag="lobby_recreate",
+            roi=ROI_LOBBY_BUTTON_BAR,
         )
         if click:
-            time.sleep(2)
+            pace("transition", 2)
             # Tazuna recreation screen possible elements: recreation_row, support_tazuna, button_white
             # Check if there are 2 recreation_row if that is the case click in the top first
 
@@ -1393,11 +1396,11 @@ class LobbyFlow(ABC):
                 
                 if chosen is not None:
                     self.ctrl.click_xyxy_center(chosen['xyxy'])
-                    time.sleep(0.5)
+                    pace("ui", 0.5)
                 else:
                     logger_uma.warning("[lobby] No active recreation rows found, skipping click")
                 
-            time.sleep(2)
+            pace("transition", 2)
         return click
 
     def _go_skills(self) -> bool:
@@ -1407,9 +1410,12 @@ class LobbyFlow(ABC):
             prefer_bottom=True,
             timeout_s=2.5,
             tag="lobby_skills",
+            roi=ROI_LOBBY_BUTTON_BAR,
         )
         if clicked:
-            time.sleep(1)
+            wait_for_settle(
+                self.ctrl, timeout_s=1.0, min_wait_s=0.4, tag="lobby_skills"
+            )
         return clicked
 
     def _go_infirmary(self) -> bool:
@@ -1419,9 +1425,10 @@ class LobbyFlow(ABC):
             prefer_bottom=True,
             timeout_s=2.5,
             tag="lobby_infirmary",
+            roi=ROI_LOBBY_BUTTON_BAR,
         )
         if click:
-            time.sleep(2)
+            pace("transition", 2)
         return click
 
     def _go_training_screen_from_lobby(self, img, dets, reason: Optional[str] = None) -> bool:
@@ -1434,16 +1441,21 @@ class LobbyFlow(ABC):
             prefer_bottom=True,
             timeout_s=2.5,
             tag="lobby_training",
+            roi=ROI_LOBBY_BUTTON_BAR,
+            wait_click=False,
         )
         clicked = True
         if clicked:
             # This replaces a time.sleep... time.sleep(1.2)
-            # If the machine is ultra powerful, then you should neet a time.sleep(1.2)
-            # Meanwhile we wait for animation we calculate stats
-            # TODO: PROCESS IN PARALLEL
+            # Meanwhile we wait for animation we calculate stats (with an input
+            # dispatcher running, even while the tap is still being delivered);
+            # scan_training_screen then waits for the screen to settle
             if self.process_on_demand and dets is not None:
                 self._update_stats(img, dets)
                 self._stats_refresh_counter += 1
+            if not self.ctrl.wait_input():
+                logger_uma.warning("[lobby] Training tap was not delivered")
+                clicked = False
 
         return clicked
 
@@ -1459,5 +1471,5 @@ class LobbyFlow(ABC):
         if ok:
             logger_uma.info("[lobby] GO BACK")
             # After back, wait for animation to end
-            time.sleep(1)
+            pace("transition", 1)
         return ok
@@ -28,9 +28,11 @@ from core.settings import Settings
 from core.types import DetectionDict
 from core.utils.geometry import crop_pil
 from core.utils.logger import logger_uma
+from core.utils.pacer import pace
 from core.utils.text import _normalize_ocr, fuzzy_ratio
 from core.utils.yolo_objects import collect, find, bottom_most, inside
 from core.utils.pointer import smart_scroll_small
+from core.utils.settle import wait_for_settle
 from core.utils.abort import abort_requested
 
 
@@ -78,7 +80,7 @@ class RaceFlow:
             logger_uma.debug(f"Looking for race buttons: {reason}")
         if Settings.ACTIVE_SCENARIO == "unity_cup":
             # Little delay before pressing race
-            time.sleep(1.5)
+            pace("transition", 1.5)
         # Try to enter race screen from lobby (idempotent)
         clicked = self.waiter.click_when(
             classes=("lobby_races", "race_race_day"),
@@ -129,7 +131,7 @@ class RaceFlow:
                         "Consecutive race. Accepted penalization per settings."
                     )
 
-                time.sleep(0.12)
+                pace("micro", 0.12)
             # If loop expires, do one last probe:
             if self.waiter.seen(classes=("race_square",), tag="race_nav_seen_final"):
                 return True
@@ -337,7 +339,7 @@ class RaceFlow:
 
         for scroll_j in range(max_scrolls + 1):
             # Wait screen to stabilize
-            time.sleep(1)
+            wait_for_settle(self.ctrl, timeout_s=1.0, tag="race_pick")
             game_img, dets = self._collect("race_pick")
             squares = find(dets, "race_square")
             if squares:
@@ -584,13 +586,13 @@ class RaceFlow:
 
             if squares and not moved_cursor:
                 self.ctrl.move_xyxy_center(squares[0]["xyxy"])
-                time.sleep(0.10)
+                pace("micro", 0.10)
                 moved_cursor = True
 
             # probe next batch
             smart_scroll_small(self.ctrl, steps_pc=4)
             did_scroll = True
-            time.sleep(0.35)
+            pace("ui", 0.35)
 
         if best_non_g1 is not None:
             # end-of-scroll fallback is always a click
@@ -616,7 +618,7 @@ class RaceFlow:
                     "No view result button found, waiting %ds more (attempt %d/%d)...",
                     delay, i, len(retry_delays)
                 )
-                time.sleep(delay)
+                pace("poll", delay)
                 view_btn = self._pick_view_results_button()
                 if view_btn is not None:
                     logger_uma.info("View button found after %d retry attempt(s)", i)
@@ -646,9 +648,9 @@ class RaceFlow:
         if is_view_active and view_btn is not None:
             # Tap 'View Results' a couple times to clear residual screens
             self.ctrl.click_xyxy_center(view_btn["xyxy"], clicks=random.randint(1, 2))
-            time.sleep(random.uniform(3, 3.5))
+            pace("animation", random.uniform(3, 3.5))
             self.ctrl.click_xyxy_center(view_btn["xyxy"], clicks=random.randint(3, 3))
-            time.sleep(random.uniform(0.3, 0.5))
+            pace("ui", random.uniform(0.3, 0.5))
         else:
             # Click green 'RACE' (prefer bottom-most; OCR disambiguation if needed)
             if not self.waiter.click_when(
@@ -661,7 +663,7 @@ class RaceFlow:
                 logger_uma.error("[race] Race button not found after ~6s of retries. "
                 "Cannot determine lobby state. Aborting race operation.")
                 return False
-            time.sleep(5)
+            pace("animation", 5)
             self.waiter.click_when(
                 classes=("button_green",),
                 texts=("RACE",),
@@ -683,7 +685,7 @@ class RaceFlow:
                     tag="race_lobby_race_confirm_try",
                 ):
                     logger_uma.debug("[race] Clicked RACE confirmation")
-                    time.sleep(0.5)
+                    pace("ui", 0.5)
                 # If we already transitioned into race (skip buttons), stop waiting.
                 if self.waiter.seen(
                     classes=("button_skip",), tag="race_lobby_seen_skip"
@@ -691,7 +693,7 @@ class RaceFlow:
                     seen_skip = True
                     logger_uma.debug("[race] Seen skip buttons, breaking to click them")
                     break
-                time.sleep(0.5)
+                pace("ui", 0.5)
             logger_uma.debug(f"[race] Seen skip buttons: {seen_skip}")
             if not seen_skip:
                 # search again for green 'Next' or 'RACE' button
@@ -705,7 +707,7 @@ class RaceFlow:
                     logger_uma.error("[race] Race button not found after ~6s of retries. "
                     "Cannot determine lobby state. Aborting race operation.")
                     return False
-            time.sleep(4)
+            pace("animation", 4)
             logger_uma.debug("[race] Starting skip loop")
             # Greedy skip: keep pressing while present; stop as soon as 'CLOSE' or 'NEXT' shows.
             closed_early = False
@@ -745,7 +747,7 @@ class RaceFlow:
                     skip_clicks += 1
                     total_time += 2
                     continue
-                time.sleep(0.12)
+                pace("micro", 0.12)
 
             if not closed_early:
                 logger_uma.debug("[race] Looking for CLOSE button.")
@@ -776,11 +778,11 @@ class RaceFlow:
                 ):
                     clicked_try_again = True
                     break
-                time.sleep(0.12)
+                pace("micro", 0.12)
 
         if clicked_try_again:
             logger_uma.debug("[race] Lost the race, trying again.")
-            time.sleep(5)  # enough time to show the view result button again
+            pace("animation", 5)  # enough time to show the view result button again
             return self.lobby()
 
         else:
@@ -838,7 +840,7 @@ class RaceFlow:
         if elements and len(elements) == 1:
             button_change = elements[0]
             self.ctrl.click_xyxy_center(button_change["xyxy"], clicks=1)
-            time.sleep(1.2)
+            pace("transition", 1.2)
         else:
             return False
         select_style = (select_style or "").strip().lower()
@@ -917,7 +919,7 @@ class RaceFlow:
 
         # Click selected style
         self.ctrl.click_xyxy_center(chosen["xyxy"], clicks=1)
-        time.sleep(0.15)
+        pace("micro", 0.15)
 
         # Click Confirm
         if confirm_btn is None:
@@ -932,7 +934,7 @@ class RaceFlow:
             return bool(clicked)
         else:
             self.ctrl.click_xyxy_center(confirm_btn["xyxy"], clicks=1)
-            time.sleep(0.15)
+            pace("micro", 0.15)
             return True
 
     def run(
@@ -970,7 +972,7 @@ class RaceFlow:
                 )
                 return False
 
-        time.sleep(2)
+        pace("transition", 2)
         # 1) Pick race card; scroll if needed
         square, need_click = self._pick_race_square(
             prioritize_g1=prioritize_g1,
@@ -986,7 +988,7 @@ class RaceFlow:
         # 2) Click the race square
         if need_click:
             self.ctrl.click_xyxy_center(square["xyxy"], clicks=1)
-            time.sleep(0.2)
+            pace("ui", 0.2)
             logger_uma.info("[race] Clicked race square")
 
         # 3) Click green 'RACE' on the list (prefer bottom-most; OCR 'RACE' if needed)
@@ -1001,7 +1003,7 @@ class RaceFlow:
             return False
 
         # Time to popup to grow, so we don't missclassify a mini button in the animation
-        time.sleep(1.2)
+        pace("transition", 1.2)
         # Reactive confirm of the popup (if/when it appears). Bail out if pre-race lobby is already visible.
         t0 = time.time()
         while (time.time() - t0) < 5.0:
@@ -1021,15 +1023,15 @@ class RaceFlow:
             ):
                 logger_uma.info("[race] Clicked green 'Race' button (popup) confirmation")
                 # Give a short beat for the transition; continue probing.
-                time.sleep(0.2)
+                pace("ui", 0.2)
                 break
             else:
                 logger_uma.warning("[race] couldn't find 'Race' button (popup) confirmation in this check.")
-            time.sleep(0.1)
+            pace("micro", 0.1)
 
         # 4) Wait until the pre-race lobby is actually on screen (key: 'button_change')
         logger_uma.info("Waiting for race lobby to appear")
-        time.sleep(7)
+        pace("animation", 7)
         t0 = time.time()
         max_wait = 14.0
         while (time.time() - t0) < max_wait:
@@ -1040,7 +1042,7 @@ class RaceFlow:
                 return False
             if self.waiter.seen(classes=("button_change",), tag="race_pre_lobby_gate"):
                 break
-            time.sleep(0.15)
+            pace("micro", 0.15)
 
         # 5) Optional: set strategy as soon as the Change button is available (no extra sleeps)
         if select_style and self.waiter.seen(
@@ -1048,7 +1050,7 @@ class RaceFlow:
         ):
             logger_uma.debug(f"Setting style: {select_style}")
             self.set_strategy(select_style)
-            time.sleep(3)  # wait for white buttons to dissapear
+            pace("animation", 3)  # wait for white buttons to dissapear
 
         # 6) Proceed with the result/lobby handling pipeline
         return self.lobby()
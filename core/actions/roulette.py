@@ -18,6 +18,7 @@ from core.types import DetectionDict
 from core.utils import nav
 from core.utils.geometry import crop_pil
 from core.utils.logger import logger_uma
+from core.utils.pacer import pace
 from core.utils.waiter import Waiter
 
 
@@ -176,7 +177,7 @@ class RouletteFlow:
                     "[RouletteFlow] Button active (p=%.3f); spinning.", state.probability
                 )
                 self.tap_spin_center(primary)
-                time.sleep(0.4)
+                pace("ui", 0.4)
                 inactive_counter = 0
                 while inactive_counter < 1.5:
                     if self._should_stop():
@@ -202,7 +203,7 @@ class RouletteFlow:
                             self.tap_spin_center(primary)
                     else:
                         inactive_counter += 0.5
-                    time.sleep(0.4)
+                    pace("ui", 0.4)
 
                 self.tap_skip_region(img, clicks=random.randint(2, 3))
 
@@ -237,10 +238,10 @@ class RouletteFlow:
                                 logger_uma.debug(
                                     "[RouletteFlow] Button inactive; continuing with bypass."
                                 )
-                                time.sleep(0.6)
+                                pace("ui", 0.6)
 
                     self.tap_skip_region(img, clicks=random.randint(2, 3))
-                    time.sleep(0.3)
+                    pace("ui", 0.3)
                 else:
                     logger_uma.debug("[RouletteFlow] Timed out waiting for button detection.")
 
@@ -255,7 +256,7 @@ class RouletteFlow:
                     state.probability,
                 )
                 self.tap_skip_region(img, clicks=random.randint(2, 3))
-                time.sleep(0.6)
+                pace("ui", 0.6)
                 return {
                     "spun": spun_any,
                     "reason": "cooldown",
@@ -263,7 +264,7 @@ class RouletteFlow:
                 }
 
             logger_uma.debug("[RouletteFlow] Unable to classify button state.")
-            time.sleep(0.4)
+            pace("ui", 0.4)
             if self._should_stop():
                 reason = "stopped_after_spin" if spun_any else "stopped"
                 return {"spun": spun_any, "reason": reason}
@@ -2,17 +2,18 @@
 from __future__ import annotations
 
 import random
-import time
 from typing import List, Optional, Sequence, Tuple, Dict
 from collections import Counter
 from PIL import Image
 
 from core.controllers.android import ScrcpyController
+from core.constants import ROI_SKILLS_LIST
 from core.controllers.base import IController
 from core.perception.ocr.interface import OCRInterface
 from core.perception.yolo.interface import IDetector
 from core.settings import Settings
 from core.utils.logger import logger_uma
+from core.utils.pacer import pace
 from core.utils.geometry import crop_pil
 from core.utils.text import (
     fix_common_ocr_confusions,
@@ -147,7 +148,7 @@ class SkillsFlow:
             tag="skills_flow_back_no_buys",
         )
         logger_uma.info("[skills] No matching skills found to buy.")
-        time.sleep(1.2)
+        pace("transition", 1.2)
         return False
 
     # --------------------------
@@ -155,12 +156,15 @@ class SkillsFlow:
     # --------------------------
 
     def _collect(self, tag: str) -> Tuple[Image.Image, List[DetectionDict]]:
+        # The scan only reads skill cards and their BUY buttons from the list
         img, _, dets = self.yolo_engine.recognize(
             imgsz=self.waiter.cfg.imgsz,
             conf=self.waiter.cfg.conf,
             iou=self.waiter.cfg.iou,
             tag=tag,
             agent=self.waiter.cfg.agent,
+            roi=ROI_SKILLS_LIST,
+            classes=("skills_square", "skills_buy"),
         )
         return img, dets
 
@@ -513,7 +517,7 @@ class SkillsFlow:
         ):
             logger_uma.warning("Confirm button not found")
             return False
-        time.sleep(waiting_popup)
+        pace("ui", waiting_popup)
 
         # Learn
         if not self.waiter.click_when(
@@ -526,7 +530,7 @@ class SkillsFlow:
             logger_uma.warning("Confirm button not found")
             return False
 
-        time.sleep(waiting_popup * 2)
+        pace("ui", waiting_popup * 2)
 
         # Close
         if not self.waiter.click_when(
@@ -539,7 +543,7 @@ class SkillsFlow:
         ):
             logger_uma.warning("Close button not found")
             return False
-        time.sleep(waiting_popup)
+        pace("ui", waiting_popup)
 
         # Back
         if not self.waiter.click_when(
@@ -551,7 +555,7 @@ class SkillsFlow:
         ):
             logger_uma.warning("Back button not found")
             return False
-        time.sleep(0.15)
+        pace("micro", 0.15)
         return True
 
     def _focus_nudge(self, game_img: Image.Image, dets: List[DetectionDict]) -> None:
@@ -575,7 +579,7 @@ class SkillsFlow:
                     duration=0.18,
                 )
                 logger_uma.debug("[skills] Focus nudge: moved to screen center")
-            time.sleep(0.07)
+            pace("micro", 0.07)
         except Exception as e:
             logger_uma.debug("[skills] Focus nudge failed: %s", e)
 
@@ -591,7 +595,7 @@ class SkillsFlow:
             x, y, w, h = xywh
             cx, cy = (x + w // 2), (y + h // 2)
             self.ctrl.move_to(cx, cy)
-            time.sleep(0.5)
+            pace("ui", 0.5)
             self.ctrl.scroll(
                 -h // 10,
                 steps=4,
@@ -599,10 +603,10 @@ class SkillsFlow:
                 end_hold_range=(0.15, 0.22),
             )
             # Inertia wait
-            time.sleep(0.12)
+            pace("micro", 0.12)
         else:
             n = random.randint(scroll_time_range[0], scroll_time_range[1])
             for _ in range(n):
                 self.ctrl.scroll(-1)
-                time.sleep(0.01)
-        time.sleep(0.12)
+                pace("micro", 0.01)
+        pace("micro", 0.12)
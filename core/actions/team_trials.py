@@ -3,7 +3,6 @@ from __future__ import annotations
 
 import random
 import time
-from time import sleep
 from typing import Tuple, List
 from enum import Enum
 
@@ -18,6 +17,7 @@ from core.perception.ocr.interface import OCRInterface
 from core.perception.yolo.interface import IDetector
 from core.types import DetectionDict
 from core.utils.logger import logger_uma
+from core.utils.pacer import pace
 from core.utils.waiter import Waiter
 from core.utils import nav
 from core.settings import Settings
@@ -74,7 +74,7 @@ class TeamTrialsFlow:
         if not ok_menu:
             return False
 
-        sleep(1.5)
+        pace("transition", 1.5)
         ok_go = self.waiter.click_when(
             classes=("race_team_trials_go",),
             prefer_bottom=False,
@@ -93,7 +93,7 @@ class TeamTrialsFlow:
           - start race (RACE!)
           - advance through post-race, handle shop if it appears, then try 'RACE AGAIN'
         """
-        sleep(1.0)
+        pace("transition", 1.0)
         img, dets = nav.collect_snapshot(
             self.waiter, self.yolo_engine, tag="team_trials_banners"
         )
@@ -124,8 +124,8 @@ class TeamTrialsFlow:
         logger_uma.info(
             f"[TeamTrials] Clicked opponent banner (slot={preferred_index + 1})"
         )
-        sleep(5)
-        sleep(4)
+        pace("animation", 5)
+        pace("animation", 4)
 
         # Pre-start: a few green clicks (progression prompts)
         pre = nav.click_button_loop(
@@ -151,7 +151,7 @@ class TeamTrialsFlow:
                 logger_uma.warning("[TeamTrials] Could not press Start button of race in second intent")
                 return
         logger_uma.debug(f"[TeamTrials] pre-start greens: {pre}")
-        sleep(1.8)
+        pace("transition", 1.8)
         # Try to hit 'RACE!' (avoid CANCEL)
         started = self.waiter.click_when(
             classes=("button_green",),
@@ -165,7 +165,7 @@ class TeamTrialsFlow:
         )
         if not started:
             logger_uma.warning("[TeamTrials] Couldn't press 'RACE!'")
-        sleep(1)
+        pace("transition", 1)
         self._handle_post_race_sequence(ensure_enter_shop=True)
 
     def resume(self, *, max_steps: int = 8) -> bool:
@@ -175,7 +175,7 @@ class TeamTrialsFlow:
         """
         handled_any = False
         for _ in range(max_steps):
-            sleep(0.8)
+            pace("ui", 0.8)
             img, dets = nav.collect_snapshot(
                 self.waiter, self.yolo_engine, tag="team_trials_resume"
             )
@@ -199,7 +199,7 @@ class TeamTrialsFlow:
             elif state is TeamTrialsState.STALE:
                 self._handle_stale_screen()
 
-            sleep(1.0)
+            pace("transition", 1.0)
 
         return handled_any
 
@@ -269,7 +269,7 @@ class TeamTrialsFlow:
             logger_uma.warning("[TeamTrials] Unable to process shop exchange")
 
     def _handle_post_race_sequence(self, *, ensure_enter_shop: bool) -> None:
-        sleep(10)
+        pace("animation", 10)
         adv = nav.advance_sequence_with_mid_taps(
             self.waiter,
             self.yolo_engine,
@@ -294,9 +294,9 @@ class TeamTrialsFlow:
                 tag="team_trials_skip",
             ):
                 skip_clicks += 1
-            sleep(0.12)
+            pace("micro", 0.12)
 
-        sleep(2)
+        pace("transition", 2)
 
         if skip_clicks > 0:
             logger_uma.debug(f"[TeamTrials] Completed skip sequence (clicks={skip_clicks})")
@@ -307,16 +307,16 @@ class TeamTrialsFlow:
                 timeout_s=2.0,
                 tag="team_trials_next",
             ):
-                sleep(5)
+                pace("animation", 5)
                 if self.waiter.click_when(
                     classes=("race_after_next",),
                     allow_greedy_click=True,
                     tag="team_trials_race_after_next",
                 ):
                     logger_uma.debug("[TeamTrials] Clicked race_after_next")
-                    sleep(3)
+                    pace("animation", 3)
         else:
-            sleep(5)
+            pace("animation", 5)
 
         img, dets = nav.collect_snapshot(
             self.waiter, self.yolo_engine, tag="team_trials_midtap"
@@ -324,7 +324,7 @@ class TeamTrialsFlow:
         nav.random_center_tap(
             self.ctrl, img, clicks=random.randint(4, 5), dev_frac=0.01
         )
-        sleep(4.2)
+        pace("animation", 4.2)
         img, dets = nav.collect_snapshot(
             self.waiter, self.yolo_engine, tag="team_trials_especial_reward"
         )
@@ -348,7 +348,7 @@ class TeamTrialsFlow:
                 clicks=1,
                 tag="team_trials_reward_next_green",
             )
-            sleep(0.5)
+            pace("ui", 0.5)
 
         did_shop = nav.handle_shop_exchange(
             self.waiter,
@@ -383,7 +383,7 @@ class TeamTrialsFlow:
             timeout_s=2.0,
             tag="team_trials_finished_no",
         )
-        sleep(0.5)
+        pace("ui", 0.5)
         self.waiter.click_when(
             classes=("button_advance",),
             prefer_bottom=True,
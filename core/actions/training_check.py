@@ -1,7 +1,6 @@
 
 from __future__ import annotations
 
-import time
 from typing import Dict, List, Optional, Tuple, Union
 import random
 
@@ -13,6 +12,7 @@ from core.settings import Settings
 from core.types import DetectionDict
 from core.utils.geometry import calculate_jitter
 from core.utils.logger import logger_uma
+from core.utils.settle import wait_for_settle
 from core.utils.skill_memory import SkillMemoryManager
 from typing import Any
 from dataclasses import dataclass, asdict
@@ -64,7 +64,7 @@ def scan_training_screen(
         return 0.6
 
     # -------- 1) Initial capture, wait for button training animations --------
-    time.sleep(0.3)
+    wait_for_settle(ctrl, timeout_s=0.3, tag="training_enter")
     cur_img, _, cur_parsed = yolo_engine.recognize(
         imgsz=param_imgsz, conf=param_conf, iou=param_iou, tag="training"
     )
@@ -72,7 +72,7 @@ def scan_training_screen(
     btns = get_buttons_ltr(cur_parsed)
 
     if btns and len(btns) != 5:
-        time.sleep(0.5)
+        wait_for_settle(ctrl, timeout_s=0.5, tag="training_enter")
         # try again
         cur_img, _, cur_parsed = yolo_engine.recognize(
             imgsz=param_imgsz, conf=param_conf, iou=param_iou, tag="training"
@@ -134,7 +134,7 @@ def scan_training_screen(
                     clicks=1,
                     jitter=calculate_jitter(tile["tile_xyxy"], percentage_offset=0.20),
                 )
-                time.sleep(_jitter_delay())
+                wait_for_settle(ctrl, timeout_s=_jitter_delay(), tag="training_tile")
                 cur_img, _, cur_parsed = yolo_engine.recognize(
                     imgsz=param_imgsz, conf=param_conf, iou=param_iou, tag="training"
                 )
@@ -217,7 +217,7 @@ def scan_training_screen(
             jitter=calculate_jitter(tile["tile_xyxy"], percentage_offset=0.20),
         )
 
-        time.sleep(_jitter_delay())
+        wait_for_settle(ctrl, timeout_s=_jitter_delay(), tag="training_tile")
 
         # Recapture once
         cur_img, _, cur_parsed = yolo_engine.recognize(
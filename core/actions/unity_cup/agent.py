@@ -1,7 +1,6 @@
 # core/unity_cup/agent.py
 from __future__ import annotations
 
-from time import sleep
 from typing import Any, Dict, List
 
 from core.actions.training_policy import check_training
@@ -18,6 +17,7 @@ from core.perception.yolo.interface import IDetector
 from core.agent_scenario import AgentScenario
 from core.settings import Settings
 from core.utils.logger import logger_uma
+from core.utils.pacer import pace, pacer
 from core.utils.text import fuzzy_contains
 from core.utils.training_policy_utils import click_training_tile
 from core.utils.waiter import PollConfig, Waiter
@@ -33,6 +33,8 @@ import random
 from core.types import TrainAction
 
 class AgentUnityCup(AgentScenario):
+    SCREENS_WITHOUT_DETS = AgentScenario.SCREENS_WITHOUT_DETS | {"UnityCupRaceday"}
+
     def __init__(
         self,
         ctrl: IController,
@@ -101,7 +103,7 @@ class AgentUnityCup(AgentScenario):
         # Track Unity Cup opponent stage count
         self._unity_cup_race_stage: int = 0
 
-    def run(self, *, delay: float = 0.4, max_iterations: int | None = None) -> None:
+    def _run_loop(self, *, delay: float, max_iterations: int | None) -> None:
         self.ctrl.focus()
         self.is_running = True
 
@@ -116,22 +118,17 @@ class AgentUnityCup(AgentScenario):
                     "[agent] Abort requested; exiting main loop immediately."
                 )
                 break
-            sleep(delay)
-            img, _, dets = self.yolo_engine.recognize(
-                imgsz=self.imgsz,
-                conf=self.conf,
-                iou=self.iou,
-                tag="screen",
-                agent=self.agent_name,
-            )
+            img, meta, dets = self._next_screen(delay)
 
-            screen, _ = classify_screen_unity_cup(
-                dets,
-                lobby_conf=0.5,
-                require_infirmary=True,
-                training_conf=0.50,
-                names_map=None,
-            )
+            screen = meta.get("screen")
+            if screen is None:
+                screen, _ = classify_screen_unity_cup(
+                    dets,
+                    lobby_conf=0.5,
+                    require_infirmary=True,
+                    training_conf=0.50,
+                    names_map=None,
+                )
 
             is_lobby_summer = screen == "LobbySummer"
             unknown_screen = screen.lower() == "unknown"
@@ -299,7 +296,7 @@ class AgentUnityCup(AgentScenario):
                 
                 if button_golden:
                     self.ctrl.click_xyxy_center(button_golden["xyxy"], clicks=1)
-                    sleep(1.5)
+                    pace("transition", 1.5)
                     self.begin_showdown(img, dets)
                 continue
 
@@ -308,6 +305,7 @@ class AgentUnityCup(AgentScenario):
                 self.patience = 0
                 self.claw_turn = 0
                 self._iterations_turn += 1
+                pacer.turn_report(self._today_date_key() or "")
                 # Keep skill memory aligned with latest state
                 self._refresh_skill_memory()
 
@@ -416,7 +414,7 @@ class AgentUnityCup(AgentScenario):
                     allow_greedy_click=True,
                     tag="unity_cup_race_day_button",
                 ):
-                    sleep(2)
+                    pace("transition", 2)
                     t0 = time.time()
                     banners_seen = False
 
@@ -427,7 +425,7 @@ class AgentUnityCup(AgentScenario):
                         ):
                             banners_seen = True
                             break
-                        time.sleep(0.5)
+                        pace("ui", 0.5)
 
                     if not banners_seen:
                         logger_uma.warning(
@@ -493,7 +491,7 @@ class AgentUnityCup(AgentScenario):
                             tag="unity_cup_click_button_green",
                         ):
                             logger_uma.info("[UnityCup] Clicked button_green")
-                            sleep(1.5)
+                            pace("transition", 1.5)
                             self.begin_showdown(img, dets)
                         else:
                             logger_uma.warning("[UnityCup] button_green not found")
@@ -505,6 +503,7 @@ class AgentUnityCup(AgentScenario):
                 self.patience = 0
                 self.claw_turn = 0
                 self._iterations_turn += 1
+                pacer.turn_report(self._today_date_key() or "")
                 outcome, reason = self.lobby.process_turn()
                 # outcome = "TO_TRAINING"
                 # self.lobby._go_training_screen_from_lobby(img, dets)
@@ -630,7 +629,7 @@ class AgentUnityCup(AgentScenario):
                     )
                     # Tile already clicked by pre-check, just wait for the normal flow
                     # The agent will detect TrainingConfirm screen and handle it
-                    sleep(1.5)  # Give time for UI to settle
+                    pace("transition", 1.5)  # Give time for UI to settle
                     continue
 
                 # For other outcomes ("INFIRMARY", "RESTED", "CONTINUE") we just loop
@@ -640,7 +639,7 @@ class AgentUnityCup(AgentScenario):
                 self.claw_turn = 0
                 # Only if skill list defined
                 if len(self.skill_list) > 0 and self.lobby._go_skills():
-                    sleep(1.0)
+                    pace("transition", 1.0)
                     bought = self.skills_flow.buy(self.skill_list)
                     self._last_skill_buy_succeeded = bool(bought)
                     logger_uma.info(f"[agent] Skills bought: {bought}")
@@ -673,7 +672,7 @@ class AgentUnityCup(AgentScenario):
                     logger_uma.debug("Claw Machine triggered sucessfully")
                 else:
                     logger_uma.error("Couldn't trigger Claw Machine")
-                sleep(3)
+                pace("animation", 3)
                 continue
 
     # --------------------------
@@ -850,7 +849,7 @@ class AgentUnityCup(AgentScenario):
             tag="unity_cup_click_showdown",
         ):
             logger_uma.info("[UnityCup] Clicked begin showdown")
-            sleep(5)
+            pace("animation", 5)
             # Wait up to 10 seconds for race_after_next to appear
             t0 = time.time()
             race_after_next_found = False
@@ -862,7 +861,7 @@ class AgentUnityCup(AgentScenario):
                 ):
                     race_after_next_found = True
                     break
-                time.sleep(0.5)
+                pace("ui", 0.5)
             
             if race_after_next_found:
                 # Now check if it's active
@@ -889,7 +888,7 @@ class AgentUnityCup(AgentScenario):
                     if is_active:
                         self.ctrl.click_xyxy_center(race_after_next_det["xyxy"], clicks=1)
                         logger_uma.debug("[unity_cup] Clicked race after next first")
-                        sleep(3)
+                        pace("animation", 3)
                         # Skip button loop (same pattern as race.py)
                         skip_clicks = 0
                         t0 = time.time()
@@ -902,8 +901,8 @@ class AgentUnityCup(AgentScenario):
                                 tag="unity_cup_skip"
                             ):
                                 skip_clicks += 1
-                            time.sleep(0.12)  # Brief pause between attempts
-                        sleep(2)
+                            pace("micro", 0.12)  # Brief pause between attempts
+                        pace("transition", 2)
                         if skip_clicks > 0:
                             logger_uma.debug(f"[unity_cup] Completed skip sequence (clicks={skip_clicks})")
                             if self.waiter.click_when(
@@ -913,20 +912,20 @@ class AgentUnityCup(AgentScenario):
                                 timeout_s=2.0,
                                 tag="unity_cup_next"
                             ):
-                                sleep(5)
+                                pace("animation", 5)
                                 if self.waiter.click_when(
                                     classes=("race_after_next",),
                                     allow_greedy_click=True,
                                     tag="unity_cup_race_after_next",
                                 ):
                                     logger_uma.debug("[unity_cup] Clicked race_after_next")
-                                    sleep(3)
+                                    pace("animation", 3)
                     else:
                         button_pink = next((d for d in dets if d.get("name") == "button_pink"), None)
                         if button_pink:
                             self.ctrl.click_xyxy_center(button_pink["xyxy"], clicks=1)
                             logger_uma.debug("[unity_cup] clicked Watch Main Race because other button was disabled")
-                            sleep(5)
+                            pace("animation", 5)
                             if self.waiter.click_when(
                                 classes=("button_green",),
                                 texts=("RACE", ),
@@ -934,7 +933,7 @@ class AgentUnityCup(AgentScenario):
                                 timeout_s=2.0,
                                 tag="unity_cup_kashimoto_next"
                             ):
-                                sleep(5)
+                                pace("animation", 5)
                                 if self.waiter.click_when(
                                     classes=("button_green",),
                                     texts=("RACE", ),
@@ -942,7 +941,7 @@ class AgentUnityCup(AgentScenario):
                                     timeout_s=5.0,
                                     tag="unity_cup_kashimoto_next_race_2"
                                 ):
-                                    sleep(2)
+                                    pace("transition", 2)
                                     # Reactive second confirmation. Click as soon as popup appears,
                                     # or bail early if the pre-race lobby appears or skip buttons show up.
                                     t0 = time.time()
@@ -957,7 +956,7 @@ class AgentUnityCup(AgentScenario):
                                             tag="race_lobby_race_confirm_try",
                                         ):
                                             logger_uma.debug("[race] Clicked RACE confirmation")
-                                            time.sleep(0.5)
+                                            pace("ui", 0.5)
                                         # If we already transitioned into race (skip buttons), stop waiting.
                                         if self.waiter.seen(
                                             classes=("button_skip",), tag="race_lobby_seen_skip"
@@ -965,7 +964,7 @@ class AgentUnityCup(AgentScenario):
                                             seen_skip = True
                                             logger_uma.debug("[race] Seen skip buttons, breaking to click them")
                                             break
-                                        time.sleep(0.5)
+                                        pace("ui", 0.5)
                                     logger_uma.debug(f"[race] Seen skip buttons: {seen_skip}")
                                     if not seen_skip:
                                         # search again for green 'Next' or 'RACE' button
@@ -979,7 +978,7 @@ class AgentUnityCup(AgentScenario):
                                             logger_uma.error("[race] Race button not found after ~6s of retries. "
                                             "Cannot determine lobby state. Aborting race operation.")
                                             
-                                    time.sleep(4)
+                                    pace("animation", 4)
                                     logger_uma.debug("[race] Starting skip loop")
                                     # Greedy skip: keep pressing while present; stop as soon as 'CLOSE' or 'NEXT' shows.
                                     closed_early = False
@@ -1007,7 +1006,7 @@ class AgentUnityCup(AgentScenario):
                                             skip_clicks += 1
                                             total_time += 2
                                             continue
-                                        time.sleep(0.12)
+                                        pace("micro", 0.12)
                                     logger_uma.debug(
                                         "[race kashimoto] Looking for button_green 'Next' button. Shown after race."
                                     )
@@ -1019,7 +1018,7 @@ class AgentUnityCup(AgentScenario):
                                         clicks=3,
                                         tag="race_kashimoto_after_flow_next",
                                     )
-                                    sleep(1.5)
+                                    pace("transition", 1.5)
                                     logger_uma.debug(
                                         "[race kashimoto] Looking for button_green 'Next' button 2. Shown after race."
                                     )
@@ -1032,7 +1031,7 @@ class AgentUnityCup(AgentScenario):
                                         tag="race_kashimoto_after_flow_next_2",
                                     )
                                     # song...
-                                    sleep(80)
+                                    pace("animation", 80)
                                     logger_uma.debug("[race kashimoto] Looking for CLOSE button.")
                                     self.waiter.click_when(
                                         classes=("button_white",),
@@ -1042,7 +1041,7 @@ class AgentUnityCup(AgentScenario):
                                         timeout_s=3,
                                         tag="race_trophy",
                                     )
-                                    sleep(1.5)
+                                    pace("transition", 1.5)
                                     # 'Next' special
                                     logger_uma.debug(
                                         "[race kashimoto] Looking for race_after_next special button. When Pyramid"
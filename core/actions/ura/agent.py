@@ -1,7 +1,6 @@
 # core/ura/gent.py
 from __future__ import annotations
 
-from time import sleep
 from typing import Any, Dict, List
 
 from core.actions.training_policy import check_training
@@ -20,6 +19,7 @@ from core.perception.yolo.interface import IDetector
 from core.agent_scenario import AgentScenario
 from core.settings import Settings
 from core.utils.logger import logger_uma
+from core.utils.pacer import pace, pacer
 from core.utils.text import fuzzy_contains
 from core.utils.training_policy_utils import click_training_tile
 from core.utils.waiter import PollConfig, Waiter
@@ -93,7 +93,7 @@ class AgentURA(AgentScenario):
             ),
         )
 
-    def run(self, *, delay: float = 0.4, max_iterations: int | None = None) -> None:
+    def _run_loop(self, *, delay: float, max_iterations: int | None) -> None:
         self.ctrl.focus()
         self.is_running = True
 
@@ -107,22 +107,17 @@ class AgentURA(AgentScenario):
                     "[agent] Abort requested; exiting main loop immediately."
                 )
                 break
-            sleep(delay)
-            img, _, dets = self.yolo_engine.recognize(
-                imgsz=self.imgsz,
-                conf=self.conf,
-                iou=self.iou,
-                tag="screen",
-                agent=self.agent_name,
-            )
+            img, meta, dets = self._next_screen(delay)
 
-            screen, _ = classify_screen_ura(
-                dets,
-                lobby_conf=0.5,
-                require_infirmary=True,
-                training_conf=0.50,
-                names_map=None,
-            )
+            screen = meta.get("screen")
+            if screen is None:
+                screen, _ = classify_screen_ura(
+                    dets,
+                    lobby_conf=0.5,
+                    require_infirmary=True,
+                    training_conf=0.50,
+                    names_map=None,
+                )
 
             is_lobby_summer = screen == "LobbySummer"
             unknown_screen = screen.lower() == "unknown"
@@ -285,6 +280,7 @@ class AgentURA(AgentScenario):
                 self.patience = 0
                 self.claw_turn = 0
                 self._iterations_turn += 1
+                pacer.turn_report(self._today_date_key() or "")
                 # Keep skill memory aligned with latest state
                 self._refresh_skill_memory()
 
@@ -390,6 +386,7 @@ class AgentURA(AgentScenario):
                 self.patience = 0
                 self.claw_turn = 0
                 self._iterations_turn += 1
+                pacer.turn_report(self._today_date_key() or "")
                 outcome, reason = self.lobby.process_turn()
                 # outcome = "TO_TRAINING"
                 # self.lobby._go_training_screen_from_lobby(img, dets)
@@ -515,7 +512,7 @@ class AgentURA(AgentScenario):
                     )
                     # Tile already clicked by pre-check, just wait for the normal flow
                     # The agent will detect TrainingConfirm screen and handle it
-                    sleep(1.5)  # Give time for UI to settle
+                    pace("transition", 1.5)  # Give time for UI to settle
                     continue
 
                 # For other outcomes ("INFIRMARY", "RESTED", "CONTINUE") we just loop
@@ -525,7 +522,7 @@ class AgentURA(AgentScenario):
                 self.claw_turn = 0
                 # Only if skill list defined
                 if len(self.skill_list) > 0 and self.lobby._go_skills():
-                    sleep(1.0)
+                    pace("transition", 1.0)
                     bought = self.skills_flow.buy(self.skill_list)
                     self._last_skill_buy_succeeded = bool(bought)
                     logger_uma.info(f"[agent] Skills bought: {bought}")
@@ -559,7 +556,7 @@ class AgentURA(AgentScenario):
                     logger_uma.debug("Claw Machine triggered sucessfully")
                 else:
                     logger_uma.error("Couldn't trigger Claw Machine")
-                sleep(3)
+                pace("animation", 3)
                 continue
 
     # --------------------------
@@ -3,7 +3,6 @@ from __future__ import annotations
 
 import threading
 from collections import Counter
-from time import sleep
 from typing import Dict, List, Tuple
 
 from PIL import Image
@@ -18,6 +17,7 @@ from core.settings import Settings
 from core.types import DetectionDict
 from core.utils import nav
 from core.utils.logger import logger_uma
+from core.utils.pacer import pace
 from core.utils.waiter import PollConfig, Waiter
 
 
@@ -235,16 +235,16 @@ class AgentNav:
             if screen == "RaceScreen":
                 if self.action == "daily_races":
                     if self.daily_race.enter_from_menu():
-                        sleep(1.0)
+                        pace("transition", 1.0)
                 elif self.action == "team_trials":
                     if self.team_trials.enter_from_menu():
-                        sleep(1.0)
+                        pace("transition", 1.0)
 
             elif screen == "RaceDailyRows":
                 if self.daily_race.pick_first_row():
-                    sleep(1.0)
+                    pace("transition", 1.0)
                     if self.daily_race.confirm_and_next_to_race():
-                        sleep(1.0)
+                        pace("transition", 1.0)
                         finalized = self.daily_race.run_race_and_collect()
 
                         if finalized:
@@ -297,7 +297,7 @@ class AgentNav:
                         patience = 3
                     else:
                         patience -= 1  # safe stop
-                        sleep(0.5)
+                        pace("ui", 0.5)
                 elif screen == "RouletteUnknown":
                     clicked = self.waiter.click_when(
                         classes=("button_white",),
@@ -311,7 +311,7 @@ class AgentNav:
                         break
                     if clicked:
                         logger_uma.info("[AgentNav] Roulette close detected")
-                        sleep(0.6)
+                        pace("ui", 0.6)
                     else:
                         patience -= 1
 
@@ -322,7 +322,7 @@ class AgentNav:
             for _ in range(20):
                 if self._stop_event.is_set():
                     break
-                sleep(0.1)
+                pace("micro", 0.1)
 
         self.is_running = False
         return last_screen, last_info
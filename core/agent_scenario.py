@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from time import sleep
 from typing import Any, Dict, List, Optional, Tuple
 
 from core.actions.claw import ClawGame
@@ -16,6 +15,7 @@ from core.perception.ocr.interface import OCRInterface
 from core.perception.yolo.interface import IDetector
 from core.settings import Settings
 from core.utils.logger import logger_uma
+from core.utils.pacer import pace
 from core.utils.skill_memory import SkillMemoryManager
 from core.utils.date_uma import date_index as uma_date_index
 from core.utils.waiter import PollConfig, Waiter
@@ -25,6 +25,11 @@ from core.utils.race_index import RaceIndex
 class AgentScenario(ABC):
     waiter: Waiter
     lobby: LobbyFlow
+    # Screens whose _run_loop handler does not use the loop frame's detections (it polls
+    # with the waiter or captures again), so a confident classifier label is enough.
+    # Terminal (FinalScreen) and frame-acting (Training) screens always get a detector pass.
+    SCREENS_WITHOUT_DETS = frozenset({"Lobby", "LobbySummer", "ClawMachine"})
+
     def __init__(
         self,
         ctrl: IController,
@@ -133,6 +138,17 @@ class AgentScenario(ABC):
         # EventStale loop detection
         self._consecutive_event_stale_clicks: int = 0
         self._force_unknown_once: bool = False
+        # Set while run() uses a prefetching ScreenPipeline (Settings.PIPELINED_LOOP)
+        self._screen_pipeline = None
+        # Optional thumbnail screen classifier consulted before the detector
+        self.screen_classifier = self._load_screen_classifier()
+        if self.screen_classifier is not None:
+            self.screen_classifier.attach(
+                self.yolo_engine,
+                self.ctrl,
+                self.SCREENS_WITHOUT_DETS,
+                min_conf=Settings.SCREEN_CLASSIFIER_MIN_CONF,
+            )
 
     # --------------------------
     # Skill memory helpers
@@ -378,7 +394,7 @@ class AgentScenario(ABC):
             self._pending_hint_supports = [info["entry"] for info in supports_with_missing]
             return False
 
-        sleep(0.6)
+        pace("ui", 0.6)
         labels = [str(info["entry"].get("label") or "support") for info in supports_with_missing]
         logger_uma.info(
             "[post-hint] Re-checking skills after hint from %s. Targets: %s",
@@ -412,6 +428,28 @@ class AgentScenario(ABC):
 
         return success
 
+    # ------------- Screen classifier -------------
+    def _load_screen_classifier(self):
+        if not Settings.SCREEN_CLASSIFIER:
+            return None
+        path = Settings.resolve_screen_classifier_path(self.scenario)
+        if not path.exists():
+            logger_uma.warning(
+                "[screenclf] %s not found; train it with train_screen_classifier.py", path
+            )
+            return None
+        try:
+            from core.perception.screen_classifier import ScreenClassifier
+
+            clf = ScreenClassifier.load(path)
+        except Exception as e:
+            logger_uma.warning("[screenclf] couldn't load %s: %s", path, e)
+            return None
+        logger_uma.info(
+            "[screenclf] loaded %s (%d frames, %s)", path, len(clf.feats), ", ".join(clf.classes)
+        )
+        return clf
+
     # ------------- Hard-stop helper -------------
     def emergency_stop(self) -> None:
         """Cooperative, best-effort immediate stop hook."""
@@ -423,8 +461,53 @@ class AgentScenario(ABC):
         except Exception:
             pass
 
-    @abstractmethod
+    # ------------- Main loop -------------
     def run(self, *, delay: float = 0.4, max_iterations: int | None = None) -> None:
+        if Settings.PIPELINED_LOOP:
+            from core.perception.screen_pipeline import ScreenPipeline
+
+            self._screen_pipeline = ScreenPipeline(
+                self.ctrl,
+                self.yolo_engine,
+                imgsz=self.imgsz,
+                conf=self.conf,
+                iou=self.iou,
+                tag="screen",
+                agent=self.agent_name,
+            ).attach()
+        try:
+            self._run_loop(delay=delay, max_iterations=max_iterations)
+        finally:
+            pipeline, self._screen_pipeline = self._screen_pipeline, None
+            if pipeline is not None:
+                pipeline.close()
+            clf = self.screen_classifier
+            if clf is not None and clf.frames:
+                logger_uma.info(
+                    "[screenclf] answered %d/%d loop frames without detection",
+                    clf.answered,
+                    clf.frames,
+                )
+
+    def _next_screen(self, delay: float) -> Tuple[Any, Dict[str, Any], List[Dict[str, Any]]]:
+        """
+        Main-loop frame: wait `delay`, capture and detect (prefetched with PIPELINED_LOOP).
+        With a screen classifier, meta["screen"] may already name the screen and dets be
+        empty (see ScreenClassifier.attach).
+        """
+        if self._screen_pipeline is not None:
+            return self._screen_pipeline.next(delay)
+        pace("loop", delay)
+        return self.yolo_engine.recognize(
+            imgsz=self.imgsz,
+            conf=self.conf,
+            iou=self.iou,
+            tag="screen",
+            agent=self.agent_name,
+        )
+
+    @abstractmethod
+    def _run_loop(self, *, delay: float, max_iterations: int | None) -> None:
         raise NotImplementedError
 
     @abstractmethod
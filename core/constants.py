@@ -13,6 +13,13 @@ CLASS_LOBBY_INFIRMARY: str = "lobby_infirmary"
 
 UNITY_TURNS_CLASS = "ui_turns_unity"
 
+# Relative (x1, y1, x2, y2) regions of the portrait game capture for ROI-scoped
+# detection (recognize(roi=...)); generous on purpose, a box is kept when its
+# crop still contains it
+ROI_LOBBY_BUTTON_BAR = (0.0, 0.70, 1.0, 1.0)
+ROI_EVENT_CHOICES = (0.0, 0.25, 1.0, 0.95)
+ROI_SKILLS_LIST = (0.0, 0.18, 1.0, 0.90)
+
 SUPPORT_CLASS_NAMES: Set[str] = {
     "support_card",
     "support_card_rainbow",
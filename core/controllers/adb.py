@@ -3,14 +3,83 @@ from __future__ import annotations
 import io
 import random
 import re
+import shlex
 import subprocess
 import time
+from dataclasses import dataclass
 from typing import Optional, Tuple, Union
 
+import numpy as np
 from PIL import Image
 
+from core.controllers.adb_shell import ADBShellSession
 from core.controllers.base import IController, RegionXYWH
+from core.controllers.scrcpy_stream import ScrcpyServerStream
 from core.types import XYXY
+from core.utils.logger import logger_uma
+
+
+# Android PixelFormat ids found in the raw `screencap` header -> (name, bytes per pixel)
+RAW_PIXEL_FORMATS: dict[int, Tuple[str, int]] = {
+    1: ("RGBA_8888", 4),
+    2: ("RGBX_8888", 4),
+    3: ("RGB_888", 3),
+    4: ("RGB_565", 2),
+    5: ("BGRA_8888", 4),
+}
+
+CAPTURE_MODES = ("png", "raw", "stream")
+
+
+@dataclass(frozen=True)
+class RawFramebuffer:
+    """Header-parsed `screencap` (without -p) payload, exposed as an RGB array."""
+
+    width: int
+    height: int
+    format: int
+    format_name: str
+    rgb: np.ndarray  # H x W x 3 uint8 (may be a strided view over the raw buffer)
+
+
+def parse_raw_screencap(blob: bytes) -> RawFramebuffer:
+    """
+    Parse the output of `adb exec-out screencap` (no PNG encoding).
+
+    Layout: little-endian u32 width, height, pixel format, then (Android 9+) an
+    extra u32 colour space, followed by width*height*bpp pixel bytes. The header
+    length is inferred from the payload size so both variants are accepted.
+    """
+    if len(blob) < 12:
+        raise ValueError(f"raw screencap too short ({len(blob)} bytes)")
+
+    width, height, fmt = np.frombuffer(blob, dtype="<u4", count=3)
+    width, height, fmt = int(width), int(height), int(fmt)
+    if fmt not in RAW_PIXEL_FORMATS:
+        raise ValueError(f"unsupported raw screencap pixel format: {fmt}")
+    name, bpp = RAW_PIXEL_FORMATS[fmt]
+
+    payload = width * height * bpp
+    header = len(blob) - payload
+    if width <= 0 or height <= 0 or header not in (12, 16):
+        raise ValueError(
+            f"raw screencap size mismatch: {len(blob)} bytes for {width}x{height} {name}"
+        )
+
+    pixels = np.frombuffer(blob, dtype=np.uint8, count=payload, offset=header)
+    if bpp == 4:
+        px = pixels.reshape(height, width, 4)
+        rgb = px[..., 2::-1] if name == "BGRA_8888" else px[..., :3]
+    elif bpp == 3:
+        rgb = pixels.reshape(height, width, 3)
+    else:
+        v = pixels.view("<u2").reshape(height, width)
+        rgb = np.empty((height, width, 3), dtype=np.uint8)
+        rgb[..., 0] = ((v >> 11) & 0x1F) * 255 // 31
+        rgb[..., 1] = ((v >> 5) & 0x3F) * 255 // 63
+        rgb[..., 2] = (v & 0x1F) * 255 // 31
+
+    return RawFramebuffer(width=width, height=height, format=fmt, format_name=name, rgb=rgb)
 
 
 class ADBController(IController):
@@ -23,15 +92,40 @@ class ADBController(IController):
         screen_width: Optional[int] = None,
         screen_height: Optional[int] = None,
         auto_connect: bool = True,
+        capture_mode: str = "png",
+        use_shell_session: bool = False,
+        scrcpy_server: Optional[str] = None,
+        scrcpy_version: str = "3.1",
+        stream_max_fps: int = 30,
+        stream_port: int = 27183,
     ) -> None:
         super().__init__(window_title="", capture_client_only=False)
         self.device = (device or "").strip() or None
+        mode = (capture_mode or "png").strip().lower()
+        if mode not in CAPTURE_MODES:
+            logger_uma.warning("[ADB] Unknown capture_mode '%s'; using 'png'", capture_mode)
+            mode = "png"
+        # "png": `screencap -p` decoded by PIL; "raw": framebuffer bytes wrapped in numpy;
+        # "stream": newest frame of a background-decoded scrcpy-server H.264 stream
+        self.capture_mode = mode
+        self.last_framebuffer: Optional[RawFramebuffer] = None
+        self._scrcpy_server = scrcpy_server
+        self._scrcpy_version = scrcpy_version
+        self._stream_max_fps = int(stream_max_fps)
+        # Local forward port for the stream; must be unique per device in one process
+        self._stream_port = int(stream_port)
+        self._stream: Optional[ScrcpyServerStream] = None
         self._screen_width = screen_width
         self._screen_height = screen_height
 
         if auto_connect and self.device:
             self._auto_connect_device(self.device)
 
+        # Optional persistent `adb shell` transport (one process for all commands)
+        self._session: Optional[ADBShellSession] = (
+            ADBShellSession(self.device) if use_shell_session else None
+        )
+
         if self._screen_width is None or self._screen_height is None:
             self._detect_screen_size()
 
@@ -65,6 +159,49 @@ class ADBController(IController):
 
         return result
 
+    def _shell(self, *args: str) -> str:
+        """Run a device shell command through the session if enabled, else a fresh adb."""
+        if self._session is not None:
+            return self._session.run_text(shlex.join(args))
+        return self._adb_command("shell", *args).stdout
+
+    def _run_gesture(self, steps: list[Tuple[list[str], float]]) -> None:
+        """
+        Run a multi-step gesture given as (shell args, pause seconds after) pairs.
+        With the shell session the whole gesture is ONE script (pauses run on the
+        device); otherwise each step is its own adb call with host-side sleeps.
+        """
+        if self._session is not None:
+            lines: list[str] = []
+            budget = 0.0
+            for args, pause in steps:
+                lines.append(shlex.join(args))
+                if pause > 0:
+                    lines.append(f"sleep {pause:.3f}")
+                budget += pause
+                if len(args) > 2 and args[1] == "swipe":
+                    budget += int(args[-1]) / 1000.0
+            self._session.run_script(lines, timeout=self._session.timeout + budget)
+            return
+
+        for args, pause in steps:
+            self._adb_command("shell", *args)
+            if pause > 0:
+                time.sleep(pause)
+
+    def _exec_out(self, *args: str) -> bytes:
+        """Binary-safe command output (`adb exec-out` or the shell session)."""
+        if self._session is not None:
+            return self._session.run_args(*args)
+        return self._adb_command("exec-out", *args, text=False).stdout
+
+    def close(self) -> None:
+        """Tear down the persistent shell session and video stream, if any."""
+        if self._stream is not None:
+            self._stream.stop()
+        if self._session is not None:
+            self._session.close()
+
     def _auto_connect_device(self, device: str) -> None:
         try:
             listing = subprocess.run(
@@ -94,8 +231,8 @@ class ADBController(IController):
 
     def _detect_screen_size(self) -> None:
         try:
-            result = self._adb_command("shell", "wm", "size")
-            for line in result.stdout.splitlines():
+            output = self._shell("wm", "size")
+            for line in output.splitlines():
                 if "size:" in line.lower() and "x" in line:
                     payload = line.split("size:")[-1].strip()
                     width_str, height_str = payload.split("x", 1)
@@ -106,8 +243,8 @@ class ADBController(IController):
             pass
 
         try:
-            result = self._adb_command("shell", "dumpsys", "display")
-            match = re.search(r"init=(\d+)x(\d+)", result.stdout)
+            output = self._shell("dumpsys", "display")
+            match = re.search(r"init=(\d+)x(\d+)", output)
             if match:
                 self._screen_width = int(match.group(1))
                 self._screen_height = int(match.group(2))
@@ -192,6 +329,7 @@ class ADBController(IController):
         def _clamp_y(y: int) -> int:
             return max(10, min(height - 10, y))
 
+        gesture: list[Tuple[list[str], float]] = []
         for _ in range(max(1, int(steps))):
             half = pixels // 2
             if scroll_down:
@@ -207,8 +345,7 @@ class ADBController(IController):
             y1j = y_end + (random.randint(-jitter_val, jitter_val) if jitter_val else 0)
 
             duration_ms = int(random.uniform(*duration_range) * 1000)
-            self._adb_command(
-                "shell",
+            swipe = [
                 "input",
                 "swipe",
                 str(max(0, min(width - 1, int(xj)))),
@@ -216,19 +353,24 @@ class ADBController(IController):
                 str(max(0, min(width - 1, int(xj)))),
                 str(max(0, min(height - 1, int(y1j)))),
                 str(max(1, duration_ms)),
-            )
-
-            time.sleep(random.uniform(*end_hold_range))
-            time.sleep(random.uniform(*pause_range))
+            ]
+            settle = random.uniform(*end_hold_range) + random.uniform(*pause_range)
+            gesture.append((swipe, settle))
 
+        self._run_gesture(gesture)
         return True
 
     # ------------------------------------------------------------------
     # Capture & input overrides
     # ------------------------------------------------------------------
-    def screenshot(self, region: Optional[RegionXYWH] = None) -> Image.Image:
-        result = self._adb_command("exec-out", "screencap", "-p", text=False)
-        img = Image.open(io.BytesIO(result.stdout))
+    def screencap_raw(self) -> RawFramebuffer:
+        """Pull the raw framebuffer (no on-device PNG encode) and parse its header."""
+        frame = parse_raw_screencap(self._exec_out("screencap"))
+        self.last_framebuffer = frame
+        return frame
+
+    def _screenshot_png(self, region: Optional[RegionXYWH]) -> Image.Image:
+        img = Image.open(io.BytesIO(self._exec_out("screencap", "-p")))
         if img.mode != "RGB":
             img = img.convert("RGB")
 
@@ -238,6 +380,68 @@ class ADBController(IController):
         if region is not None:
             left, top, width, height = region
             img = img.crop((left, top, left + width, top + height))
+        return img
+
+    def _screenshot_raw(self, region: Optional[RegionXYWH]) -> Image.Image:
+        frame = self.screencap_raw()
+        self._screen_width = frame.width
+        self._screen_height = frame.height
+
+        rgb = frame.rgb
+        if region is not None:
+            # Crop before materializing so only the requested pixels are copied
+            left, top, width, height = region
+            rgb = rgb[max(0, top) : top + height, max(0, left) : left + width]
+        return Image.fromarray(np.ascontiguousarray(rgb))
+
+    def _screenshot_stream(self, region: Optional[RegionXYWH]) -> Image.Image:
+        if self._stream is None:
+            if not self._scrcpy_server:
+                raise RuntimeError("no scrcpy-server path configured")
+            self._stream = ScrcpyServerStream(
+                self._adb_command,
+                self.device,
+                server_path=self._scrcpy_server,
+                server_version=self._scrcpy_version,
+                port=self._stream_port,
+                max_fps=self._stream_max_fps,
+            )
+        if not self._stream.alive:
+            self._stream.start()
+
+        latest = self._stream.latest(wait_s=2.0)
+        if latest is None:
+            raise RuntimeError("stream produced no frame")
+        rgb = latest[0]
+        self._screen_height, self._screen_width = rgb.shape[:2]
+
+        if region is not None:
+            left, top, width, height = region
+            rgb = rgb[max(0, top) : top + height, max(0, left) : left + width]
+        return Image.fromarray(np.ascontiguousarray(rgb))
+
+    def screenshot(self, region: Optional[RegionXYWH] = None) -> Image.Image:
+        img: Optional[Image.Image] = None
+        if self.capture_mode in ("raw", "stream"):
+            try:
+                if self.capture_mode == "stream":
+                    img = self._screenshot_stream(region)
+                else:
+                    img = self._screenshot_raw(region)
+            except (ValueError, RuntimeError) as exc:
+                logger_uma.warning(
+                    "[ADB] %s capture unusable (%s); falling back to PNG capture",
+                    self.capture_mode,
+                    exc,
+                )
+                if self._stream is not None:
+                    self._stream.stop()
+                self.capture_mode = "png"
+        if img is None:
+            img = self._screenshot_png(region)
+
+        if region is not None:
+            left, top, width, height = region
             self._last_origin = (left, top)
             self._last_bbox = (left, top, width, height)
         else:
@@ -273,10 +477,10 @@ class ADBController(IController):
             time.sleep(random.uniform(0.12, 0.22))
             time.sleep(random.uniform(0.03, 0.08))
 
-        for _ in range(max(1, clicks)):
-            self._adb_command("shell", "input", "tap", str(tx), str(ty))
-            if clicks > 1:
-                time.sleep(max(0.05, duration))
+        pause = max(0.05, duration) if clicks > 1 else 0.0
+        self._run_gesture(
+            [(["input", "tap", str(tx), str(ty)], pause) for _ in range(max(1, clicks))]
+        )
 
     def mouse_down(
         self,
@@ -304,8 +508,7 @@ class ADBController(IController):
             ty = max(0, min(self._screen_height - 1, ty))
 
         duration_ms = int(max(0.05, seconds) * 1000)
-        self._adb_command(
-            "shell",
+        self._shell(
             "input",
             "swipe",
             str(tx),
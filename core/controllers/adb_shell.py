@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import shlex
+import subprocess
+import threading
+import time
+import uuid
+from typing import Optional, Sequence
+
+from core.utils.logger import logger_uma
+
+
+class ADBShellSession:
+    """
+    One long-lived `adb shell` process used as a command transport.
+
+    Every command is written to the shell's stdin followed by an end marker that
+    carries its exit status, and the response is everything the shell printed
+    before that marker. This avoids spawning a new `adb` process (and paying the
+    adb handshake) for each tap/swipe/screencap.
+
+      - run(cmd)          -> raw stdout bytes (binary-safe, e.g. `screencap`)
+      - run_text(cmd)     -> decoded stdout
+      - run_script(lines) -> several commands delivered as ONE framed request
+
+    A command that exceeds its timeout kills the session (its state is unknown)
+    and raises RuntimeError; the next call transparently reconnects.
+    Commands must not read from stdin (it is redirected from /dev/null).
+    """
+
+    def __init__(
+        self,
+        device: Optional[str] = None,
+        *,
+        timeout: float = 10.0,
+        adb_path: str = "adb",
+    ) -> None:
+        self.device = device
+        self.timeout = float(timeout)
+        self.adb_path = adb_path
+
+        self._proc: Optional[subprocess.Popen] = None
+        self._reader: Optional[threading.Thread] = None
+        self._buf = bytearray()
+        self._eof = False
+        self._cond = threading.Condition()
+        self._lock = threading.Lock()  # one in-flight command at a time
+        self._token = uuid.uuid4().hex[:12]
+        self._seq = 0
+
+        # Diagnostics
+        self.spawn_count = 0
+        self.command_count = 0
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+    @property
+    def alive(self) -> bool:
+        return self._proc is not None and self._proc.poll() is None
+
+    def start(self) -> None:
+        """Spawn the `adb shell` process if it is not running."""
+        if self.alive:
+            return
+        self._kill()
+
+        cmd = [self.adb_path]
+        if self.device:
+            cmd.extend(["-s", self.device])
+        cmd.append("shell")
+        try:
+            proc = subprocess.Popen(
+                cmd,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                bufsize=0,
+            )
+        except FileNotFoundError as exc:  # pragma: no cover - adb missing
+            raise RuntimeError(
+                "ADB executable not found. Install Android Platform Tools and ensure 'adb' is on PATH."
+            ) from exc
+
+        with self._cond:
+            self._buf.clear()
+            self._eof = False
+        self._proc = proc
+        self._reader = threading.Thread(
+            target=self._read_loop, args=(proc,), daemon=True
+        )
+        self._reader.start()
+        self.spawn_count += 1
+        logger_uma.debug(
+            "[ADB] shell session started (device=%s, spawn #%d)",
+            self.device,
+            self.spawn_count,
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            self._kill()
+
+    def _kill(self) -> None:
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        try:
+            if proc.stdin:
+                proc.stdin.close()
+        except Exception:
+            pass
+        try:
+            proc.kill()
+            proc.wait(timeout=2)
+        except Exception:
+            pass
+
+    def _read_loop(self, proc: subprocess.Popen) -> None:
+        stream = proc.stdout
+        while stream is not None:
+            try:
+                chunk = stream.read(1 << 16)
+            except Exception:
+                chunk = b""
+            with self._cond:
+                if proc is not self._proc:
+                    return  # stale reader of a killed session
+                if not chunk:
+                    self._eof = True
+                    self._cond.notify_all()
+                    return
+                self._buf.extend(chunk)
+                self._cond.notify_all()
+
+    # ------------------------------------------------------------------
+    # Commands
+    # ------------------------------------------------------------------
+    def run(self, command: str, *, timeout: Optional[float] = None) -> bytes:
+        """Run `command` in the session; return its stdout, raise on failure."""
+        timeout = self.timeout if timeout is None else float(timeout)
+        with self._lock:
+            self._seq += 1
+            marker = f"__UMA_{self._token}_{self._seq}__"
+            payload = (
+                f"{{ {command}\n}} </dev/null\n"
+                f"__uma_rc=$?\necho\necho {marker} $__uma_rc\n"
+            ).encode("utf-8")
+
+            for attempt in (0, 1):
+                self.start()
+                try:
+                    assert self._proc is not None and self._proc.stdin is not None
+                    self._proc.stdin.write(payload)
+                    self._proc.stdin.flush()
+                    break
+                except (OSError, ValueError) as exc:
+                    # The write never reached the shell, so retrying is safe.
+                    self._kill()
+                    if attempt:
+                        raise RuntimeError(f"ADB shell session unavailable: {exc}") from exc
+                    logger_uma.debug("[ADB] shell session lost (%s); reconnecting", exc)
+
+            out, rc = self._read_response(marker, time.monotonic() + timeout, command)
+            self.command_count += 1
+
+        if rc != 0:
+            raise RuntimeError(f"ADB shell command failed (rc={rc}): {command}")
+        return out
+
+    def run_text(self, command: str, *, timeout: Optional[float] = None) -> str:
+        return self.run(command, timeout=timeout).decode("utf-8", errors="ignore")
+
+    def run_args(self, *args: str, timeout: Optional[float] = None) -> bytes:
+        return self.run(shlex.join(args), timeout=timeout)
+
+    def run_script(
+        self, lines: Sequence[str], *, timeout: Optional[float] = None
+    ) -> bytes:
+        """Deliver a multi-step gesture/script as a single framed request."""
+        return self.run("\n".join(lines), timeout=timeout)
+
+    def _read_response(self, marker: str, deadline: float, command: str):
+        needle = b"\n" + marker.encode("ascii") + b" "
+        with self._cond:
+            while True:
+                idx = self._buf.find(needle)
+                if idx >= 0:
+                    eol = self._buf.find(b"\n", idx + len(needle))
+                    if eol >= 0:
+                        out = bytes(self._buf[:idx])
+                        status = bytes(self._buf[idx + len(needle) : eol]).strip()
+                        del self._buf[: eol + 1]
+                        try:
+                            rc = int(status or b"0")
+                        except ValueError:
+                            rc = -1
+                        return out, rc
+                if self._eof:
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._kill()
+                    raise RuntimeError(f"ADB shell command timed out: {command}")
+                self._cond.wait(remaining)
+
+        self._kill()
+        raise RuntimeError(f"ADB shell session closed while running: {command}")
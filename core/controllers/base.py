@@ -1,6 +1,6 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import Any, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Optional, Tuple, Union
 
 import random
 import time
@@ -10,6 +10,10 @@ from PIL import ImageGrab, Image
 from core.types import XYXY, RegionXYWH
 from core.utils.geometry import calculate_jitter
 
+if TYPE_CHECKING:
+    from core.controllers.capture_service import CaptureService, CapturedFrame
+    from core.controllers.input_dispatcher import InputDispatcher
+
 
 class IController(ABC):
     """
@@ -24,6 +28,12 @@ class IController(ABC):
     Everything else is generic and implemented here.
     """
 
+    # Opt-in background capture (see start_capture_service)
+    capture_service: Optional["CaptureService"] = None
+    last_frame: Optional["CapturedFrame"] = None
+    # Opt-in asynchronous input delivery (see start_input_dispatcher)
+    input_dispatcher: Optional["InputDispatcher"] = None
+
     def __init__(self, window_title: str, capture_client_only: bool = True) -> None:
         self.window_title = window_title
         self.capture_client_only = capture_client_only
@@ -98,6 +108,75 @@ class IController(ABC):
         self._last_bbox = (0, 0, scr.width, scr.height)
         return scr
 
+    # ---- Background capture ----
+    def start_capture_service(
+        self, *, interval_s: float = 0.0, buffer_size: int = 3
+    ) -> "CaptureService":
+        """
+        Grab frames continuously on a background thread. While running,
+        `screenshot()` returns (a crop of) the freshest buffered frame instead
+        of capturing on the caller's thread; the image carries its grab time in
+        `img.info["capture_ts"]`. Reads after click/scroll/hold wait briefly for
+        a frame taken after the input.
+        """
+        from core.controllers import capture_service as _cs
+
+        if self.capture_service is not None and self.capture_service.running:
+            return self.capture_service
+        self.capture_service = _cs.attach(
+            self, {"interval_s": interval_s, "buffer_size": buffer_size}
+        )
+        return self.capture_service
+
+    def stop_capture_service(self) -> Optional[dict]:
+        """Stop background capture; returns its final stats (or None if not running)."""
+        from core.controllers import capture_service as _cs
+
+        service, self.capture_service = self.capture_service, None
+        if service is None:
+            return None
+        _cs.detach(self)
+        service.stop()
+        return service.stats()
+
+    def latest_frame(self) -> Optional["CapturedFrame"]:
+        """Newest buffered frame without cropping or waiting (None if capture is off)."""
+        if self.capture_service is None:
+            return None
+        frames = self.capture_service.frames()
+        return frames[-1] if frames else None
+
+    # ---- Asynchronous input ----
+    def start_input_dispatcher(self) -> "InputDispatcher":
+        """
+        Deliver actions submitted through `self.input_dispatcher` on a worker
+        thread. Direct calls to click()/scroll() stay synchronous.
+        """
+        from core.controllers.input_dispatcher import InputDispatcher
+
+        if self.input_dispatcher is None or not self.input_dispatcher.running:
+            self.input_dispatcher = InputDispatcher(self).start()
+        return self.input_dispatcher
+
+    def stop_input_dispatcher(self) -> Optional[dict]:
+        """Flush and stop the dispatcher; returns per-kind latency stats (or None)."""
+        dispatcher, self.input_dispatcher = self.input_dispatcher, None
+        if dispatcher is None:
+            return None
+        dispatcher.stop()
+        return dispatcher.stats()
+
+    def wait_input(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until queued input actions were delivered (no-op without dispatcher).
+
+        False on timeout or when a queued action raised since the last call;
+        the exception is kept on `input_dispatcher.last_error`.
+        """
+        if self.input_dispatcher is None:
+            return True
+        return self.input_dispatcher.join(timeout)
+
     def resolution(self) -> Tuple[int, int]:
         sz = pyautogui.size()
         return sz.width, sz.height
@@ -0,0 +1,269 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from PIL import Image
+
+from core.utils.logger import logger_uma
+
+if TYPE_CHECKING:
+    from core.controllers.base import IController
+
+
+@dataclass(frozen=True)
+class CapturedFrame:
+    """One frame grabbed by the capture thread, with the geometry it was taken at."""
+
+    image: Image.Image
+    seq: int
+    started_at: float  # time.time() when the grab began
+    timestamp: float  # time.time() when the grab finished
+    origin: Tuple[int, int]
+    bbox: Tuple[int, int, int, int]
+
+    @property
+    def age_s(self) -> float:
+        return max(0.0, time.time() - self.timestamp)
+
+    @property
+    def capture_ms(self) -> float:
+        return (self.timestamp - self.started_at) * 1000.0
+
+
+class CaptureService:
+    """
+    Grab frames continuously on a worker thread into a small ring buffer so that
+    consumers get the freshest frame without waiting for a capture.
+
+    Counters tell where the loop is bound:
+      - dropped: frames overwritten before anyone read them (capture outpaces
+        the consumer -> perception-bound)
+      - reused: reads that returned an already-delivered frame (consumer
+        outpaces capture -> capture-bound)
+    """
+
+    def __init__(
+        self,
+        grab: Callable[[], Tuple[Image.Image, Tuple[int, int], Tuple[int, int, int, int]]],
+        *,
+        interval_s: float = 0.0,
+        buffer_size: int = 3,
+        name: str = "capture-service",
+    ) -> None:
+        self._grab = grab
+        self.interval_s = max(0.0, float(interval_s))
+        self._ring: Deque[CapturedFrame] = deque(maxlen=max(1, int(buffer_size)))
+        self._name = name
+
+        self._cond = threading.Condition()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._seq = 0
+        self._last_delivered_seq = 0
+
+        # Counters
+        self.captured = 0
+        self.delivered = 0
+        self.dropped = 0
+        self.reused = 0
+        self.errors = 0
+        self._capture_ms_total = 0.0
+        self._age_ms_total = 0.0
+
+    # ---- lifecycle ----
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> "CaptureService":
+        if self.running:
+            return self
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, timeout: float = 2.0) -> None:
+        self._stop.set()
+        with self._cond:
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+        self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            started = time.time()
+            try:
+                img, origin, bbox = self._grab()
+            except Exception as exc:
+                self.errors += 1
+                logger_uma.debug("[capture] grab failed: %s", exc)
+                self._stop.wait(max(0.1, self.interval_s))
+                continue
+            if img is None:
+                self._stop.wait(max(0.05, self.interval_s))
+                continue
+
+            with self._cond:
+                self._seq += 1
+                frame = CapturedFrame(
+                    image=img,
+                    seq=self._seq,
+                    started_at=started,
+                    timestamp=time.time(),
+                    origin=origin,
+                    bbox=bbox,
+                )
+                if self._ring and self._ring[-1].seq > self._last_delivered_seq:
+                    self.dropped += 1
+                self._ring.append(frame)
+                self.captured += 1
+                self._capture_ms_total += frame.capture_ms
+                self._cond.notify_all()
+
+            if self.interval_s > 0:
+                self._stop.wait(self.interval_s)
+
+    # ---- frame access ----
+    def latest(
+        self, *, newer_than: float = 0.0, wait_s: float = 1.0
+    ) -> Optional[CapturedFrame]:
+        """
+        Newest frame whose grab *started* after `newer_than` (e.g. the last input
+        action). Waits at most `wait_s` for such a frame; on timeout returns the
+        newest frame available (possibly older), or None if nothing was captured.
+        """
+        deadline = time.monotonic() + max(0.0, wait_s)
+        with self._cond:
+            while not self._ring or self._ring[-1].started_at < newer_than:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self.running:
+                    break
+                self._cond.wait(remaining)
+            if not self._ring:
+                return None
+            frame = self._ring[-1]
+            if frame.seq <= self._last_delivered_seq:
+                self.reused += 1
+            self._last_delivered_seq = max(self._last_delivered_seq, frame.seq)
+            self.delivered += 1
+            self._age_ms_total += frame.age_s * 1000.0
+            return frame
+
+    def frames(self) -> List[CapturedFrame]:
+        """Snapshot of the ring buffer, oldest first."""
+        with self._cond:
+            return list(self._ring)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            newest = self._ring[-1] if self._ring else None
+            return {
+                "captured": self.captured,
+                "delivered": self.delivered,
+                "dropped": self.dropped,
+                "reused": self.reused,
+                "errors": self.errors,
+                "avg_capture_ms": (
+                    self._capture_ms_total / self.captured if self.captured else 0.0
+                ),
+                "avg_delivered_age_ms": (
+                    self._age_ms_total / self.delivered if self.delivered else 0.0
+                ),
+                "frame_age_s": newest.age_s if newest else None,
+            }
+
+
+def frame_meta(img: Image.Image) -> Dict[str, Any]:
+    """Capture timestamp/age of an image served by a CaptureService ({} otherwise)."""
+    ts = img.info.get("capture_ts") if img is not None else None
+    if ts is None:
+        return {}
+    return {
+        "capture_ts": ts,
+        "capture_seq": img.info.get("capture_seq"),
+        "frame_age_s": max(0.0, time.time() - ts),
+    }
+
+
+_INPUT_METHODS = ("click", "scroll", "hold", "mouse_down", "mouse_up")
+
+
+def attach(ctrl: "IController", service_kwargs: Dict[str, Any]) -> CaptureService:
+    """
+    Route `ctrl.screenshot()` through a CaptureService.
+
+    The worker calls the controller class's own `screenshot()`; the instance
+    gets a `screenshot` override that serves (crops of) the newest frame and
+    restores the capture geometry of the frame it returns, so coordinate
+    helpers keep matching what the caller sees. Input methods are wrapped to
+    record when the screen was last acted on: the next read waits (bounded)
+    for a frame that started after that action.
+    """
+    cls_screenshot = type(ctrl).screenshot
+    geom_lock = threading.Lock()
+    state: Dict[str, Any] = {"geometry": None, "not_before": 0.0}
+
+    def _restore_geometry() -> None:
+        geom = state["geometry"]
+        if geom is not None:
+            ctrl._last_origin, ctrl._last_bbox = geom
+
+    def _grab():
+        img = cls_screenshot(ctrl)
+        origin = tuple(getattr(ctrl, "_last_origin", (0, 0)))
+        bbox = tuple(getattr(ctrl, "_last_bbox", (0, 0, 0, 0)))
+        if img is not None and bbox[2:] == (0, 0):
+            bbox = (origin[0], origin[1], img.width, img.height)
+        with geom_lock:
+            _restore_geometry()
+        return img, origin, bbox
+
+    service = CaptureService(_grab, **service_kwargs)
+
+    def screenshot(region=None):
+        frame = service.latest(newer_than=state["not_before"])
+        if frame is None:
+            return cls_screenshot(ctrl, region=region)
+
+        img, origin, bbox = frame.image, frame.origin, frame.bbox
+        if region is not None:
+            L, T, W, H = region
+            x, y = L - frame.origin[0], T - frame.origin[1]
+            if x < 0 or y < 0 or x + W > img.width or y + H > img.height:
+                return cls_screenshot(ctrl, region=region)
+            img = img.crop((x, y, x + W, y + H))
+            origin, bbox = (L, T), (L, T, W, H)
+
+        img.info["capture_ts"] = frame.timestamp
+        img.info["capture_seq"] = frame.seq
+        with geom_lock:
+            state["geometry"] = (origin, bbox)
+            _restore_geometry()
+        ctrl.last_frame = frame
+        return img
+
+    def _wrap_input(fn):
+        def wrapped(*args, **kwargs):
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                state["not_before"] = time.time()
+
+        return wrapped
+
+    ctrl.screenshot = screenshot  # type: ignore[method-assign]
+    for name in _INPUT_METHODS:
+        setattr(ctrl, name, _wrap_input(getattr(type(ctrl), name).__get__(ctrl)))
+    return service.start()
+
+
+def detach(ctrl: "IController") -> None:
+    """Undo `attach`: drop the instance overrides so class methods apply again."""
+    for name in ("screenshot",) + _INPUT_METHODS:
+        ctrl.__dict__.pop(name, None)
@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
+
+from core.types import XYXY
+from core.utils.geometry import calculate_jitter
+from core.utils.logger import logger_uma
+
+if TYPE_CHECKING:
+    from core.controllers.base import IController
+
+
+@dataclass
+class _Job:
+    kind: str
+    fn: Callable[..., Any]
+    args: tuple
+    kwargs: dict
+    future: Future
+    enqueued_at: float = field(default_factory=time.perf_counter)
+
+
+@dataclass
+class _KindStats:
+    count: int = 0
+    errors: int = 0
+    queue_ms_total: float = 0.0
+    queue_ms_max: float = 0.0
+    delivery_ms_total: float = 0.0
+    delivery_ms_max: float = 0.0
+
+    def as_dict(self) -> Dict[str, float]:
+        n = max(1, self.count)
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "queue_ms_avg": self.queue_ms_total / n,
+            "queue_ms_max": self.queue_ms_max,
+            "delivery_ms_avg": self.delivery_ms_total / n,
+            "delivery_ms_max": self.delivery_ms_max,
+        }
+
+
+class InputDispatcher:
+    """
+    Deliver input actions (taps, moves, scrolls…) on a worker thread, in order.
+
+    Each submitted action returns a Future so the caller can keep capturing or
+    analysing while the pointer is still moving, and `join()` (or the future)
+    before a step that depends on the action having landed.
+
+    Screen coordinates are resolved at submit time: helpers like
+    `click_xyxy_center` read the controller's last capture origin, which may
+    change once the caller takes the next screenshot.
+    """
+
+    def __init__(self, ctrl: "IController", *, name: str = "input-dispatch") -> None:
+        self.ctrl = ctrl
+        self._q: "queue.Queue[Optional[_Job]]" = queue.Queue()
+        self._name = name
+        self._thread: Optional[threading.Thread] = None
+        self._stats: Dict[str, _KindStats] = {}
+        self._stats_lock = threading.Lock()
+        # First failure since the last join(); join() reports and clears it
+        self._failure: Optional[BaseException] = None
+        self.last_error: Optional[BaseException] = None
+
+    # ---- lifecycle ----
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> "InputDispatcher":
+        if self.running:
+            return self
+        self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Deliver what is already queued, then stop the worker."""
+        if self._thread is None:
+            return
+        self._q.put(None)
+        self._thread.join(timeout=timeout)
+        self._thread = None
+
+    def _run(self) -> None:
+        while True:
+            job = self._q.get()
+            try:
+                if job is None:
+                    return
+                if not job.future.set_running_or_notify_cancel():
+                    continue
+                started = time.perf_counter()
+                try:
+                    result = job.fn(*job.args, **job.kwargs)
+                except BaseException as exc:
+                    self._record(job, started, exc=exc)
+                    logger_uma.warning("[input] %s failed: %s", job.kind, exc)
+                    job.future.set_exception(exc)
+                else:
+                    self._record(job, started)
+                    job.future.set_result(result)
+            finally:
+                self._q.task_done()
+
+    def _record(
+        self, job: _Job, started: float, *, exc: Optional[BaseException] = None
+    ) -> None:
+        done = time.perf_counter()
+        queue_ms = (started - job.enqueued_at) * 1000.0
+        delivery_ms = (done - started) * 1000.0
+        with self._stats_lock:
+            if exc is not None and self._failure is None:
+                self._failure = exc
+            st = self._stats.setdefault(job.kind, _KindStats())
+            st.count += 1
+            st.errors += int(exc is not None)
+            st.queue_ms_total += queue_ms
+            st.queue_ms_max = max(st.queue_ms_max, queue_ms)
+            st.delivery_ms_total += delivery_ms
+            st.delivery_ms_max = max(st.delivery_ms_max, delivery_ms)
+
+    # ---- submission ----
+    def submit(self, kind: str, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        fut: Future = Future()
+        if not self.running:
+            # Not started (or stopped): deliver inline so callers never hang.
+            job = _Job(kind, fn, args, kwargs, fut)
+            started = time.perf_counter()
+            try:
+                fut.set_result(fn(*args, **kwargs))
+                self._record(job, started)
+            except BaseException as exc:
+                self._record(job, started, exc=exc)
+                fut.set_exception(exc)
+            return fut
+        self._q.put(_Job(kind, fn, args, kwargs, fut))
+        return fut
+
+    def click(self, x: int, y: int, **kwargs: Any) -> Future:
+        return self.submit("click", self.ctrl.click, x, y, **kwargs)
+
+    def click_xyxy_center(
+        self,
+        xyxy: XYXY,
+        *,
+        clicks: int = 1,
+        jitter: Optional[int] = None,
+        percentage_offset: float = 0.20,
+        **kwargs: Any,
+    ) -> Future:
+        if jitter is None:
+            jitter = calculate_jitter(xyxy, percentage_offset=percentage_offset)
+        sx, sy = self.ctrl.center_from_xyxy(xyxy)
+        return self.submit(
+            "click", self.ctrl.click, sx, sy, clicks=clicks, jitter=jitter, **kwargs
+        )
+
+    def move_to(self, x: int, y: int, **kwargs: Any) -> Future:
+        return self.submit("move", self.ctrl.move_to, x, y, **kwargs)
+
+    def scroll(self, delta_or_xyxy: Any, **kwargs: Any) -> Future:
+        return self.submit("scroll", self.ctrl.scroll, delta_or_xyxy, **kwargs)
+
+    def hold(self, x: int, y: int, seconds: float, **kwargs: Any) -> Future:
+        return self.submit("hold", self.ctrl.hold, x, y, seconds, **kwargs)
+
+    # ---- sync points ----
+    @property
+    def pending(self) -> int:
+        return self._q.unfinished_tasks
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every queued action was delivered.
+
+        False on timeout, or when an action failed since the previous join
+        (the error is then available from `last_error`).
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._q.unfinished_tasks:
+            if not self.running:
+                return False
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(0.005)
+        with self._stats_lock:
+            failure, self._failure = self._failure, None
+        if failure is not None:
+            self.last_error = failure
+            return False
+        return True
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        with self._stats_lock:
+            return {k: v.as_dict() for k, v in self._stats.items()}
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from PIL import Image
+
+from core.controllers.static_image import StaticImageController
+from core.types import XYXY
+from core.utils.logger import logger_uma
+from core.utils.session_recorder import SessionLog
+
+
+class ReplayController(StaticImageController):
+    """
+    Play a recorded session (see core/utils/session_recorder.py) back into an agent.
+
+    Frames are grouped into segments delimited by the recorded inputs. Within a
+    segment, each screenshot() returns the next recorded frame and then holds the
+    last one, so an agent that polls more or less often than during recording
+    still sees the same screens. An input action jumps to the frames recorded
+    after the corresponding input; a different action kind than recorded is
+    counted as a divergence.
+
+    When the agent asks for a frame past the end of the log, `on_exhausted` is
+    called once (e.g. to request an abort) and the last frame keeps being served.
+    """
+
+    def __init__(
+        self,
+        session: Union[SessionLog, str, Path],
+        *,
+        on_exhausted: Optional[Callable[[], None]] = None,
+    ) -> None:
+        self.session = session if isinstance(session, SessionLog) else SessionLog(session)
+        self.on_exhausted = on_exhausted
+
+        self._segments: List[List[Dict[str, Any]]] = [[]]
+        self._expected: List[Dict[str, Any]] = []
+        for ev in self.session.events:
+            if ev["ev"] == "frame":
+                self._segments[-1].append(ev)
+            elif ev["ev"] == "input":
+                self._expected.append(ev)
+                self._segments.append([])
+        first = next((seg[0] for seg in self._segments if seg), None)
+        if first is None:
+            raise ValueError(f"Session {self.session.dir} has no frames")
+
+        super().__init__(self.session.frame(first["id"]))
+        self._seg = 0
+        self._pos = 0
+
+        # Diagnostics
+        self.frames_served = 0
+        self.inputs: List[Tuple[str, tuple]] = []
+        self.divergences = 0
+        self.exhausted = False
+
+    # ---- frames ----
+    def screenshot(self, region=None) -> Image.Image:
+        seg = self._segments[self._seg]
+        if self._pos < len(seg):
+            ev = seg[self._pos]
+            self._pos += 1
+        else:
+            if self._seg >= len(self._segments) - 1:
+                self._mark_exhausted()
+            if not seg:
+                return self._img
+            ev = seg[-1]
+
+        img = self.session.frame(ev["id"])
+        img.info["session_frame"] = ev["id"]
+        self._img = img
+        self._last_origin = tuple(ev.get("origin") or (0, 0))
+        self._last_bbox = tuple(ev.get("bbox") or (0, 0, img.width, img.height))
+        self.frames_served += 1
+        return img
+
+    def _mark_exhausted(self) -> None:
+        if self.exhausted:
+            return
+        self.exhausted = True
+        logger_uma.info(
+            "[replay] end of session: %d frames served, %d inputs, %d divergences",
+            self.frames_served,
+            len(self.inputs),
+            self.divergences,
+        )
+        if self.on_exhausted is not None:
+            self.on_exhausted()
+
+    # ---- inputs ----
+    def _advance(self, kind: str, args: tuple) -> None:
+        self.inputs.append((kind, args))
+        expected = self._expected[self._seg] if self._seg < len(self._expected) else None
+        if expected is None or expected.get("kind") != kind:
+            self.divergences += 1
+            logger_uma.debug(
+                "[replay] input #%d: got %s, recorded %s",
+                len(self.inputs),
+                kind,
+                expected.get("kind") if expected else None,
+            )
+        if self._seg < len(self._segments) - 1:
+            self._seg += 1
+            self._pos = 0
+        else:
+            self._mark_exhausted()
+
+    def focus(self) -> bool:
+        return True
+
+    def resolution(self) -> Tuple[int, int]:
+        return self._img.width, self._img.height
+
+    def move_to(self, x: int, y: int, duration: float = 0.15) -> None:
+        return None
+
+    def click(self, x: int, y: int, **kwargs: Any) -> None:
+        self._advance("click", (x, y))
+
+    def mouse_down(self, x: int, y: int, **kwargs: Any) -> None:
+        self._advance("mouse_down", (x, y))
+
+    def mouse_up(self, x: int, y: int, **kwargs: Any) -> None:
+        self._advance("mouse_up", (x, y))
+
+    def hold(self, x: int, y: int, seconds: float, **kwargs: Any) -> None:
+        self._advance("hold", (x, y, seconds))
+
+    def scroll(self, delta_or_xyxy: Union[int, XYXY], **kwargs: Any) -> None:
+        self._advance("scroll", (delta_or_xyxy,))
+
@@ -0,0 +1,291 @@
+from __future__ import annotations
+
+import socket
+import subprocess
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Optional, Tuple
+
+import numpy as np
+
+from core.utils.logger import logger_uma
+
+DEVICE_SERVER_PATH = "/data/local/tmp/scrcpy-server.jar"
+
+
+def _import_av():
+    try:
+        import av  # type: ignore
+    except Exception as exc:  # pragma: no cover - optional dependency
+        raise RuntimeError(
+            "Streaming capture requires PyAV (pip install av)."
+        ) from exc
+    return av
+
+
+class H264StreamDecoder:
+    """
+    Decode an Annex-B H.264 byte stream on a background thread and keep only
+    the newest frame (RGB uint8). `read(n)` is any blocking byte source: a
+    device socket's `recv`, or a recorded `.h264` file's `read` for offline use.
+    `on_stop` should unblock a pending `read` (close/shutdown the source).
+    """
+
+    def __init__(
+        self,
+        read: Callable[[int], bytes],
+        *,
+        on_stop: Optional[Callable[[], None]] = None,
+        chunk_size: int = 1 << 16,
+        name: str = "h264-decoder",
+    ) -> None:
+        self._read = read
+        self._on_stop = on_stop
+        self._chunk_size = int(chunk_size)
+        self._name = name
+
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._cond = threading.Condition()
+        self._frame: Optional[np.ndarray] = None
+        self._frame_ts: float = 0.0
+        self._seq = 0
+
+        # Diagnostics
+        self.bytes_read = 0
+        self.error: Optional[BaseException] = None
+
+    @classmethod
+    def from_file(cls, path: str | Path, **kwargs) -> "H264StreamDecoder":
+        fh = open(path, "rb")
+        return cls(fh.read, on_stop=fh.close, **kwargs)
+
+    # ---- lifecycle ----
+    @property
+    def alive(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def frames_decoded(self) -> int:
+        return self._seq
+
+    def start(self) -> "H264StreamDecoder":
+        if self.alive:
+            return self
+        _import_av()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, timeout: float = 2.0) -> None:
+        self._stop.set()
+        if self._on_stop is not None:
+            try:
+                self._on_stop()
+            except Exception:
+                pass
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+        with self._cond:
+            self._cond.notify_all()
+
+    def _run(self) -> None:
+        av = _import_av()
+        codec = av.CodecContext.create("h264", "r")
+        try:
+            while not self._stop.is_set():
+                chunk = self._read(self._chunk_size)
+                if not chunk:
+                    break
+                self.bytes_read += len(chunk)
+                for packet in codec.parse(chunk):
+                    self._decode(codec, packet)
+            # flush parser/decoder at end of stream
+            for packet in codec.parse(b""):
+                self._decode(codec, packet)
+            self._decode(codec, None)
+        except Exception as exc:
+            if not self._stop.is_set():
+                self.error = exc
+                logger_uma.warning("[stream] H.264 decoder stopped: %s", exc)
+        finally:
+            with self._cond:
+                self._cond.notify_all()
+
+    def _decode(self, codec, packet) -> None:
+        try:
+            frames = codec.decode(packet)
+        except Exception as exc:  # corrupt packet: skip, keep the last good frame
+            logger_uma.debug("[stream] decode error: %s", exc)
+            return
+        for frame in frames:
+            rgb = frame.to_ndarray(format="rgb24")
+            with self._cond:
+                self._frame = rgb
+                self._frame_ts = time.time()
+                self._seq += 1
+                self._cond.notify_all()
+
+    # ---- frame access ----
+    def latest(self) -> Optional[Tuple[np.ndarray, float, int]]:
+        """(rgb, decode timestamp, sequence number) of the newest frame, or None."""
+        with self._cond:
+            if self._frame is None:
+                return None
+            return self._frame, self._frame_ts, self._seq
+
+    def wait_frame(self, timeout: float, *, after_seq: int = 0) -> bool:
+        """Block until a frame newer than `after_seq` exists or `timeout` elapses."""
+        deadline = time.monotonic() + max(0.0, timeout)
+        with self._cond:
+            while self._seq <= after_seq:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self.alive:
+                    break
+                self._cond.wait(remaining)
+            return self._seq > after_seq
+
+
+class ScrcpyServerStream:
+    """
+    Push scrcpy-server to the device, start it in raw H.264 mode over a forwarded
+    socket and decode the stream in the background. Video only: scrcpy's control
+    channel is disabled, input keeps going through ADB.
+
+    Frames are encoded at the device's native resolution so detections stay in
+    the same coordinate space as `adb shell input`.
+    """
+
+    def __init__(
+        self,
+        adb_command: Callable[..., subprocess.CompletedProcess],
+        device: Optional[str],
+        *,
+        server_path: str | Path,
+        server_version: str,
+        port: int = 27183,
+        max_fps: int = 30,
+        bit_rate: int = 8_000_000,
+        connect_timeout: float = 5.0,
+    ) -> None:
+        self._adb_command = adb_command
+        self.device = device
+        self.server_path = Path(server_path)
+        self.server_version = str(server_version)
+        self.port = int(port)
+        self.max_fps = int(max_fps)
+        self.bit_rate = int(bit_rate)
+        self.connect_timeout = float(connect_timeout)
+
+        self._server: Optional[subprocess.Popen] = None
+        self._sock: Optional[socket.socket] = None
+        self.decoder: Optional[H264StreamDecoder] = None
+
+    @property
+    def alive(self) -> bool:
+        return self.decoder is not None and self.decoder.alive
+
+    def start(self) -> None:
+        if self.alive:
+            return
+        self.stop()
+        if not self.server_path.exists():
+            raise RuntimeError(f"scrcpy-server not found at {self.server_path}")
+        _import_av()
+
+        self._adb_command("push", str(self.server_path), DEVICE_SERVER_PATH)
+        self._adb_command("forward", f"tcp:{self.port}", "localabstract:scrcpy")
+
+        cmd = ["adb"]
+        if self.device:
+            cmd.extend(["-s", self.device])
+        cmd.extend(
+            [
+                "shell",
+                f"CLASSPATH={DEVICE_SERVER_PATH}",
+                "app_process",
+                "/",
+                "com.genymobile.scrcpy.Server",
+                self.server_version,
+                "tunnel_forward=true",
+                "audio=false",
+                "control=false",
+                "raw_stream=true",
+                "max_size=0",
+                f"max_fps={self.max_fps}",
+                f"video_bit_rate={self.bit_rate}",
+            ]
+        )
+        self._server = subprocess.Popen(
+            cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+
+        sock = self._connect()
+        self._sock = sock
+
+        def _shutdown() -> None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            sock.close()
+
+        self.decoder = H264StreamDecoder(
+            sock.recv, on_stop=_shutdown, name="scrcpy-decoder"
+        ).start()
+        logger_uma.info(
+            "[stream] scrcpy-server %s streaming from %s on tcp:%d",
+            self.server_version,
+            self.device or "default device",
+            self.port,
+        )
+
+    def _connect(self) -> socket.socket:
+        # adb accepts the forwarded connection before the server listens; an
+        # immediate EOF means "not ready yet", so retry until the first byte.
+        deadline = time.monotonic() + self.connect_timeout
+        last_exc: Optional[BaseException] = None
+        while time.monotonic() < deadline:
+            sock: Optional[socket.socket] = None
+            try:
+                remaining = max(0.1, deadline - time.monotonic())
+                sock = socket.create_connection(("127.0.0.1", self.port), timeout=remaining)
+                if sock.recv(1, socket.MSG_PEEK):
+                    sock.settimeout(None)
+                    return sock
+            except OSError as exc:
+                last_exc = exc
+            if sock is not None:
+                sock.close()
+            time.sleep(0.1)
+        self.stop()
+        raise RuntimeError(f"scrcpy-server did not start streaming: {last_exc}")
+
+    def stop(self) -> None:
+        if self.decoder is not None:
+            self.decoder.stop()
+        elif self._sock is not None:
+            self._sock.close()
+        server, self._server = self._server, None
+        self.decoder = None
+        self._sock = None
+        if server is None:
+            return
+        try:
+            server.kill()
+        except Exception:
+            pass
+        try:
+            self._adb_command("forward", "--remove", f"tcp:{self.port}")
+        except Exception:
+            pass
+
+    def latest(self, wait_s: float = 0.0) -> Optional[Tuple[np.ndarray, float, int]]:
+        """Newest decoded frame; optionally wait up to `wait_s` for the first one."""
+        if self.decoder is None:
+            return None
+        if wait_s > 0 and self.decoder.frames_decoded == 0:
+            self.decoder.wait_frame(wait_s)
+        return self.decoder.latest()
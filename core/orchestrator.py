@@ -0,0 +1,139 @@
+# core/orchestrator.py
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+from core.controllers.base import IController
+from core.perception.hub import PerceptionHub
+from core.perception.ocr.interface import OCRInterface
+from core.perception.yolo.interface import IDetector
+from core.utils.abort import request_abort
+from core.utils.logger import logger_uma
+
+# (ctrl, ocr, yolo_engine) -> agent exposing run(**run_kwargs)
+AgentFactory = Callable[[IController, OCRInterface, IDetector], Any]
+
+
+@dataclass
+class DeviceSlot:
+    device: str
+    ctrl: IController
+    agent: Any = None
+    thread: Optional[threading.Thread] = None
+    started_at: float = 0.0
+    finished_at: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def alive(self) -> bool:
+        return self.thread is not None and self.thread.is_alive()
+
+
+class MultiDeviceOrchestrator:
+    """
+    Run one agent per device in a single process, all sharing one OCR/YOLO
+    stack through a PerceptionHub.
+
+    Controllers are owned per device (capture and input never cross devices);
+    only model calls are funneled through the hub. Each agent runs on its own
+    thread; a crash on one device does not stop the others.
+    """
+
+    def __init__(
+        self,
+        ctrls: Dict[str, IController],
+        ocr: OCRInterface,
+        yolo_engine: IDetector,
+        agent_factory: AgentFactory,
+        *,
+        run_kwargs: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        self.hub = PerceptionHub(ocr, yolo_engine)
+        self.agent_factory = agent_factory
+        self.run_kwargs = dict(run_kwargs or {})
+        self.slots: Dict[str, DeviceSlot] = {
+            device: DeviceSlot(device, ctrl) for device, ctrl in ctrls.items()
+        }
+
+    def start(self) -> None:
+        self.hub.start()
+        for slot in self.slots.values():
+            ocr = self.hub.ocr_for(slot.device)
+            yolo_engine = self.hub.detector_for(slot.device, slot.ctrl)
+            slot.agent = self.agent_factory(slot.ctrl, ocr, yolo_engine)
+            slot.thread = threading.Thread(
+                target=self._run_slot, args=(slot,), name=f"agent-{slot.device}", daemon=True
+            )
+            slot.started_at = time.time()
+            slot.thread.start()
+        logger_uma.info("[ORCH] Started %d device(s): %s", len(self.slots), ", ".join(self.slots))
+
+    def _run_slot(self, slot: DeviceSlot) -> None:
+        try:
+            slot.agent.run(**self.run_kwargs)
+        except Exception as e:
+            slot.error = str(e)
+            logger_uma.exception("[ORCH] %s crashed: %s", slot.device, e)
+        finally:
+            slot.finished_at = time.time()
+            logger_uma.info("[ORCH] %s finished.", slot.device)
+
+    @property
+    def running(self) -> bool:
+        return any(slot.alive for slot in self.slots.values())
+
+    def stop(self) -> None:
+        logger_uma.info("[ORCH] Stopping all devices…")
+        request_abort()
+        for slot in self.slots.values():
+            if slot.agent is None:
+                continue
+            slot.agent.is_running = False
+            try:
+                slot.agent.emergency_stop()
+            except Exception:
+                pass
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """Wait for every agent thread; returns True when all have exited."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for slot in self.slots.values():
+            if slot.thread is None:
+                continue
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            slot.thread.join(timeout=remaining)
+        done = not self.running
+        if done:
+            self.hub.stop()
+        return done
+
+    def stats(self) -> Dict[str, Any]:
+        hub = self.hub.stats()
+        now = time.time()
+        for device, slot in self.slots.items():
+            st = hub["devices"].setdefault(device, {})
+            end = slot.finished_at or now
+            st["alive"] = slot.alive
+            st["uptime_s"] = (end - slot.started_at) if slot.started_at else 0.0
+            st["error"] = slot.error
+        return hub
+
+    def log_stats(self) -> None:
+        st = self.stats()
+        logger_uma.info("[ORCH] fairness=%.3f", st["fairness"])
+        for device, d in st["devices"].items():
+            logger_uma.info(
+                "[ORCH] %s: %d requests (%d errors, %d pending), wait avg %.1fms p95 %.1fms, "
+                "service avg %.1fms, alive=%s",
+                device,
+                d.get("requests", 0),
+                d.get("errors", 0),
+                d.get("pending", 0),
+                d.get("wait_ms_avg", 0.0),
+                d.get("wait_ms_p95", 0.0),
+                d.get("service_ms_avg", 0.0),
+                d["alive"],
+            )
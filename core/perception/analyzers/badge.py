@@ -1,11 +1,11 @@
 from typing import Tuple
 
-import cv2
 import numpy as np
 from PIL import Image
 
 from core.perception.ocr.interface import OCRInterface
 from core.types import XYXY
+from core.utils.frame import as_frame
 from core.utils.geometry import crop_pil
 from core.utils.text import fuzzy_ratio
 
@@ -30,11 +30,10 @@ def _badge_label_by_ocr(
 def _badge_label_by_color(img: Image.Image, xyxy: XYXY) -> Tuple[str, float]:
     """Color fallback using hue medians on colored pixels."""
     x1, y1, x2, y2 = map(int, xyxy)
-    crop = np.array(img.crop((x1, y1, x2, y2)))
+    crop = as_frame(img).crop((x1, y1, x2, y2))
     if crop.size == 0:
         return "UNK", 0.0
-    bgr = cv2.cvtColor(crop, cv2.COLOR_RGB2BGR)
-    hsv = cv2.cvtColor(bgr, cv2.COLOR_BGR2HSV)
+    hsv = crop.hsv
     H, S, V = hsv[..., 0], hsv[..., 1], hsv[..., 2]
     colored = (S >= 80) & (V >= 80)
     if not np.any(colored):
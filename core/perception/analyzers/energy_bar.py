@@ -1,14 +1,16 @@
 # core/perception/analyzers/energy_bar.py
 from __future__ import annotations
 
-from typing import Dict
+from typing import Dict, Union
 
 import cv2
 import numpy as np
 from PIL import Image
 
+from core.utils.frame import Frame, as_frame
 
-def energy_from_bar_crop(pil_img: Image.Image) -> Dict[str, object]:
+
+def energy_from_bar_crop(pil_img: Union[Image.Image, Frame]) -> Dict[str, object]:
     """
     Estimate energy fill from a cropped 'ui_energy' bar *including* the white inner ring.
     Automatically locates the bar's interior (colored+gray) and computes the fill ratio.
@@ -24,8 +26,8 @@ def energy_from_bar_crop(pil_img: Image.Image) -> Dict[str, object]:
         cut_x:        int
         inner_shape:  (W,H)
     """
-    bgr = cv2.cvtColor(np.array(pil_img), cv2.COLOR_RGB2BGR)
-    H, W = bgr.shape[:2]
+    bar = as_frame(pil_img)
+    H, W = bar.shape[:2]
     if H < 10 or W < 20:
         return {
             "energy_ratio": 0.0,
@@ -39,7 +41,7 @@ def energy_from_bar_crop(pil_img: Image.Image) -> Dict[str, object]:
     # 1) Trim top/bottom white rings only
     pad_y = max(2, int(round(0.18 * H)))
     y1, y2 = pad_y, H - pad_y
-    inner = bgr[y1:y2, :]
+    inner = bar.crop((0, y1, W, y2))
     if inner.size == 0:
         return {
             "energy_ratio": 0.0,
@@ -51,7 +53,7 @@ def energy_from_bar_crop(pil_img: Image.Image) -> Dict[str, object]:
         }
 
     # 2) HSV masks
-    hsv = cv2.cvtColor(inner, cv2.COLOR_BGR2HSV)
+    hsv = inner.hsv
     S, V = hsv[..., 1], hsv[..., 2]
     colored_mask = (S >= 70) & (V >= 60)  # blue→green→yellow gradient
     grayish_mask = (S <= 60) & (V >= 70) & (V <= 200)
@@ -1,10 +1,12 @@
 # -*- coding: utf-8 -*-
 from dataclasses import dataclass
-from typing import Tuple, Dict, Optional
+from typing import Tuple, Dict, Optional, Union
 import os
 import cv2
 import numpy as np
 
+from core.utils.frame import Frame, as_frame
+
 
 @dataclass
 class FBAConfig:
@@ -159,13 +161,14 @@ class FriendshipBarAnalyzer:
     # -----------------------------
     # Public API
     # -----------------------------
-    def analyze(self, card_bgr: np.ndarray) -> Dict:
+    def analyze(self, card_bgr: Union[np.ndarray, Frame]) -> Dict:
+        card = as_frame(card_bgr)
         # 1) ROI & bar strip localization (pure geometry, no contours)
-        x1r, y1r, x2r, y2r = self._bottom_roi_xyxy(card_bgr)
+        x1r, y1r, x2r, y2r = self._bottom_roi_xyxy(card)
         bx1, by1, bx2, by2 = self._bar_strip_xyxy((x1r, y1r, x2r, y2r))
 
-        roi = card_bgr[y1r:y2r, x1r:x2r]
-        bar = card_bgr[by1:by2, bx1:bx2]
+        roi = card.crop((x1r, y1r, x2r, y2r))
+        bar = card.crop((bx1, by1, bx2, by2))
         if roi.size == 0 or bar.size == 0:
             return {
                 "roi_xyxy": (x1r, y1r, x2r, y2r),
@@ -179,7 +182,7 @@ class FriendshipBarAnalyzer:
 
         # small safety: drop the right gray cap from evaluation
         drop_cols = int(self.cfg.cap_ignore_frac * bar.shape[1])
-        hsv = self._to_hsv(bar)
+        hsv = bar.hsv
         _, S, V = hsv[..., 0], hsv[..., 1], hsv[..., 2]
 
         # 2) voting for dominant color (blue/green/orange/yellow)
@@ -243,7 +246,7 @@ class FriendshipBarAnalyzer:
             },
         }
 
-    def analyze_strip(self, bar_bgr: np.ndarray) -> Dict:
+    def analyze_strip(self, bar_bgr: Union[np.ndarray, Frame]) -> Dict:
         if bar_bgr is None or bar_bgr.size == 0:
             return {
                 "progress_pct": 0,
@@ -254,7 +257,7 @@ class FriendshipBarAnalyzer:
             }
 
         cfg = self.cfg
-        hsv = self._to_hsv(bar_bgr)
+        hsv = as_frame(bar_bgr).hsv
 
         # small safety: drop right “cap”
         drop_cols = int(cfg.cap_ignore_frac * bar_bgr.shape[1])
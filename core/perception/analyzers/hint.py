@@ -1,9 +1,11 @@
 # -*- coding: utf-8 -*-
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Sequence, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 import numpy as np
 import cv2
 
+from core.utils.frame import Frame, as_frame
+
 
 @dataclass
 class HintConfig:
@@ -73,12 +75,13 @@ class HintDetector:
         m = cv2.morphologyEx(m, cv2.MORPH_CLOSE, ker)
         return m
 
-    def analyze(self, card_bgr: np.ndarray) -> Dict:
+    def analyze(self, card_bgr: Union[np.ndarray, Frame]) -> Dict:
         cfg = self.cfg
+        card = as_frame(card_bgr)
 
         # 1) crop ROI
-        rx1, ry1, rx2, ry2 = self._roi_xyxy(card_bgr)
-        roi = card_bgr[ry1:ry2, rx1:rx2]
+        rx1, ry1, rx2, ry2 = self._roi_xyxy(card)
+        roi = card.crop((rx1, ry1, rx2, ry2))
         Hroi, Wroi = roi.shape[:2]
         area_roi = float(max(1, Hroi * Wroi))
 
@@ -92,7 +95,7 @@ class HintDetector:
                 "purity": 0.0,
             }
 
-        hsv = self._to_hsv(roi)
+        hsv = roi.hsv
         h, s, v = hsv[..., 0], hsv[..., 1], hsv[..., 2]
 
         # 2) strict + wide pink masks
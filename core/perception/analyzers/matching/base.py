@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
 # OpenCV is optional for remote-only clients. Guard runtime access so module import works without it.
 try:  # pragma: no cover - exercised indirectly
@@ -12,6 +12,7 @@ import numpy as np
 from PIL import Image
 from imagehash import hex_to_hash, phash
 
+from core.utils.frame import Frame, as_frame
 from core.utils.img import to_bgr
 from core.utils.logger import logger_uma
 
@@ -218,7 +219,7 @@ class TemplateMatcherBase:
             return None
 
     def _prepare_region(self, region_bgr: np.ndarray) -> RegionFeatures:
-        cv2 = _require_cv2()
+        _require_cv2()
         # Ensure canonical BGR regardless of source (RGB/BGRA/PIL)
         region_bgr = to_bgr(region_bgr)
         region_bgr = np.ascontiguousarray(region_bgr)
@@ -227,18 +228,19 @@ class TemplateMatcherBase:
         if self.use_portrait_masking:
             region_bgr = self._gray_world_white_balance(region_bgr)
 
-        reg_gray, reg_edges = self.prepare_gray_edges(region_bgr)
+        # gray/HSV/RGB views are each converted once and shared below
+        region = Frame(region_bgr)
+        reg_gray, reg_edges = self.prepare_gray_edges(region)
         
         # Apply hair-focused mask for histogram if portrait mode enabled
         reg_mask = None
         if self.use_portrait_masking:
-            reg_hsv = cv2.cvtColor(region_bgr, cv2.COLOR_BGR2HSV)
-            reg_mask = self._portrait_hair_mask(reg_hsv)
+            reg_mask = self._portrait_hair_mask(region.hsv)
         
-        reg_hist = self._histogram(region_bgr, mask=reg_mask)
+        reg_hist = self._histogram(region, mask=reg_mask)
 
         # Perceptual hash over normalized BGR region
-        reg_hash = phash(Image.fromarray(cv2.cvtColor(region_bgr, cv2.COLOR_BGR2RGB)))
+        reg_hash = phash(region.pil)
         h, w = region_bgr.shape[:2]
         return RegionFeatures(
             bgr=region_bgr,
@@ -369,11 +371,11 @@ class TemplateMatcherBase:
             return 0.0
 
     @staticmethod
-    def prepare_gray_edges(img_bgr: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    def prepare_gray_edges(img_bgr: Union[np.ndarray, Frame]) -> Tuple[np.ndarray, np.ndarray]:
         cv2 = _require_cv2()
         if img_bgr is None or img_bgr.size == 0:
             return np.zeros((1, 1), dtype=np.uint8), np.zeros((1, 1), dtype=np.uint8)
-        gray = cv2.cvtColor(img_bgr, cv2.COLOR_BGR2GRAY)
+        gray = as_frame(img_bgr).gray
         gray = cv2.GaussianBlur(gray, (3, 3), 0)
         gray_array = np.asarray(gray, dtype=np.uint8)
         v = np.median(gray_array)
@@ -384,9 +386,9 @@ class TemplateMatcherBase:
 
 
     @staticmethod
-    def _histogram(bgr: np.ndarray, mask: Optional[np.ndarray] = None) -> np.ndarray:
+    def _histogram(bgr: Union[np.ndarray, Frame], mask: Optional[np.ndarray] = None) -> np.ndarray:
         cv2 = _require_cv2()
-        hsv = cv2.cvtColor(bgr, cv2.COLOR_BGR2HSV)
+        hsv = as_frame(bgr).hsv
         # 2D histogram on H and S; mask restricts to portrait when available
         # Use 32x32 bins for robustness (vs 180x256 high resolution)
         hist = cv2.calcHist([hsv], [0, 1], mask, [32, 32], [0, 180, 0, 256])
@@ -3,12 +3,12 @@ from __future__ import annotations
 
 from typing import Dict, Tuple
 
-import cv2
 import numpy as np
 from PIL import Image
 
 from core.perception.ocr.interface import OCRInterface
 from core.types import XYXY
+from core.utils.frame import as_frame
 from core.utils.geometry import crop_pil
 from core.utils.text import fuzzy_ratio
 
@@ -51,12 +51,11 @@ def _robust_hue_from_crop(img: Image.Image, xyxy: XYXY) -> Tuple[float, float]:
     Uses a forgiving saturation/value mask to handle AWFUL (low-S purple) as well.
     """
     x1, y1, x2, y2 = map(int, xyxy)
-    crop = np.array(img.crop((x1, y1, x2, y2)))
+    crop = as_frame(img).crop((x1, y1, x2, y2))
     if crop.size == 0:
         return -1.0, 0.0
 
-    bgr = cv2.cvtColor(crop, cv2.COLOR_RGB2BGR)
-    hsv = cv2.cvtColor(bgr, cv2.COLOR_BGR2HSV)
+    hsv = crop.hsv
     H, S, V = hsv[..., 0].astype(np.float32), hsv[..., 1], hsv[..., 2]
 
     # Primary mask: colorful & bright enough
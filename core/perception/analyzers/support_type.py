@@ -1,10 +1,12 @@
 import os
-from typing import Dict, Tuple, Optional
+from typing import Dict, Tuple, Optional, Union
 from dataclasses import dataclass
 
 import cv2
 import numpy as np
 
+from core.utils.frame import Frame, as_frame
+
 
 # ---------- small helpers ----------
 def _to_hsv(bgr: np.ndarray) -> np.ndarray:
@@ -124,8 +126,8 @@ class FixedRoiTypeClassifier:
         return x1, y1, x2, y2
 
     # ----- nearest-by-hue among *templates* (soft fallback) -----
-    def _fallback_from_hue(self, roi_bgr: np.ndarray) -> Optional[str]:
-        hsv = _to_hsv(roi_bgr)
+    def _fallback_from_hue(self, roi_bgr: Union[np.ndarray, Frame]) -> Optional[str]:
+        hsv = as_frame(roi_bgr).hsv
         cmask = _color_mask(hsv, s_min=70, v_min=90)
         if cv2.countNonZero(cmask) == 0:
             return None
@@ -141,7 +143,7 @@ class FixedRoiTypeClassifier:
                 bestd, bestk = d, k
         return bestk
 
-    def classify(self, card_bgr: np.ndarray) -> Dict:
+    def classify(self, card_bgr: Union[np.ndarray, Frame]) -> Dict:
         """
         Color-only support-type classifier with robust STA vs GUTS disambiguation.
 
@@ -155,8 +157,9 @@ class FixedRoiTypeClassifier:
         5) Confidence combines hue distance to the reference center and coverage.
         """
         # ---------- ROI ----------
-        x1, y1, x2, y2 = self._fixed_roi(card_bgr)
-        roi = card_bgr[y1:y2, x1:x2]
+        card = as_frame(card_bgr)
+        x1, y1, x2, y2 = self._fixed_roi(card)
+        roi = card.crop((x1, y1, x2, y2))
         if roi.size == 0:
             return {
                 "type": "unknown",
@@ -167,7 +170,7 @@ class FixedRoiTypeClassifier:
             }
 
         # ---------- HSV + colored mask ----------
-        hsv = _to_hsv(roi)
+        hsv = roi.hsv
         Hh, Ss, Vv = hsv[..., 0], hsv[..., 1], hsv[..., 2]
         colored = (Ss >= 70) & (Vv >= 80)  # keep badge background, drop white glyph
         n_colored = int(colored.sum())
@@ -231,7 +234,7 @@ class FixedRoiTypeClassifier:
             cov["STA"] > 0 and abs(cov["STA"] - cov["GUTS"]) < close_margin
         ):
             # compute Lab 'b' for colored pixels (OpenCV Lab has b∈[0..255], 128 neutral)
-            lab = cv2.cvtColor(roi, cv2.COLOR_BGR2LAB)
+            lab = roi.lab
             b_chan = lab[..., 2]
             if n_colored > 0:
                 mean_b = float(b_chan[colored].mean())
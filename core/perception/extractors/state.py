@@ -6,6 +6,7 @@ from typing import Dict, List, Optional, Tuple, Literal, overload
 from PIL import Image
 
 from core.perception.analyzers.mood import mood_label
+from core.perception.glyph_digits import read_number
 from core.perception.ocr.interface import OCRInterface
 from core.perception.analyzers.energy_bar import energy_from_bar_crop
 from core.settings import Settings
@@ -19,6 +20,7 @@ from core.constants import (
     CLASS_UI_GOAL,
     CLASS_LOBBY_INFIRMARY,
 )
+from core.utils.frame import as_frame
 from core.utils.geometry import crop_pil, xyxy_int
 from core.utils.logger import logger_uma
 from core.perception.is_button_active import ActiveButtonClassifier
@@ -126,6 +128,10 @@ def extract_turns(
 
     turns_img = crop_pil(game_img, (x1, y1, x2, y2), pad=0)
 
+    glyph_val = read_number(turns_img, lo=1, hi=30, field="turns")
+    if glyph_val is not None:
+        return glyph_val
+
     # First, try raw (fast path)
     turns_left = ocr.digits(turns_img)
     if 1 <= turns_left <= 30:
@@ -265,29 +271,74 @@ def extract_career_date(
 # ------------------------------
 # Stats (SPD/STA/PWR/GUTS/WIT)
 # ------------------------------
-def _parse_stat_segment(ocr: OCRInterface, seg_img: Image.Image) -> int:
+def stat_segments(
+    game_img: Image.Image,
+    parsed_objects_screen: List[DetectionDict],
+    *,
+    conf_min: float = 0.20,
+) -> List[Image.Image]:
+    """The five stat value crops (SPD, STA, PWR, GUTS, WIT); [] without a stats panel."""
+    d = find_best(parsed_objects_screen, CLASS_UI_STATS, conf_min=conf_min)
+    if not d:
+        return []
+
+    stats_img = crop_pil(game_img, d["xyxy"], pad=(0, 0))
+    W, H = stats_img.size
+
+    # segmentation geometry (kept as you set)
+    k = 5
+    segW = max(1, W // k)
+    y_top_offset = 0.27
+    y_bottom_offset = 0.74
+    x_left_offset = 0.45
+    x_right_offset = 0.10
+
+    def _crop_seg(i: int, last: bool) -> Image.Image:
+        x1 = int((i * segW) + segW * x_left_offset)
+        x2 = W if last else int((i + 1) * segW)
+        x2 = int(x2 + segW * x_right_offset)  # keep your extra right margin
+        return stats_img.crop((x1, int(H * y_top_offset), x2, int(H * y_bottom_offset)))
+
+    return [_crop_seg(i, last=(i == k - 1)) for i in range(k)]
+
+
+def _stat_from_loose_text(raw_loose: str) -> Optional[int]:
+    """Fast path: digits of a min_conf=0.0 read, if they form a plausible stat."""
+    digits_only = re.sub(r"[^\d]", "", raw_loose or "").strip()
+    if 1 <= len(digits_only) <= 4:
+        val_fast = int(digits_only)
+        if 90 <= val_fast <= 1200:
+            return val_fast
+        # if it's clearly out of range (e.g., 2034), fall through to salvage
+    return None
+
+
+def _read_stat_segments(ocr: OCRInterface, segs: List[Image.Image]) -> List[int]:
     """
-    Segment typically looks like `C 416 / 1200`.
-    Strategy:
-      1) Try a digits-only fast path using low confidence threshold (min_conf=0.0).
-      2) If that fails, fall back to your robust regex salvage (kept intact).
+    Stat segments typically look like `C 416 / 1200`. Read them with at most two
+    batched OCR calls (PaddleOCR batches recognition across the crops):
+      1) fast path: every segment at min_conf=0.0, stripped to digits;
+      2) robust regex salvage of a default-confidence read, only for the
+         segments the fast path rejected.
     """
-    import re
-
-    # ---- 1) fast path: keep low-confidence chars, then strip to digits ----
+    vals: List[Optional[int]] = [None] * len(segs)
     try:
-        raw_loose = ocr.text(seg_img, min_conf=0.0) or ""
-        digits_only = re.sub(r"[^\d]", "", raw_loose).strip()
-        if 1 <= len(digits_only) <= 4:
-            val_fast = int(digits_only)
-            if 90 <= val_fast <= 1200:
-                return val_fast
-            # if it's clearly out of range (e.g., 2034), fall through to salvage
-    except Exception:
-        pass
+        loose = ocr.batch_text(segs, min_conf=0.0)
+        if len(loose) == len(segs):
+            vals = [_stat_from_loose_text(t or "") for t in loose]
+    except Exception as e:
+        logger_uma.debug(f"[stats] batched fast path failed ({e})")
+
+    retry = [i for i, v in enumerate(vals) if v is None]
+    if retry:
+        raws = ocr.batch_text([segs[i] for i in retry])
+        for i, raw in zip(retry, raws):
+            vals[i] = _salvage_stat_text(raw or "")
+    return [int(v) for v in vals]  # type: ignore[arg-type]
 
-    # ---- 2) original robust salvage path (unchanged) ----
-    raw = ocr.text(seg_img) or ""
+
+def _salvage_stat_text(raw: str) -> int:
+    """Robust regex salvage of a default-confidence read (`C 416 / 1200`, OCR confusions)."""
     # Normalize and remove the capacity part (tolerant to whitespace)
     t = re.sub(r"[\s,.:;]+", "", raw)
     t = re.sub(r"/\s*1200", "", t, flags=re.IGNORECASE)
@@ -429,44 +480,30 @@ def extract_stats(
       • If the *full* input image is small (height < 900), preprocess each
         stat segment before OCR to improve low-res robustness.
       • Keeps your y/x offsets exactly as requested.
+      • Glyph templates (core.perception.glyph_digits) read each segment first;
+        only segments they can't match confidently go to OCR.
     """
-    d = find_best(parsed_objects_screen, CLASS_UI_STATS, conf_min=conf_min)
-    if not d:
-        return {"SPD": -1, "STA": -1, "PWR": -1, "GUTS": -1, "WIT": -1}
-
-    stats_img = crop_pil(game_img, d["xyxy"], pad=(0, 0))
-    W, H = stats_img.size
-
-    # segmentation geometry (kept as you set)
-    k = 5
-    segW = max(1, W // k)
     keys = ["SPD", "STA", "PWR", "GUTS", "WIT"]
-    y_top_offset = 0.27
-    y_bottom_offset = 0.74
-    x_left_offset = 0.45
-    x_right_offset = 0.10
+    segs = stat_segments(game_img, parsed_objects_screen, conf_min=conf_min)
+    if not segs:
+        return {key: -1 for key in keys}
 
     # Decide whether to run the preprocessor based on *full* image height
     full_h = game_img.size[1]
     use_pp = full_h < 900
 
-    def _crop_seg(i: int, last: bool) -> Image.Image:
-        x1 = int((i * segW) + segW * x_left_offset)
-        x2 = W if last else int((i + 1) * segW)
-        x2 = int(x2 + segW * x_right_offset)  # keep your extra right margin
-        return stats_img.crop((x1, int(H * y_top_offset), x2, int(H * y_bottom_offset)))
-
-    if with_segments:
-        out: Dict[str, Dict[str, object]] = {}
-        for i, key in enumerate(keys):
-            seg = _crop_seg(i, last=(i == k - 1))
-
+    # glyph templates first; only the segments they can't read confidently go to OCR
+    values = [read_number(seg, lo=90, hi=1200, field="stat") for seg in segs]
+    todo = [i for i, v in enumerate(values) if v is None]
+    if todo:
+        segs_for_ocr: List[Image.Image] = []
+        for i in todo:
             # Preprocess only for small full-frame captures
-            seg_for_ocr = seg
+            seg_for_ocr = segs[i]
             if use_pp:
                 try:
                     seg_for_ocr, _ = preprocess_digits(
-                        seg,
+                        segs[i],
                         scale=3,
                         drop_top_frac=0.35,
                         trim_right_frac=0.15,
@@ -477,33 +514,15 @@ def extract_stats(
                     logger_uma.debug(
                         f"[stats] preprocess_digits failed ({e}); using raw segment"
                     )
+            segs_for_ocr.append(seg_for_ocr)
+        for i, v in zip(todo, _read_stat_segments(ocr, segs_for_ocr)):
+            values[i] = v
 
-            out[key] = {"value": _parse_stat_segment(ocr, seg_for_ocr), "seg": seg}
-        return out
-
-    out2: Dict[str, int] = {}
-    for i, key in enumerate(keys):
-        seg = _crop_seg(i, last=(i == k - 1))
-
-        seg_for_ocr = seg
-        if use_pp:
-            try:
-                seg_for_ocr, _ = preprocess_digits(
-                    seg,
-                    scale=3,
-                    drop_top_frac=0.35,
-                    trim_right_frac=0.15,
-                    dilate_iters=1,
-                    focus_largest_cc=False,
-                )
-            except Exception as e:
-                logger_uma.debug(
-                    f"[stats] preprocess_digits failed ({e}); using raw segment"
-                )
-
-        out2[key] = _parse_stat_segment(ocr, seg_for_ocr)
-
-    return out2
+    if with_segments:
+        return {
+            key: {"value": val, "seg": seg} for key, val, seg in zip(keys, values, segs)
+        }
+    return dict(zip(keys, values))
 
 
 # ------------------------------
@@ -565,6 +584,10 @@ def extract_skill_points(
 
     crop = crop_pil(game_img, d["xyxy"], pad=0)
 
+    glyph_val = read_number(crop, lo=0, hi=9999, field="skill_pts")
+    if glyph_val is not None:
+        return glyph_val
+
     # Fast path
     v = ocr.digits(crop)
     if 0 <= v <= 9999:
@@ -640,8 +663,7 @@ def extract_energy_pct(
     if not d:
         return -1
 
-    e_img = crop_pil(game_img, d["xyxy"], pad=0)
-    info = energy_from_bar_crop(e_img)
+    info = energy_from_bar_crop(as_frame(game_img).crop(d["xyxy"]))
     if not info.get("valid", False):
         logger_uma.debug("energy_from_bar_crop invalid: %s", info.get("reason"))
         return -1
@@ -2,11 +2,11 @@
 from __future__ import annotations
 from typing import Dict, List, Optional, Tuple
 
-import cv2
-import numpy as np
 from PIL import Image
 
+from core.perception.glyph_digits import read_number
 from core.perception.ocr.interface import OCRInterface
+from core.utils.frame import as_frame
 from core.utils.logger import logger_uma
 
 
@@ -141,7 +141,7 @@ def extract_failure_pct_for_tile(
         logger_uma.debug("[failure] missing btn/stats for failure calculation")
         return -1
 
-    frame_bgr = cv2.cvtColor(np.array(left_img), cv2.COLOR_RGB2BGR)
+    frame_bgr = as_frame(left_img).bgr
 
     # band between ui_stats (bottom) and button (top), same width as button
     band_xyxy = _failure_band_xyxy(frame_bgr.shape, btn["xyxy"], stats["xyxy"])
@@ -160,6 +160,11 @@ def extract_failure_pct_for_tile(
     if Wb > 2 * cut:
         band_bgr = band_bgr[:, cut : Wb - cut]
 
+    # "Failure" caption over "N%": glyph templates read the bottom line without OCR
+    glyph_val = read_number(band_bgr, lo=0, hi=100, line="last", field="failure")
+    if glyph_val is not None:
+        return glyph_val
+
     # ---- OCR on COLOR (BGR) ----
     ocr_text_split = ocr.text(band_bgr, joiner="|").split("|")
 
@@ -0,0 +1,256 @@
+# core/perception/glyph_digits.py
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import Any, List, Optional, Sequence, Tuple, Union
+
+import cv2
+import numpy as np
+
+from core.settings import Settings
+from core.utils.img import to_bgr
+from core.utils.logger import logger_uma
+
+GLYPH = 16  # glyphs are compared as GLYPH x GLYPH masks
+MIN_MARGIN = 0.04  # best char must beat the best other char by this much
+Box = Tuple[int, int, int, int]  # x, y, w, h
+
+
+def _normalize(mask: np.ndarray) -> np.ndarray:
+    """Glyph mask -> unit-length zero-mean GLYPH x GLYPH vector (aspect ratio kept)."""
+    h, w = mask.shape[:2]
+    scale = GLYPH / max(h, w)
+    nw, nh = max(1, int(round(w * scale))), max(1, int(round(h * scale)))
+    small = cv2.resize(mask, (nw, nh), interpolation=cv2.INTER_AREA)
+    canvas = np.zeros((GLYPH, GLYPH), dtype=np.float32)
+    x0, y0 = (GLYPH - nw) // 2, (GLYPH - nh) // 2
+    canvas[y0 : y0 + nh, x0 : x0 + nw] = small
+    v = canvas.ravel()
+    v -= v.mean()
+    n = float(np.linalg.norm(v))
+    return v / n if n > 1e-6 else v
+
+
+def _merge_columns(boxes: List[Box]) -> List[Box]:
+    """Join components that share most of their columns (broken strokes, '%')."""
+    out: List[Box] = []
+    for b in sorted(boxes):
+        if out:
+            x, y, w, h = out[-1]
+            overlap = min(x + w, b[0] + b[2]) - max(x, b[0])
+            if overlap > 0.5 * min(w, b[2]):
+                x2, y2 = max(x + w, b[0] + b[2]), max(y + h, b[1] + b[3])
+                nx, ny = min(x, b[0]), min(y, b[1])
+                out[-1] = (nx, ny, x2 - nx, y2 - ny)
+                continue
+        out.append(b)
+    return out
+
+
+def _lines(boxes: List[Box]) -> List[List[Box]]:
+    """Group glyph boxes into text lines (vertical overlap), top to bottom."""
+    lines: List[List[Box]] = []
+    for b in sorted(boxes, key=lambda b: b[1] + b[3] / 2):
+        cy = b[1] + b[3] / 2
+        for line in lines:
+            top = min(g[1] for g in line)
+            bottom = max(g[1] + g[3] for g in line)
+            if top <= cy <= bottom:
+                line.append(b)
+                break
+        else:
+            lines.append([b])
+    return [sorted(line) for line in lines]
+
+
+def segment(fg: np.ndarray, *, line: str = "tallest") -> List[Box]:
+    """
+    Glyph boxes of one text line in a binary foreground mask, left to right.
+    line="tallest" reads the line with the tallest glyphs (a value above a
+    smaller caption or "/1200"), "last" the bottom one ("Failure" over "0%").
+    """
+    H, W = fg.shape[:2]
+    n, _, st, _ = cv2.connectedComponentsWithStats(fg, connectivity=8)
+    boxes: List[Box] = []
+    for i in range(1, n):
+        x, y, w, h, area = (int(v) for v in st[i])
+        if area < 4 or h < 0.2 * H:
+            continue
+        if w > 0.8 * W or (h > 0.95 * H and w > 0.5 * W):
+            continue  # background / pill frame, not a glyph
+        boxes.append((x, y, w, h))
+    lines = _lines(_merge_columns(boxes))
+    if not lines:
+        return []
+    if line == "last":
+        chosen = lines[-1]
+    else:
+        chosen = max(lines, key=lambda ln: float(np.median([b[3] for b in ln])))
+    tallest = max(b[3] for b in chosen)
+    return [b for b in chosen if b[3] >= 0.45 * tallest or b[2] >= 0.45 * tallest]
+
+
+class GlyphDigitReader:
+    """
+    Reads short numbers in the game's fixed UI font without OCR.
+
+    The crop is binarized (Otsu, both polarities), split into connected
+    components, and each glyph is matched against stored exemplar masks by
+    normalized correlation. read() returns (text, confidence): confidence is
+    the weakest glyph's correlation, or 0 when any glyph is nearly as close to
+    another character (MIN_MARGIN) or nothing was found. A whole read costs
+    well under a millisecond on field-sized crops.
+    """
+
+    def __init__(self, templates: np.ndarray, chars: Sequence[str]) -> None:
+        self.templates = np.asarray(templates, dtype=np.float32).reshape(-1, GLYPH * GLYPH)
+        self.chars = [str(c) for c in chars]
+        self._char_ids = np.array([sorted(set(self.chars)).index(c) for c in self.chars])
+        self._alphabet = sorted(set(self.chars))
+
+    # ---- building ----
+    @classmethod
+    def empty(cls) -> "GlyphDigitReader":
+        return cls(np.zeros((0, GLYPH * GLYPH), dtype=np.float32), [])
+
+    def learn(self, img: Any, text: str, *, line: str = "tallest", dedup: float = 0.97) -> bool:
+        """
+        Add the glyphs of a crop whose value is `text` (e.g. "416", "0%").
+        Returns False (and learns nothing) when the crop doesn't split into
+        exactly len(text) glyphs in either polarity.
+        """
+        text = "".join(text.split())
+        for fg, boxes in self._candidates(img, line):
+            if len(boxes) != len(text):
+                continue
+            vecs = [_normalize(fg[y : y + h, x : x + w]) for x, y, w, h in boxes]
+            for ch, v in zip(text, vecs):
+                same = [i for i, c in enumerate(self.chars) if c == ch]
+                if same and float((self.templates[same] @ v).max()) >= dedup:
+                    continue
+                self.templates = np.vstack([self.templates, v[None, :]])
+                self.chars.append(ch)
+            self._alphabet = sorted(set(self.chars))
+            self._char_ids = np.array([self._alphabet.index(c) for c in self.chars])
+            return True
+        return False
+
+    # ---- reading ----
+    def _candidates(self, img: Any, line: str) -> List[Tuple[np.ndarray, List[Box]]]:
+        bgr = to_bgr(img)
+        gray = cv2.cvtColor(bgr, cv2.COLOR_BGR2GRAY) if bgr.ndim == 3 else bgr
+        if gray.shape[0] < 24:  # tiny low-res fields: upscale so glyphs keep their holes
+            f = 24.0 / max(1, gray.shape[0])
+            gray = cv2.resize(gray, None, fx=f, fy=f, interpolation=cv2.INTER_CUBIC)
+        _, bw = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+        out = []
+        for fg in (cv2.bitwise_not(bw), bw):  # dark text first, then light text
+            out.append((fg, segment(fg, line=line)))
+        return out
+
+    def _classify(self, fg: np.ndarray, boxes: List[Box]) -> Tuple[str, float]:
+        if not boxes or not len(self.templates):
+            return "", 0.0
+        vecs = np.stack([_normalize(fg[y : y + h, x : x + w]) for x, y, w, h in boxes])
+        sims = vecs @ self.templates.T  # glyphs x exemplars
+        n_chars = len(self._alphabet)
+        per_char = np.full((len(boxes), n_chars), -1.0, dtype=np.float32)
+        for cid in range(n_chars):
+            per_char[:, cid] = sims[:, self._char_ids == cid].max(axis=1)
+        order = np.argsort(-per_char, axis=1)
+        text, conf = [], 1.0
+        for g in range(len(boxes)):
+            best = float(per_char[g, order[g, 0]])
+            second = float(per_char[g, order[g, 1]]) if n_chars > 1 else -1.0
+            text.append(self._alphabet[order[g, 0]])
+            conf = min(conf, best if best - second >= MIN_MARGIN else 0.0)
+        return "".join(text), max(0.0, conf)
+
+    def read(self, img: Any, *, line: str = "tallest") -> Tuple[str, float]:
+        best = ("", 0.0)
+        for fg, boxes in self._candidates(img, line):
+            res = self._classify(fg, boxes)
+            if res[1] > best[1]:
+                best = res
+        return best
+
+    def read_int(
+        self, img: Any, *, lo: int = 0, hi: int = 9999, line: str = "tallest"
+    ) -> Tuple[int, float]:
+        """(value, confidence); (-1, 0.0) unless the digits parse into [lo, hi]."""
+        text, conf = self.read(img, line=line)
+        digits = "".join(c for c in text if c.isdigit())
+        if not digits or conf <= 0.0:
+            return -1, 0.0
+        val = int(digits)
+        return (val, conf) if lo <= val <= hi else (-1, 0.0)
+
+    # ---- persistence ----
+    def save(self, path: Union[str, Path]) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as f:
+            np.savez_compressed(
+                f,
+                templates=self.templates.reshape(-1, GLYPH, GLYPH),
+                chars=np.array(self.chars, dtype="<U1"),
+            )
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "GlyphDigitReader":
+        with np.load(Path(path), allow_pickle=False) as data:
+            if data["templates"].shape[1:] != (GLYPH, GLYPH):
+                raise ValueError(f"{path}: glyphs are not {GLYPH}x{GLYPH}; rebuild it")
+            return cls(data["templates"], [str(c) for c in data["chars"]])
+
+
+# ---------- shared reader ----------
+_reader: Optional[GlyphDigitReader] = None
+_loaded = False
+_lock = threading.Lock()
+
+
+def glyph_reader() -> Optional[GlyphDigitReader]:
+    """The reader built from Settings.DIGIT_GLYPHS_PATH (None if disabled or missing)."""
+    global _reader, _loaded
+    if _loaded:
+        return _reader
+    with _lock:
+        if not _loaded:
+            path = Path(Settings.DIGIT_GLYPHS_PATH)
+            if Settings.DIGIT_GLYPHS and path.exists():
+                try:
+                    _reader = GlyphDigitReader.load(path)
+                    logger_uma.info(
+                        "[glyphs] loaded %d glyphs (%s) from %s",
+                        len(_reader.chars),
+                        "".join(_reader._alphabet),
+                        path,
+                    )
+                except Exception as e:
+                    logger_uma.warning("[glyphs] couldn't load %s: %s", path, e)
+            _loaded = True
+    return _reader
+
+
+def read_number(
+    img: Any, *, lo: int = 0, hi: int = 9999, line: str = "tallest", field: str = "number"
+) -> Optional[int]:
+    """
+    Value of a numeric field read from glyph templates, or None when no reader
+    is available or its confidence is below Settings.DIGIT_GLYPHS_MIN_CONF
+    (callers then fall back to OCR).
+    """
+    reader = glyph_reader()
+    if reader is None:
+        return None
+    try:
+        val, conf = reader.read_int(img, lo=lo, hi=hi, line=line)
+    except Exception as e:
+        logger_uma.debug("[glyphs] %s read failed: %s", field, e)
+        return None
+    if val < 0 or conf < Settings.DIGIT_GLYPHS_MIN_CONF:
+        logger_uma.debug("[glyphs] %s: low confidence (%d, %.2f) -> OCR", field, val, conf)
+        return None
+    return val
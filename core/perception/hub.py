@@ -0,0 +1,324 @@
+# core/perception/hub.py
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Tuple
+
+from PIL import Image
+
+from core.controllers.base import IController, RegionXYWH
+from core.controllers.capture_service import frame_meta
+from core.perception.ocr.interface import OCRInterface
+from core.perception.yolo.imgsz_profile import tuned_imgsz
+from core.perception.yolo.interface import BatchImage, IDetector
+from core.perception.yolo.roi import ROI, detect_in_roi
+from core.types import DetectionDict
+from core.utils.logger import logger_uma
+
+
+@dataclass
+class _Request:
+    device: str
+    kind: str  # "yolo" | "ocr"
+    fn: Callable[..., Any]
+    args: tuple
+    kwargs: dict
+    future: Future = field(default_factory=Future)
+    enqueued_at: float = field(default_factory=time.perf_counter)
+
+
+@dataclass
+class _DeviceStats:
+    requests: int = 0
+    errors: int = 0
+    wait_ms_total: float = 0.0
+    service_ms_total: float = 0.0
+    recent_waits: Deque[float] = field(default_factory=lambda: deque(maxlen=200))
+
+    def as_dict(self) -> Dict[str, float]:
+        n = max(1, self.requests)
+        waits = sorted(self.recent_waits)
+        p95 = waits[int(0.95 * (len(waits) - 1))] if waits else 0.0
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "wait_ms_avg": self.wait_ms_total / n,
+            "wait_ms_p95": p95,
+            "service_ms_avg": self.service_ms_total / n,
+            "service_ms_total": self.service_ms_total,
+        }
+
+
+class PerceptionHub:
+    """
+    One OCR engine + one YOLO engine shared by several devices in one process.
+
+    Devices submit requests through lightweight per-device clients
+    (`detector_for` / `ocr_for`); a single worker executes them against the
+    shared models. Pending requests are kept per device and served round-robin,
+    so a chatty device cannot starve the others. Capture stays on the device's
+    own thread; only model calls go through the hub.
+    """
+
+    def __init__(self, ocr: OCRInterface, yolo_engine: IDetector) -> None:
+        self.ocr = ocr
+        self.yolo_engine = yolo_engine
+        self._queues: "OrderedDict[str, Deque[_Request]]" = OrderedDict()
+        self._cond = threading.Condition()
+        self._stop = False
+        self._rr = 0
+        self._stats: Dict[str, _DeviceStats] = {}
+        self._thread: Optional[threading.Thread] = None
+
+    # ---- lifecycle ----
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> "PerceptionHub":
+        if not self.running:
+            self._stop = False
+            self._thread = threading.Thread(
+                target=self._run, name="perception-hub", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: float = 5.0) -> None:
+        with self._cond:
+            self._stop = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+        self._thread = None
+
+    # ---- clients ----
+    def detector_for(self, device: str, ctrl: IController) -> "SharedYOLOClient":
+        self._register(device)
+        return SharedYOLOClient(self, device, ctrl)
+
+    def ocr_for(self, device: str) -> "SharedOCRClient":
+        self._register(device)
+        return SharedOCRClient(self, device)
+
+    def _register(self, device: str) -> None:
+        with self._cond:
+            self._queues.setdefault(device, deque())
+            self._stats.setdefault(device, _DeviceStats())
+
+    # ---- requests ----
+    def submit(self, device: str, kind: str, fn: Callable[..., Any], *args, **kwargs) -> Future:
+        req = _Request(device, kind, fn, args, kwargs)
+        with self._cond:
+            if self._stop or self._thread is None:
+                req.future.set_exception(RuntimeError("PerceptionHub is not running"))
+                return req.future
+            self._queues.setdefault(device, deque()).append(req)
+            self._stats.setdefault(device, _DeviceStats())
+            self._cond.notify()
+        return req.future
+
+    def call(self, device: str, kind: str, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        return self.submit(device, kind, fn, *args, **kwargs).result()
+
+    def _next(self) -> Optional[_Request]:
+        """Round-robin over devices with pending work (caller holds the lock)."""
+        devices = list(self._queues.keys())
+        for i in range(len(devices)):
+            dev = devices[(self._rr + i) % len(devices)]
+            q = self._queues[dev]
+            if q:
+                self._rr = (self._rr + i + 1) % len(devices)
+                return q.popleft()
+        return None
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                req = self._next()
+                while req is None and not self._stop:
+                    self._cond.wait()
+                    req = self._next()
+                if req is None:
+                    return
+            if not req.future.set_running_or_notify_cancel():
+                continue
+            started = time.perf_counter()
+            error = False
+            try:
+                req.future.set_result(req.fn(*req.args, **req.kwargs))
+            except BaseException as exc:
+                error = True
+                logger_uma.warning("[hub] %s request from %s failed: %s", req.kind, req.device, exc)
+                req.future.set_exception(exc)
+            done = time.perf_counter()
+            wait_ms = (started - req.enqueued_at) * 1000.0
+            with self._cond:
+                st = self._stats[req.device]
+                st.requests += 1
+                st.errors += int(error)
+                st.wait_ms_total += wait_ms
+                st.service_ms_total += (done - started) * 1000.0
+                st.recent_waits.append(wait_ms)
+
+    # ---- metrics ----
+    def stats(self) -> Dict[str, Any]:
+        """Per-device latency/throughput plus Jain's fairness index over service time."""
+        with self._cond:
+            per_device = {d: s.as_dict() for d, s in self._stats.items()}
+            pending = {d: len(q) for d, q in self._queues.items()}
+        shares = [s["service_ms_total"] for s in per_device.values()]
+        denom = len(shares) * sum(x * x for x in shares)
+        fairness = (sum(shares) ** 2 / denom) if denom > 0 else 1.0
+        for d, s in per_device.items():
+            s["pending"] = pending.get(d, 0)
+        return {"devices": per_device, "fairness": fairness}
+
+
+class SharedYOLOClient(IDetector):
+    """Per-device IDetector: captures on the device, detects on the shared engine."""
+
+    def __init__(self, hub: PerceptionHub, device: str, ctrl: IController) -> None:
+        self.hub = hub
+        self.device = device
+        self.ctrl = ctrl
+
+    def detect_bgr(
+        self,
+        bgr: Any,
+        *,
+        imgsz: Optional[int] = None,
+        conf: Optional[float] = None,
+        iou: Optional[float] = None,
+        tag: str = "general",
+        agent: Optional[str] = None,
+    ) -> Tuple[Dict[str, Any], List[DetectionDict]]:
+        return self.hub.call(
+            self.device,
+            "yolo",
+            self.hub.yolo_engine.detect_bgr,
+            bgr,
+            imgsz=imgsz,
+            conf=conf,
+            iou=iou,
+            tag=tag,
+            agent=agent,
+        )
+
+    def detect_pil(
+        self,
+        pil_img: Image.Image,
+        *,
+        imgsz: Optional[int] = None,
+        conf: Optional[float] = None,
+        iou: Optional[float] = None,
+        tag: str = "general",
+        agent: Optional[str] = None,
+    ) -> Tuple[Dict[str, Any], List[DetectionDict]]:
+        return self.hub.call(
+            self.device,
+            "yolo",
+            self.hub.yolo_engine.detect_pil,
+            pil_img,
+            imgsz=imgsz,
+            conf=conf,
+            iou=iou,
+            tag=tag,
+            agent=agent,
+        )
+
+    def detect_batch(
+        self,
+        images: Sequence[BatchImage],
+        *,
+        imgsz: Optional[int] = None,
+        conf: Optional[float] = None,
+        iou: Optional[float] = None,
+        tag: str = "general",
+        agent: Optional[str] = None,
+    ) -> List[Tuple[Dict[str, Any], List[DetectionDict]]]:
+        # one hub slot for the whole batch, so it stays a single forward pass
+        return self.hub.call(
+            self.device,
+            "yolo",
+            self.hub.yolo_engine.detect_batch,
+            images,
+            imgsz=imgsz,
+            conf=conf,
+            iou=iou,
+            tag=tag,
+            agent=agent,
+        )
+
+    def recognize(
+        self,
+        *,
+        region: Optional[RegionXYWH] = None,
+        imgsz: Optional[int] = None,
+        conf: Optional[float] = None,
+        iou: Optional[float] = None,
+        tag: str = "general",
+        agent: Optional[str] = None,
+        roi: Optional[ROI] = None,
+        classes: Optional[Sequence[str]] = None,
+    ) -> Tuple[Image.Image, Dict[str, Any], List[DetectionDict]]:
+        imgsz = tuned_imgsz(getattr(self.hub.yolo_engine, "weights_path", None), tag, imgsz)
+        img = self.ctrl.screenshot(region=region)
+        if roi is not None or classes:
+            meta, dets = self.hub.call(
+                self.device,
+                "yolo",
+                detect_in_roi,
+                self.hub.yolo_engine,
+                img,
+                roi,
+                classes=classes,
+                imgsz=imgsz,
+                conf=conf,
+                iou=iou,
+                tag=tag,
+                agent=agent,
+            )
+        else:
+            meta, dets = self.detect_pil(
+                img, imgsz=imgsz, conf=conf, iou=iou, tag=tag, agent=agent
+            )
+        meta = dict(meta)
+        meta["device"] = self.device
+        meta.update(frame_meta(img))
+        return img, meta, dets
+
+
+class SharedOCRClient(OCRInterface):
+    """Per-device OCRInterface forwarding every call to the shared engine."""
+
+    def __init__(self, hub: PerceptionHub, device: str) -> None:
+        self.hub = hub
+        self.device = device
+
+    def _call(self, name: str, *args, **kwargs):
+        return self.hub.call(self.device, "ocr", getattr(self.hub.ocr, name), *args, **kwargs)
+
+    def raw(self, img: Any) -> Dict[str, Any]:
+        return self._call("raw", img)
+
+    def text(self, img: Any, joiner: str = " ", min_conf: float = 0.2) -> str:
+        return self._call("text", img, joiner=joiner, min_conf=min_conf)
+
+    def digits(self, img: Any) -> int:
+        return self._call("digits", img)
+
+    def batch_text(
+        self, imgs: List[Any], *, joiner: str = " ", min_conf: float = 0.2
+    ) -> List[str]:
+        return self._call("batch_text", imgs, joiner=joiner, min_conf=min_conf)
+
+    def batch_digits(self, imgs: List[Any]) -> List[str]:
+        return self._call("batch_digits", imgs)
+
+    def batch_rec(self, imgs: List[Any]) -> List[Tuple[str, float]]:
+        return self._call("batch_rec", imgs)
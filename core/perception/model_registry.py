@@ -0,0 +1,230 @@
+# core/perception/model_registry.py
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from core.utils.logger import logger_uma
+
+MB = 1024 * 1024
+
+
+@dataclass
+class ModelSpec:
+    """How to build one servable model and what to call it."""
+
+    model_id: str  # e.g. "yolo/ura", "yolo/ura@int8", "ocr", "spirit/unity_cup"
+    loader: Callable[[], Any]
+    kind: str = "yolo"
+    weights: Optional[str] = None  # requests naming this path (or file name) resolve here
+    aliases: Tuple[str, ...] = ()
+    pinned: bool = False  # never evicted
+    size_bytes: Optional[int] = None  # overrides the measured footprint
+    info: Dict[str, Any] = field(default_factory=dict)  # free-form, e.g. default agent
+
+
+@dataclass
+class _Slot:
+    spec: ModelSpec
+    model: Any = None
+    size_bytes: int = 0
+    requests: int = 0
+    loads: int = 0
+    evictions: int = 0
+    load_ms_total: float = 0.0
+    last_used: float = 0.0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def as_dict(self, now: float) -> Dict[str, Any]:
+        return {
+            "kind": self.spec.kind,
+            "weights": self.spec.weights,
+            "pinned": self.spec.pinned,
+            "loaded": self.model is not None,
+            "size_mb": round(self.size_bytes / MB, 1),
+            "requests": self.requests,
+            "loads": self.loads,
+            "evictions": self.evictions,
+            "avg_load_ms": round(self.load_ms_total / self.loads, 1) if self.loads else 0.0,
+            "idle_s": round(now - self.last_used, 1) if self.last_used else None,
+        }
+
+
+def _process_bytes() -> int:
+    """Resident host memory plus CUDA memory held by torch (0 if unknown)."""
+    total = 0
+    try:
+        import psutil
+
+        total += psutil.Process(os.getpid()).memory_info().rss
+    except Exception:
+        pass
+    torch = sys.modules.get("torch")
+    try:
+        if torch is not None and torch.cuda.is_available():
+            total += int(torch.cuda.memory_allocated())
+    except Exception:
+        pass
+    return total
+
+
+def _release_cached_memory() -> None:
+    torch = sys.modules.get("torch")
+    try:
+        if torch is not None and torch.cuda.is_available():
+            torch.cuda.empty_cache()
+    except Exception:
+        pass
+
+
+class ModelRegistry:
+    """
+    Named, lazily loaded models with LRU eviction under a memory budget.
+
+    get(key) resolves an explicit model id, an alias, or a weights path/file
+    name (what older clients send), loads the model on first use and marks it
+    most recently used. A model's footprint is the process memory growth
+    (RSS + CUDA) while it loads, or its weights file size when that cannot be
+    measured. After a load, least recently used unpinned models are unloaded
+    until the total fits `budget_bytes` (0 = no limit). Callers that already
+    hold an evicted model keep using it; only the registry drops it.
+    """
+
+    def __init__(self, budget_bytes: int = 0) -> None:
+        self.budget_bytes = max(0, int(budget_bytes))
+        self._slots: "OrderedDict[str, _Slot]" = OrderedDict()  # LRU order: oldest first
+        self._keys: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()  # one load at a time keeps the measurement honest
+
+    # ---- registration ----
+    def register(self, spec: ModelSpec) -> None:
+        with self._lock:
+            self._slots[spec.model_id] = _Slot(spec)
+            for key in (spec.model_id, *spec.aliases):
+                self._keys[key.lower()] = spec.model_id
+            if spec.weights:
+                self._keys.setdefault(str(spec.weights).lower(), spec.model_id)
+                self._keys.setdefault(Path(str(spec.weights)).name.lower(), spec.model_id)
+
+    def ids(self) -> List[str]:
+        return list(self._slots)
+
+    def spec(self, key: str) -> ModelSpec:
+        return self._slots[self.resolve(key)].spec
+
+    def resolve(self, key: str) -> str:
+        """Model id for an id, alias or weights path; KeyError if unknown."""
+        k = str(key or "").strip().lower()
+        if k in self._keys:
+            return self._keys[k]
+        name = Path(k).name
+        if name in self._keys:
+            return self._keys[name]
+        raise KeyError(f"Unknown model {key!r}; known: {', '.join(self._slots)}")
+
+    # ---- access ----
+    def get(self, key: str) -> Any:
+        mid = self.resolve(key)
+        slot = self._slots[mid]
+        with self._lock:
+            slot.requests += 1
+            slot.last_used = time.monotonic()
+            self._slots.move_to_end(mid)
+            model = slot.model
+        if model is not None:
+            return model
+
+        with slot.lock:
+            if slot.model is None:
+                self._load(slot)
+            model = slot.model
+        self._evict(keep=mid)
+        return model
+
+    def _load(self, slot: _Slot) -> None:
+        spec = slot.spec
+        with self._load_lock:
+            before = _process_bytes()
+            t0 = time.perf_counter()
+            model = spec.loader()
+            load_ms = (time.perf_counter() - t0) * 1000.0
+            grown = max(0, _process_bytes() - before)
+        size = spec.size_bytes
+        if size is None:
+            size = grown
+            if spec.weights and Path(spec.weights).exists():
+                size = max(size, Path(spec.weights).stat().st_size)
+        with self._lock:
+            slot.model = model
+            slot.size_bytes = int(size)
+            slot.loads += 1
+            slot.load_ms_total += load_ms
+        logger_uma.info(
+            "[models] loaded %s in %.0fms (%.0f MB, %.0f/%s MB in use)",
+            spec.model_id,
+            load_ms,
+            size / MB,
+            self.used_bytes() / MB,
+            f"{self.budget_bytes / MB:.0f}" if self.budget_bytes else "-",
+        )
+
+    def _evict(self, keep: str) -> None:
+        if not self.budget_bytes:
+            return
+        evicted: List[str] = []
+        with self._lock:
+            for mid, slot in list(self._slots.items()):  # oldest first
+                if self._used_locked() <= self.budget_bytes:
+                    break
+                if mid == keep or slot.model is None or slot.spec.pinned:
+                    continue
+                slot.model = None
+                slot.evictions += 1
+                evicted.append(mid)
+            over = self._used_locked() > self.budget_bytes
+        if evicted:
+            _release_cached_memory()
+            logger_uma.info("[models] evicted %s to stay within budget", ", ".join(evicted))
+        if over:
+            logger_uma.warning(
+                "[models] %.0f MB in use exceeds the %.0f MB budget (pinned/in-use models)",
+                self.used_bytes() / MB,
+                self.budget_bytes / MB,
+            )
+
+    def unload(self, key: str) -> bool:
+        slot = self._slots[self.resolve(key)]
+        with self._lock:
+            if slot.model is None:
+                return False
+            slot.model = None
+        _release_cached_memory()
+        return True
+
+    # ---- metrics ----
+    def _used_locked(self) -> int:
+        return sum(s.size_bytes for s in self._slots.values() if s.model is not None)
+
+    def used_bytes(self) -> int:
+        with self._lock:
+            return self._used_locked()
+
+    def loaded(self) -> List[str]:
+        with self._lock:
+            return [mid for mid, s in self._slots.items() if s.model is not None]
+
+    def stats(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        with self._lock:
+            return {
+                "budget_mb": round(self.budget_bytes / MB, 1),
+                "used_mb": round(self._used_locked() / MB, 1),
+                "models": {mid: s.as_dict(now) for mid, s in self._slots.items()},
+            }
@@ -1,6 +1,6 @@
 # core/perception/ocr/interface.py
 from __future__ import annotations
-from typing import Any, Dict, List, Protocol, runtime_checkable
+from typing import Any, Dict, List, Protocol, Tuple, runtime_checkable
 
 
 @runtime_checkable
@@ -31,3 +31,12 @@ class OCRInterface(Protocol):
     def batch_digits(self, imgs: List[Any]) -> List[str]:
         """Vectorized digits-only strings for each image."""
         ...
+
+    def batch_rec(self, imgs: List[Any]) -> List[Tuple[str, float]]:
+        """
+        Recognition only: each image is taken as ONE text line and fed straight to
+        the recognizer (no text detection). Returns (text, score) per image.
+        Meant for tight single-line crops (button labels, values); use
+        text()/batch_text() for regions that may hold several lines.
+        """
+        ...
@@ -0,0 +1,249 @@
+# core/perception/ocr/ocr_cache.py
+from __future__ import annotations
+
+import copy
+import hashlib
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+from PIL import Image
+
+from core.settings import Settings
+from core.utils.logger import logger_uma
+
+CACHED_METHODS = ("raw", "text", "digits", "batch_text", "batch_digits", "batch_rec")
+# batch calls cache per crop; batch_text items are text() results, batch_digits items are
+# digit strings (digits() returns an int, so they don't share entries), batch_rec items
+# are recognizer-only (text, score) pairs
+_PER_ITEM = {"batch_text": "text", "batch_digits": "digit_str", "batch_rec": "rec"}
+
+
+def crop_key(img: Any) -> Optional[bytes]:
+    """Digest of the pixels (plus shape/mode) of a crop; None for inputs that aren't pixels."""
+    h = hashlib.blake2b(digest_size=16)
+    if isinstance(img, Image.Image):
+        h.update(f"{img.mode}{img.size}".encode())
+        h.update(img.tobytes())
+    elif isinstance(img, np.ndarray):
+        h.update(f"{img.dtype}{img.shape}".encode())
+        h.update(np.ascontiguousarray(img).data)
+    else:
+        return None  # paths etc. can change behind our back
+    return h.digest()
+
+
+def _size(result: Any) -> int:
+    """Rough footprint of a cached result in bytes."""
+    if isinstance(result, str):
+        return 49 + len(result)
+    if isinstance(result, (int, float)):
+        return 32
+    return 64 + len(repr(result))
+
+
+@dataclass
+class _Entry:
+    result: Any
+    size: int
+    cost_ms: float
+
+
+@dataclass
+class _MethodStats:
+    calls: int = 0
+    hits: int = 0
+    saved_ms: float = 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "hits": self.hits,
+            "misses": self.calls - self.hits,
+            "hit_rate": self.hits / self.calls if self.calls else 0.0,
+            "saved_ms": round(self.saved_ms, 1),
+        }
+
+
+class OCRCache:
+    """
+    Content-addressed LRU cache of OCR results.
+
+    attach(ocr) wraps raw/text/digits/batch_text/batch_digits/batch_rec of any
+    OCRInterface (local, remote, replay). A call hits when a crop with
+    bit-identical pixels was read before with the same method and arguments
+    (joiner, min_conf, ...). Batch calls look up every crop on its own and send
+    only the misses to the engine. Memory is bounded by `max_entries` and
+    `max_bytes` (estimated result sizes); least recently used results go first.
+    Calls an engine makes to itself (text() going through raw()) are not
+    cached twice.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        log_every_s: float = 60.0,
+    ) -> None:
+        self.max_entries = max(
+            1, int(max_entries if max_entries is not None else Settings.OCR_CACHE_MAX_ENTRIES)
+        )
+        self.max_bytes = max(
+            1, int(max_bytes if max_bytes is not None else Settings.OCR_CACHE_MAX_MB * 1024 * 1024)
+        )
+        self.log_every_s = float(log_every_s)
+        self._entries: "OrderedDict[Tuple[Any, ...], _Entry]" = OrderedDict()
+        self._bytes = 0
+        self._stats: Dict[str, _MethodStats] = defaultdict(_MethodStats)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._last_log = time.monotonic()
+        self._patched: List[Tuple[Any, str, bool, Any]] = []
+
+    # ---- lookup ----
+    def _get(self, key: Tuple[Any, ...], method: str, t0: float) -> Tuple[bool, Any]:
+        with self._lock:
+            st = self._stats[method]
+            st.calls += 1
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            self._entries.move_to_end(key)
+            st.hits += 1
+            st.saved_ms += max(0.0, entry.cost_ms - (time.perf_counter() - t0) * 1000.0)
+            result = entry.result
+        return True, copy.deepcopy(result) if isinstance(result, (dict, list)) else result
+
+    def _put(self, key: Tuple[Any, ...], result: Any, cost_ms: float) -> None:
+        size = _size(result)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old.size
+            self._entries[key] = _Entry(copy.deepcopy(result), size, cost_ms)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, dropped = self._entries.popitem(last=False)
+                self._bytes -= dropped.size
+            due = self._log_due(time.monotonic())
+        if due:
+            self.log_stats()
+
+    def call(self, method: str, fn: Callable[..., Any], img: Any, *args: Any, **kwargs: Any) -> Any:
+        """fn(img, *args, **kwargs) through the cache, `method` naming the OCR call."""
+        if getattr(self._local, "depth", 0):
+            return fn(img, *args, **kwargs)
+        if method in _PER_ITEM:
+            return self._call_batch(method, fn, img, *args, **kwargs)
+
+        t0 = time.perf_counter()
+        digest = crop_key(img)
+        if digest is None:
+            return self._run(fn, img, *args, **kwargs)
+        key = (method, digest, args, tuple(sorted(kwargs.items())))
+        hit, result = self._get(key, method, t0)
+        if hit:
+            return result
+        result = self._run(fn, img, *args, **kwargs)
+        self._put(key, result, (time.perf_counter() - t0) * 1000.0)
+        return result
+
+    def _call_batch(
+        self, method: str, fn: Callable[..., List[Any]], imgs: List[Any], *args: Any, **kwargs: Any
+    ) -> List[Any]:
+        t0 = time.perf_counter()
+        params = (args, tuple(sorted(kwargs.items())))
+        keys = [crop_key(im) for im in imgs]
+        out: List[Any] = [None] * len(imgs)
+        todo: List[int] = []
+        for i, digest in enumerate(keys):
+            hit = False
+            if digest is not None:
+                hit, out[i] = self._get((_PER_ITEM[method], digest, *params), method, t0)
+            if not hit:
+                todo.append(i)
+        if not todo:
+            return out
+
+        results = self._run(fn, [imgs[i] for i in todo], *args, **kwargs)
+        cost_ms = (time.perf_counter() - t0) * 1000.0 / len(todo)
+        for i, result in zip(todo, results):
+            out[i] = result
+            if keys[i] is not None:
+                self._put((_PER_ITEM[method], keys[i], *params), result, cost_ms)
+        return out
+
+    def _run(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        self._local.depth = getattr(self._local, "depth", 0) + 1
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            self._local.depth -= 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    # ---- metrics ----
+    def stats(self) -> Dict[str, Any]:
+        """Entries/bytes held and {method: {"calls", "hits", "misses", "hit_rate", "saved_ms"}}."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "methods": {m: s.as_dict() for m, s in sorted(self._stats.items())},
+            }
+
+    def log_stats(self) -> None:
+        st = self.stats()
+        for method, s in st["methods"].items():
+            logger_uma.info(
+                "[ocrcache] %s: %d/%d hits (%.0f%%), saved %.0f ms",
+                method,
+                s["hits"],
+                s["calls"],
+                s["hit_rate"] * 100.0,
+                s["saved_ms"],
+            )
+        logger_uma.info("[ocrcache] %d entries, %.1f KB", st["entries"], st["bytes"] / 1024.0)
+
+    def _log_due(self, now: float) -> bool:
+        # called with the lock held
+        if self.log_every_s <= 0 or now - self._last_log < self.log_every_s:
+            return False
+        self._last_log = now
+        return True
+
+    # ---- wrapping a live engine ----
+    def attach(self, ocr: Any) -> Any:
+        """Route the OCR methods of `ocr` through the cache; returns `ocr`."""
+        for method in CACHED_METHODS:
+            orig = getattr(ocr, method, None)
+            if orig is None:
+                continue
+            had = method in vars(ocr)
+            self._patched.append((ocr, method, had, vars(ocr).get(method)))
+
+            def wrapper(img, *args, _m=method, _fn=orig, **kwargs):
+                return self.call(_m, _fn, img, *args, **kwargs)
+
+            setattr(ocr, method, wrapper)
+        ocr.ocr_cache = self
+        return ocr
+
+    def detach(self) -> None:
+        """Restore every method replaced by attach()."""
+        for ocr, method, had, prev in reversed(self._patched):
+            if had:
+                setattr(ocr, method, prev)
+            else:
+                vars(ocr).pop(method, None)
+            vars(ocr).pop("ocr_cache", None)
+        self._patched.clear()
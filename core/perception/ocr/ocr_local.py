@@ -5,7 +5,7 @@ import numpy as np
 import importlib
 import os
 import re
-from typing import Any, Dict, List, cast
+from typing import Any, Dict, List, Tuple, cast
 from core.perception.ocr.interface import OCRInterface
 from core.types import OCRItem
 
@@ -26,6 +26,7 @@ class LocalOCREngine(OCRInterface):
       - raw(...) -> normalized [(box, text, score), ...]
       - text(...) -> single string of concatenated words
       - digits(...) -> digits-only string (handy for counters)
+      - batch_rec(...) -> (text, score) per single-line crop, recognizer only
     """
 
     def __init__(
@@ -65,6 +66,10 @@ class LocalOCREngine(OCRInterface):
             logger_uma.warning("Error while checking GPU in Paddle")
 
         self.device = device_str
+        self.text_recognition_model_name = text_recognition_model_name
+        # standalone recognizer for batch_rec(); built on first use
+        self._rec_model: Any = None
+        self._rec_unavailable = False
 
         # Instantiate PaddleOCR, turning off unneeded subpipelines and using the mobile detector.
         # Also shrink det input and bump rec batch for small crops.
@@ -242,3 +247,64 @@ class LocalOCREngine(OCRInterface):
         """
         outs = self.batch_text(imgs)
         return [re.sub(r"[^\d]", "", s or "") for s in outs]
+
+    # -------- Recognition only --------
+    def _recognizer(self) -> Any:
+        """paddleocr.TextRecognition with the pipeline's rec model, or None if unavailable."""
+        if self._rec_model is not None or self._rec_unavailable:
+            return self._rec_model
+        try:
+            from paddleocr import TextRecognition
+
+            kwargs: Dict[str, Any] = {"device": self.device}
+            if self.text_recognition_model_name:
+                kwargs["model_name"] = self.text_recognition_model_name
+            self._rec_model = TextRecognition(**kwargs)
+            logger_uma.info(
+                "OCRInterface: recognition-only model ready (%s)",
+                self.text_recognition_model_name or "default",
+            )
+        except Exception as e:
+            self._rec_unavailable = True
+            logger_uma.warning(
+                "OCRInterface: recognition-only model unavailable (%s); "
+                "batch_rec() uses the full pipeline.",
+                e,
+            )
+        return self._rec_model
+
+    def batch_rec(self, imgs: List[Any]) -> List[Tuple[str, float]]:
+        """
+        Feed single-line crops straight to the text recognizer, batched.
+        Skips text detection entirely, so each crop must hold one line of text.
+        """
+        if not imgs:
+            return []
+        bgr_list = [self._ensure_bgr3(im) for im in imgs]
+        rec = self._recognizer()
+        if rec is None:
+            return self._batch_rec_pipeline(bgr_list)
+        out: List[Tuple[str, float]] = []
+        for o in rec.predict(input=bgr_list, batch_size=16):
+            to_json = getattr(o, "_to_json", None)
+            j = cast(Dict[str, Any], to_json()) if callable(to_json) else o
+            res = j.get("res", j) if isinstance(j, dict) else {}
+            out.append((str(res.get("rec_text") or ""), float(res.get("rec_score") or 0.0)))
+        return out
+
+    def _batch_rec_pipeline(self, bgr_list: List[np.ndarray]) -> List[Tuple[str, float]]:
+        # same contract through detection + recognition: lines joined, mean score
+        if self.reader is None:
+            raise RuntimeError("PaddleOCR reader is not initialized.")
+        out: List[Tuple[str, float]] = []
+        for o in self.reader.predict(bgr_list):
+            if isinstance(o, list) and o:
+                o = o[0]
+            to_json = getattr(o, "_to_json", None)
+            j = cast(Dict[str, Any], to_json()) if callable(to_json) else o
+            res = j.get("res", {}) if isinstance(j, dict) else {}
+            texts = res.get("rec_texts", []) or []
+            scores = [float(x) for x in (res.get("rec_scores", []) or [])]
+            score = sum(scores) / len(scores) if scores else 0.0
+            out.append((" ".join(texts).strip(), score))
+        return out
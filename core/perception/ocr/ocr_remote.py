@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import base64
 import hashlib
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import cv2
 import numpy as np
@@ -113,3 +113,10 @@ class RemoteOCREngine(OCRInterface):
     def batch_digits(self, imgs: List[Any]) -> List[str]:
         imgs64 = [_encode_image_to_base64(im) for im in imgs]
         return list(self._post({"mode": "batch_digits", "imgs": imgs64})["data"])
+
+    def batch_rec(self, imgs: List[Any]) -> List[Tuple[str, float]]:
+        if not imgs:
+            return []
+        imgs64 = [_encode_image_to_base64(im) for im in imgs]
+        data = self._post({"mode": "batch_rec", "imgs": imgs64})["data"]
+        return [(str(t), float(s)) for t, s in data]
@@ -0,0 +1,74 @@
+# core/perception/ocr/ocr_replay.py
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from core.perception.ocr.interface import OCRInterface
+from core.utils.logger import logger_uma
+from core.utils.session_recorder import SessionLog, image_key
+
+
+class ReplayOCREngine(OCRInterface):
+    """
+    OCR that answers from a recorded session, keyed by method and the crops'
+    content hashes. Unknown crops go to `fallback` if given, else get an empty
+    answer ("" / -1 / {} / ("", 0.0)).
+    """
+
+    def __init__(self, session: SessionLog, *, fallback: Optional[OCRInterface] = None) -> None:
+        self.fallback = fallback
+        self._results: Dict[Tuple[str, Tuple[str, ...]], Any] = {}
+        for ev in session.of("ocr"):
+            keys = tuple(ev.get("keys") or ())
+            self._results.setdefault((ev["method"], keys), ev.get("result"))
+        self.hits = 0
+        self.misses = 0
+
+    def _lookup(self, method: str, imgs: List[Any]) -> Tuple[bool, Any]:
+        key = (method, tuple(image_key(i) for i in imgs))
+        if key in self._results:
+            self.hits += 1
+            return True, self._results[key]
+        self.misses += 1
+        logger_uma.debug("[replay] OCR miss (%s)", method)
+        return False, None
+
+    def raw(self, img: Any) -> Dict[str, Any]:
+        ok, res = self._lookup("raw", [img])
+        if ok:
+            return res
+        return self.fallback.raw(img) if self.fallback else {}
+
+    def text(self, img: Any, joiner: str = " ", min_conf: float = 0.2) -> str:
+        ok, res = self._lookup("text", [img])
+        if ok:
+            return res
+        return self.fallback.text(img, joiner=joiner, min_conf=min_conf) if self.fallback else ""
+
+    def digits(self, img: Any) -> int:
+        ok, res = self._lookup("digits", [img])
+        if ok:
+            return res
+        return self.fallback.digits(img) if self.fallback else -1
+
+    def batch_text(
+        self, imgs: List[Any], *, joiner: str = " ", min_conf: float = 0.2
+    ) -> List[str]:
+        ok, res = self._lookup("batch_text", list(imgs))
+        if ok:
+            return res
+        if self.fallback:
+            return self.fallback.batch_text(imgs, joiner=joiner, min_conf=min_conf)
+        return ["" for _ in imgs]
+
+    def batch_digits(self, imgs: List[Any]) -> List[str]:
+        ok, res = self._lookup("batch_digits", list(imgs))
+        if ok:
+            return res
+        return self.fallback.batch_digits(imgs) if self.fallback else ["" for _ in imgs]
+
+    def batch_rec(self, imgs: List[Any]) -> List[Tuple[str, float]]:
+        ok, res = self._lookup("batch_rec", list(imgs))
+        if ok:
+            return [(str(t), float(s)) for t, s in res]
+        return self.fallback.batch_rec(imgs) if self.fallback else [("", 0.0) for _ in imgs]
@@ -0,0 +1,208 @@
+# core/perception/screen_classifier.py
+from __future__ import annotations
+
+import inspect
+import json
+from pathlib import Path
+from typing import Any, Collection, Dict, List, Sequence, Tuple, Union
+
+import cv2
+import numpy as np
+
+from core.utils.img import to_bgr
+
+GRAY_SIZE = 32  # gray layout thumbnail (GRAY_SIZE x GRAY_SIZE)
+COLOR_SIZE = 8  # coarse colour thumbnail (COLOR_SIZE x COLOR_SIZE x 3)
+
+
+def features(img: Any) -> np.ndarray:
+    """
+    Unit-length descriptor of a whole screen: a zero-mean gray thumbnail (layout)
+    next to a zero-mean colour thumbnail (palette), each normalised on its own so
+    neither dominates. Cosine similarity between two screens is a dot product.
+    """
+    bgr = to_bgr(img)
+    gray = cv2.cvtColor(bgr, cv2.COLOR_BGR2GRAY)
+    g = cv2.resize(gray, (GRAY_SIZE, GRAY_SIZE), interpolation=cv2.INTER_AREA)
+    c = cv2.resize(bgr, (COLOR_SIZE, COLOR_SIZE), interpolation=cv2.INTER_AREA)
+    parts = []
+    for a in (g, c):
+        v = a.astype(np.float32).ravel()
+        v -= v.mean()
+        n = float(np.linalg.norm(v))
+        parts.append(v / n if n > 1e-6 else v)
+    return np.concatenate(parts) / np.sqrt(2.0)
+
+
+class ScreenClassifier:
+    """
+    Tiny CPU screen-type classifier: k nearest neighbours over screen
+    thumbnails (see `features`), trained by train_screen_classifier.py.
+
+    predict() returns (label, confidence). Confidence is the similarity-weighted
+    vote share of the winning label among the k nearest training frames, and 0
+    when even the nearest one is less similar than `min_similarity` (a screen
+    unlike anything seen in training). Labels are the names of
+    classify_screen_ura / classify_screen_unity_cup.
+
+    attach() puts it in front of a detector's recognize(), so the session
+    recorder and the screen pipeline see its answers like any detection.
+    """
+
+    def __init__(
+        self,
+        feats: np.ndarray,
+        labels: Sequence[int],
+        classes: Sequence[str],
+        *,
+        k: int = 5,
+        min_similarity: float = 0.8,
+    ) -> None:
+        self.feats = np.asarray(feats, dtype=np.float32)
+        self.labels = np.asarray(labels, dtype=np.int32)
+        self.classes = [str(c) for c in classes]
+        self.k = max(1, int(k))
+        self.min_similarity = float(min_similarity)
+        self.frames = 0
+        self.answered = 0
+
+    # ---- training ----
+    @classmethod
+    def fit(
+        cls,
+        images: Sequence[Any],
+        labels: Sequence[str],
+        *,
+        k: int = 5,
+        min_similarity: float = 0.8,
+    ) -> "ScreenClassifier":
+        """Build from labelled frames (any image to_bgr accepts) and their screen names."""
+        if not images or len(images) != len(labels):
+            raise ValueError("fit() needs as many labels as images (and at least one)")
+        classes = sorted(set(labels))
+        idx = {c: i for i, c in enumerate(classes)}
+        feats = np.stack([features(im) for im in images])
+        return cls(
+            feats, [idx[name] for name in labels], classes, k=k, min_similarity=min_similarity
+        )
+
+    def evaluate(self) -> Dict[str, Any]:
+        """Leave-one-out accuracy over the training frames, overall and per label."""
+        n = len(self.feats)
+        per: Dict[str, List[int]] = {c: [0, 0] for c in self.classes}
+        hits = 0
+        for i in range(n):
+            mask = np.ones(n, dtype=bool)
+            mask[i] = False
+            label, _ = self._vote(self.feats[i], self.feats[mask], self.labels[mask])
+            truth = self.classes[int(self.labels[i])]
+            per[truth][1] += 1
+            if label == truth:
+                per[truth][0] += 1
+                hits += 1
+        return {
+            "frames": n,
+            "accuracy": hits / n if n else 0.0,
+            "per_label": {c: {"correct": a, "frames": b} for c, (a, b) in per.items()},
+        }
+
+    # ---- inference ----
+    def _vote(self, f: np.ndarray, feats: np.ndarray, labels: np.ndarray) -> Tuple[str, float]:
+        if len(feats) == 0:
+            return "Unknown", 0.0
+        sims = feats @ f
+        k = min(self.k, len(sims))
+        top = np.argpartition(-sims, k - 1)[:k]
+        if float(sims[top].max()) < self.min_similarity:
+            return self.classes[int(labels[top[np.argmax(sims[top])]])], 0.0
+        weights = np.clip(sims[top], 0.0, None)
+        votes = np.bincount(labels[top], weights=weights, minlength=len(self.classes))
+        best = int(np.argmax(votes))
+        total = float(votes.sum())
+        return self.classes[best], float(votes[best] / total) if total > 0 else 0.0
+
+    def predict(self, img: Any) -> Tuple[str, float]:
+        return self._vote(features(img), self.feats, self.labels)
+
+    def attach(
+        self,
+        engine: Any,
+        ctrl: Any,
+        screens: Collection[str],
+        *,
+        min_conf: float,
+        tag: str = "screen",
+    ) -> Any:
+        """
+        Route `engine.recognize(tag=tag)` through the classifier; returns the engine.
+
+        A label in `screens` predicted with at least `min_conf` is returned as
+        meta["screen"] with no detections; any other frame goes through the
+        detector. Calls with another tag, a region, an ROI or a class filter are
+        passed through untouched.
+        """
+        # imported here so training/evaluation need no controller stack
+        from core.controllers.capture_service import frame_meta
+        from core.perception.yolo.imgsz_profile import tuned_imgsz
+
+        orig = engine.recognize
+        # engines behind a hub/replay take only the IDetector arguments
+        with_tag = "tag" in inspect.signature(engine.detect_pil).parameters
+
+        def recognize(**kwargs):
+            if kwargs.get("tag", "general") != tag or any(
+                kwargs.get(k) for k in ("region", "roi", "classes")
+            ):
+                return orig(**kwargs)
+            grab = getattr(ctrl, "screenshot_left_half", None)  # what recognize() captures
+            img = grab() if callable(grab) else ctrl.screenshot()
+            self.frames += 1
+            label, confidence = self.predict(img)
+            if label in screens and confidence >= min_conf:
+                self.answered += 1
+                return img, {"screen": label, "screen_conf": confidence, **frame_meta(img)}, []
+
+            weights = getattr(engine, "weights_path", None) or getattr(engine, "weights", None)
+            extra = {"tag": tag, "agent": kwargs.get("agent")} if with_tag else {}
+            meta, dets = engine.detect_pil(
+                img,
+                imgsz=tuned_imgsz(weights, tag, kwargs.get("imgsz")),
+                conf=kwargs.get("conf"),
+                iou=kwargs.get("iou"),
+                **extra,
+            )
+            meta = dict(meta)
+            meta.update(frame_meta(img))
+            return img, meta, dets
+
+        engine.recognize = recognize
+        engine.screen_classifier = self
+        return engine
+
+    # ---- persistence ----
+    def save(self, path: Union[str, Path]) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        meta = {
+            "classes": self.classes,
+            "k": self.k,
+            "min_similarity": self.min_similarity,
+            "gray_size": GRAY_SIZE,
+            "color_size": COLOR_SIZE,
+        }
+        with open(path, "wb") as f:
+            np.savez_compressed(f, feats=self.feats, labels=self.labels, meta=json.dumps(meta))
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "ScreenClassifier":
+        with np.load(Path(path), allow_pickle=False) as data:
+            meta = json.loads(str(data["meta"]))
+            if (meta.get("gray_size"), meta.get("color_size")) != (GRAY_SIZE, COLOR_SIZE):
+                raise ValueError(f"{path}: trained with other thumbnail sizes; retrain it")
+            return cls(
+                data["feats"],
+                data["labels"],
+                meta["classes"],
+                k=meta.get("k", 5),
+                min_similarity=meta.get("min_similarity", 0.8),
+            )
@@ -0,0 +1,256 @@
+# core/perception/screen_pipeline.py
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from PIL import Image
+
+from core.types import DetectionDict
+from core.utils.abort import abort_requested
+from core.utils.logger import logger_uma
+from core.utils.pacer import pace, pacer
+
+# Controller methods that change what is on screen: any call discards the prefetch
+INPUT_METHODS = ("click", "scroll", "hold", "mouse_down", "mouse_up")
+
+Recognized = Tuple[Image.Image, Dict[str, Any], List[DetectionDict]]
+Geometry = Tuple[Tuple[int, int], Tuple[int, int, int, int]]
+
+
+@dataclass
+class _Prefetched:
+    result: Recognized
+    captured_at: float  # time.monotonic() right before the capture
+    geometry: Optional[Geometry]  # ctrl capture origin/bbox of that frame
+    cost_ms: float  # loop delay + recognize, i.e. what the agent would have waited
+
+
+@dataclass
+class _Speculation:
+    generation: int
+    cancel: threading.Event
+    future: "Future[Optional[_Prefetched]]"
+
+
+class ScreenPipeline:
+    """
+    Double-buffered main-loop perception for the agents.
+
+    While the agent decides on frame N, a worker waits the loop delay and
+    captures + detects frame N+1. next() hands that frame over if nothing
+    invalidated it, otherwise it falls back to the sequential pace + recognize:
+
+      - any input (click/scroll/hold/mouse_down/mouse_up, direct or through the
+        input dispatcher) sent after the prefetch started discards it;
+      - a prefetched frame older than the loop delay when it is asked for is
+        discarded as stale (the agent spent that long waiting on something).
+
+    Detection calls on the engine are serialized while attached, and the
+    worker's captures do not move the controller's capture geometry until the
+    frame is actually used.
+    """
+
+    def __init__(
+        self,
+        ctrl: Any,
+        yolo_engine: Any,
+        *,
+        imgsz: Optional[int] = None,
+        conf: Optional[float] = None,
+        iou: Optional[float] = None,
+        tag: str = "screen",
+        agent: Optional[str] = None,
+    ) -> None:
+        self.ctrl = ctrl
+        self.yolo_engine = yolo_engine
+        self.recognize_kwargs: Dict[str, Any] = {
+            "imgsz": imgsz,
+            "conf": conf,
+            "iou": iou,
+            "tag": tag,
+            "agent": agent,
+        }
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: Optional[_Speculation] = None
+        self._generation = 0
+        self._gen_lock = threading.Lock()
+        self._geom_lock = threading.Lock()
+        self._detect_lock = threading.RLock()
+        self._local = threading.local()
+        self._patched: List[Tuple[Any, str, bool, Any]] = []
+
+        # Counters
+        self.frames = 0
+        self.used = 0
+        self.discarded = 0
+        self.stale = 0
+        self.saved_ms = 0.0
+
+    # ---- lifecycle ----
+    def attach(self) -> "ScreenPipeline":
+        """Hook the controller/engine and start the prefetch worker."""
+
+        def wrap_input(orig: Callable) -> Callable:
+            def action(*args, **kwargs):
+                self._invalidate()
+                try:
+                    return orig(*args, **kwargs)
+                finally:
+                    self._invalidate()
+
+            return action
+
+        def wrap_screenshot(orig: Callable) -> Callable:
+            def screenshot(region=None):
+                with self._geom_lock:
+                    if not getattr(self._local, "speculating", False):
+                        return orig(region=region)
+                    saved = (self.ctrl._last_origin, self.ctrl._last_bbox)
+                    try:
+                        img = orig(region=region)
+                        self._local.geometry = (self.ctrl._last_origin, self.ctrl._last_bbox)
+                    finally:
+                        self.ctrl._last_origin, self.ctrl._last_bbox = saved
+                    return img
+
+            return screenshot
+
+        def wrap_detect(orig: Callable) -> Callable:
+            def detect_bgr(bgr, **kwargs):
+                with self._detect_lock:
+                    return orig(bgr, **kwargs)
+
+            return detect_bgr
+
+        for name in INPUT_METHODS:
+            self._patch(self.ctrl, name, wrap_input)
+        self._patch(self.ctrl, "screenshot", wrap_screenshot)
+        self._patch(self.yolo_engine, "detect_bgr", wrap_detect)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="screen-prefetch")
+        return self
+
+    def close(self) -> Dict[str, Any]:
+        """Drop the pending prefetch, stop the worker and restore the hooks."""
+        if self._pending is not None:
+            self._pending.cancel.set()
+            self._pending = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        for obj, name, had, prev in reversed(self._patched):
+            if had:
+                setattr(obj, name, prev)
+            else:
+                vars(obj).pop(name, None)
+        self._patched.clear()
+        stats = self.stats()
+        logger_uma.info(
+            "[pipeline] frames=%d prefetched=%d discarded=%d stale=%d saved=%.0fms",
+            stats["frames"],
+            stats["used"],
+            stats["discarded"],
+            stats["stale"],
+            stats["saved_ms"],
+        )
+        return stats
+
+    def _patch(self, obj: Any, name: str, make: Callable[[Callable], Callable]) -> None:
+        orig = getattr(obj, name, None)
+        if orig is None:
+            return
+        had = name in vars(obj)
+        self._patched.append((obj, name, had, vars(obj).get(name)))
+        setattr(obj, name, make(orig))
+
+    # ---- main loop ----
+    def next(self, delay: float) -> Recognized:
+        """
+        The next main-loop frame: the prefetched one when still valid, else
+        pace("loop", delay) + recognize() as the sequential loop does.
+        Schedules the prefetch of the frame after it.
+        """
+        self.frames += 1
+        spec, self._pending = self._pending, None
+        result = self._take(spec, delay) if spec is not None else None
+        if result is None:
+            pace("loop", delay)
+            result = self.yolo_engine.recognize(**self.recognize_kwargs)
+        self._pending = self._start(delay)
+        return result
+
+    def _take(self, spec: _Speculation, delay: float) -> Optional[Recognized]:
+        if spec.generation != self._generation or self._inputs_pending():
+            spec.cancel.set()
+            self.discarded += 1
+            return None
+        t0 = time.perf_counter()
+        asked_at = time.monotonic()
+        try:
+            got = spec.future.result()
+        except Exception as e:
+            logger_uma.debug("[pipeline] prefetch failed: %s", e)
+            got = None
+        if got is None or spec.generation != self._generation:
+            self.discarded += 1
+            return None
+        if asked_at - got.captured_at > pacer.delay_for("loop", delay):
+            self.stale += 1
+            return None
+        if got.geometry is not None:
+            with self._geom_lock:
+                self.ctrl._last_origin, self.ctrl._last_bbox = got.geometry
+        self.used += 1
+        self.saved_ms += max(0.0, got.cost_ms - (time.perf_counter() - t0) * 1000.0)
+        return got.result
+
+    # ---- worker ----
+    def _start(self, delay: float) -> Optional[_Speculation]:
+        if self._executor is None:
+            return None
+        cancel = threading.Event()
+        generation = self._generation
+        future = self._executor.submit(self._speculate, generation, cancel, delay)
+        return _Speculation(generation, cancel, future)
+
+    def _speculate(
+        self, generation: int, cancel: threading.Event, delay: float
+    ) -> Optional[_Prefetched]:
+        wait_s = pacer.delay_for("loop", delay)
+        if cancel.wait(wait_s) or generation != self._generation or abort_requested():
+            return None
+        self._local.speculating = True
+        self._local.geometry = None
+        t0 = time.perf_counter()
+        captured_at = time.monotonic()
+        try:
+            result = self.yolo_engine.recognize(**self.recognize_kwargs)
+            geometry = self._local.geometry
+        finally:
+            self._local.speculating = False
+        cost_ms = wait_s * 1000.0 + (time.perf_counter() - t0) * 1000.0
+        return _Prefetched(result, captured_at, geometry, cost_ms)
+
+    def _invalidate(self) -> None:
+        with self._gen_lock:
+            self._generation += 1
+            pending = self._pending
+        if pending is not None:
+            pending.cancel.set()
+
+    def _inputs_pending(self) -> bool:
+        dispatcher = getattr(self.ctrl, "input_dispatcher", None)
+        return dispatcher is not None and dispatcher.pending > 0
+
+    # ---- metrics ----
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "frames": self.frames,
+            "used": self.used,
+            "discarded": self.discarded,
+            "stale": self.stale,
+            "saved_ms": round(self.saved_ms, 1),
+        }
@@ -0,0 +1,227 @@
+# core/perception/warmup.py
+from __future__ import annotations
+
+import inspect
+import itertools
+import threading
+import time
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import cv2
+import numpy as np
+from PIL import Image
+
+from core.perception.yolo.imgsz_profile import active_profile, model_key
+from core.settings import Settings
+from core.utils.abort import abort_requested
+from core.utils.logger import logger_uma
+
+WarmupJob = Tuple[str, Callable[[], Any]]  # (input label, one inference on dummy input)
+
+
+@dataclass
+class _Run:
+    input: str
+    cold_ms: Optional[float] = None
+    warm_ms: Optional[float] = None
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {"input": self.input, "cold_ms": self.cold_ms, "warm_ms": self.warm_ms}
+
+
+@dataclass
+class _Component:
+    jobs: List[WarmupJob]
+    state: str = "pending"  # pending | warming | ready | failed | cancelled
+    error: Optional[str] = None
+    runs: List[_Run] = field(default_factory=list)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "error": self.error,
+            "runs": [r.as_dict() for r in self.runs],
+        }
+
+
+class Warmup:
+    """
+    Background warmup of perception models.
+
+    Each component (a detector, the OCR engine, a classifier) gets its own
+    thread that runs every job twice: the first call pays lazy init / graph
+    build / allocator growth for that input shape (cold), the second is the
+    steady-state latency (warm). Jobs of one component run sequentially, so a
+    model never sees concurrent warmup calls. A failing component is reported
+    and does not block readiness of the others. cancel() skips the jobs not
+    started yet; join() then returns once each thread's in-flight call ends.
+    """
+
+    def __init__(self) -> None:
+        self._components: Dict[str, _Component] = {}
+        self._lock = threading.Lock()
+        self._threads: List[threading.Thread] = []
+        self._cancel = threading.Event()
+        self._started_at: Optional[float] = None
+        self._finished_at: Optional[float] = None
+
+    def add(self, name: str, jobs: Iterable[WarmupJob]) -> "Warmup":
+        self._components[name] = _Component(list(jobs))
+        return self
+
+    def start(self) -> "Warmup":
+        global _current
+        self._started_at = time.perf_counter()
+        for name, comp in self._components.items():
+            t = threading.Thread(
+                target=self._run_component, args=(name, comp), name=f"warmup-{name}", daemon=True
+            )
+            self._threads.append(t)
+            t.start()
+        _current = self
+        if not self._components:
+            self._finished_at = self._started_at
+        return self
+
+    def _run_component(self, name: str, comp: _Component) -> None:
+        comp.state = "warming"
+        try:
+            for label, fn in comp.jobs:
+                if self._cancel.is_set():
+                    break
+                run = _Run(label)
+                comp.runs.append(run)
+                t0 = time.perf_counter()
+                fn()
+                run.cold_ms = round((time.perf_counter() - t0) * 1000.0, 1)
+                if self._cancel.is_set():
+                    break
+                t0 = time.perf_counter()
+                fn()
+                run.warm_ms = round((time.perf_counter() - t0) * 1000.0, 1)
+                logger_uma.info(
+                    "[warmup] %s %s: cold %.0fms, warm %.0fms", name, label, run.cold_ms, run.warm_ms
+                )
+            comp.state = "cancelled" if self._cancel.is_set() else "ready"
+        except Exception as e:
+            comp.state = "failed"
+            comp.error = str(e)
+            logger_uma.warning("[warmup] %s failed: %s", name, e)
+        finally:
+            with self._lock:
+                if self._finished_at is None and all(
+                    c.state in ("ready", "failed", "cancelled") for c in self._components.values()
+                ):
+                    self._finished_at = time.perf_counter()
+                    logger_uma.info(
+                        "[warmup] done in %.0fms", (self._finished_at - (self._started_at or 0.0)) * 1000.0
+                    )
+
+    @property
+    def ready(self) -> bool:
+        return self._finished_at is not None
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until every component finished (or `timeout`/an abort). Returns `ready`."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self.ready and not abort_requested():
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+            time.sleep(0.05)
+        return self.ready
+
+    def cancel(self) -> None:
+        """Skip every job that has not started yet."""
+        self._cancel.set()
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        """Wait for the warmup threads to exit (after cancel(): their in-flight call)."""
+        for t in self._threads:
+            t.join(timeout)
+
+    def status(self) -> Dict[str, Any]:
+        end = self._finished_at or time.perf_counter()
+        return {
+            "enabled": True,
+            "ready": self.ready,
+            "elapsed_ms": round((end - self._started_at) * 1000.0, 1) if self._started_at else 0.0,
+            "components": {n: c.as_dict() for n, c in self._components.items()},
+        }
+
+
+_current: Optional[Warmup] = None
+
+
+def current() -> Optional[Warmup]:
+    """The most recently started Warmup in this process (None if none ran)."""
+    return _current
+
+
+def status() -> Dict[str, Any]:
+    if _current is None:
+        return {"enabled": False, "ready": True, "elapsed_ms": 0.0, "components": {}}
+    return _current.status()
+
+
+# ---------- jobs ----------
+# The builders take the model itself or a zero-argument callable returning it
+# (a function/partial), in which case loading happens on the warmup thread.
+def _getter(model: Any) -> Callable[[], Any]:
+    if isinstance(model, partial) or inspect.isroutine(model):
+        return model
+    return lambda: model
+
+
+def yolo_sizes(weights: Any) -> List[int]:
+    """YOLO_IMGSZ plus every size the imgsz profile tuned for this model."""
+    sizes = {int(Settings.YOLO_IMGSZ)}
+    sizes.update(int(s) for s in active_profile().models.get(model_key(weights), {}).values())
+    return sorted(sizes, reverse=True)
+
+
+def yolo_jobs(engine: Any, sizes: Optional[Iterable[int]] = None) -> List[WarmupJob]:
+    """One job per input size (default: yolo_sizes() of the engine's weights)."""
+    # a different gray on every call, so a DetectionCache cannot answer the warm run
+    get = _getter(engine)
+    shade = itertools.count()
+    if sizes is None:
+        weights = getattr(engine, "weights_path", None) or getattr(engine, "weights", None)
+        sizes = yolo_sizes(weights)
+
+    def detect(s: int) -> Any:
+        frame = np.full((s, s, 3), (114 + 37 * next(shade)) % 256, dtype=np.uint8)
+        return get().detect_bgr(frame, imgsz=s)
+
+    return [(f"{s}x{s}", partial(detect, s)) for s in sizes]
+
+
+def _text_sample(n: int = 1234) -> np.ndarray:
+    img = np.full((64, 320, 3), 255, dtype=np.uint8)
+    cv2.putText(img, f"Speed {n}", (8, 44), cv2.FONT_HERSHEY_SIMPLEX, 1.2, (0, 0, 0), 2)
+    return img
+
+
+def ocr_jobs(ocr: Any) -> List[WarmupJob]:
+    # rendered text, so the recognizer runs too (a blank crop stops at detection);
+    # a different number on every call, so an OCRCache cannot answer the warm run
+    get = _getter(ocr)
+    counter = iter(range(1000, 10000))
+    return [
+        ("text", lambda: get().text(_text_sample(next(counter)))),
+        ("digits", lambda: get().digits(_text_sample(next(counter)))),
+    ]
+
+
+def classifier_jobs(classifier: Any) -> List[WarmupJob]:
+    get = _getter(classifier)
+
+    def predict() -> None:
+        clf = get()
+        if clf is None:
+            raise RuntimeError("classifier unavailable")
+        size = tuple(getattr(clf, "img_size", (64, 64)))
+        clf.predict(Image.new("RGB", size, (90, 140, 220)))
+
+    return [("icon", predict)]
@@ -0,0 +1,207 @@
+# core/perception/yolo/detection_cache.py
+from __future__ import annotations
+
+import copy
+import hashlib
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from core.settings import Settings
+from core.types import DetectionDict
+from core.utils.logger import logger_uma
+
+Signature = Tuple[Tuple[int, ...], int, float, float]  # (shape, imgsz, conf, iou)
+
+
+def fingerprint(bgr: np.ndarray, width: int = 64) -> Tuple[bytes, np.ndarray]:
+    """(digest, gray thumbnail) of a BGR frame, downscaled to `width` pixels wide."""
+    h, w = bgr.shape[:2]
+    tw = max(8, min(int(width), w))
+    th = max(8, int(round(h * tw / max(1, w))))
+    small = cv2.resize(bgr, (tw, th), interpolation=cv2.INTER_AREA)
+    if small.ndim == 3:
+        small = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+    thumb = np.ascontiguousarray(small, dtype=np.uint8)
+    return hashlib.blake2b(thumb.tobytes(), digest_size=16).digest(), thumb.astype(np.int16)
+
+
+@dataclass
+class _Entry:
+    digest: bytes
+    thumb: np.ndarray
+    meta: Dict[str, Any]
+    dets: List[DetectionDict]
+    cost_ms: float
+    at: float
+
+
+@dataclass
+class _TagStats:
+    calls: int = 0
+    hits: int = 0
+    saved_ms: float = 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "hits": self.hits,
+            "hit_rate": self.hits / self.calls if self.calls else 0.0,
+            "saved_ms": round(self.saved_ms, 1),
+        }
+
+
+class DetectionCache:
+    """
+    Reuse the last detections for a frame that has not visibly changed.
+
+    attach(engine) wraps the engine's detect_bgr, which detect_pil and
+    recognize go through. A frame hits when its gray thumbnail is identical to
+    the last one detected with the same (shape, imgsz, conf, iou), or within
+    `threshold` mean / `max_pixel_diff` single-pixel difference of it, and the
+    cached result is younger than `ttl_s`. Hits return copies of the cached
+    meta/dets with meta["cache"] = "hit" and skip training-debug capture.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_s: Optional[float] = None,
+        threshold: Optional[float] = None,
+        max_pixel_diff: int = 24,
+        thumb_width: int = 64,
+        max_entries: int = 16,
+        log_every_s: float = 60.0,
+    ) -> None:
+        self.ttl_s = float(ttl_s if ttl_s is not None else Settings.DETECTION_CACHE_TTL_S)
+        self.threshold = float(
+            threshold if threshold is not None else Settings.DETECTION_CACHE_DIFF
+        )
+        self.max_pixel_diff = int(max_pixel_diff)
+        self.thumb_width = int(thumb_width)
+        self.max_entries = max(1, int(max_entries))
+        self.log_every_s = float(log_every_s)
+        self._entries: "OrderedDict[Signature, _Entry]" = OrderedDict()
+        self._stats: Dict[str, _TagStats] = defaultdict(_TagStats)
+        self._lock = threading.Lock()
+        self._last_log = time.monotonic()
+        self._patched: List[Tuple[Any, bool, Any]] = []
+
+    # ---- lookup ----
+    def _signature(
+        self, bgr: np.ndarray, imgsz: Optional[int], conf: Optional[float], iou: Optional[float]
+    ) -> Signature:
+        return (
+            tuple(bgr.shape),
+            int(imgsz if imgsz is not None else Settings.YOLO_IMGSZ),
+            float(conf if conf is not None else Settings.YOLO_CONF),
+            float(iou if iou is not None else Settings.YOLO_IOU),
+        )
+
+    def _match(self, entry: _Entry, digest: bytes, thumb: np.ndarray, now: float) -> bool:
+        if now - entry.at > self.ttl_s:
+            return False
+        if entry.digest == digest:
+            return True
+        diff = np.abs(entry.thumb - thumb)
+        return float(diff.mean()) <= self.threshold and int(diff.max()) <= self.max_pixel_diff
+
+    def detect(
+        self,
+        detect_fn: Callable[..., Tuple[Dict[str, Any], List[DetectionDict]]],
+        bgr: np.ndarray,
+        **kwargs: Any,
+    ) -> Tuple[Dict[str, Any], List[DetectionDict]]:
+        """detect_fn(bgr, **kwargs) through the cache; stats go to kwargs["tag"]."""
+        t0 = time.perf_counter()
+        tag = kwargs.get("tag") or "general"
+        sig = self._signature(bgr, kwargs.get("imgsz"), kwargs.get("conf"), kwargs.get("iou"))
+        digest, thumb = fingerprint(bgr, self.thumb_width)
+        now = time.monotonic()
+
+        hit: Optional[Tuple[Dict[str, Any], List[DetectionDict]]] = None
+        with self._lock:
+            st = self._stats[tag]
+            st.calls += 1
+            entry = self._entries.get(sig)
+            if entry is not None and self._match(entry, digest, thumb, now):
+                self._entries.move_to_end(sig)
+                st.hits += 1
+                st.saved_ms += max(0.0, entry.cost_ms - (time.perf_counter() - t0) * 1000.0)
+                hit = ({**entry.meta, "cache": "hit"}, copy.deepcopy(entry.dets))
+                due = self._log_due(now)
+        if hit is not None:
+            if due:
+                self.log_stats()
+            return hit
+
+        meta, dets = detect_fn(bgr, **kwargs)
+        cost_ms = (time.perf_counter() - t0) * 1000.0
+        with self._lock:
+            self._entries[sig] = _Entry(
+                digest, thumb, dict(meta), copy.deepcopy(dets), cost_ms, time.monotonic()
+            )
+            self._entries.move_to_end(sig)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            due = self._log_due(now)
+        if due:
+            self.log_stats()
+        return meta, dets
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    # ---- metrics ----
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """{tag: {"calls", "hits", "hit_rate", "saved_ms"}} since construction."""
+        with self._lock:
+            return {tag: s.as_dict() for tag, s in sorted(self._stats.items())}
+
+    def log_stats(self) -> None:
+        for tag, s in self.stats().items():
+            logger_uma.info(
+                "[detcache] %s: %d/%d hits (%.0f%%), saved %.0f ms",
+                tag,
+                s["hits"],
+                s["calls"],
+                s["hit_rate"] * 100.0,
+                s["saved_ms"],
+            )
+
+    def _log_due(self, now: float) -> bool:
+        # called with the lock held
+        if self.log_every_s <= 0 or now - self._last_log < self.log_every_s:
+            return False
+        self._last_log = now
+        return True
+
+    # ---- wrapping a live engine ----
+    def attach(self, engine: Any) -> Any:
+        """Route `engine.detect_bgr` through the cache; returns the engine."""
+        orig = engine.detect_bgr
+        had = "detect_bgr" in vars(engine)
+        self._patched.append((engine, had, vars(engine).get("detect_bgr")))
+
+        def detect_bgr(bgr, **kwargs):
+            return self.detect(orig, bgr, **kwargs)
+
+        engine.detect_bgr = detect_bgr
+        engine.detection_cache = self
+        return engine
+
+    def detach(self) -> None:
+        """Restore every detect_bgr replaced by attach()."""
+        for engine, had, prev in reversed(self._patched):
+            if had:
+                engine.detect_bgr = prev
+            else:
+                vars(engine).pop("detect_bgr", None)
+            vars(engine).pop("detection_cache", None)
+        self._patched.clear()
@@ -0,0 +1,260 @@
+# core/perception/yolo/evaluate.py
+from __future__ import annotations
+
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from PIL import Image
+
+from core.perception.yolo.interface import IDetector
+from core.settings import Settings
+from core.types import DetectionDict
+
+Box = Tuple[float, float, float, float]
+GroundTruth = List[Tuple[str, Box]]  # (class name, xyxy) per object in one frame
+
+EVAL_CONF = 0.001  # mAP is computed over the whole PR curve, not at the operating conf
+
+
+def box_iou(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Pairwise IoU of xyxy boxes: (N, 4) x (M, 4) -> (N, M)."""
+    lt = np.maximum(a[:, None, :2], b[None, :, :2])
+    rb = np.minimum(a[:, None, 2:], b[None, :, 2:])
+    inter = (rb - lt).clip(0).prod(axis=2)
+    area_a = (a[:, 2:] - a[:, :2]).clip(0).prod(axis=1)
+    area_b = (b[:, 2:] - b[:, :2]).clip(0).prod(axis=1)
+    return inter / (area_a[:, None] + area_b[None, :] - inter + 1e-9)
+
+
+def average_precision(tp: np.ndarray, conf: np.ndarray, n_gt: int) -> float:
+    """COCO-style 101-point interpolated AP for one class."""
+    if n_gt <= 0:
+        return float("nan")
+    if tp.size == 0:
+        return 0.0
+    order = np.argsort(-conf, kind="stable")
+    ctp = np.cumsum(tp[order])
+    recall = ctp / n_gt
+    precision = ctp / np.arange(1, tp.size + 1)
+    precision = np.maximum.accumulate(precision[::-1])[::-1]  # monotone envelope
+    idx = np.searchsorted(recall, np.linspace(0.0, 1.0, 101), side="left")
+    q = np.zeros(101)
+    ok = idx < recall.size
+    q[ok] = precision[idx[ok]]
+    return float(q.mean())
+
+
+def per_class_ap(
+    preds: Sequence[List[DetectionDict]],
+    gts: Sequence[GroundTruth],
+    *,
+    iou_thr: float = 0.5,
+) -> Dict[str, Dict[str, float]]:
+    """
+    AP@iou_thr per class over a set of frames. Each prediction is greedily
+    matched (by descending confidence) to the best unmatched box of its class.
+    Returns {class: {"ap", "n_gt", "n_pred"}} for every class with ground truth.
+    """
+    hits: Dict[str, List[Tuple[float, float]]] = defaultdict(list)
+    n_gt: Dict[str, int] = defaultdict(int)
+    for dets, gt in zip(preds, gts):
+        gt_by_cls: Dict[str, List[Box]] = defaultdict(list)
+        for name, box in gt:
+            gt_by_cls[name].append(box)
+            n_gt[name] += 1
+        det_by_cls: Dict[str, List[DetectionDict]] = defaultdict(list)
+        for d in dets:
+            det_by_cls[d["name"]].append(d)
+        for name, cls_dets in det_by_cls.items():
+            g = np.asarray(gt_by_cls.get(name, []), dtype=np.float32).reshape(-1, 4)
+            used = np.zeros(len(g), dtype=bool)
+            for d in sorted(cls_dets, key=lambda d: -float(d["conf"])):
+                tp = 0.0
+                if len(g):
+                    ious = box_iou(np.asarray([d["xyxy"]], dtype=np.float32), g)[0]
+                    ious[used] = -1.0
+                    j = int(ious.argmax())
+                    if ious[j] >= iou_thr:
+                        used[j] = True
+                        tp = 1.0
+                hits[name].append((float(d["conf"]), tp))
+
+    out: Dict[str, Dict[str, float]] = {}
+    for name in sorted(n_gt):
+        rec = np.asarray(hits.get(name, []), dtype=np.float64).reshape(-1, 2)
+        out[name] = {
+            "ap": average_precision(rec[:, 1], rec[:, 0], n_gt[name]),
+            "n_gt": n_gt[name],
+            "n_pred": int(rec.shape[0]),
+        }
+    return out
+
+
+def class_recall(
+    preds: Sequence[List[DetectionDict]],
+    gts: Sequence[GroundTruth],
+    *,
+    iou_thr: float = 0.5,
+) -> Dict[str, Tuple[int, int]]:
+    """{class: (found, total)} with one-to-one matching at IoU >= iou_thr."""
+    found: Dict[str, int] = defaultdict(int)
+    total: Dict[str, int] = defaultdict(int)
+    for dets, gt in zip(preds, gts):
+        for name in {n for n, _ in gt}:
+            g = np.asarray([b for n, b in gt if n == name], dtype=np.float32)
+            p = np.asarray(
+                [d["xyxy"] for d in sorted(dets, key=lambda d: -float(d["conf"])) if d["name"] == name],
+                dtype=np.float32,
+            ).reshape(-1, 4)
+            total[name] += len(g)
+            if not len(p):
+                continue
+            ious = box_iou(p, g)
+            used = np.zeros(len(g), dtype=bool)
+            for row in ious:
+                row = np.where(used, -1.0, row)
+                j = int(row.argmax())
+                if row[j] >= iou_thr:
+                    used[j] = True
+            found[name] += int(used.sum())
+    return {name: (found[name], total[name]) for name in sorted(total)}
+
+
+def load_yolo_labels(
+    path: Union[str, Path], names: Dict[int, str], width: int, height: int
+) -> GroundTruth:
+    """Read a YOLO `.txt` label file (cls cx cy w h, normalized) into xyxy pixels."""
+    gt: GroundTruth = []
+    p = Path(path)
+    if not p.exists():
+        return gt
+    for line in p.read_text(encoding="utf-8").splitlines():
+        parts = line.split()
+        if len(parts) < 5:
+            continue
+        c = int(parts[0])
+        cx, cy, w, h = (float(v) for v in parts[1:5])
+        gt.append(
+            (
+                names.get(c, str(c)),
+                (
+                    (cx - w / 2) * width,
+                    (cy - h / 2) * height,
+                    (cx + w / 2) * width,
+                    (cy + h / 2) * height,
+                ),
+            )
+        )
+    return gt
+
+
+def latency_stats(samples_ms: Sequence[float]) -> Dict[str, float]:
+    s = sorted(samples_ms)
+    if not s:
+        return {"mean": 0.0, "p50": 0.0, "p95": 0.0}
+    return {
+        "mean": float(np.mean(s)),
+        "p50": s[len(s) // 2],
+        "p95": s[min(len(s) - 1, int(0.95 * len(s)))],
+    }
+
+
+def _timed(engine: IDetector, img: Image.Image, **kw: Any) -> Tuple[float, Dict[str, Any], List[DetectionDict]]:
+    t0 = time.perf_counter()
+    meta, dets = engine.detect_pil(img, **kw)
+    return (time.perf_counter() - t0) * 1000.0, meta, dets
+
+
+def drift_report(
+    reference: IDetector,
+    candidate: IDetector,
+    frames: Sequence[Union[str, Path]],
+    *,
+    labels_dir: Optional[Union[str, Path]] = None,
+    imgsz: Optional[int] = None,
+    iou_thr: float = 0.5,
+    warmup: int = 2,
+) -> Dict[str, Any]:
+    """
+    Compare a candidate detector (e.g. INT8) against a reference (fp32).
+
+    With `labels_dir` (YOLO `.txt` files named after each frame) both models
+    are scored against the labels and drift = AP(candidate) - AP(reference).
+    Without labels, the reference's detections at the operating confidence
+    serve as ground truth, so AP(reference) is 1.0 by construction and the
+    drift is how much of the reference's output the candidate loses.
+
+    Latency is measured at the operating confidence (Settings.YOLO_CONF) on
+    every frame, after `warmup` untimed calls per model.
+    """
+    images = [(Path(f), Image.open(f).convert("RGB")) for f in frames]
+    if not images:
+        raise ValueError("drift_report needs at least one frame")
+    for i in range(warmup):
+        img = images[i % len(images)][1]
+        reference.detect_pil(img, imgsz=imgsz)
+        candidate.detect_pil(img, imgsz=imgsz)
+
+    per_frame: List[Dict[str, Any]] = []
+    ref_ms: List[float] = []
+    cand_ms: List[float] = []
+    ref_eval: List[List[DetectionDict]] = []
+    cand_eval: List[List[DetectionDict]] = []
+    gts: List[GroundTruth] = []
+    names: Dict[int, str] = {}
+
+    for path, img in images:
+        r_ms, r_meta, r_dets = _timed(reference, img, imgsz=imgsz)
+        c_ms, _, c_dets = _timed(candidate, img, imgsz=imgsz)
+        ref_ms.append(r_ms)
+        cand_ms.append(c_ms)
+        per_frame.append(
+            {
+                "frame": path.name,
+                "ref_ms": r_ms,
+                "cand_ms": c_ms,
+                "n_ref": len(r_dets),
+                "n_cand": len(c_dets),
+            }
+        )
+        _, c_low = candidate.detect_pil(img, imgsz=imgsz, conf=EVAL_CONF)
+        cand_eval.append(c_low)
+        if labels_dir is not None:
+            if not names:
+                raw = r_meta.get("names") or {}
+                names = raw if isinstance(raw, dict) else dict(enumerate(raw))
+            gts.append(load_yolo_labels(Path(labels_dir) / f"{path.stem}.txt", names, *img.size))
+            ref_eval.append(reference.detect_pil(img, imgsz=imgsz, conf=EVAL_CONF)[1])
+        else:
+            gts.append([(d["name"], tuple(d["xyxy"])) for d in r_dets])  # type: ignore[misc]
+
+    cand_ap = per_class_ap(cand_eval, gts, iou_thr=iou_thr)
+    ref_ap = per_class_ap(ref_eval, gts, iou_thr=iou_thr) if labels_dir is not None else None
+
+    classes: Dict[str, Dict[str, float]] = {}
+    for name, c in cand_ap.items():
+        r = ref_ap[name]["ap"] if ref_ap is not None else 1.0
+        classes[name] = {
+            "n_gt": c["n_gt"],
+            "ap_ref": r,
+            "ap_cand": c["ap"],
+            "drift": c["ap"] - r,
+        }
+    map_ref = float(np.mean([c["ap_ref"] for c in classes.values()])) if classes else float("nan")
+    map_cand = float(np.mean([c["ap_cand"] for c in classes.values()])) if classes else float("nan")
+
+    return {
+        "mode": "labels" if labels_dir is not None else "reference",
+        "frames": len(images),
+        "iou_thr": iou_thr,
+        "conf": Settings.YOLO_CONF,
+        "map_ref": map_ref,
+        "map_cand": map_cand,
+        "map_drift": map_cand - map_ref,
+        "classes": classes,
+        "latency": {"reference": latency_stats(ref_ms), "candidate": latency_stats(cand_ms)},
+        "per_frame": per_frame,
+    }
@@ -0,0 +1,186 @@
+# core/perception/yolo/imgsz_profile.py
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from PIL import Image
+
+from core.perception.yolo.evaluate import GroundTruth, class_recall, load_yolo_labels
+from core.settings import Settings
+from core.types import DetectionDict
+from core.utils.logger import logger_uma
+
+IMAGE_EXTS = (".png", ".jpg", ".jpeg")
+DEFAULT_SIZES = (320, 384, 448, 512, 576, 640, 704, 768, 832)
+
+
+def model_key(weights: Union[str, Path, None]) -> str:
+    """Profile key for a weights path: its stem, ignoring .onnx/.int8 suffixes."""
+    return Path(str(weights or Settings.YOLO_WEIGHTS_URA)).name.split(".")[0]
+
+
+class ImgszProfile:
+    """
+    Smallest safe YOLO input size per model and call-site tag, as produced by
+    `python yolo_tools.py imgsz-tune`:
+
+        {"models": {"uma_ura": {"training": 640, "waiter": 512, ...}, ...}}
+
+    A tag's "default" entry (if any) covers tags that were not tuned.
+    """
+
+    def __init__(self, models: Optional[Dict[str, Dict[str, int]]] = None) -> None:
+        self.models: Dict[str, Dict[str, int]] = {
+            m: {t: int(s) for t, s in tags.items()} for m, tags in (models or {}).items()
+        }
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "ImgszProfile":
+        p = Path(path)
+        if not p.exists():
+            return cls()
+        data = json.loads(p.read_text(encoding="utf-8"))
+        return cls(data.get("models") or {})
+
+    def save(self, path: Union[str, Path]) -> None:
+        p = Path(path)
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_text(json.dumps({"models": self.models}, indent=2, sort_keys=True), encoding="utf-8")
+
+    def lookup(self, weights: Union[str, Path, None], tag: Optional[str]) -> Optional[int]:
+        tags = self.models.get(model_key(weights))
+        if not tags:
+            return None
+        return tags.get(tag or "general", tags.get("default"))
+
+    def update(self, weights: Union[str, Path, None], tuned: Dict[str, int]) -> None:
+        self.models.setdefault(model_key(weights), {}).update(tuned)
+
+
+_lock = threading.Lock()
+_cached: Tuple[Optional[float], ImgszProfile] = (None, ImgszProfile())
+
+
+def active_profile() -> ImgszProfile:
+    """Settings.YOLO_IMGSZ_PROFILE, reloaded when the file changes."""
+    global _cached
+    try:
+        mtime = Path(Settings.YOLO_IMGSZ_PROFILE).stat().st_mtime
+    except OSError:
+        return ImgszProfile()
+    if _cached[0] != mtime:
+        with _lock:
+            if _cached[0] != mtime:
+                try:
+                    _cached = (mtime, ImgszProfile.load(Settings.YOLO_IMGSZ_PROFILE))
+                except Exception as e:
+                    logger_uma.warning("[imgsz] ignoring unreadable profile: %s", e)
+                    _cached = (mtime, ImgszProfile())
+    return _cached[1]
+
+
+def tuned_imgsz(
+    weights: Union[str, Path, None], tag: Optional[str], imgsz: Optional[int]
+) -> Optional[int]:
+    """
+    Input size for a recognize() call: the profile's size for (model, tag)
+    when it is smaller than what the caller asked for, else the request.
+    """
+    if not Settings.YOLO_IMGSZ_AUTOTUNE:
+        return imgsz
+    tuned = active_profile().lookup(weights, tag)
+    if tuned is None:
+        return imgsz
+    return min(tuned, imgsz if imgsz is not None else Settings.YOLO_IMGSZ)
+
+
+# ---------- calibration ----------
+def frames_by_tag(
+    roots: Iterable[Union[str, Path]], *, tag: Optional[str] = None
+) -> Dict[str, List[Path]]:
+    """
+    Group frames by call-site tag. Debug-corpus captures
+    (<DEBUG_DIR>/[agent/]<tag>/raw/*.png) take the tag from their folder;
+    anything else uses `tag` or its parent folder's name.
+    """
+    out: Dict[str, List[Path]] = defaultdict(list)
+    for root in roots:
+        root = Path(root)
+        paths = [root] if root.is_file() else sorted(root.rglob("*"))
+        for p in paths:
+            if p.suffix.lower() not in IMAGE_EXTS:
+                continue
+            if tag:
+                out[tag].append(p)
+            elif p.parent.name == "raw":
+                out[p.parent.parent.name].append(p)
+            else:
+                out[p.parent.name].append(p)
+    return dict(out)
+
+
+def tune_tag(
+    engine: Any,
+    frames: Sequence[Path],
+    *,
+    sizes: Sequence[int] = DEFAULT_SIZES,
+    reference_imgsz: Optional[int] = None,
+    min_recall: float = 0.98,
+    classes: Optional[Sequence[str]] = None,
+    labels_dir: Optional[Union[str, Path]] = None,
+    iou_thr: float = 0.5,
+) -> Dict[str, Any]:
+    """
+    Smallest size in `sizes` whose recall on every needed class stays at or
+    above `min_recall`.
+
+    Ground truth is the YOLO labels in `labels_dir` when given, otherwise the
+    engine's own detections at `reference_imgsz` (default YOLO_IMGSZ). The
+    needed classes are `classes`, or every class present in the ground truth.
+    Returns {"imgsz", "classes", "sizes": {size: {"recall", "min_recall", "ms"}}}.
+    """
+    ref_size = int(reference_imgsz or Settings.YOLO_IMGSZ)
+    images = [(p, Image.open(p).convert("RGB")) for p in frames]
+    names: Dict[int, str] = {}
+    gts: List[GroundTruth] = []
+    for path, img in images:
+        meta, dets = engine.detect_pil(img, imgsz=ref_size)
+        if labels_dir is not None:
+            if not names:
+                raw = meta.get("names") or {}
+                names = raw if isinstance(raw, dict) else dict(enumerate(raw))
+            gts.append(load_yolo_labels(Path(labels_dir) / f"{path.stem}.txt", names, *img.size))
+        else:
+            gts.append([(d["name"], tuple(d["xyxy"])) for d in dets])  # type: ignore[misc]
+
+    if classes:
+        wanted = set(classes)
+        gts = [[g for g in gt if g[0] in wanted] for gt in gts]
+    needed = sorted({n for gt in gts for n, _ in gt})
+
+    report: Dict[int, Dict[str, Any]] = {}
+    best = ref_size
+    if not needed:
+        # nothing to keep recall on: no evidence that a smaller size is safe
+        return {"imgsz": best, "classes": needed, "frames": len(images), "sizes": report}
+    for size in sorted(s for s in sizes if s <= ref_size):
+        preds: List[List[DetectionDict]] = []
+        t0 = time.perf_counter()
+        for _, img in images:
+            preds.append(engine.detect_pil(img, imgsz=size)[1])
+        ms = (time.perf_counter() - t0) * 1000.0 / max(1, len(images))
+        recall = {
+            n: (found / total if total else 1.0)
+            for n, (found, total) in class_recall(preds, gts, iou_thr=iou_thr).items()
+        }
+        worst = min(recall.values(), default=1.0)
+        report[size] = {"recall": recall, "min_recall": worst, "ms": ms}
+        if worst >= min_recall:
+            best = size
+            break
+    return {"imgsz": best, "classes": needed, "frames": len(images), "sizes": report}
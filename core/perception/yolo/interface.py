@@ -1,9 +1,15 @@
 # core/perception/yolo/interface.py
 from __future__ import annotations
-from typing import Any, Dict, List, Optional, Protocol, Tuple, runtime_checkable
+from typing import Any, Dict, List, Optional, Protocol, Sequence, Tuple, Union, runtime_checkable
+import numpy as np
 from PIL import Image
 from core.controllers.base import IController, RegionXYWH
+from core.perception.yolo.roi import ROI
 from core.types import DetectionDict
+from core.utils.frame import Frame
+
+# detect_batch inputs: captures/crops as PIL, Frame, or BGR ndarray
+BatchImage = Union[Image.Image, Frame, np.ndarray]
 
 
 @runtime_checkable
@@ -37,6 +43,29 @@ class IDetector(Protocol):
         """Run detection on a PIL image and return (meta, dets)."""
         raise NotImplementedError
 
+    def detect_batch(
+        self,
+        images: Sequence[BatchImage],
+        *,
+        imgsz: Optional[int] = None,
+        conf: Optional[float] = None,
+        iou: Optional[float] = None,
+        tag: str = "general",
+        agent: Optional[str] = None,
+    ) -> List[Tuple[Dict[str, Any], List[DetectionDict]]]:
+        """
+        Run detection on several images and return one (meta, dets) per image,
+        in order. Engines that can share one forward pass override this; the
+        default runs the images one at a time.
+        """
+        out = []
+        for img in images:
+            if isinstance(img, np.ndarray):
+                out.append(self.detect_bgr(img, imgsz=imgsz, conf=conf, iou=iou))
+            else:
+                out.append(self.detect_pil(img, imgsz=imgsz, conf=conf, iou=iou))
+        return out
+
     def recognize(
         self,
         *,
@@ -46,9 +75,16 @@ class IDetector(Protocol):
         iou: Optional[float] = None,
         tag: str = "general",
         agent: Optional[str] = None,
+        roi: Optional[ROI] = None,
+        classes: Optional[Sequence[str]] = None,
     ) -> Tuple[Image.Image, Dict[str, Any], List[DetectionDict]]:
         """
         Capture via controller and run detection.
         Returns (captured_image, meta, dets).
+
+        With `roi` (relative or pixel xyxy on the capture) only that part is
+        detected, at an input size scaled down from `imgsz` by the ROI's share
+        of the frame; boxes still come back in full-frame coordinates.
+        `classes` drops every other class from the result.
         """
         raise NotImplementedError
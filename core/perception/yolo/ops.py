@@ -0,0 +1,152 @@
+# core/perception/yolo/ops.py
+"""
+Framework-free YOLO pre/post-processing (numpy + cv2), mirroring the
+ultralytics predict path: letterbox, head decoding, NMS and box rescaling,
+plus the low-confidence capture dump shared by the detector engines.
+"""
+from __future__ import annotations
+
+import os
+import time
+from typing import Any, List, Optional, Tuple
+
+import cv2
+import numpy as np
+from PIL import Image
+
+from core.settings import Settings
+from core.types import DetectionDict
+from core.utils.logger import logger_uma
+
+LETTERBOX_COLOR = (114, 114, 114)
+MAX_WH = 7680  # class offset for class-aware NMS (same as ultralytics)
+MAX_NMS = 30000
+MAX_DET = 300
+
+
+def letterbox(
+    bgr: np.ndarray, new_shape: Tuple[int, int], *, auto: bool = False, stride: int = 32
+) -> np.ndarray:
+    """
+    Resize keeping aspect ratio and pad to `new_shape` (h, w) like ultralytics'
+    LetterBox(center=True). With `auto`, pad only up to a multiple of `stride`
+    (rectangular inference, for dynamic-shape models).
+    """
+    h, w = bgr.shape[:2]
+    r = min(new_shape[0] / h, new_shape[1] / w)
+    new_unpad = (int(round(w * r)), int(round(h * r)))
+    dw, dh = new_shape[1] - new_unpad[0], new_shape[0] - new_unpad[1]
+    if auto:
+        dw, dh = np.mod(dw, stride), np.mod(dh, stride)
+    dw, dh = dw / 2.0, dh / 2.0
+    if (w, h) != new_unpad:
+        bgr = cv2.resize(bgr, new_unpad, interpolation=cv2.INTER_LINEAR)
+    top, bottom = int(round(dh - 0.1)), int(round(dh + 0.1))
+    left, right = int(round(dw - 0.1)), int(round(dw + 0.1))
+    return cv2.copyMakeBorder(
+        bgr, top, bottom, left, right, cv2.BORDER_CONSTANT, value=LETTERBOX_COLOR
+    )
+
+
+def to_blob(letterboxed_bgr: np.ndarray, dtype: Any = np.float32) -> np.ndarray:
+    """BGR HWC uint8 -> RGB NCHW in [0, 1]."""
+    rgb = letterboxed_bgr[..., ::-1].transpose(2, 0, 1)
+    return np.ascontiguousarray(rgb, dtype=dtype)[None] / np.asarray(255.0, dtype=dtype)
+
+
+def nms(boxes: np.ndarray, scores: np.ndarray, iou_thr: float) -> np.ndarray:
+    """Greedy IoU NMS over xyxy boxes; returns kept indices by descending score."""
+    x1, y1, x2, y2 = boxes[:, 0], boxes[:, 1], boxes[:, 2], boxes[:, 3]
+    areas = (x2 - x1).clip(0) * (y2 - y1).clip(0)
+    order = scores.argsort()[::-1]
+    keep: List[int] = []
+    while order.size:
+        i = int(order[0])
+        keep.append(i)
+        rest = order[1:]
+        if not rest.size:
+            break
+        iw = (np.minimum(x2[i], x2[rest]) - np.maximum(x1[i], x1[rest])).clip(0)
+        ih = (np.minimum(y2[i], y2[rest]) - np.maximum(y1[i], y1[rest])).clip(0)
+        inter = iw * ih
+        iou = inter / (areas[i] + areas[rest] - inter + 1e-9)
+        order = rest[iou <= iou_thr]
+    return np.asarray(keep, dtype=np.int64)
+
+
+def decode(
+    pred: np.ndarray, *, conf: float, iou: float, max_det: int = MAX_DET
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Decode one raw YOLOv8/11 head output (4 + nc, N) into (xyxy, conf, cls),
+    best class per anchor, class-aware NMS. Boxes are in letterboxed pixels.
+    """
+    p = pred.T  # (N, 4 + nc)
+    scores = p[:, 4:]
+    cls = scores.argmax(axis=1)
+    best = scores[np.arange(scores.shape[0]), cls]
+    m = best > conf
+    if not m.any():
+        empty = np.zeros((0,), dtype=np.float32)
+        return np.zeros((0, 4), dtype=np.float32), empty, empty.astype(np.int64)
+    xywh, best, cls = p[m, :4], best[m], cls[m]
+    if best.size > MAX_NMS:
+        top = best.argsort()[::-1][:MAX_NMS]
+        xywh, best, cls = xywh[top], best[top], cls[top]
+    xyxy = np.empty_like(xywh)
+    xyxy[:, :2] = xywh[:, :2] - xywh[:, 2:] / 2
+    xyxy[:, 2:] = xywh[:, :2] + xywh[:, 2:] / 2
+    keep = nms(xyxy + (cls * MAX_WH)[:, None], best, iou)[:max_det]
+    return xyxy[keep], best[keep], cls[keep]
+
+
+def scale_boxes(
+    xyxy: np.ndarray, input_hw: Tuple[int, int], shape_hw: Tuple[int, int]
+) -> np.ndarray:
+    """Map xyxy from the letterboxed input back to the original image and clip."""
+    gain = min(input_hw[0] / shape_hw[0], input_hw[1] / shape_hw[1])
+    pad_w = round((input_hw[1] - shape_hw[1] * gain) / 2 - 0.1)
+    pad_h = round((input_hw[0] - shape_hw[0] * gain) / 2 - 0.1)
+    out = xyxy.astype(np.float32, copy=True)
+    out[:, [0, 2]] -= pad_w
+    out[:, [1, 3]] -= pad_h
+    out /= gain
+    out[:, [0, 2]] = out[:, [0, 2]].clip(0, shape_hw[1])
+    out[:, [1, 3]] = out[:, [1, 3]].clip(0, shape_hw[0])
+    return out
+
+
+def maybe_store_debug(
+    pil_img: Image.Image,
+    dets: List[DetectionDict],
+    *,
+    tag: str,
+    thr: float,
+    agent: Optional[str] = None,
+) -> None:
+    """Save the capture for training when STORE_FOR_TRAINING and a det is at/below `thr`."""
+    if not Settings.STORE_FOR_TRAINING or not dets:
+        return
+    lows = [d for d in dets if float(d.get("conf", 0.0)) <= float(thr)]
+    if not lows:
+        return
+    try:
+        agent_segment = (agent or "").strip()
+        base_dir = Settings.DEBUG_DIR / agent_segment if agent_segment else Settings.DEBUG_DIR
+        out_dir_raw = base_dir / tag / "raw"
+        os.makedirs(out_dir_raw, exist_ok=True)
+
+        ts = time.strftime("%Y%m%d-%H%M%S") + f"_{int((time.time() % 1) * 1000):03d}"
+
+        lowest = min(lows, key=lambda d: float(d.get("conf", 0.0)))
+        conf_line = f"{float(lowest.get('conf', 0.0)):.2f}"
+        raw_name = str(lowest.get("name", "unknown")).strip()
+        class_segment = "".join(
+            ch if ch.isalnum() or ch in "-_" else "-" for ch in raw_name
+        ) or "unknown"
+
+        raw_path = out_dir_raw / f"{tag}_{ts}_{class_segment}_{conf_line}.png"
+        pil_img.save(raw_path)
+        logger_uma.debug("saved low-conf training debug -> %s", raw_path)
+    except Exception as e:
+        logger_uma.debug("failed saving training debug: %s", e)
@@ -0,0 +1,151 @@
+# core/perception/yolo/quantize.py
+from __future__ import annotations
+
+import random
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import cv2
+import numpy as np
+
+from core.perception.yolo.ops import letterbox, to_blob
+from core.settings import Settings
+from core.utils.logger import logger_uma
+
+IMAGE_EXTS = (".png", ".jpg", ".jpeg")
+
+
+def calibration_frames(
+    roots: Optional[Iterable[Union[str, Path]]] = None,
+    *,
+    limit: int = 256,
+    seed: int = 0,
+) -> List[Path]:
+    """
+    Frames for static-quantization calibration, sampled from the training
+    corpus (Settings.DEBUG_DIR by default: the low-confidence captures saved by
+    STORE_FOR_TRAINING and collect_data_training.py). The sample is seeded so
+    repeated runs calibrate on the same frames.
+    """
+    paths: List[Path] = []
+    for root in roots or [Settings.DEBUG_DIR]:
+        root = Path(root)
+        if root.is_file():
+            paths.append(root)
+        elif root.is_dir():
+            paths.extend(p for p in root.rglob("*") if p.suffix.lower() in IMAGE_EXTS)
+    paths = sorted(set(paths))
+    if len(paths) > limit:
+        paths = sorted(random.Random(seed).sample(paths, limit))
+    return paths
+
+
+class FrameCalibrationReader:
+    """onnxruntime CalibrationDataReader feeding letterboxed frames one by one."""
+
+    def __init__(self, frames: Sequence[Path], input_name: str, input_hw: Tuple[int, int]):
+        self.frames = list(frames)
+        self.input_name = input_name
+        self.input_hw = input_hw
+        self._it = iter(self.frames)
+
+    def get_next(self) -> Optional[Dict[str, np.ndarray]]:
+        for path in self._it:
+            bgr = cv2.imread(str(path), cv2.IMREAD_COLOR)
+            if bgr is None:
+                logger_uma.debug("[quant] skipping unreadable frame %s", path)
+                continue
+            return {self.input_name: to_blob(letterbox(bgr, self.input_hw))}
+        return None
+
+    def rewind(self) -> None:
+        self._it = iter(self.frames)
+
+
+def _input_spec(model: Any, imgsz: Optional[int]) -> Tuple[str, Tuple[int, int]]:
+    inp = model.graph.input[0]
+    dims = [d.dim_value if d.HasField("dim_value") else None for d in inp.type.tensor_type.shape.dim]
+    if dims[2] and dims[3]:
+        return inp.name, (int(dims[2]), int(dims[3]))
+    s = int(imgsz or Settings.YOLO_IMGSZ)
+    return inp.name, (s, s)
+
+
+def head_postprocess_nodes(model: Any) -> List[str]:
+    """
+    Nodes of the Detect head's decoding tail (DFL, anchor math, concat and
+    sigmoid) in an ultralytics export. Box coordinates and class scores share
+    one output tensor with very different ranges, so quantizing this tail
+    costs most of the accuracy for almost none of the compute; the head's
+    convolutions (cv2/cv3 branches) are still quantized.
+    """
+    idx = [int(m.group(1)) for n in model.graph.node if (m := re.match(r"/model\.(\d+)/", n.name))]
+    if not idx:
+        return []
+    prefix = f"/model.{max(idx)}/"
+    return [
+        n.name
+        for n in model.graph.node
+        if n.name.startswith(prefix) and not n.name[len(prefix):].startswith("cv")
+    ]
+
+
+def quantize_onnx(
+    onnx_path: Union[str, Path],
+    *,
+    mode: str = "static",
+    frames: Optional[Sequence[Path]] = None,
+    out: Optional[Union[str, Path]] = None,
+    imgsz: Optional[int] = None,
+    per_channel: bool = True,
+    keep_head_fp32: bool = True,
+) -> Path:
+    """
+    Write an INT8 copy of an exported detector (`<stem>.int8.onnx` by default).
+
+    "static" calibrates activation ranges on `frames` (default:
+    calibration_frames()) and emits QDQ; it is the mode that speeds up convs on
+    CPU. "dynamic" needs no data but only quantizes weights, and ConvInteger is
+    often not faster than fp32 on x86, so check it with the drift harness.
+    """
+    import onnx
+    from onnxruntime.quantization import QuantFormat, QuantType, quantize_dynamic, quantize_static
+
+    from core.perception.yolo.yolo_onnx import onnx_path_for
+
+    src = onnx_path_for(onnx_path)
+    dst = Path(out) if out else onnx_path_for(src, int8=True)
+    if mode == "dynamic":
+        quantize_dynamic(
+            str(src), str(dst), weight_type=QuantType.QUInt8, per_channel=per_channel
+        )
+    elif mode == "static":
+        frames = list(frames) if frames is not None else calibration_frames()
+        if not frames:
+            raise ValueError(
+                f"No calibration frames (looked in {Settings.DEBUG_DIR}); pass --calib <dir>"
+            )
+        model = onnx.load(str(src))
+        input_name, input_hw = _input_spec(model, imgsz)
+        quantize_static(
+            str(src),
+            str(dst),
+            FrameCalibrationReader(frames, input_name, input_hw),
+            quant_format=QuantFormat.QDQ,
+            activation_type=QuantType.QUInt8,
+            weight_type=QuantType.QInt8,
+            per_channel=per_channel,
+            nodes_to_exclude=head_postprocess_nodes(model) if keep_head_fp32 else [],
+        )
+    else:
+        raise ValueError(f"Unknown quantization mode: {mode!r} (expected 'static' or 'dynamic')")
+
+    logger_uma.info(
+        "[quant] %s -> %s (mode=%s, calib=%s)",
+        src,
+        dst,
+        mode,
+        len(frames) if mode == "static" else 0,  # type: ignore[arg-type]
+    )
+    return dst
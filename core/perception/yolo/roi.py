@@ -0,0 +1,115 @@
+# core/perception/yolo/roi.py
+from __future__ import annotations
+
+import math
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from PIL import Image
+
+from core.settings import Settings
+from core.types import XYXY, DetectionDict
+from core.utils.frame import Frame, as_frame
+
+# Region of interest for a detection call: either relative to the frame (every
+# value in [0, 1], so the same ROI works on any capture size) or absolute pixels.
+ROI = Tuple[float, float, float, float]
+
+STRIDE = 32
+
+
+def resolve_roi(roi: ROI, width: int, height: int) -> Tuple[int, int, int, int]:
+    """Absolute, clipped, integer xyxy for `roi` on a width x height frame."""
+    x1, y1, x2, y2 = (float(v) for v in roi)
+    if max(x1, y1, x2, y2) <= 1.0:
+        x1, x2 = x1 * width, x2 * width
+        y1, y2 = y1 * height, y2 * height
+    x1, x2 = max(0, int(math.floor(x1))), min(width, int(math.ceil(x2)))
+    y1, y2 = max(0, int(math.floor(y1))), min(height, int(math.ceil(y2)))
+    if x2 <= x1 or y2 <= y1:
+        raise ValueError(f"Empty ROI {roi} on a {width}x{height} frame")
+    return x1, y1, x2, y2
+
+
+def roi_imgsz(
+    box: Tuple[int, int, int, int], width: int, height: int, full_imgsz: int
+) -> int:
+    """
+    Input size that keeps the full-frame pass's pixels-per-input scale, so
+    objects reach the model at the size it was tuned for. Cost falls roughly
+    with the square of the ROI's share of the frame's long side.
+    """
+    roi_long = max(box[2] - box[0], box[3] - box[1])
+    s = full_imgsz * roi_long / float(max(width, height))
+    s = int(math.ceil(s / STRIDE) * STRIDE)
+    return max(min(Settings.YOLO_ROI_MIN_IMGSZ, full_imgsz), min(full_imgsz, s))
+
+
+def only_classes(
+    dets: List[DetectionDict], classes: Optional[Sequence[str]]
+) -> List[DetectionDict]:
+    if not classes:
+        return dets
+    wanted = set(classes)
+    return [d for d in dets if d["name"] in wanted]
+
+
+def offset_dets(dets: List[DetectionDict], dx: float, dy: float) -> List[DetectionDict]:
+    """ROI-local detections -> full-frame coordinates (renumbered)."""
+    out: List[DetectionDict] = []
+    for i, d in enumerate(dets):
+        x1, y1, x2, y2 = d["xyxy"]
+        xyxy: XYXY = (x1 + dx, y1 + dy, x2 + dx, y2 + dy)
+        out.append({**d, "idx": i, "xyxy": xyxy})
+    return out
+
+
+def within_roi(
+    dets: List[DetectionDict], box: Tuple[int, int, int, int]
+) -> List[DetectionDict]:
+    """Full-frame detections whose center lies inside `box`."""
+    out: List[DetectionDict] = []
+    for d in dets:
+        x1, y1, x2, y2 = d["xyxy"]
+        cx, cy = (x1 + x2) * 0.5, (y1 + y2) * 0.5
+        if box[0] <= cx <= box[2] and box[1] <= cy <= box[3]:
+            out.append(d)
+    return out
+
+
+def detect_in_roi(
+    engine: Any,
+    img: Union[Image.Image, Frame],
+    roi: Optional[ROI] = None,
+    *,
+    classes: Optional[Sequence[str]] = None,
+    imgsz: Optional[int] = None,
+    conf: Optional[float] = None,
+    iou: Optional[float] = None,
+    tag: str = "general",
+    agent: Optional[str] = None,
+) -> Tuple[Dict[str, Any], List[DetectionDict]]:
+    """
+    Detect only inside `roi` of `img` and return full-frame boxes.
+
+    `imgsz` is the size the full frame would use (default YOLO_IMGSZ); the
+    crop runs at roi_imgsz() of it. `classes` keeps only those names. With no
+    ROI (or Settings.YOLO_ROI off) this is a plain full-frame detect_pil plus
+    the class filter.
+    """
+    full_imgsz = imgsz if imgsz is not None else Settings.YOLO_IMGSZ
+    frame = as_frame(img)
+    if roi is None or not Settings.YOLO_ROI:
+        meta, dets = engine.detect_pil(
+            frame, imgsz=full_imgsz, conf=conf, iou=iou, tag=tag, agent=agent
+        )
+        return meta, only_classes(dets, classes)
+
+    box = resolve_roi(roi, frame.width, frame.height)
+    size = roi_imgsz(box, frame.width, frame.height, full_imgsz)
+    meta, dets = engine.detect_pil(
+        frame.crop(box), imgsz=size, conf=conf, iou=iou, tag=tag, agent=agent
+    )
+    meta = dict(meta)
+    meta["roi"] = box
+    meta["imgsz"] = size
+    return meta, offset_dets(only_classes(dets, classes), box[0], box[1])
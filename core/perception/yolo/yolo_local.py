@@ -1,17 +1,21 @@
 # core/perception/yolo/yolo_local.py
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 import numpy as np
 from PIL import Image
 from ultralytics.models import YOLO
 
-from core.perception.yolo.interface import IDetector
+from core.perception.yolo.interface import BatchImage, IDetector
+from core.perception.yolo.imgsz_profile import tuned_imgsz
+from core.perception.yolo.ops import maybe_store_debug
+from core.perception.yolo.roi import ROI, detect_in_roi
 from core.controllers.base import IController, RegionXYWH
+from core.controllers.capture_service import frame_meta
 from core.controllers.steam import SteamController
 from core.settings import Settings
 from core.types import DetectionDict
-from core.utils.img import pil_to_bgr
+from core.utils.frame import Frame, as_frame
 from core.utils.logger import logger_uma
 
 
@@ -70,45 +74,6 @@ class LocalYOLOEngine(IDetector):
             )
         return out
 
-    @staticmethod
-    def _maybe_store_debug(
-        pil_img: Image.Image,
-        dets: List[DetectionDict],
-        *,
-        tag: str,
-        thr: float,
-        agent: Optional[str] = None,
-    ) -> None:
-        import os, time
-
-        if not Settings.STORE_FOR_TRAINING or not dets:
-            return
-        lows = [d for d in dets if float(d.get("conf", 0.0)) <= float(thr)]
-        if not lows:
-            return
-        try:
-            agent_segment = (agent or "").strip()
-            base_dir = Settings.DEBUG_DIR / agent_segment if agent_segment else Settings.DEBUG_DIR
-            out_dir_raw = base_dir / tag / "raw"
-            os.makedirs(out_dir_raw, exist_ok=True)
-
-            ts = (
-                time.strftime("%Y%m%d-%H%M%S") + f"_{int((time.time() % 1) * 1000):03d}"
-            )
-
-            lowest = min(lows, key=lambda d: float(d.get("conf", 0.0)))
-            conf_line = f"{float(lowest.get('conf', 0.0)):.2f}"
-            raw_name = str(lowest.get("name", "unknown")).strip()
-            class_segment = "".join(
-                ch if ch.isalnum() or ch in "-_" else "-" for ch in raw_name
-            ) or "unknown"
-
-            raw_path = out_dir_raw / f"{tag}_{ts}_{class_segment}_{conf_line}.png"
-            pil_img.save(raw_path)
-            logger_uma.debug("saved low-conf training debug -> %s", raw_path)
-        except Exception as e:
-            logger_uma.debug("failed saving training debug: %s", e)
-
     # ---------- public API ----------
     def detect_bgr(
         self,
@@ -132,7 +97,7 @@ class LocalYOLOEngine(IDetector):
         dets = self._extract_dets(result, conf_min=conf)
 
         if original_pil_img is not None:
-            self._maybe_store_debug(
+            maybe_store_debug(
                 original_pil_img,
                 dets,
                 tag=tag,
@@ -145,7 +110,7 @@ class LocalYOLOEngine(IDetector):
 
     def detect_pil(
         self,
-        pil_img: Image.Image,
+        pil_img: Union[Image.Image, Frame],
         *,
         imgsz: Optional[int] = None,
         conf: Optional[float] = None,
@@ -153,19 +118,69 @@ class LocalYOLOEngine(IDetector):
         tag="general",
         agent: Optional[str] = None,
     ) -> Tuple[Dict[str, Any], List[DetectionDict]]:
-        bgr = pil_to_bgr(pil_img)
+        # Shared with the extractors/analyzers that later read this capture
+        frame = as_frame(pil_img)
+        bgr = frame.bgr
 
         meta, dets = self.detect_bgr(
             bgr,
             imgsz=imgsz,
             conf=conf,
             iou=iou,
-            original_pil_img=pil_img,
+            original_pil_img=frame.pil,
             tag=tag,
             agent=agent,
         )
         return meta, dets
 
+    def detect_batch(
+        self,
+        images: Sequence[BatchImage],
+        *,
+        imgsz: Optional[int] = None,
+        conf: Optional[float] = None,
+        iou: Optional[float] = None,
+        tag: str = "general",
+        agent: Optional[str] = None,
+    ) -> List[Tuple[Dict[str, Any], List[DetectionDict]]]:
+        """All images through one predict() call (a single batched forward pass)."""
+        if not images:
+            return []
+        imgsz = imgsz if imgsz is not None else Settings.YOLO_IMGSZ
+        conf = conf if conf is not None else Settings.YOLO_CONF
+        iou = iou if iou is not None else Settings.YOLO_IOU
+
+        frames = [as_frame(img) for img in images]
+        res_list = self.model.predict(
+            source=[f.bgr for f in frames],
+            imgsz=imgsz,
+            conf=conf,
+            iou=iou,
+            batch=len(frames),
+            verbose=False,
+        )
+
+        out: List[Tuple[Dict[str, Any], List[DetectionDict]]] = []
+        for frame, result in zip(frames, res_list):
+            dets = self._extract_dets(result, conf_min=conf)
+            if Settings.STORE_FOR_TRAINING:
+                maybe_store_debug(
+                    frame.pil,
+                    dets,
+                    tag=tag,
+                    thr=Settings.STORE_FOR_TRAINING_THRESHOLD,
+                    agent=agent,
+                )
+            meta = {
+                "names": result.names,
+                "imgsz": imgsz,
+                "conf": conf,
+                "iou": iou,
+                "batch": len(frames),
+            }
+            out.append((meta, dets))
+        return out
+
     def recognize(
         self,
         *,
@@ -175,16 +190,25 @@ class LocalYOLOEngine(IDetector):
         iou: Optional[float] = None,
         tag: str = "general",
         agent: Optional[str] = None,
+        roi: Optional[ROI] = None,
+        classes: Optional[Sequence[str]] = None,
     ) -> Tuple[Image.Image, Dict[str, Any], List[DetectionDict]]:
         if self.ctrl is None:
             raise RuntimeError(
                 "LocalYOLOEngine.recognize() requires a controller injected in the constructor."
             )
 
+        imgsz = tuned_imgsz(self.weights_path, tag, imgsz)
         if isinstance(self.ctrl, SteamController):
             img = self.ctrl.screenshot_left_half()
         else:
             img = self.ctrl.screenshot(region=region)
 
-        meta, dets = self.detect_pil(img, imgsz=imgsz, conf=conf, iou=iou, agent=agent)
+        if roi is not None or classes:
+            meta, dets = detect_in_roi(
+                self, img, roi, classes=classes, imgsz=imgsz, conf=conf, iou=iou, tag=tag, agent=agent
+            )
+        else:
+            meta, dets = self.detect_pil(img, imgsz=imgsz, conf=conf, iou=iou, tag=tag, agent=agent)
+        meta.update(frame_meta(img))
         return img, meta, dets
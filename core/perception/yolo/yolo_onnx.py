@@ -0,0 +1,325 @@
+# core/perception/yolo/yolo_onnx.py
+from __future__ import annotations
+
+import ast
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from PIL import Image
+
+from core.controllers.base import IController, RegionXYWH
+from core.controllers.capture_service import frame_meta
+from core.perception.yolo.interface import BatchImage, IDetector
+from core.perception.yolo.imgsz_profile import tuned_imgsz
+from core.perception.yolo.roi import ROI, detect_in_roi
+from core.perception.yolo.ops import (
+    decode,
+    letterbox,
+    maybe_store_debug,
+    scale_boxes,
+    to_blob,
+)
+from core.settings import Settings
+from core.types import DetectionDict
+from core.utils.frame import Frame, as_frame
+from core.utils.logger import logger_uma
+
+
+def onnx_path_for(weights: Union[str, Path], *, int8: bool = False) -> Path:
+    """
+    `.onnx` sibling of a `.pt` weights path (or the path itself); with `int8`,
+    the quantized `<stem>.int8.onnx` sibling written by quantize_onnx.
+    """
+    p = Path(weights)
+    if p.suffix.lower() != ".onnx":
+        p = p.with_suffix(".onnx")
+    if int8 and not p.name.endswith(".int8.onnx"):
+        p = p.with_name(p.stem + ".int8.onnx")
+    return p
+
+
+def export_onnx(
+    weights: Union[str, Path],
+    *,
+    imgsz: Optional[int] = None,
+    dynamic: bool = False,
+    half: bool = False,
+    opset: Optional[int] = None,
+    simplify: bool = True,
+) -> Path:
+    """
+    Export ultralytics `.pt` weights to ONNX next to them (needs ultralytics at
+    export time only). Static shapes are fastest on CPU; use `dynamic=True` to
+    allow per-call imgsz / rectangular inference.
+    """
+    from ultralytics.models import YOLO
+
+    imgsz = imgsz or Settings.YOLO_IMGSZ
+    kwargs: Dict[str, Any] = dict(
+        format="onnx", imgsz=imgsz, dynamic=dynamic, half=half, simplify=simplify
+    )
+    if opset is not None:
+        kwargs["opset"] = opset
+    out = Path(YOLO(str(weights)).export(**kwargs))
+    logger_uma.info("[onnx] exported %s -> %s (imgsz=%s dynamic=%s)", weights, out, imgsz, dynamic)
+    return out
+
+
+class ONNXYOLOEngine(IDetector):
+    """
+    YOLO detector running exported ONNX weights on onnxruntime, without
+    ultralytics/torch at runtime. Letterbox, decoding and NMS mirror the
+    ultralytics predict path so detections are interchangeable with
+    LocalYOLOEngine.
+    """
+
+    def __init__(
+        self,
+        ctrl: Optional[IController] = None,
+        *,
+        weights: Optional[str] = None,
+        use_gpu: Optional[bool] = None,
+        providers: Optional[Sequence[str]] = None,
+        threads: Optional[int] = None,
+        int8: Optional[bool] = None,
+    ):
+        import onnxruntime as ort
+
+        self.ctrl = ctrl
+        weights = weights or Settings.YOLO_WEIGHTS_URA
+        if int8 is None:
+            int8 = Settings.yolo_model_key(weights) in Settings.YOLO_INT8_MODELS
+        self.int8 = bool(int8) and onnx_path_for(weights, int8=True).exists()
+        if int8 and not self.int8:
+            logger_uma.warning(
+                "[onnx] INT8 weights missing for %s; using fp32 "
+                "(create them with `python yolo_tools.py quantize`)",
+                weights,
+            )
+        self.weights_path = str(onnx_path_for(weights, int8=self.int8))
+        self.int8 = self.weights_path.endswith(".int8.onnx")
+        self.use_gpu = Settings.USE_GPU if use_gpu is None else bool(use_gpu)
+        if not Path(self.weights_path).exists():
+            raise FileNotFoundError(
+                f"ONNX weights not found: {self.weights_path} "
+                "(export them with `python yolo_tools.py export <weights.pt>`)"
+            )
+
+        if providers is None:
+            available = ort.get_available_providers()
+            providers = ["CPUExecutionProvider"]
+            if self.use_gpu and "CUDAExecutionProvider" in available:
+                providers.insert(0, "CUDAExecutionProvider")
+        opts = ort.SessionOptions()
+        opts.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        threads = Settings.ONNX_THREADS if threads is None else int(threads)
+        if threads > 0:
+            opts.intra_op_num_threads = threads
+
+        logger_uma.info(f"Loading ONNX YOLO weights from: {self.weights_path}")
+        self.session = ort.InferenceSession(self.weights_path, opts, providers=list(providers))
+        inp = self.session.get_inputs()[0]
+        self.input_name = inp.name
+        self.input_dtype = np.float16 if "float16" in inp.type else np.float32
+        # None when the export has a dynamic batch axis (any batch size per run)
+        self.batch_dim: Optional[int] = inp.shape[0] if isinstance(inp.shape[0], int) else None
+        h, w = inp.shape[2], inp.shape[3]
+        # Static export: the graph fixes imgsz. Dynamic: honour per-call imgsz.
+        self.static_hw: Optional[Tuple[int, int]] = (
+            (int(h), int(w)) if isinstance(h, int) and isinstance(w, int) else None
+        )
+
+        meta = self.session.get_modelmeta().custom_metadata_map or {}
+        self.names = self._parse_names(meta.get("names"))
+        self.stride = int(ast.literal_eval(meta["stride"])) if "stride" in meta else 32
+
+    @staticmethod
+    def _parse_names(raw: Optional[str]) -> Dict[int, str]:
+        if not raw:
+            return {}
+        names = ast.literal_eval(raw)
+        if isinstance(names, dict):
+            return {int(k): str(v) for k, v in names.items()}
+        return {i: str(n) for i, n in enumerate(names)}
+
+    def _input_hw(self, imgsz: int) -> Tuple[Tuple[int, int], bool]:
+        if self.static_hw is not None:
+            return self.static_hw, False
+        s = int(np.ceil(imgsz / self.stride) * self.stride)
+        return (s, s), True
+
+    def _dets_from_pred(
+        self,
+        pred: np.ndarray,
+        input_hw: Tuple[int, int],
+        shape_hw: Tuple[int, int],
+        *,
+        conf: float,
+        iou: float,
+    ) -> List[DetectionDict]:
+        xyxy, scores, cls = decode(pred.astype(np.float32), conf=conf, iou=iou)
+        xyxy = scale_boxes(xyxy, input_hw, shape_hw)
+        return [
+            {
+                "idx": i,
+                "name": self.names.get(int(c), str(int(c))),
+                "conf": float(s),
+                "xyxy": tuple(map(float, b)),
+            }
+            for i, (b, s, c) in enumerate(zip(xyxy, scores, cls))
+        ]
+
+    def _meta(self, imgsz: int, conf: float, iou: float) -> Dict[str, Any]:
+        return {
+            "names": self.names,
+            "imgsz": imgsz,
+            "conf": conf,
+            "iou": iou,
+            "backend": "onnx-int8" if self.int8 else "onnx",
+        }
+
+    # ---------- public API ----------
+    def detect_bgr(
+        self,
+        bgr: np.ndarray,
+        *,
+        imgsz: Optional[int] = None,
+        conf: Optional[float] = None,
+        iou: Optional[float] = None,
+        original_pil_img=None,
+        tag="general",
+        agent: Optional[str] = None,
+    ) -> Tuple[Dict[str, Any], List[DetectionDict]]:
+        imgsz = imgsz if imgsz is not None else Settings.YOLO_IMGSZ
+        conf = conf if conf is not None else Settings.YOLO_CONF
+        iou = iou if iou is not None else Settings.YOLO_IOU
+
+        new_hw, auto = self._input_hw(imgsz)
+        lb = letterbox(bgr, new_hw, auto=auto, stride=self.stride)
+        blob = to_blob(lb, self.input_dtype)
+        pred = self.session.run(None, {self.input_name: blob})[0][0]
+        dets = self._dets_from_pred(pred, lb.shape[:2], bgr.shape[:2], conf=conf, iou=iou)
+
+        if original_pil_img is not None:
+            maybe_store_debug(
+                original_pil_img,
+                dets,
+                tag=tag,
+                thr=Settings.STORE_FOR_TRAINING_THRESHOLD,
+                agent=agent,
+            )
+
+        return self._meta(imgsz, conf, iou), dets
+
+    def detect_pil(
+        self,
+        pil_img: Union[Image.Image, Frame],
+        *,
+        imgsz: Optional[int] = None,
+        conf: Optional[float] = None,
+        iou: Optional[float] = None,
+        tag="general",
+        agent: Optional[str] = None,
+    ) -> Tuple[Dict[str, Any], List[DetectionDict]]:
+        frame = as_frame(pil_img)
+        return self.detect_bgr(
+            frame.bgr,
+            imgsz=imgsz,
+            conf=conf,
+            iou=iou,
+            original_pil_img=frame.pil,
+            tag=tag,
+            agent=agent,
+        )
+
+    def detect_batch(
+        self,
+        images: Sequence[BatchImage],
+        *,
+        imgsz: Optional[int] = None,
+        conf: Optional[float] = None,
+        iou: Optional[float] = None,
+        tag: str = "general",
+        agent: Optional[str] = None,
+    ) -> List[Tuple[Dict[str, Any], List[DetectionDict]]]:
+        """
+        Stack the images into NCHW runs. Each image is letterboxed exactly as
+        detect_bgr does, so a batch gives the same detections as one call per
+        image; images sharing an input shape go in one run (a dynamic-batch
+        export) or in chunks of the export's batch size (the last one padded).
+        """
+        if not images:
+            return []
+        imgsz = imgsz if imgsz is not None else Settings.YOLO_IMGSZ
+        conf = conf if conf is not None else Settings.YOLO_CONF
+        iou = iou if iou is not None else Settings.YOLO_IOU
+
+        frames = [as_frame(img) for img in images]
+        new_hw, auto = self._input_hw(imgsz)
+        lbs = [letterbox(f.bgr, new_hw, auto=auto, stride=self.stride) for f in frames]
+        by_shape: Dict[Tuple[int, ...], List[int]] = {}
+        for i, lb in enumerate(lbs):
+            by_shape.setdefault(lb.shape, []).append(i)
+
+        preds: List[Optional[np.ndarray]] = [None] * len(frames)
+        for idxs in by_shape.values():
+            chunk = self.batch_dim or len(idxs)
+            for start in range(0, len(idxs), chunk):
+                part = idxs[start : start + chunk]
+                blobs = [to_blob(lbs[i], self.input_dtype) for i in part]
+                batch = np.concatenate(blobs + [np.zeros_like(blobs[0])] * (chunk - len(part)))
+                out_part = self.session.run(None, {self.input_name: batch})[0]
+                for i, pred in zip(part, out_part):
+                    preds[i] = pred
+
+        out: List[Tuple[Dict[str, Any], List[DetectionDict]]] = []
+        for frame, lb, pred in zip(frames, lbs, preds):
+            dets = self._dets_from_pred(pred, lb.shape[:2], frame.shape[:2], conf=conf, iou=iou)
+            if Settings.STORE_FOR_TRAINING:
+                maybe_store_debug(
+                    frame.pil,
+                    dets,
+                    tag=tag,
+                    thr=Settings.STORE_FOR_TRAINING_THRESHOLD,
+                    agent=agent,
+                )
+            meta = self._meta(imgsz, conf, iou)
+            meta["batch"] = len(frames)
+            out.append((meta, dets))
+        return out
+
+    def recognize(
+        self,
+        *,
+        region: Optional[RegionXYWH] = None,
+        imgsz: Optional[int] = None,
+        conf: Optional[float] = None,
+        iou: Optional[float] = None,
+        tag: str = "general",
+        agent: Optional[str] = None,
+        roi: Optional[ROI] = None,
+        classes: Optional[Sequence[str]] = None,
+    ) -> Tuple[Image.Image, Dict[str, Any], List[DetectionDict]]:
+        if self.ctrl is None:
+            raise RuntimeError(
+                "ONNXYOLOEngine.recognize() requires a controller injected in the constructor."
+            )
+
+        imgsz = tuned_imgsz(self.weights_path, tag, imgsz)
+        # Duck-typed SteamController check: importing it pulls in pygetwindow,
+        # which refuses to import off Windows (this backend's main target)
+        left_half = getattr(self.ctrl, "screenshot_left_half", None)
+        if callable(left_half):
+            img = left_half()
+        else:
+            img = self.ctrl.screenshot(region=region)
+
+        if roi is not None or classes:
+            meta, dets = detect_in_roi(
+                self, img, roi, classes=classes, imgsz=imgsz, conf=conf, iou=iou, tag=tag, agent=agent
+            )
+        else:
+            meta, dets = self.detect_pil(img, imgsz=imgsz, conf=conf, iou=iou, tag=tag, agent=agent)
+        meta.update(frame_meta(img))
+        return img, meta, dets
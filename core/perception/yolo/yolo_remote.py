@@ -2,30 +2,34 @@
 from __future__ import annotations
 
 import base64
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 import cv2
 import numpy as np
 from PIL import Image
 import requests
 
-from core.perception.yolo.interface import IDetector
+from core.perception.yolo.interface import BatchImage, IDetector
+from core.perception.yolo.imgsz_profile import tuned_imgsz
+from core.perception.yolo.ops import maybe_store_debug
+from core.perception.yolo.roi import ROI, detect_in_roi
 from core.controllers.base import IController, RegionXYWH
+from core.controllers.capture_service import frame_meta
 from core.controllers.steam import SteamController
 from core.settings import Settings
 from core.types import DetectionDict
-from core.utils.img import pil_to_bgr, to_bgr
-from core.utils.logger import logger_uma
+from core.utils.img import to_bgr
+from core.utils.frame import Frame, as_frame
 
 
 def _encode_image_to_base64(img: Any, *, fmt: str = ".png") -> str:
     """
     Encode to base64 as a true 3-channel BGR PNG.
-    - If PIL.Image: convert RGB->BGR.
+    - If PIL.Image/Frame: use its (cached) BGR view.
     - If ndarray: assume it's already BGR (do NOT swap again).
     - Normalize grayscale/BGRA to BGR.
     """
-    if isinstance(img, Image.Image):
-        bgr = cv2.cvtColor(np.array(img), cv2.COLOR_RGB2BGR)
+    if isinstance(img, (Image.Image, Frame)):
+        bgr = as_frame(img).bgr
     elif isinstance(img, np.ndarray):
         bgr = img
     else:
@@ -57,6 +61,7 @@ class RemoteYOLOEngine(IDetector):
         timeout: float = 30.0,
         session: Optional[requests.Session] = None,
         weights: str | None = None,
+        model: str | None = None,
     ):
         self.ctrl = ctrl
         self.base_url = base_url.rstrip("/")
@@ -64,6 +69,8 @@ class RemoteYOLOEngine(IDetector):
         self.session = session or requests.Session()
         # Ensure JSON-serializable type (avoid WindowsPath issues)
         self.weights = str(weights) if weights is not None else None
+        # Server registry id (e.g. "yolo/ura@int8"); takes precedence over weights there
+        self.model = model
 
     def _post(self, payload: Dict[str, any]) -> Dict[str, any]:
         r = self.session.post(
@@ -95,6 +102,7 @@ class RemoteYOLOEngine(IDetector):
                 "conf": conf,
                 "iou": iou,
                 "weights_path": self.weights,
+                "model": self.model,
                 "tag": tag,
                 "agent": agent,
             }
@@ -111,7 +119,7 @@ class RemoteYOLOEngine(IDetector):
 
     def detect_pil(
         self,
-        pil_img: Image.Image,
+        pil_img: Union[Image.Image, Frame],
         *,
         imgsz: Optional[int] = None,
         conf: Optional[float] = None,
@@ -119,7 +127,9 @@ class RemoteYOLOEngine(IDetector):
         tag: str = "general",
         agent: Optional[str] = None,
     ) -> Tuple[Dict[str, Any], List[DetectionDict]]:
-        bgr = pil_to_bgr(pil_img)
+        # Shared with the extractors/analyzers that later read this capture
+        frame = as_frame(pil_img)
+        bgr = frame.bgr
         return self.detect_bgr(
             bgr,
             imgsz=imgsz,
@@ -129,44 +139,46 @@ class RemoteYOLOEngine(IDetector):
             agent=agent,
         )
 
-    @staticmethod
-    def _maybe_store_debug(
-        pil_img: Image.Image,
-        dets: List[DetectionDict],
+    def detect_batch(
+        self,
+        images: Sequence[BatchImage],
         *,
-        tag: str,
-        thr: float,
+        imgsz: Optional[int] = None,
+        conf: Optional[float] = None,
+        iou: Optional[float] = None,
+        tag: str = "general",
         agent: Optional[str] = None,
-    ) -> None:
-        import os, time
-
-        if not Settings.STORE_FOR_TRAINING or not dets:
-            return
-        lows = [d for d in dets if float(d.get("conf", 0.0)) <= float(thr)]
-        if not lows:
-            return
-        try:
-            agent_segment = (agent or "").strip()
-            base_dir = Settings.DEBUG_DIR / agent_segment if agent_segment else Settings.DEBUG_DIR
-            out_dir_raw = base_dir / tag / "raw"
-            os.makedirs(out_dir_raw, exist_ok=True)
-
-            ts = (
-                time.strftime("%Y%m%d-%H%M%S") + f"_{int((time.time() % 1) * 1000):03d}"
-            )
-
-            lowest = min(lows, key=lambda d: float(d.get("conf", 0.0)))
-            conf_line = f"{float(lowest.get('conf', 0.0)):.2f}"
-            raw_name = str(lowest.get("name", "unknown")).strip()
-            class_segment = "".join(
-                ch if ch.isalnum() or ch in "-_" else "-" for ch in raw_name
-            ) or "unknown"
+    ) -> List[Tuple[Dict[str, Any], List[DetectionDict]]]:
+        """One /yolo request for all images; the server runs them as one batch."""
+        if not images:
+            return []
+        imgsz = imgsz if imgsz is not None else Settings.YOLO_IMGSZ
+        conf = conf if conf is not None else Settings.YOLO_CONF
+        iou = iou if iou is not None else Settings.YOLO_IOU
 
-            raw_path = out_dir_raw / f"{tag}_{ts}_{class_segment}_{conf_line}.png"
-            pil_img.save(raw_path)
-            logger_uma.debug("saved low-conf training debug -> %s", raw_path)
-        except Exception as e:
-            logger_uma.debug("failed saving training debug: %s", e)
+        data = self._post(
+            {
+                "imgs": [_encode_image_to_base64(img) for img in images],
+                "imgsz": imgsz,
+                "conf": conf,
+                "iou": iou,
+                "weights_path": self.weights,
+                "model": self.model,
+                "tag": tag,
+                "agent": agent,
+            }
+        )
+        out: List[Tuple[Dict[str, Any], List[DetectionDict]]] = []
+        for item in data.get("results", []):
+            meta = item.get(
+                "meta", {"backend": "remote", "imgsz": imgsz, "conf": conf, "iou": iou}
+            )
+            if tag:
+                meta.setdefault("tag", tag)
+            if agent:
+                meta.setdefault("agent", agent)
+            out.append((meta, item.get("dets", [])))
+        return out
 
     def recognize(
         self,
@@ -177,29 +189,38 @@ class RemoteYOLOEngine(IDetector):
         iou: Optional[float] = None,
         tag: str = "general",
         agent: Optional[str] = None,
+        roi: Optional[ROI] = None,
+        classes: Optional[Sequence[str]] = None,
     ):
         if self.ctrl is None:
             raise RuntimeError(
                 "RemoteYOLOEngine.recognize() requires a controller injected in the constructor."
             )
 
+        imgsz = tuned_imgsz(self.weights, tag, imgsz)
         if isinstance(self.ctrl, SteamController):
             img = self.ctrl.screenshot_left_half()
         else:
             img = self.ctrl.screenshot(region=region)
 
-        meta, dets = self.detect_pil(
-            img,
-            imgsz=imgsz,
-            conf=conf,
-            iou=iou,
-            tag=tag,
-            agent=agent,
-        )
+        if roi is not None or classes:
+            meta, dets = detect_in_roi(
+                self, img, roi, classes=classes, imgsz=imgsz, conf=conf, iou=iou, tag=tag, agent=agent
+            )
+        else:
+            meta, dets = self.detect_pil(
+                img,
+                imgsz=imgsz,
+                conf=conf,
+                iou=iou,
+                tag=tag,
+                agent=agent,
+            )
+        meta.update(frame_meta(img))
 
         if not Settings.USE_EXTERNAL_PROCESSOR:
             # otherwise it is already saved in external processor
-            self._maybe_store_debug(
+            maybe_store_debug(
                 img,
                 dets,
                 tag=tag,
@@ -0,0 +1,122 @@
+# core/perception/yolo/yolo_replay.py
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from PIL import Image
+
+from core.controllers.base import IController, RegionXYWH
+from core.perception.yolo.interface import IDetector
+from core.perception.yolo.roi import ROI, only_classes, resolve_roi, within_roi
+from core.types import DetectionDict
+from core.utils.img import bgr_to_pil, to_bgr
+from core.utils.logger import logger_uma
+from core.utils.session_recorder import SessionLog, image_key
+
+
+class ReplayYOLOEngine(IDetector):
+    """
+    Detector that answers from a recorded session: detections are looked up by
+    the frame's content hash (and tag, when the same frame was detected more
+    than once). Frames never seen during recording go to `fallback` (a live
+    engine) if given, else return no detections.
+    """
+
+    def __init__(
+        self,
+        ctrl: Optional[IController],
+        session: SessionLog,
+        *,
+        fallback: Optional[IDetector] = None,
+    ) -> None:
+        self.ctrl = ctrl
+        self.fallback = fallback
+        self._by_frame: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        for ev in session.of("detect"):
+            self._by_frame[ev["frame"]].append(ev)
+        self.hits = 0
+        self.misses = 0
+
+    def _lookup(self, fid: str, tag: Optional[str]) -> Optional[Dict[str, Any]]:
+        evs = self._by_frame.get(fid)
+        if not evs:
+            return None
+        for ev in evs:
+            if ev.get("tag") == tag:
+                return ev
+        return evs[0]
+
+    def _answer(
+        self,
+        img: Image.Image,
+        *,
+        imgsz: Optional[int],
+        conf: Optional[float],
+        iou: Optional[float],
+        tag: Optional[str] = None,
+        fid: Optional[str] = None,
+    ) -> Tuple[Dict[str, Any], List[DetectionDict]]:
+        ev = self._lookup(fid or image_key(img), tag)
+        if ev is not None:
+            self.hits += 1
+            meta = dict(ev.get("meta") or {})
+            meta["replay"] = True
+            return meta, [dict(d) for d in ev.get("dets") or []]
+        self.misses += 1
+        if self.fallback is not None:
+            return self.fallback.detect_pil(img, imgsz=imgsz, conf=conf, iou=iou)
+        logger_uma.debug("[replay] no recorded detections for frame (tag=%s)", tag)
+        return {"replay": True, "miss": True}, []
+
+    def detect_bgr(
+        self,
+        bgr: Any,
+        *,
+        imgsz: Optional[int] = None,
+        conf: Optional[float] = None,
+        iou: Optional[float] = None,
+    ) -> Tuple[Dict[str, Any], List[DetectionDict]]:
+        return self._answer(bgr_to_pil(to_bgr(bgr)), imgsz=imgsz, conf=conf, iou=iou)
+
+    def detect_pil(
+        self,
+        pil_img: Image.Image,
+        *,
+        imgsz: Optional[int] = None,
+        conf: Optional[float] = None,
+        iou: Optional[float] = None,
+    ) -> Tuple[Dict[str, Any], List[DetectionDict]]:
+        return self._answer(pil_img.convert("RGB"), imgsz=imgsz, conf=conf, iou=iou)
+
+    def recognize(
+        self,
+        *,
+        region: Optional[RegionXYWH] = None,
+        imgsz: Optional[int] = None,
+        conf: Optional[float] = None,
+        iou: Optional[float] = None,
+        tag: str = "general",
+        agent: Optional[str] = None,
+        roi: Optional[ROI] = None,
+        classes: Optional[Sequence[str]] = None,
+    ) -> Tuple[Image.Image, Dict[str, Any], List[DetectionDict]]:
+        if self.ctrl is None:
+            raise RuntimeError(
+                "ReplayYOLOEngine.recognize() requires a controller injected in the constructor."
+            )
+        img = self.ctrl.screenshot(region=region)
+        meta, dets = self._answer(
+            img,
+            imgsz=imgsz,
+            conf=conf,
+            iou=iou,
+            tag=tag,
+            fid=img.info.get("session_frame"),
+        )
+        # recordings hold full-frame detections: narrow them the way a live ROI call would
+        if roi is not None:
+            box = resolve_roi(roi, *img.size)
+            dets = within_roi(dets, box)
+            meta["roi"] = box
+        return img, meta, only_classes(dets, classes)
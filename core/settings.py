@@ -139,17 +139,113 @@ class Settings:
     MODE: str = _env("MODE", "steam") or "steam"
     USE_ADB: bool = _env_bool("USE_ADB", False)
     ADB_DEVICE: Optional[str] = _env("ADB_DEVICE", "localhost:5555")
+    # "png" (screencap -p), "raw" (uncompressed framebuffer, skips PNG encode/decode)
+    # or "stream" (scrcpy-server H.264 decoded in background; needs PyAV + SCRCPY_SERVER_PATH)
+    ADB_CAPTURE_MODE: str = (_env("ADB_CAPTURE_MODE", "png") or "png").strip().lower()
+    # Keep one `adb shell` process open for taps/swipes/screencap instead of one adb per action
+    ADB_SHELL_SESSION: bool = _env_bool("ADB_SHELL_SESSION", False)
+    SCRCPY_SERVER_PATH: Path = Path(
+        _env("SCRCPY_SERVER_PATH") or (ROOT_DIR / "scrcpy-server")
+    )
+    # Must match the pushed scrcpy-server build exactly
+    SCRCPY_SERVER_VERSION: str = _env("SCRCPY_SERVER_VERSION", "3.1") or "3.1"
+    SCRCPY_MAX_FPS: int = _env_int("SCRCPY_MAX_FPS", default=30)
+    # Local forward port of the stream; multi-device runs use SCRCPY_PORT + device index
+    SCRCPY_PORT: int = _env_int("SCRCPY_PORT", default=27183)
+    # Grab frames on a background thread; screenshot() then serves the newest buffered frame
+    CAPTURE_SERVICE: bool = _env_bool("CAPTURE_SERVICE", False)
+    CAPTURE_INTERVAL_S: float = _env_float("CAPTURE_INTERVAL_S", default=0.0)
+    CAPTURE_BUFFER_SIZE: int = _env_int("CAPTURE_BUFFER_SIZE", default=3)
+    # Deliver queued taps on a worker thread so flows can analyse while the pointer moves
+    INPUT_DISPATCHER: bool = _env_bool("INPUT_DISPATCHER", False)
+    # Agents capture + detect the next main-loop frame on a worker while deciding on the
+    # current one; the prefetch is dropped whenever an input is sent before it is used
+    PIPELINED_LOOP: bool = _env_bool("PIPELINED_LOOP", False)
+    # Agents ask a thumbnail screen classifier (train_screen_classifier.py) first and only run
+    # the detector when the screen's handler needs detections or the classifier is unsure
+    SCREEN_CLASSIFIER: bool = _env_bool("SCREEN_CLASSIFIER", False)
+    SCREEN_CLASSIFIER_PATH: Path = Path(
+        _env("SCREEN_CLASSIFIER_PATH") or (MODELS_DIR / "screen_clf.npz")
+    )
+    SCREEN_CLASSIFIER_MIN_CONF: float = _env_float("SCREEN_CLASSIFIER_MIN_CONF", 0.9)
+    # When set, every run is recorded (frames, detections, OCR, inputs) under this folder
+    # for offline replay with replay_session.py
+    SESSION_RECORD_DIR: Optional[str] = _env("SESSION_RECORD_DIR")
+    # main.py --devices: how often the orchestrator logs per-device hub latency/fairness
+    ORCH_STATS_INTERVAL_S: float = _env_float("ORCH_STATS_INTERVAL_S", default=60.0)
 
     # --------- Detection (YOLO) ---------
     YOLO_IMGSZ: int = _env_int("YOLO_IMGSZ", default=832)
     YOLO_CONF: float = _env_float("YOLO_CONF", default=0.60)  # should be 0.7 in general, but we are a little conservative here...
     YOLO_IOU: float = _env_float("YOLO_IOU", default=0.45)
+    # Local detector runtime: "ultralytics" (torch) or "onnx" (onnxruntime on the
+    # <weights>.onnx sibling; create it with `python yolo_tools.py export`)
+    YOLO_BACKEND: str = (_env("YOLO_BACKEND", "ultralytics") or "ultralytics").strip().lower()
+    ONNX_THREADS: int = _env_int("ONNX_THREADS", default=0)  # 0 = onnxruntime default
+    # recognize(roi=...): smallest input size an ROI crop is scaled down to; with
+    # YOLO_ROI off every ROI call detects the full frame (class filter still applies)
+    YOLO_ROI: bool = _env_bool("YOLO_ROI", True)
+    YOLO_ROI_MIN_IMGSZ: int = _env_int("YOLO_ROI_MIN_IMGSZ", default=160)
+    # Per-model, per-tag input sizes from `python yolo_tools.py imgsz-tune`; recognize()
+    # uses the tuned size when it is below the requested one (no file = YOLO_IMGSZ everywhere)
+    YOLO_IMGSZ_PROFILE: Path = Path(
+        _env("YOLO_IMGSZ_PROFILE") or (MODELS_DIR / "imgsz_profile.json")
+    )
+    YOLO_IMGSZ_AUTOTUNE: bool = _env_bool("YOLO_IMGSZ_AUTOTUNE", True)
+    # Reuse the last detections while the screen is unchanged (same downscaled frame, or
+    # within DETECTION_CACHE_DIFF mean gray difference) for up to DETECTION_CACHE_TTL_S
+    DETECTION_CACHE: bool = _env_bool("DETECTION_CACHE", False)
+    DETECTION_CACHE_TTL_S: float = _env_float("DETECTION_CACHE_TTL_S", default=1.0)
+    DETECTION_CACHE_DIFF: float = _env_float("DETECTION_CACHE_DIFF", default=0.5)
+    # Read numeric fields (stats, turns, skill pts, failure %) from glyph templates built by
+    # build_digit_glyphs.py first; PaddleOCR only runs when the match is not confident
+    DIGIT_GLYPHS: bool = _env_bool("DIGIT_GLYPHS", True)
+    DIGIT_GLYPHS_PATH: Path = Path(
+        _env("DIGIT_GLYPHS_PATH") or (MODELS_DIR / "digit_glyphs.npz")
+    )
+    DIGIT_GLYPHS_MIN_CONF: float = _env_float("DIGIT_GLYPHS_MIN_CONF", default=0.85)
+    # Reuse OCR results for bit-identical crops (same method and arguments), LRU-bounded
+    OCR_CACHE: bool = _env_bool("OCR_CACHE", True)
+    OCR_CACHE_MAX_ENTRIES: int = _env_int("OCR_CACHE_MAX_ENTRIES", 2048)
+    OCR_CACHE_MAX_MB: float = _env_float("OCR_CACHE_MAX_MB", default=16.0)
+    # Waiter reads button labels with one recognition-only batch_rec call instead of text()
+    # per box. Off until validated on real button crops (icons, padding)
+    WAITER_BATCH_REC: bool = _env_bool("WAITER_BATCH_REC", False)
+    # Run dummy inferences (each YOLO input size, OCR, spirit classifier) on background
+    # threads when engines are built, so the first career turn skips lazy init
+    WARMUP: bool = _env_bool("WARMUP", True)
+    # The hotkey start waits up to this long for warmup before the agent runs; jobs not
+    # started by then are cancelled (0 = cancel right away, after the in-flight call)
+    WARMUP_WAIT_S: float = _env_float("WARMUP_WAIT_S", default=60.0)
+    # Detector models ("ura", "unity_cup", "nav") that load their INT8 <stem>.int8.onnx on
+    # the onnx backend. Decide per model with `python yolo_tools.py drift`.
+    YOLO_INT8_MODELS: Set[str] = {
+        m.strip().lower() for m in (_env("YOLO_INT8_MODELS", "") or "").split(",") if m.strip()
+    }
+
+    # --------- Inference server (server/main_inference.py) ---------
+    # Models are loaded on demand; beyond this many MB the least recently used ones are
+    # unloaded (0 = keep everything). OCR is never evicted.
+    INFERENCE_MEMORY_BUDGET_MB: int = _env_int("INFERENCE_MEMORY_BUDGET_MB", default=0)
+    # Model ids loaded (and warmed) at server startup; see GET /models for the list
+    INFERENCE_PRELOAD: List[str] = [
+        m.strip()
+        for m in (
+            _env("INFERENCE_PRELOAD", "ocr,yolo/ura,yolo/unity_cup,yolo/nav,spirit/unity_cup")
+            or ""
+        ).split(",")
+        if m.strip()
+    ]
 
     # --------- Logging ---------
     LOG_LEVEL: str = _env("LOG_LEVEL", "DEBUG" if DEBUG else "INFO") or (
         "DEBUG" if DEBUG else "INFO"
     )
     FAST_MODE = False
+    # Wait for the screen to stop changing after clicks instead of fixed sleeps
+    VISUAL_SETTLE: bool = _env_bool("VISUAL_SETTLE", True)
+    # Scales every named delay in the flows: "safe" | "normal" | "fast" (see core/utils/pacer.py)
+    PACE_PROFILE: str = (_env("PACE_PROFILE", "normal") or "normal").strip().lower()
     USE_FAST_OCR = True
     USE_GPU = True
     HINT_IS_IMPORTANT = False
@@ -284,6 +380,7 @@ class Settings:
             cls.WINDOW_TITLE = wt
             cls.ANDROID_WINDOW_TITLE = wt
         cls.FAST_MODE = bool(g.get("fastMode", cls.FAST_MODE))
+        cls.PACE_PROFILE = str(g.get("paceProfile", cls.PACE_PROFILE) or "normal").lower()
         cls.TRY_AGAIN_ON_FAILED_GOAL = bool(
             g.get("tryAgainOnFailedGoal", cls.TRY_AGAIN_ON_FAILED_GOAL)
         )
@@ -597,6 +694,19 @@ class Settings:
             return cls.YOLO_WEIGHTS_UNITY_CUP
         return cls.YOLO_WEIGHTS_URA
 
+    @classmethod
+    def yolo_model_key(cls, weights: str | Path) -> Optional[str]:
+        """"ura" / "unity_cup" / "nav" for a configured weights path (any extension)."""
+        stem = Path(weights).stem.split(".")[0]
+        for key, path in (
+            ("ura", cls.YOLO_WEIGHTS_URA),
+            ("unity_cup", cls.YOLO_WEIGHTS_UNITY_CUP),
+            ("nav", cls.YOLO_WEIGHTS_NAV),
+        ):
+            if Path(path).stem == stem:
+                return key
+        return None
+
     @classmethod
     def resolve_skill_memory_path(cls, scenario: str | None = None) -> Path:
         scenario_key = cls.normalize_scenario(scenario or cls.ACTIVE_SCENARIO)
@@ -607,6 +717,12 @@ class Settings:
             return base.with_name(f"{stem}.{scenario_key}{suffix}")
         return base / f"runtime_skill_memory.{scenario_key}.json"
 
+    @classmethod
+    def resolve_screen_classifier_path(cls, scenario: str | None = None) -> Path:
+        scenario_key = cls.normalize_scenario(scenario or cls.ACTIVE_SCENARIO)
+        base = cls.SCREEN_CLASSIFIER_PATH
+        return base.with_name(f"{base.stem}.{scenario_key}{base.suffix or '.npz'}")
+
     @classmethod
     def _get_active_preset_from_config(cls, cfg: dict) -> tuple[list, str | None, dict | None]:
         """
@@ -2,13 +2,14 @@
 from __future__ import annotations
 
 import os
-from typing import Any, Dict, Optional, Sequence
+from typing import Any, Dict, Optional, Sequence, Union
 
 import numpy as np
 
 from core.perception.analyzers.friendship_bar import FBAConfig, FriendshipBarAnalyzer
 from core.perception.analyzers.hint import HintConfig, HintDetector
 from core.perception.analyzers.support_type import FixedRoiTypeClassifier
+from core.utils.frame import Frame
 from core.utils.logger import logger_uma
 from core.settings import Settings
 
@@ -45,15 +46,16 @@ hint_det = HintDetector(
 
 def analyze_support_crop(
     class_name,
-    bgr: np.ndarray,
+    bgr: Union[np.ndarray, Frame],
     *,
-    piece_bar_bgr: Optional[np.ndarray] = None,
-    piece_type_bgr: Optional[np.ndarray] = None,
+    piece_bar_bgr: Optional[Union[np.ndarray, Frame]] = None,
+    piece_type_bgr: Optional[Union[np.ndarray, Frame]] = None,
     hint_sources: Optional[Sequence[Dict[str, Any]]] = None,
     hint_confidence_max: float = 0.0,
 ) -> Dict:
     """
-    Run support-type, friendship-bar, and hint analyzers on a single crop (BGR).
+    Run support-type, friendship-bar, and hint analyzers on a single crop (BGR
+    array or Frame; with Frames the analyzers share colour conversions).
     Returns a dict with the same shape you already used.
     """
     out = {
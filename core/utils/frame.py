@@ -0,0 +1,204 @@
+# core/utils/frame.py
+from __future__ import annotations
+
+from typing import Any, Dict, Optional, Tuple, Union
+
+import cv2
+import numpy as np
+from PIL import Image
+
+# Per-pixel conversions derived from BGR. They commute with cropping, so a crop
+# can reuse a parent's converted view by slicing instead of converting again.
+_DERIVED = {
+    "gray": cv2.COLOR_BGR2GRAY,
+    "hsv": cv2.COLOR_BGR2HSV,
+    "lab": cv2.COLOR_BGR2LAB,
+}
+
+Box = Tuple[int, int, int, int]
+
+
+class Frame:
+    """
+    One captured image with lazily converted, cached views.
+
+    `bgr`, `rgb`, `gray`, `hsv` and `lab` are computed on first access and
+    reused afterwards. `crop(xyxy)` returns a child Frame whose views are
+    slices of the parent's when the parent already converted them, and are
+    otherwise converted from the crop's own pixels only. `downscaled(max_w)`
+    is cached per width.
+
+    Cached arrays are read-only; callers that need to draw or write into one
+    must `.copy()` it first. A Frame assumes its source pixels never change.
+    """
+
+    def __init__(
+        self,
+        image: Union[Image.Image, np.ndarray, None] = None,
+        *,
+        parent: Optional["Frame"] = None,
+        box: Optional[Box] = None,
+    ) -> None:
+        self.parent = parent
+        self.box = box
+        self._pil: Optional[Image.Image] = None
+        self._views: Dict[str, np.ndarray] = {}
+        self._crops: Dict[Box, Frame] = {}
+        self._scaled: Dict[int, Frame] = {}
+
+        if parent is not None:
+            x1, y1, x2, y2 = box  # type: ignore[misc]
+            self._hw = (y2 - y1, x2 - x1)
+            self.info: Dict[str, Any] = parent.info
+        elif isinstance(image, Image.Image):
+            self._pil = image if image.mode == "RGB" else image.convert("RGB")
+            self._hw = (image.height, image.width)
+            self.info = image.info
+        elif isinstance(image, np.ndarray):
+            arr = image
+            if arr.ndim == 2:
+                self._store("gray", arr)
+                arr = cv2.cvtColor(arr, cv2.COLOR_GRAY2BGR)
+            elif arr.ndim == 3 and arr.shape[2] == 4:
+                arr = cv2.cvtColor(arr, cv2.COLOR_BGRA2BGR)
+            self._store("bgr", arr)
+            self._hw = arr.shape[:2]
+            self.info = {}
+        else:
+            raise TypeError(f"Unsupported image type for Frame: {type(image)}")
+
+    # ---- geometry ----
+    @property
+    def height(self) -> int:
+        return int(self._hw[0])
+
+    @property
+    def width(self) -> int:
+        return int(self._hw[1])
+
+    @property
+    def shape(self) -> Tuple[int, int, int]:
+        """Shape of the BGR view, available without converting anything."""
+        return (self.height, self.width, 3)
+
+    @property
+    def size(self) -> int:
+        return self.height * self.width * 3
+
+    # ---- views ----
+    @property
+    def bgr(self) -> np.ndarray:
+        return self._get("bgr")
+
+    @property
+    def rgb(self) -> np.ndarray:
+        return self._get("rgb")
+
+    @property
+    def gray(self) -> np.ndarray:
+        return self._get("gray")
+
+    @property
+    def hsv(self) -> np.ndarray:
+        return self._get("hsv")
+
+    @property
+    def lab(self) -> np.ndarray:
+        return self._get("lab")
+
+    @property
+    def pil(self) -> Image.Image:
+        if self._pil is None:
+            self._pil = Image.fromarray(self.rgb)
+        return self._pil
+
+    def crop(self, xyxy: Any) -> "Frame":
+        """Child frame for `xyxy` (clipped to bounds; cached per box)."""
+        x1, y1, x2, y2 = (int(round(float(v))) for v in xyxy)
+        x1, x2 = max(0, min(x1, self.width)), max(0, min(x2, self.width))
+        y1, y2 = max(0, min(y1, self.height)), max(0, min(y2, self.height))
+        box = (x1, y1, max(x1, x2), max(y1, y2))
+        child = self._crops.get(box)
+        if child is None:
+            child = Frame(parent=self, box=box)
+            self._crops[box] = child
+        return child
+
+    def downscaled(self, max_w: int) -> "Frame":
+        """Frame shrunk to at most `max_w` pixels wide (INTER_AREA), or self."""
+        if self.width <= max_w:
+            return self
+        small = self._scaled.get(max_w)
+        if small is None:
+            scale = max_w / float(self.width)
+            size = (int(self.width * scale), int(self.height * scale))
+            small = Frame(cv2.resize(self.bgr, size, interpolation=cv2.INTER_AREA))
+            self._scaled[max_w] = small
+        return small
+
+    # ---- internals ----
+    def _store(self, name: str, arr: np.ndarray) -> np.ndarray:
+        arr = arr.view()  # never flip the flag on a caller's array
+        arr.flags.writeable = False
+        self._views[name] = arr
+        return arr
+
+    def _slice(self, arr: np.ndarray) -> np.ndarray:
+        x1, y1, x2, y2 = self.box  # type: ignore[misc]
+        return arr[y1:y2, x1:x2]
+
+    def _source(self) -> str:
+        """View the root was built from ("rgb" for PIL, else "bgr")."""
+        if self.parent is not None:
+            return self.parent._source()
+        return "bgr" if "bgr" in self._views else "rgb"
+
+    def _cached(self, name: str) -> Optional[np.ndarray]:
+        arr = self._views.get(name)
+        if arr is None and self.parent is not None:
+            parent_arr = self.parent._cached(name)
+            if parent_arr is not None:
+                arr = self._views[name] = self._slice(parent_arr)
+        return arr
+
+    def _get(self, name: str) -> np.ndarray:
+        arr = self._cached(name)
+        if arr is None:
+            arr = self._store(name, self._convert(name))
+        return arr
+
+    def _convert(self, name: str) -> np.ndarray:
+        if name in _DERIVED:
+            return cv2.cvtColor(self.bgr, _DERIVED[name])
+        other = "rgb" if name == "bgr" else "bgr"
+        src = self._cached(other)
+        if src is None:
+            if self.parent is not None:
+                # only the crop's pixels get converted, never the whole parent
+                other = self._source()
+                src = self._slice(self.parent._get(other))
+            else:
+                other = "rgb"
+                src = self._store("rgb", np.asarray(self._pil))
+            if other == name:
+                return src
+        # RGB<->BGR is the same channel swap either way
+        return cv2.cvtColor(src, cv2.COLOR_RGB2BGR)
+
+
+def as_frame(img: Union[Frame, Image.Image, np.ndarray]) -> Frame:
+    """
+    Frame for `img`; arrays are taken as BGR (GRAY/BGRA are normalized).
+    A PIL capture keeps its Frame on the image object, so every consumer of
+    the same capture (detector, extractors, analyzers) shares one set of
+    conversions.
+    """
+    if isinstance(img, Frame):
+        return img
+    if isinstance(img, Image.Image):
+        frame = getattr(img, "_uma_frame", None)
+        if frame is None:
+            frame = Frame(img)
+            img._uma_frame = frame  # type: ignore[attr-defined]
+        return frame
+    return Frame(img)
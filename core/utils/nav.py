@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 import random
-from time import sleep
 from typing import List, Sequence, Tuple, Dict, Optional, Iterable
 
 from PIL import Image
@@ -12,6 +11,7 @@ from core.perception.yolo.interface import IDetector
 from core.settings import Settings
 from core.types import DetectionDict
 from core.utils.logger import logger_uma
+from core.utils.pacer import pace
 from core.utils.pointer import smart_scroll_small
 from core.utils.waiter import Waiter
 
@@ -120,7 +120,7 @@ def click_button_loop(
         if not ok:
             break
         done += 1
-        sleep(sleep_between_s)
+        pace("ui", sleep_between_s)
     return done
 
 
@@ -156,7 +156,7 @@ def advance_sequence_with_mid_taps(
         )
         if not did and i > 5:
             break
-        sleep(sleep_after_advance)
+        pace("ui", sleep_after_advance)
         
         # Click on the same position as the button we just clicked
         if clicked_obj:
@@ -185,7 +185,7 @@ def advance_sequence_with_mid_taps(
             )
         
         advances += 1
-        sleep(sleep_after_advance)
+        pace("ui", sleep_after_advance)
     return advances
 
 
@@ -213,7 +213,7 @@ def _confirm_exchange_dialog(waiter: Waiter, tag_prefix: str) -> bool:
     if not ok:
         return False
 
-    sleep(1.5)
+    pace("transition", 1.5)
     if not waiter.click_when(
         classes=("button_white",),
         texts=("CLOSE",),
@@ -224,7 +224,7 @@ def _confirm_exchange_dialog(waiter: Waiter, tag_prefix: str) -> bool:
     ):
         return False
 
-    sleep(0.8)
+    pace("ui", 0.8)
     return True
 
 def end_sale_dialog(waiter: Waiter, tag_prefix: str) -> bool:
@@ -238,7 +238,7 @@ def end_sale_dialog(waiter: Waiter, tag_prefix: str) -> bool:
     ):
         return False
 
-    sleep(0.7)
+    pace("ui", 0.7)
     waiter.click_when(
         classes=("button_green",),
         texts=("OK",),
@@ -247,7 +247,7 @@ def end_sale_dialog(waiter: Waiter, tag_prefix: str) -> bool:
         allow_greedy_click=False,
         tag=f"{tag_prefix}_ok",
     )
-    sleep(0.6)
+    pace("ui", 0.6)
     waiter.click_when(
         classes=("ui_race",),
         prefer_bottom=True,
@@ -284,9 +284,9 @@ def handle_shop_exchange(
         )
         if not shop_appeared:
             return False
-        sleep(2.5)
+        pace("transition", 2.5)
     else:
-        sleep(1.0)
+        pace("transition", 1.0)
 
     attempts = 0
     any_purchased = False
@@ -300,7 +300,7 @@ def handle_shop_exchange(
         if not rows:
             logger_uma.debug("[nav] shop: no shop_row detected, retry scrolling")
             smart_scroll_small(ctrl, steps_android=1, steps_pc=1)
-            sleep(1.0)
+            pace("transition", 1.0)
             continue
 
         any_purchased = False
@@ -323,7 +323,7 @@ def handle_shop_exchange(
                 logger_uma.info(
                     f"[nav] shop: clicked exchange for '{det_name}' (pref={pref_key})"
                 )
-                sleep(0.5)
+                pace("ui", 0.5)
 
                 confirmed = _confirm_exchange_dialog(waiter, tag_prefix)
                 if confirmed:
@@ -342,7 +342,7 @@ def handle_shop_exchange(
 
         if expected_purchases > 0:
             smart_scroll_small(ctrl, steps_android=1, steps_pc=1)
-            sleep(1.0)
+            pace("transition", 1.0)
         elif any_purchased:
             # everything purchased at first glance
             end_sale_dialog(waiter, tag_prefix)
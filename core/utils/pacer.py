@@ -0,0 +1,137 @@
+# core/utils/pacer.py
+from __future__ import annotations
+
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, Optional
+
+from core.utils.abort import abort_requested
+from core.utils.logger import logger_uma
+
+# Delay categories used by the flows:
+#   micro      – tiny gaps between consecutive inputs (< 0.2s)
+#   ui         – short UI reactions: popups, buttons enabling, list refresh
+#   transition – screen changes after navigation clicks
+#   animation  – long cut-scenes (race start/result, claw, Team Trials)
+#   poll       – retry/poll loop intervals
+#   loop       – the agents' main-loop idle delay
+CATEGORIES = ("micro", "ui", "transition", "animation", "poll", "loop")
+
+# Multipliers applied to each call site's base delay, per profile
+PROFILES: Dict[str, Dict[str, float]] = {
+    "safe": {
+        "micro": 1.0,
+        "ui": 1.3,
+        "transition": 1.3,
+        "animation": 1.2,
+        "poll": 1.2,
+        "loop": 1.5,
+    },
+    "normal": {c: 1.0 for c in CATEGORIES},
+    "fast": {
+        "micro": 0.6,
+        "ui": 0.6,
+        "transition": 0.7,
+        "animation": 0.85,
+        "poll": 0.6,
+        "loop": 0.5,
+    },
+}
+
+_ABORT_SLICE_S = 0.25
+
+
+class Pacer:
+    """
+    One place for every humanized/fixed delay in the flows.
+
+    Call sites keep their base delay and name its category; the active profile
+    scales it. Time actually slept is accounted per category, both cumulatively
+    and for the current turn (see `turn_report`). Long waits are cut short when
+    an abort is requested.
+    """
+
+    def __init__(self, profile: str = "normal") -> None:
+        self._lock = threading.Lock()
+        self.profile = "normal"
+        self.set_profile(profile)
+        self._total_s: Dict[str, float] = defaultdict(float)
+        self._count: Dict[str, int] = defaultdict(int)
+        self._turn_s: Dict[str, float] = defaultdict(float)
+        self._turn_started = time.monotonic()
+
+    def set_profile(self, profile: Optional[str]) -> None:
+        name = (profile or "normal").strip().lower()
+        if name not in PROFILES:
+            logger_uma.warning("[pacer] Unknown profile '%s'; using 'normal'", profile)
+            name = "normal"
+        self.profile = name
+
+    def delay_for(self, category: str, seconds: float) -> float:
+        factor = PROFILES[self.profile].get(category, 1.0)
+        return max(0.0, float(seconds)) * factor
+
+    def sleep(self, category: str, seconds: float) -> float:
+        """Sleep the profile-scaled `seconds`; returns the time actually waited."""
+        target = self.delay_for(category, seconds)
+        t0 = time.monotonic()
+        if target <= _ABORT_SLICE_S:
+            time.sleep(target)
+        else:
+            end = t0 + target
+            while not abort_requested():
+                remaining = end - time.monotonic()
+                if remaining <= 0:
+                    break
+                time.sleep(min(_ABORT_SLICE_S, remaining))
+        waited = time.monotonic() - t0
+        with self._lock:
+            self._total_s[category] += waited
+            self._count[category] += 1
+            self._turn_s[category] += waited
+        return waited
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            return {
+                c: {"count": self._count[c], "total_s": self._total_s[c]}
+                for c in sorted(self._total_s)
+            }
+
+    def turn_report(self, label: str = "") -> Dict[str, float]:
+        """Log and reset the waits accumulated since the previous report."""
+        now = time.monotonic()
+        with self._lock:
+            per_cat = dict(self._turn_s)
+            self._turn_s.clear()
+            span = now - self._turn_started
+            self._turn_started = now
+        waited = sum(per_cat.values())
+        if per_cat:
+            parts = " ".join(f"{c}={s:.2f}s" for c, s in sorted(per_cat.items()))
+            logger_uma.info(
+                "[pacer] turn %s: waited %.2fs of %.2fs (%s) profile=%s",
+                label or "-",
+                waited,
+                span,
+                parts,
+                self.profile,
+            )
+        per_cat["total"] = waited
+        return per_cat
+
+    def reset(self) -> None:
+        with self._lock:
+            self._total_s.clear()
+            self._count.clear()
+            self._turn_s.clear()
+            self._turn_started = time.monotonic()
+
+
+pacer = Pacer()
+
+
+def pace(category: str, seconds: float) -> float:
+    """Shorthand for `pacer.sleep(category, seconds)`."""
+    return pacer.sleep(category, seconds)
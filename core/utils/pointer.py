@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import time
 
+from core.controllers.adb import ADBController
 from core.controllers.android import ScrcpyController  # type check only
 from core.controllers.base import IController
 from core.utils.logger import logger_uma
@@ -22,6 +23,7 @@ def smart_scroll_small(
     """
     Small, device-aware scroll:
       • On Android (scrcpy): slight cursor nudge to mid/lower area, short drag with end-hold to kill inertia.
+      • On ADB: the same ticks sent as one multi-step swipe gesture.
       • On PC: a few wheel ticks with short delays.
 
     Tunables:
@@ -51,6 +53,9 @@ def smart_scroll_small(
             duration_range=(0.20, 0.40),
             end_hold_range=(0.10, 0.20),
         )
+    elif isinstance(ctrl, ADBController):
+        # One multi-step gesture (a single script when the ADB shell session is on)
+        ctrl.scroll(-1, steps=max(1, steps_pc))
     else:
         for _ in range(max(1, steps_pc)):
             ctrl.scroll(-1)
@@ -3,9 +3,12 @@ from PIL import Image
 import matplotlib.pyplot as plt
 import numpy as np
 import cv2 as cv
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 from core.perception.ocr.interface import OCRInterface
-from core.utils.date_uma import score_date_like
+from core.utils.date_uma import parse_career_date, score_date_like
 from core.utils.geometry import xyxy_int
+from core.utils.logger import logger_uma
+from core.utils.text import fuzzy_contains
 
 
 def preprocess_digits(
@@ -219,54 +222,121 @@ def career_date_crop_box(
 
 
 # ------------------------------
-# Low-res letter OCR helper
+# Multi-variant OCR (career date pill)
 # ------------------------------
-def read_date_pill_robust(ocr: OCRInterface, pill_img_pil: Image.Image) -> str:
-    """
-    Try several upscaling/contrast variants and pick the string that looks most
-    like a valid date ('Junior Year Early Mar', 'Finale Season', ...).
-    """
-    import numpy as _np
-    import cv2 as _cv
+# (name, build) pairs: build(img) -> preprocessed image to OCR
+OCRVariant = Tuple[str, Callable[[Image.Image], Image.Image]]
 
-    def _to_cv(img):
-        return _cv.cvtColor(_np.asarray(img.convert("RGB")), _cv.COLOR_RGB2BGR)
 
-    def _to_pil(img_cv):
-        from PIL import Image as _Image
+def ocr_first_accepted(
+    ocr: OCRInterface,
+    img: Image.Image,
+    variants: Sequence[OCRVariant],
+    *,
+    accept: Callable[[str], bool],
+    score: Callable[[str], float],
+    first: Optional[str] = None,
+    min_conf: float = 0.0,
+) -> Tuple[str, str, bool]:
+    """
+    OCR preprocessing variants of `img` in order until one reads as `accept`able.
+
+    The `first` variant (default: the first in `variants`) is built and read on
+    its own; only when `accept` rejects it are the remaining variants built and
+    read in ONE batch_text() call, and the earliest accepted one in `variants`
+    order wins. Returns (variant name, text, accepted); when nothing is
+    accepted, the variant whose text has the highest `score`.
+    """
+    order = list(variants)
+    if first is not None:
+        order.sort(key=lambda v: v[0] != first)  # stable: the rest keep their order
+
+    def _read(batch: Sequence[OCRVariant]) -> List[str]:
+        imgs = [build(img) for _, build in batch]
+        return [(t or "").strip() for t in ocr.batch_text(imgs, min_conf=min_conf)]
+
+    name, _ = order[0]
+    text = _read(order[:1])[0]
+    ok = accept(text)
+    if ok or len(order) == 1:
+        return name, text, ok
+
+    read = [(name, text)]
+    rest = order[1:]
+    for (vname, _), t in zip(rest, _read(rest)):
+        read.append((vname, t))
+    rank = {vname: i for i, (vname, _) in enumerate(variants)}
+    read.sort(key=lambda r: rank[r[0]])
+    for vname, t in read:
+        if accept(t):
+            return vname, t, True
+    best = max(read, key=lambda r: score(r[1]))
+    return best[0], best[1], False
+
+
+def _enhance_date_pill(img: Image.Image, scale: float) -> Image.Image:
+    """Cubic upscale, light denoise + unsharp, CLAHE on L (brown text on the pill)."""
+    src = cv2.cvtColor(np.asarray(img.convert("RGB")), cv2.COLOR_RGB2BGR)
+    up = cv2.resize(src, dsize=None, fx=scale, fy=scale, interpolation=cv2.INTER_CUBIC)
+    den = cv2.bilateralFilter(up, d=5, sigmaColor=40, sigmaSpace=40)
+    gauss = cv2.GaussianBlur(den, (0, 0), 1.2)
+    sharp = cv2.addWeighted(den, 1.7, gauss, -0.7, 0)
+    lab = cv2.cvtColor(sharp, cv2.COLOR_BGR2LAB)
+    L, A, B = cv2.split(lab)
+    clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
+    out = cv2.cvtColor(cv2.merge([clahe.apply(L), A, B]), cv2.COLOR_LAB2BGR)
+    return Image.fromarray(cv2.cvtColor(out, cv2.COLOR_BGR2RGB))
+
+
+DATE_PILL_VARIANTS: List[OCRVariant] = [
+    ("x2", lambda im: _enhance_date_pill(im, 2.0)),
+    ("x3", lambda im: _enhance_date_pill(im, 3.0)),
+    ("raw", lambda im: im),
+]
+# pill height bucket -> variant that last produced an accepted date there
+_date_pill_winner: Dict[int, str] = {}
+
+
+def date_text_accepted(text: str) -> bool:
+    """
+    True when parse_career_date reads `text` as a complete date: year, half and
+    month for Junior/Classic/Senior, or Junior plus the pre-debut token
+    ('Junior Year Pre-Debut'); Pre-Debut / Finale only when the text actually
+    says so (parse_career_date falls back to Y0 on garbage).
+    """
+    if not text:
+        return False
+    di = parse_career_date(text)
+    if di.year_code == 1 and any(fuzzy_contains(text, t) for t in ("pre debut", "predebut")):
+        return True
+    if di.year_code in (1, 2, 3):
+        return di.month is not None and di.half is not None
+    return score_date_like(text) >= 0.6
 
-        return _Image.fromarray(_cv.cvtColor(img_cv, _cv.COLOR_BGR2RGB))
 
-    src = _to_cv(pill_img_pil)
+def read_date_pill_robust(ocr: OCRInterface, pill_img_pil: Image.Image) -> str:
+    """
+    Read the career date pill ('Junior Year Early Mar', 'Finale Season', ...).
 
-    variants = []
-    # x2 and x3 cubic upscales
-    for scale in (2.0, 3.0):
-        up = _cv.resize(
-            src, dsize=None, fx=scale, fy=scale, interpolation=_cv.INTER_CUBIC
+    Variants (x2 / x3 enhanced upscales, then the raw pill) are tried in order
+    with ocr_first_accepted, stopping at the first one parse_career_date
+    accepts. The variant that won last time for this pill size (i.e. this
+    resolution) is tried first, so usually a single OCR call is needed.
+    Without an accepted read, the most date-like text is returned.
+    """
+    bucket = int(round(pill_img_pil.height / 8.0))
+    first = _date_pill_winner.get(bucket)
+    name, text, accepted = ocr_first_accepted(
+        ocr,
+        pill_img_pil,
+        DATE_PILL_VARIANTS,
+        accept=date_text_accepted,
+        score=score_date_like,
+        first=first,
+    )
+    if accepted and name != first:
+        logger_uma.debug(
+            "[date] variant %s wins for pill height ~%dpx (was %s)", name, bucket * 8, first
         )
-        # Light denoise + unsharp
-        den = _cv.bilateralFilter(up, d=5, sigmaColor=40, sigmaSpace=40)
-        gauss = _cv.GaussianBlur(den, (0, 0), 1.2)
-        sharp = _cv.addWeighted(den, 1.7, gauss, -0.7, 0)
-        # CLAHE on L channel (improves contrast on brown text)
-        lab = _cv.cvtColor(sharp, _cv.COLOR_BGR2LAB)
-        L, A, B = _cv.split(lab)
-        clahe = _cv.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
-        L2 = clahe.apply(L)
-        lab2 = _cv.merge([L2, A, B])
-        out = _cv.cvtColor(lab2, _cv.COLOR_LAB2BGR)
-        variants.append(_to_pil(out))
-
-    # Also include the raw pill for completeness
-    variants.append(pill_img_pil)
-
-    # OCR all variants and pick the most "date-like" by fuzzy score
-    best_txt, best_score = "", -1.0
-    for v in variants:
-        t = (ocr.text(v, min_conf=0.0) or "").strip()
-        s = score_date_like(t)
-        if s > best_score:
-            best_txt, best_score = t, s
-
-    return best_txt
+        _date_pill_winner[bucket] = name
+    return text
@@ -0,0 +1,294 @@
+# core/utils/session_recorder.py
+"""
+On-disk session log: every captured frame, detection result, OCR result and
+input action of a run, with timestamps.
+
+Layout of a session directory:
+    session.jsonl     one event per line ({"t": seconds since start, "ev": ...})
+    frames/<id>.png   unique frames; <id> is a content hash, so repeated
+                      identical screens are stored once
+
+Events:
+    start   {agent, scenario, action, config}
+    frame   {id, region, origin, bbox}
+    detect  {frame, tag, imgsz, conf, iou, meta, dets}
+    ocr     {method, keys, args, result}
+    input   {kind, args, kwargs, dur}
+
+`SessionRecorder` writes it by wrapping a live controller / detector / OCR;
+`SessionLog` reads it back for `ReplayController` and the replay engines.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import queue
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from PIL import Image
+
+from core.utils.logger import logger_uma
+
+EVENTS_FILE = "session.jsonl"
+FRAMES_DIR = "frames"
+
+# Outermost input methods recorded (move_to is skipped: it never changes the screen
+# and is called from inside click/mouse_down)
+INPUT_METHODS = ("click", "scroll", "hold", "mouse_down", "mouse_up")
+OCR_METHODS = ("raw", "text", "digits", "batch_text", "batch_digits", "batch_rec")
+
+
+def image_key(img: Any) -> str:
+    """Content hash of a PIL image or numpy array (shape-aware)."""
+    if isinstance(img, Image.Image):
+        arr = np.asarray(img)
+    else:
+        arr = np.ascontiguousarray(np.asarray(img))
+    h = hashlib.blake2b(digest_size=10)
+    h.update(repr((arr.shape, str(arr.dtype))).encode("ascii"))
+    h.update(arr.tobytes())
+    return h.hexdigest()
+
+
+def _json_default(obj: Any) -> Any:
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, (set, tuple)):
+        return list(obj)
+    if isinstance(obj, Path):
+        return str(obj)
+    return repr(obj)
+
+
+class SessionRecorder:
+    """
+    Record a live run into `out_dir`. PNG encoding of new frames happens on a
+    writer thread so recording does not stretch the timings being measured.
+    """
+
+    def __init__(self, out_dir: str | Path, *, compress_level: int = 3) -> None:
+        self.dir = Path(out_dir)
+        (self.dir / FRAMES_DIR).mkdir(parents=True, exist_ok=True)
+        self.compress_level = int(compress_level)
+
+        self._events = open(self.dir / EVENTS_FILE, "a", encoding="utf-8")
+        self._lock = threading.Lock()
+        self._t0 = time.perf_counter()
+        self._seen = {p.stem for p in (self.dir / FRAMES_DIR).glob("*.png")}
+        self._patched: List[Tuple[Any, str, bool, Any]] = []
+        self._local = threading.local()
+
+        self._q: "queue.Queue[Optional[Tuple[str, Image.Image]]]" = queue.Queue()
+        self._writer = threading.Thread(
+            target=self._write_loop, name="session-writer", daemon=True
+        )
+        self._writer.start()
+
+        # Diagnostics
+        self.frames_total = 0
+        self.frames_unique = 0
+        self.events = 0
+
+    # ---- writing ----
+    def emit(self, ev: str, **fields: Any) -> None:
+        fields.setdefault("t", round(time.perf_counter() - self._t0, 4))
+        line = json.dumps({"ev": ev, **fields}, default=_json_default)
+        with self._lock:
+            self._events.write(line + "\n")
+            self.events += 1
+
+    def add_frame(self, img: Image.Image) -> str:
+        fid = image_key(img)
+        with self._lock:
+            self.frames_total += 1
+            is_new = fid not in self._seen
+            if is_new:
+                self._seen.add(fid)
+                self.frames_unique += 1
+        if is_new:
+            self._q.put((fid, img))
+        return fid
+
+    def _write_loop(self) -> None:
+        while True:
+            item = self._q.get()
+            if item is None:
+                return
+            fid, img = item
+            try:
+                img.save(
+                    self.dir / FRAMES_DIR / f"{fid}.png",
+                    compress_level=self.compress_level,
+                )
+            except Exception as e:
+                logger_uma.warning("[session] failed to store frame %s: %s", fid, e)
+
+    def close(self) -> None:
+        self.detach()
+        self._q.put(None)
+        self._writer.join(timeout=30)
+        with self._lock:
+            self._events.close()
+        logger_uma.info(
+            "[session] recorded %d events, %d frames (%d unique) → %s",
+            self.events,
+            self.frames_total,
+            self.frames_unique,
+            self.dir,
+        )
+
+    # ---- wrapping live objects ----
+    def _patch(self, obj: Any, name: str, make: Callable[[Callable], Callable]) -> None:
+        orig = getattr(obj, name, None)
+        if orig is None:
+            return
+        had = name in vars(obj)
+        self._patched.append((obj, name, had, vars(obj).get(name)))
+        setattr(obj, name, make(orig))
+
+    def detach(self) -> None:
+        """Restore every method replaced by attach()."""
+        for obj, name, had, prev in reversed(self._patched):
+            if had:
+                setattr(obj, name, prev)
+            else:
+                vars(obj).pop(name, None)
+        self._patched.clear()
+
+    def attach(self, ctrl: Any, yolo_engine: Any = None, ocr: Any = None) -> None:
+        """Start recording what flows through `ctrl`, `yolo_engine` and `ocr`."""
+
+        def wrap_screenshot(orig):
+            def screenshot(region=None):
+                img = orig(region=region)
+                fid = self.add_frame(img)
+                img.info["session_frame"] = fid
+                self.emit(
+                    "frame",
+                    id=fid,
+                    region=region,
+                    origin=ctrl.capture_origin(),
+                    bbox=ctrl.capture_bbox(),
+                )
+                return img
+
+            return screenshot
+
+        def wrap_input(kind: str):
+            def make(orig):
+                def action(*args, **kwargs):
+                    # only the outermost call (click → move_to/mouse_down… is one action)
+                    if getattr(self._local, "in_input", False):
+                        return orig(*args, **kwargs)
+                    self._local.in_input = True
+                    t = round(time.perf_counter() - self._t0, 4)
+                    try:
+                        return orig(*args, **kwargs)
+                    finally:
+                        self._local.in_input = False
+                        self.emit(
+                            "input",
+                            t=t,
+                            kind=kind,
+                            args=args,
+                            kwargs=kwargs,
+                            dur=round(time.perf_counter() - self._t0 - t, 4),
+                        )
+
+                return action
+
+            return make
+
+        self._patch(ctrl, "screenshot", wrap_screenshot)
+        for kind in INPUT_METHODS:
+            self._patch(ctrl, kind, wrap_input(kind))
+
+        if yolo_engine is not None:
+
+            def wrap_recognize(orig):
+                def recognize(**kwargs):
+                    img, meta, dets = orig(**kwargs)
+                    fid = img.info.get("session_frame") or self.add_frame(img)
+                    self.emit(
+                        "detect",
+                        frame=fid,
+                        tag=kwargs.get("tag", "general"),
+                        imgsz=kwargs.get("imgsz"),
+                        conf=kwargs.get("conf"),
+                        iou=kwargs.get("iou"),
+                        meta=meta,
+                        dets=dets,
+                    )
+                    return img, meta, dets
+
+                return recognize
+
+            self._patch(yolo_engine, "recognize", wrap_recognize)
+
+        if ocr is not None:
+
+            def wrap_ocr(method: str):
+                def make(orig):
+                    def call(img, *args, **kwargs):
+                        result = orig(img, *args, **kwargs)
+                        imgs: Iterable[Any] = img if method.startswith("batch_") else [img]
+                        self.emit(
+                            "ocr",
+                            method=method,
+                            keys=[image_key(i) for i in imgs],
+                            args=[args, kwargs],
+                            result=result,
+                        )
+                        return result
+
+                    return call
+
+                return make
+
+            for method in OCR_METHODS:
+                self._patch(ocr, method, wrap_ocr(method))
+
+
+class SessionLog:
+    """Read-only view of a recorded session directory."""
+
+    def __init__(self, path: str | Path, *, frame_cache: int = 16) -> None:
+        self.dir = Path(path)
+        events_path = self.dir / EVENTS_FILE
+        if not events_path.exists():
+            raise FileNotFoundError(f"No {EVENTS_FILE} in {self.dir}")
+        with open(events_path, "r", encoding="utf-8") as fh:
+            self.events: List[Dict[str, Any]] = [
+                json.loads(line) for line in fh if line.strip()
+            ]
+        self._cache: "OrderedDict[str, Image.Image]" = OrderedDict()
+        self._cache_size = max(1, int(frame_cache))
+
+    @property
+    def header(self) -> Dict[str, Any]:
+        for ev in self.events:
+            if ev["ev"] == "start":
+                return ev
+        return {}
+
+    def of(self, kind: str) -> List[Dict[str, Any]]:
+        return [ev for ev in self.events if ev["ev"] == kind]
+
+    def frame(self, fid: str) -> Image.Image:
+        img = self._cache.get(fid)
+        if img is not None:
+            self._cache.move_to_end(fid)
+            return img
+        with Image.open(self.dir / FRAMES_DIR / f"{fid}.png") as im:
+            img = im.convert("RGB")
+        self._cache[fid] = img
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+        return img
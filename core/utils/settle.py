@@ -0,0 +1,133 @@
+# core/utils/settle.py
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+from PIL import Image
+
+from core.controllers.base import IController
+from core.settings import Settings
+from core.types import XYXY
+from core.utils.abort import abort_requested
+from core.utils.geometry import crop_pil
+from core.utils.logger import logger_uma
+
+
+@dataclass(frozen=True)
+class SettleResult:
+    settled: bool  # False → hit the timeout while the screen was still moving
+    elapsed_s: float
+    frames: int
+    last_diff: float  # mean abs gray diff (0..255) of the last compared pair
+    image: Optional[Image.Image]  # last captured frame (full, not ROI)
+
+
+def _thumb(img: Image.Image, roi: Optional[XYXY], width: int) -> np.ndarray:
+    if roi is not None:
+        img = crop_pil(img, roi)
+    w, h = img.size
+    tw = max(8, min(int(width), w))
+    th = max(8, int(round(h * tw / max(1, w))))
+    small = img.convert("L").resize((tw, th), Image.BILINEAR)
+    return np.asarray(small, dtype=np.int16)
+
+
+def _capture_stamp(img: Image.Image) -> Optional[object]:
+    """Identity of a buffered capture (seq, else timestamp); None for direct grabs."""
+    info = getattr(img, "info", None) or {}
+    seq = info.get("capture_seq")
+    return seq if seq is not None else info.get("capture_ts")
+
+
+def frame_diff(
+    a: Image.Image, b: Image.Image, *, roi: Optional[XYXY] = None, width: int = 64
+) -> float:
+    """Mean absolute difference (0..255) between downscaled gray versions of two frames."""
+    ta, tb = _thumb(a, roi, width), _thumb(b, roi, width)
+    if ta.shape != tb.shape:
+        return 255.0
+    return float(np.abs(ta - tb).mean())
+
+
+def wait_for_settle(
+    ctrl: IController,
+    *,
+    timeout_s: float,
+    roi: Optional[XYXY] = None,
+    threshold: float = 1.5,
+    stable_frames: int = 2,
+    min_wait_s: float = 0.3,
+    poll_s: float = 0.05,
+    width: int = 64,
+    tag: str = "settle",
+) -> SettleResult:
+    """
+    Wait until the screen stops changing, instead of a fixed post-action sleep.
+
+    Consecutive frames are compared on a small grayscale thumbnail (optionally
+    only inside `roi`, given in screenshot coords). Returns once `stable_frames`
+    consecutive comparisons stay under `threshold`, or after `timeout_s` —
+    so the worst case equals the sleep it replaces.
+
+    `min_wait_s` keeps us from declaring "stable" before the transition even
+    started (the first frames after a click are often still the old screen).
+    Frames that carry `capture_seq`/`capture_ts` (CaptureService) are only
+    compared once that stamp advances, so a re-served buffered frame never
+    counts as "no motion".
+    With Settings.VISUAL_SETTLE disabled this is just `time.sleep(timeout_s)`.
+    """
+    t0 = time.monotonic()
+    timeout_s = max(0.0, float(timeout_s))
+    if not Settings.VISUAL_SETTLE:
+        time.sleep(timeout_s)
+        return SettleResult(False, timeout_s, 0, -1.0, None)
+
+    deadline = t0 + timeout_s
+    min_until = t0 + min(max(0.0, min_wait_s), timeout_s)
+    prev: Optional[np.ndarray] = None
+    prev_stamp = None
+    img: Optional[Image.Image] = None
+    frames = 0
+    streak = 0
+    diff = -1.0
+
+    while True:
+        try:
+            img = ctrl.screenshot()
+        except Exception as e:
+            logger_uma.debug("[settle] %s: capture failed (%s); sleeping out", tag, e)
+            time.sleep(max(0.0, deadline - time.monotonic()))
+            return SettleResult(False, time.monotonic() - t0, frames, diff, img)
+
+        stamp = _capture_stamp(img)
+        if stamp is None or stamp != prev_stamp:
+            prev_stamp = stamp
+            frames += 1
+            cur = _thumb(img, roi, width)
+            if prev is not None:
+                diff = (
+                    255.0 if cur.shape != prev.shape else float(np.abs(cur - prev).mean())
+                )
+                streak = streak + 1 if diff <= threshold else 0
+            prev = cur
+
+        now = time.monotonic()
+        if streak >= stable_frames and now >= min_until:
+            elapsed = now - t0
+            logger_uma.debug(
+                "[settle] %s: stable after %.2fs (%d frames, saved %.2fs)",
+                tag,
+                elapsed,
+                frames,
+                timeout_s - elapsed,
+            )
+            return SettleResult(True, elapsed, frames, diff, img)
+        if now >= deadline or abort_requested():
+            logger_uma.debug(
+                "[settle] %s: timeout %.2fs (last diff=%.2f)", tag, timeout_s, diff
+            )
+            return SettleResult(False, now - t0, frames, diff, img)
+        time.sleep(min(poll_s, max(0.0, deadline - now)))
@@ -3,7 +3,6 @@ from typing import Any, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 from PIL import Image
-import cv2
 import time
 from core.perception.extractors.training_metrics import extract_failure_pct_for_tile
 from core.settings import Settings
@@ -13,6 +12,7 @@ from core.perception.analyzers.hint import (
     build_support_geometries,
 )
 
+from core.utils.frame import Frame, as_frame
 from core.utils.logger import logger_uma
 from core.utils.analyzers import analyze_support_crop
 from core.utils.support_matching import (
@@ -168,7 +168,7 @@ def _get_spirit_clf():
         _SPIRIT_CLF = None
     return _SPIRIT_CLF
 
-def _classify_spirit_icon(frame_bgr, xyxy, *, threshold: float = 0.51):
+def _classify_spirit_icon(frame: Frame, xyxy, *, threshold: float = 0.51):
     """
     Returns dict with keys: spirit_label ('spirit_blue'|'spirit_white'|'unknown'),
     spirit_color ('blue'|'white'|'unknown'), spirit_confidence (0..1).
@@ -178,15 +178,14 @@ def _classify_spirit_icon(frame_bgr, xyxy, *, threshold: float = 0.51):
         return {"spirit_label": "unknown", "spirit_color": "unknown", "spirit_confidence": 0.0}
 
     x1, y1, x2, y2 = [int(v) for v in xyxy]
-    h, w = frame_bgr.shape[:2]
+    h, w = frame.shape[:2]
     pad = 2
     x1 = max(0, x1 - pad); y1 = max(0, y1 - pad)
     x2 = min(w, x2 + pad); y2 = min(h, y2 + pad)
     if x2 <= x1 or y2 <= y1:
         return {"spirit_label": "unknown", "spirit_color": "unknown", "spirit_confidence": 0.0}
 
-    crop_rgb = cv2.cvtColor(frame_bgr[y1:y2, x1:x2], cv2.COLOR_BGR2RGB)
-    pil_img = Image.fromarray(crop_rgb)
+    pil_img = frame.crop((x1, y1, x2, y2)).pil
 
     try:
         pred = clf.predict(pil_img)  # {'pred_label':'spirit_blue', 'confidence':0.97, ...}
@@ -209,7 +208,8 @@ def collect_supports_enriched(
     Take *all* supports visible in this capture — they correspond to the currently raised tile.
     Enrich each with bar/type pieces, hint, rainbow, etc.
     """
-    frame_bgr = cv2.cvtColor(np.array(cur_img), cv2.COLOR_RGB2BGR)
+    # Same Frame the detector used for this capture: BGR is already converted
+    frame = as_frame(cur_img)
 
     # --- helpers: IoU + NMS ---
     def _area(xyxy):
@@ -312,10 +312,10 @@ def collect_supports_enriched(
 
     # Reuse the same geometry assignment for both markers
     support_assignments, tile_hints = assign_hints_to_supports(
-        support_geoms, hints, canvas_height=frame_bgr.shape[0],
+        support_geoms, hints, canvas_height=frame.height,
     )
     spirit_assignments, tile_spirits = assign_hints_to_supports(
-        support_geoms, spirits, canvas_height=frame_bgr.shape[0],
+        support_geoms, spirits, canvas_height=frame.height,
     )
     # Flames tend to be either at left side of the circular portrait or at the bottom-right
     # of the portrait, sometimes slightly outside the bbox. Use a wider horizontal expansion
@@ -323,7 +323,7 @@ def collect_supports_enriched(
     flame_assignments, tile_flames = assign_hints_to_supports(
         support_geoms,
         flames,
-        canvas_height=frame_bgr.shape[0],
+        canvas_height=frame.height,
         expand_x_frac=0.50,     # allow overhang to left/right
         expand_top_frac=0.20,   # small margin above the portrait
         expand_bottom_frac=0.55 # larger margin below (exploded bubble)
@@ -356,7 +356,7 @@ def collect_supports_enriched(
 
     for s, geom in zip(supports, support_geoms):
         x1, y1, x2, y2 = geom.bbox
-        crop = frame_bgr[y1:y2, x1:x2].copy()
+        card = frame.crop((x1, y1, x2, y2))
 
         # parts within this support
         bar_xyxy = None
@@ -372,20 +372,8 @@ def collect_supports_enriched(
                 type_xyxy = (tx1, ty1, tx2, ty2)
                 break
 
-        bar_crop = (
-            None
-            if bar_xyxy is None
-            else frame_bgr[
-                bar_xyxy[1] : bar_xyxy[3], bar_xyxy[0] : bar_xyxy[2]
-            ].copy()
-        )
-        type_crop = (
-            None
-            if type_xyxy is None
-            else frame_bgr[
-                type_xyxy[1] : type_xyxy[3], type_xyxy[0] : type_xyxy[2]
-            ].copy()
-        )
+        bar_crop = None if bar_xyxy is None else frame.crop(bar_xyxy)
+        type_crop = None if type_xyxy is None else frame.crop(type_xyxy)
 
         support_key = geom.key
         assigned_hints = support_assignments.get(support_key, [])
@@ -405,14 +393,14 @@ def collect_supports_enriched(
         if assigned_spirits:
             # pick the highest-conf spirit detection for color classification
             best_spt = max(assigned_spirits, key=lambda d: float(d.get("conf", 0.0)))
-            spirit_cls = _classify_spirit_icon(frame_bgr, best_spt.get("xyxy"))
+            spirit_cls = _classify_spirit_icon(frame, best_spt.get("xyxy"))
             spirit_label = spirit_cls["spirit_label"]
             spirit_color = spirit_cls["spirit_color"]
             spirit_color_conf = float(spirit_cls["spirit_confidence"])
             
         attrs = analyze_support_crop(
             s["name"],
-            crop,
+            card,
             piece_bar_bgr=bar_crop,
             piece_type_bgr=type_crop,
             hint_sources=assigned_hints,
@@ -507,7 +495,7 @@ def collect_supports_enriched(
         if support_record["has_hint"] and has_priority_customization:
             if matcher is None:
                 matcher = get_runtime_support_matcher(min_confidence=min_confidence)
-            match = match_support_crop(crop, matcher=matcher)
+            match = match_support_crop(card.bgr, matcher=matcher)
             if match:
                 name = match.get("name", "")
                 rarity = match.get("rarity", "")
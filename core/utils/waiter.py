@@ -3,20 +3,22 @@ from __future__ import annotations
 
 import time
 from dataclasses import dataclass
-from typing import List, Optional, Sequence, Tuple, Union, overload
+from typing import Iterator, List, Optional, Sequence, Tuple, Union, overload
 
 from PIL import Image
 
 from core.controllers.base import IController
 from core.perception.ocr.interface import OCRInterface
 from core.perception.yolo.interface import IDetector
+from core.perception.yolo.roi import ROI
+from core.settings import Settings
 from core.utils.geometry import crop_pil
 from core.utils.logger import logger_uma
 from core.utils.text import fuzzy_contains, fuzzy_ratio
 from core.utils.yolo_objects import filter_by_classes as det_filter
 from core.types import DetectionDict
 
-
+REC_MIN_CONF = 0.2  # same floor text() applies per recognized line (WAITER_BATCH_REC)
 
 
 @dataclass(frozen=True)
@@ -83,6 +85,8 @@ class Waiter:
         forbid_texts: Optional[Sequence[str]] = None,
         forbid_threshold: float = 0.65,
         return_object: bool = False,
+        wait_click: bool = True,
+        roi: Optional[ROI] = None,
     ) -> bool: ...
 
     @overload
@@ -101,6 +105,8 @@ class Waiter:
         forbid_texts: Optional[Sequence[str]] = None,
         forbid_threshold: float = 0.65,
         return_object: bool = True,
+        wait_click: bool = True,
+        roi: Optional[ROI] = None,
     ) -> Tuple[bool, Optional[DetectionDict]]: ...
 
     def click_when(
@@ -119,6 +125,8 @@ class Waiter:
         forbid_texts: Optional[Sequence[str]] = None,
         forbid_threshold: float = 0.65,
         return_object: bool = False,
+        wait_click: bool = True,
+        roi: Optional[ROI] = None,
     ) -> Union[bool, Tuple[bool, Optional[DetectionDict]]]:
         """
         Wait until an object of `classes` appears and click it using the cascade.
@@ -133,6 +141,14 @@ class Waiter:
         return_object:
             If True, returns (did_click, clicked_object) tuple instead of just bool.
             The clicked_object is the DetectionDict that was clicked, or None if no click.
+        wait_click:
+            If False and the controller has an input dispatcher running, the click
+            is queued and this returns immediately; call `ctrl.wait_input()` before
+            any step that depends on the click having landed.
+        roi:
+            Detect only inside this region of the capture (relative or pixel
+            xyxy) at a proportionally smaller input size, and only `classes`.
+            Returned/clicked boxes stay in full-frame coordinates.
 
         Returns True if clicked; False if timed out.
         If return_object=True, returns (bool, Optional[DetectionDict]) tuple.
@@ -152,7 +168,7 @@ class Waiter:
 
         t0 = time.time()
         while True:
-            img, dets = self._snap(tag=tag)
+            img, dets = self._snap(tag=tag, roi=roi, classes=classes)
             cand = det_filter(dets, classes)
 
             if cand:
@@ -166,7 +182,7 @@ class Waiter:
                             tag,
                         )
                     else:
-                        self.ctrl.click_xyxy_center(pick["xyxy"], clicks=clicks)
+                        self._click(pick["xyxy"], clicks=clicks, wait=wait_click)
                         return (True, pick) if return_object else True
 
                 # 2) Bottom-most preference (try from bottom to top; skip forbiddens)
@@ -184,7 +200,7 @@ class Waiter:
                             chosen = d
                             break
                     if chosen is not None:
-                        self.ctrl.click_xyxy_center(chosen["xyxy"], clicks=clicks)
+                        self._click(chosen["xyxy"], clicks=clicks, wait=wait_click)
                         return (True, chosen) if return_object else True
                     # All bottom candidates forbidden → continue polling.
 
@@ -194,7 +210,7 @@ class Waiter:
                         img, cand, texts, threshold, forbid_texts, forbid_threshold
                     )
                     if pick is not None:
-                        self.ctrl.click_xyxy_center(pick["xyxy"], clicks=clicks)
+                        self._click(pick["xyxy"], clicks=clicks, wait=wait_click)
                         return (True, pick) if return_object else True
                     # If OCR didn't reach threshold or all candidates were forbidden, continue polling.
 
@@ -217,6 +233,7 @@ class Waiter:
         tag: Optional[str] = None,
         conf_min: float = 0.0,
         threshold: float = 0.58,
+        roi: Optional[ROI] = None,
     ) -> bool:
         """
         Snapshot once and return True if:
@@ -226,7 +243,9 @@ class Waiter:
 
         No waiting/polling, no clicks.
         """
-        img, dets = self._snap(tag=tag or (self.cfg.tag + "_seen"))
+        img, dets = self._snap(
+            tag=tag or (self.cfg.tag + "_seen"), roi=roi, classes=classes
+        )
 
         # Filter by classes when provided
         candidates = (
@@ -245,21 +264,14 @@ class Waiter:
         if not self.ocr:
             return False
 
-        for d in candidates:
-            try:
-                roi = d.get("xyxy")
-                if not roi:
-                    continue
-                crop = crop_pil(img, roi, pad=0)
-                txt = (self.ocr.text(crop) or "").strip()
-                if not txt:
-                    continue
-                for target in texts:
-                    if fuzzy_contains(txt, target, threshold=threshold):
-                        return True
-            except Exception:
-                # Be conservative; failure to OCR this box shouldn't stop others
+        boxed = [d for d in candidates if d.get("xyxy")]
+        # Be conservative; failure to OCR one box shouldn't stop the others
+        for txt in self._labels(img, boxed, skip_errors=True):
+            if not txt:
                 continue
+            for target in texts:
+                if fuzzy_contains(txt, target, threshold=threshold):
+                    return True
         return False
 
     def try_click_once(
@@ -274,6 +286,7 @@ class Waiter:
         allow_greedy_click: bool = True,
         forbid_texts: Optional[Sequence[str]] = None,
         forbid_threshold: float = 0.65,
+        roi: Optional[ROI] = None,
     ) -> bool:
         """
         Single snapshot best-effort click using the same cascade as `click_when`,
@@ -281,7 +294,9 @@ class Waiter:
         """
         if not classes:
             return False
-        img, dets = self._snap(tag=tag or (self.cfg.tag + "_try"))
+        img, dets = self._snap(
+            tag=tag or (self.cfg.tag + "_try"), roi=roi, classes=classes
+        )
         cand = det_filter(dets, classes)
         texts = self._norm_seq(texts)
         forbid_texts = self._norm_seq(forbid_texts)
@@ -321,13 +336,31 @@ class Waiter:
     # Internals
     # ---------------------------
 
-    def _snap(self, *, tag: str) -> Tuple[Image.Image, List[DetectionDict]]:
+    def _click(self, xyxy, *, clicks: int, wait: bool) -> None:
+        dispatcher = self.ctrl.input_dispatcher
+        if not wait and dispatcher is not None and dispatcher.running:
+            dispatcher.click_xyxy_center(xyxy, clicks=clicks)
+        else:
+            self.ctrl.click_xyxy_center(xyxy, clicks=clicks)
+
+    def _snap(
+        self,
+        *,
+        tag: str,
+        roi: Optional[ROI] = None,
+        classes: Optional[Sequence[str]] = None,
+    ) -> Tuple[Image.Image, List[DetectionDict]]:
+        kwargs = {}
+        if roi is not None:
+            # plain snaps stay unfiltered so recordings/debug captures keep every class
+            kwargs = {"roi": roi, "classes": classes}
         img, _, dets = self.yolo_engine.recognize(
             imgsz=self.cfg.imgsz,
             conf=self.cfg.conf,
             iou=self.cfg.iou,
             tag=tag,
             agent=self.agent,
+            **kwargs,
         )
         return img, dets
 
@@ -345,8 +378,7 @@ class Waiter:
         """
         if not forbid_texts or not self.ocr:
             return False
-        crop = crop_pil(img, det["xyxy"], pad=0)
-        txt = (self.ocr.text(crop) or "").strip().lower()
+        txt = next(self._labels(img, [det]), "").lower()
         if not txt:
             return False
         for ft in forbid_texts:
@@ -354,6 +386,37 @@ class Waiter:
                 return True
         return False
 
+    def _labels(
+        self, img: Image.Image, dets: Sequence[DetectionDict], *, skip_errors: bool = False
+    ) -> Iterator[str]:
+        """
+        Text on each detected box, read lazily with text() per crop so callers can
+        stop at the first match. With Settings.WAITER_BATCH_REC all crops go to the
+        recognizer in one batch_rec() call instead (no text detection pass); if
+        that call fails the crops are read one by one again.
+        `skip_errors` reads a crop whose text() raises as "" instead of raising.
+        """
+        if not dets:
+            return
+        batch_rec = getattr(self.ocr, "batch_rec", None) if Settings.WAITER_BATCH_REC else None
+        if batch_rec is not None:
+            try:
+                recs = batch_rec([crop_pil(img, d["xyxy"], pad=0) for d in dets])
+            except Exception as e:
+                logger_uma.debug("[waiter] batch_rec failed (%s); reading boxes one by one", e)
+            else:
+                for t, s in recs:
+                    yield (t or "").strip() if s >= REC_MIN_CONF else ""
+                return
+
+        for d in dets:
+            try:
+                yield (self.ocr.text(crop_pil(img, d["xyxy"], pad=0)) or "").strip()
+            except Exception:
+                if not skip_errors:
+                    raise
+                yield ""
+
     def _pick_by_text(
         self,
         img: Image.Image,
@@ -373,9 +436,7 @@ class Waiter:
             return None
 
         best_d, best_s = None, 0.0
-        for d in cand:
-            crop = crop_pil(img, d["xyxy"], pad=0)
-            txt = (self.ocr.text(crop) or "").strip()
+        for d, txt in zip(cand, self._labels(img, cand)):
             if not txt:
                 continue
             # Skip forbidden
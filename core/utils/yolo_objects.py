@@ -6,6 +6,7 @@ from typing import List, Optional, Sequence, Tuple
 
 from PIL import Image
 from core.perception.yolo.interface import IDetector
+from core.perception.yolo.roi import ROI
 from core.types import XYXY, DetectionDict
 from core.utils.logger import logger_uma
 
@@ -20,6 +21,8 @@ def collect(
     iou=0.45,
     tag: str = "general",
     agent: Optional[str] = None,
+    roi: Optional[ROI] = None,
+    classes: Optional[Sequence[str]] = None,
 ) -> Tuple[Image.Image, List[DetectionDict]]:
     conf = max(conf, 0.1)
     if agent is None:
@@ -27,8 +30,9 @@ def collect(
         logger_uma.warning(
             f"collect called without agent; defaulting to generic debug folder: {extra}",
         )
+    kwargs = {"roi": roi, "classes": classes} if (roi is not None or classes) else {}
     img, _, dets = yolo_engine.recognize(
-        imgsz=imgsz, conf=conf, iou=iou, tag=tag, agent=agent
+        imgsz=imgsz, conf=conf, iou=iou, tag=tag, agent=agent, **kwargs
     )
     return img, dets
 
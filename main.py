@@ -29,6 +29,8 @@ from server.utils import (
     save_config,
 )
 from core.utils.abort import request_abort, clear_abort
+from core.utils.pacer import pacer
+from core.utils.session_recorder import SessionRecorder
 from core.utils.event_processor import UserPrefs
 from core.utils.preset_overlay import show_preset_overlay
 from core.ui.scenario_prompt import choose_active_scenario, ScenarioSelectionCancelled
@@ -55,6 +57,80 @@ except Exception:
 # ---------------------------
 # Helpers to instantiate runtimes from Settings
 # ---------------------------
+def _adb_stream_kwargs() -> dict:
+    return {
+        "scrcpy_server": str(Settings.SCRCPY_SERVER_PATH),
+        "scrcpy_version": Settings.SCRCPY_SERVER_VERSION,
+        "stream_max_fps": Settings.SCRCPY_MAX_FPS,
+        "stream_port": Settings.SCRCPY_PORT,
+    }
+
+
+def start_background_services(ctrl: IController) -> None:
+    """Start the controller's capture thread / input dispatcher if enabled in Settings."""
+    if Settings.CAPTURE_SERVICE:
+        ctrl.start_capture_service(
+            interval_s=Settings.CAPTURE_INTERVAL_S,
+            buffer_size=Settings.CAPTURE_BUFFER_SIZE,
+        )
+        logger_uma.info("[CTRL] Background capture enabled")
+    if Settings.INPUT_DISPATCHER:
+        ctrl.start_input_dispatcher()
+        logger_uma.info("[CTRL] Asynchronous input dispatch enabled")
+
+
+def stop_background_services(ctrl: IController) -> None:
+    stats = ctrl.stop_capture_service()
+    if stats:
+        logger_uma.info(
+            "[CTRL] Capture stats: captured=%d delivered=%d dropped=%d reused=%d "
+            "avg_capture=%.1fms avg_frame_age=%.1fms",
+            stats["captured"],
+            stats["delivered"],
+            stats["dropped"],
+            stats["reused"],
+            stats["avg_capture_ms"],
+            stats["avg_delivered_age_ms"],
+        )
+    input_stats = ctrl.stop_input_dispatcher()
+    for kind, st in (input_stats or {}).items():
+        logger_uma.info(
+            "[CTRL] Input %s: n=%d queue avg=%.1fms max=%.1fms delivery avg=%.1fms max=%.1fms",
+            kind,
+            st["count"],
+            st["queue_ms_avg"],
+            st["queue_ms_max"],
+            st["delivery_ms_avg"],
+            st["delivery_ms_max"],
+        )
+
+
+def start_session_recording(
+    ctrl: IController,
+    ocr: OCRInterface,
+    yolo_engine: IDetector,
+    *,
+    agent: str,
+    action: str | None = None,
+) -> SessionRecorder | None:
+    """Record this run for offline replay if Settings.SESSION_RECORD_DIR is set."""
+    if not Settings.SESSION_RECORD_DIR:
+        return None
+    stamp = time.strftime("%Y%m%d_%H%M%S")
+    out_dir = Path(Settings.SESSION_RECORD_DIR) / f"{stamp}_{action or agent}"
+    recorder = SessionRecorder(out_dir)
+    recorder.emit(
+        "start",
+        agent=agent,
+        scenario=Settings.ACTIVE_SCENARIO,
+        action=action,
+        config=Settings._last_config or {},
+    )
+    recorder.attach(ctrl, yolo_engine, ocr)
+    logger_uma.info(f"[CTRL] Recording session to {out_dir}")
+    return recorder
+
+
 def make_controller_from_settings() -> IController:
     """Build a fresh controller based on current Settings.MODE + resolved window title."""
     mode = Settings.MODE.lower().strip()
@@ -70,13 +146,24 @@ def make_controller_from_settings() -> IController:
     elif mode == "adb":
         device = getattr(Settings, "ADB_DEVICE", None)
         logger_uma.info(f"[CTRL] Mode=adb, device='{device}'")
-        return ADBController(device=device)
+        return ADBController(
+            device=device,
+            capture_mode=Settings.ADB_CAPTURE_MODE,
+            use_shell_session=Settings.ADB_SHELL_SESSION,
+            **_adb_stream_kwargs(),
+        )
     elif mode == "bluestack":
         use_adb = getattr(Settings, "USE_ADB", False)
         if use_adb:
             device = getattr(Settings, "ADB_DEVICE", "localhost:5555")
             logger_uma.info(f"[CTRL] Mode=bluestack (ADB), device='{device}'")
-            return ADBController(device=device, auto_connect=True)
+            return ADBController(
+                device=device,
+                auto_connect=True,
+                capture_mode=Settings.ADB_CAPTURE_MODE,
+                use_shell_session=Settings.ADB_SHELL_SESSION,
+                **_adb_stream_kwargs(),
+            )
 
         logger_uma.info(f"[CTRL] Mode=bluestack, window_title='{window_title}'")
         if HAS_BLUESTACKS_CTRL and BlueStacksController is not None:
@@ -89,7 +176,7 @@ def make_controller_from_settings() -> IController:
 
 
 def make_ocr_yolo_from_settings(
-    ctrl: IController, weights: str | Path | None = None
+    ctrl: IController | None, weights: str | Path | None = None
 ) -> tuple[OCRInterface, IDetector]:
     """Build fresh OCR and YOLO engines based on current Settings."""
     resolved_weights = weights if weights is not None else Settings.ACTIVE_YOLO_WEIGHTS
@@ -118,24 +205,200 @@ def make_ocr_yolo_from_settings(
             yolo_engine = RemoteYOLOEngine(
                 ctrl=ctrl, base_url=Settings.EXTERNAL_PROCESSOR_URL
             )
-        return ocr, yolo_engine
+        return _finish_perception(ocr, yolo_engine)
 
     logger_uma.info("[PERCEPTION] Using internal processors")
     from core.perception.ocr.ocr_local import LocalOCREngine
-    from core.perception.yolo.yolo_local import LocalYOLOEngine
 
     ocr = LocalOCREngine(
         text_detection_model_name=det_name,
         text_recognition_model_name=rec_name,
     )
+    engine_cls: type[IDetector]
+    if Settings.YOLO_BACKEND == "onnx":
+        logger_uma.info("[PERCEPTION] YOLO backend: onnxruntime")
+        from core.perception.yolo.yolo_onnx import ONNXYOLOEngine
+
+        engine_cls = ONNXYOLOEngine
+    else:
+        from core.perception.yolo.yolo_local import LocalYOLOEngine
+
+        engine_cls = LocalYOLOEngine
+
     if weights_str:
-        yolo_engine = LocalYOLOEngine(ctrl=ctrl, weights=weights_str)
+        yolo_engine = engine_cls(ctrl=ctrl, weights=weights_str)
     else:
-        yolo_engine = LocalYOLOEngine(ctrl=ctrl)
+        yolo_engine = engine_cls(ctrl=ctrl)
+
+    return _finish_perception(ocr, yolo_engine)
+
 
+def _finish_perception(
+    ocr: OCRInterface, yolo_engine: IDetector
+) -> tuple[OCRInterface, IDetector]:
+    yolo_engine = _maybe_cache_detections(yolo_engine)
+    ocr = _maybe_cache_ocr(ocr)
+    if Settings.WARMUP:
+        start_warmup(ocr, yolo_engine)
     return ocr, yolo_engine
 
 
+def start_warmup(ocr: OCRInterface, yolo_engine: IDetector):
+    """Warm the detector at every configured input size, the OCR and (Unity Cup) the spirit classifier."""
+    from core.perception import warmup
+
+    w = warmup.Warmup()
+    w.add("yolo", warmup.yolo_jobs(yolo_engine))
+    w.add("ocr", warmup.ocr_jobs(ocr))
+    if Settings.ACTIVE_SCENARIO == "unity_cup":
+        from core.utils.training_check_helpers import _get_spirit_clf
+
+        w.add("spirit", warmup.classifier_jobs(_get_spirit_clf))
+    return w.start()
+
+
+def wait_for_warmup() -> None:
+    """
+    Block up to Settings.WARMUP_WAIT_S until the latest warmup finished; past
+    that, cancel the remaining jobs. Warmup shares the (not thread-safe) engines
+    with the agent, so its threads have always exited when this returns.
+    """
+    if not Settings.WARMUP:
+        return
+    from core.perception import warmup
+
+    w = warmup.current()
+    if w is None:
+        return
+    if not w.wait(max(0.0, Settings.WARMUP_WAIT_S)):
+        logger_uma.warning(
+            "[PERCEPTION] Warmup not finished after %.0fs; cancelling the rest.",
+            Settings.WARMUP_WAIT_S,
+        )
+        w.cancel()
+    w.join()
+
+
+def _maybe_cache_detections(yolo_engine: IDetector) -> IDetector:
+    """Put a DetectionCache in front of the engine when Settings.DETECTION_CACHE is on."""
+    if not Settings.DETECTION_CACHE:
+        return yolo_engine
+    from core.perception.yolo.detection_cache import DetectionCache
+
+    logger_uma.info(
+        "[PERCEPTION] Detection cache on (ttl=%.2fs, diff<=%.2f)",
+        Settings.DETECTION_CACHE_TTL_S,
+        Settings.DETECTION_CACHE_DIFF,
+    )
+    return DetectionCache().attach(yolo_engine)
+
+
+def _maybe_cache_ocr(ocr: OCRInterface) -> OCRInterface:
+    """Put an OCRCache in front of the engine when Settings.OCR_CACHE is on."""
+    if not Settings.OCR_CACHE:
+        return ocr
+    from core.perception.ocr.ocr_cache import OCRCache
+
+    logger_uma.info(
+        "[PERCEPTION] OCR cache on (%d entries, %.0f MB)",
+        Settings.OCR_CACHE_MAX_ENTRIES,
+        Settings.OCR_CACHE_MAX_MB,
+    )
+    return OCRCache().attach(ocr)
+
+
+def make_agent_from_settings(
+    ctrl: IController,
+    ocr: OCRInterface,
+    yolo_engine: IDetector,
+    cfg: dict | None,
+) -> AgentScenario:
+    """Build the active scenario agent with runtime knobs from Settings + presets + event prefs."""
+    # Preset-specific runtime opts (skill_list / plan_races / select_style)
+    preset_opts = Settings.extract_runtime_preset(cfg or {})
+
+    # Event prefs from config (active preset). If malformed/missing,
+    # UserPrefs.from_config() returns safe defaults and EventFlow will still
+    # pick the top option if a pick is invalid at runtime.
+    event_prefs = UserPrefs.from_config(cfg or {})
+
+    agent_cls = AgentUnityCup if Settings.ACTIVE_SCENARIO == "unity_cup" else AgentURA
+    return agent_cls(
+        ctrl=ctrl,
+        ocr=ocr,
+        yolo_engine=yolo_engine,
+        interval_stats_refresh=1,
+        minimum_skill_pts=preset_opts.get("minimum_skill_pts", Settings.MINIMUM_SKILL_PTS),
+        prioritize_g1=False,
+        auto_rest_minimum=Settings.AUTO_REST_MINIMUM,
+        plan_races=preset_opts["plan_races"],
+        skill_list=preset_opts["skill_list"],
+        select_style=preset_opts["select_style"],  # "end"|"late"|"pace"|"front"|None
+        event_prefs=event_prefs,
+    )
+
+
+def run_multi_device(devices: list[str], cfg: dict | None) -> None:
+    """
+    Headless orchestrator mode: one agent thread per ADB device, all sharing a
+    single OCR/YOLO stack (loaded once) behind a PerceptionHub.
+    """
+    from core.orchestrator import MultiDeviceOrchestrator
+
+    ctrls: dict[str, IController] = {}
+    for i, device in enumerate(devices):
+        stream_kwargs = _adb_stream_kwargs()
+        stream_kwargs["stream_port"] += i  # one local forward port per device
+        ctrl = ADBController(
+            device=device,
+            capture_mode=Settings.ADB_CAPTURE_MODE,
+            use_shell_session=Settings.ADB_SHELL_SESSION,
+            **stream_kwargs,
+        )
+        if not ctrl.focus():
+            logger_uma.error(f"[ORCH] Could not connect to ADB device '{device}'; skipping.")
+            continue
+        start_background_services(ctrl)
+        ctrls[device] = ctrl
+    if not ctrls:
+        logger_uma.error("[ORCH] No reachable devices.")
+        return
+
+    pacer.set_profile(Settings.PACE_PROFILE)
+    pacer.reset()
+    # Engines are shared: recognize() goes through each device's own client/controller.
+    ocr, yolo_engine = make_ocr_yolo_from_settings(None)
+    wait_for_warmup()
+
+    orch = MultiDeviceOrchestrator(
+        ctrls,
+        ocr,
+        yolo_engine,
+        lambda ctrl, o, y: make_agent_from_settings(ctrl, o, y, cfg),
+        run_kwargs={
+            "delay": getattr(Settings, "MAIN_LOOP_DELAY", 0.4),
+            "max_iterations": getattr(Settings, "MAX_ITERATIONS", None),
+        },
+    )
+    clear_abort()
+    orch.start()
+    last_report = time.monotonic()
+    try:
+        while orch.running:
+            time.sleep(1.0)
+            if time.monotonic() - last_report >= Settings.ORCH_STATS_INTERVAL_S:
+                orch.log_stats()
+                last_report = time.monotonic()
+    except KeyboardInterrupt:
+        orch.stop()
+    finally:
+        orch.join(timeout=10.0)
+        orch.log_stats()
+        for ctrl in ctrls.values():
+            stop_background_services(ctrl)
+        clear_abort()
+
+
 # ---------------------------
 # Server
 # ---------------------------
@@ -278,56 +541,24 @@ class BotState:
                     )
                 return
 
+            start_background_services(ctrl)
+            pacer.set_profile(Settings.PACE_PROFILE)
+            pacer.reset()
             ocr, yolo_engine = make_ocr_yolo_from_settings(ctrl)
 
-            # 4) Extract preset-specific runtime opts (skill_list / plan_races / select_style)
-            preset_opts = Settings.extract_runtime_preset(cfg or {})
-
-            # 5) Build event prefs from config (active preset). If malformed/missing,
-            #    UserPrefs.from_config() returns safe defaults and EventFlow will still
-            #    pick the top option if a pick is invalid at runtime.
-            event_prefs = UserPrefs.from_config(cfg or {})
-            
-
-            if Settings.ACTIVE_SCENARIO == "unity_cup":
-                # Instantiate Player with runtime knobs from Settings + presets + event prefs
-                self.agent_scenario = AgentUnityCup(
-                    ctrl=ctrl,
-                    ocr=ocr,
-                    yolo_engine=yolo_engine,
-                    interval_stats_refresh=1,
-                    minimum_skill_pts=preset_opts.get("minimum_skill_pts", Settings.MINIMUM_SKILL_PTS),
-                    prioritize_g1=False,
-                    auto_rest_minimum=Settings.AUTO_REST_MINIMUM,
-                    plan_races=preset_opts["plan_races"],
-                    skill_list=preset_opts["skill_list"],
-                    select_style=preset_opts[
-                        "select_style"
-                    ],  # "end"|"late"|"pace"|"front"|None
-                    event_prefs=event_prefs,
-                )
-            else:
-                # Instantiate Player with runtime knobs from Settings + presets + event prefs
-                self.agent_scenario = AgentURA(
-                    ctrl=ctrl,
-                    ocr=ocr,
-                    yolo_engine=yolo_engine,
-                    interval_stats_refresh=1,
-                    minimum_skill_pts=preset_opts.get("minimum_skill_pts", Settings.MINIMUM_SKILL_PTS),
-                    prioritize_g1=False,
-                    auto_rest_minimum=Settings.AUTO_REST_MINIMUM,
-                    plan_races=preset_opts["plan_races"],
-                    skill_list=preset_opts["skill_list"],
-                    select_style=preset_opts[
-                        "select_style"
-                    ],  # "end"|"late"|"pace"|"front"|None
-                    event_prefs=event_prefs,
-                )
+            # 4) Instantiate the scenario agent with Settings + presets + event prefs
+            self.agent_scenario = make_agent_from_settings(ctrl, ocr, yolo_engine, cfg)
 
             def _runner():
                 re_init = False
+                recorder = None
                 try:
                     logger_uma.info("[BOT] Started.")
+                    wait_for_warmup()
+                    # attached only now, so warmup inferences stay out of the recording
+                    recorder = start_session_recording(
+                        ctrl, ocr, yolo_engine, agent=Settings.ACTIVE_SCENARIO
+                    )
                     # if not none
                     if self.agent_scenario:
                         self.agent_scenario.run(
@@ -348,6 +579,16 @@ class BotState:
                     else:
                         logger_uma.exception("[BOT] Crash: %s", e)
                 finally:
+                    stop_background_services(ctrl)
+                    if recorder is not None:
+                        recorder.close()
+                    for category, st in pacer.stats().items():
+                        logger_uma.info(
+                            "[pacer] %s: %d waits, %.1fs total",
+                            category,
+                            st["count"],
+                            st["total_s"],
+                        )
                     if not re_init:
                         with self._lock:
                             self.running = False
@@ -434,6 +675,10 @@ class NavState:
                     )
                 return
 
+            start_background_services(ctrl)
+            pacer.set_profile(Settings.PACE_PROFILE)
+            pacer.reset()
+
             # OCR from settings, YOLO engine for NAV specifically
             ocr, yolo_engine_nav = make_ocr_yolo_from_settings(
                 ctrl, weights=Settings.YOLO_WEIGHTS_NAV
@@ -442,13 +687,21 @@ class NavState:
             self.agent = AgentNav(ctrl, ocr, yolo_engine_nav, action=action)
 
             def _runner():
+                recorder = None
                 try:
                     logger_uma.info(f"[AgentNav] Started (action={action}).")
+                    wait_for_warmup()
+                    recorder = start_session_recording(
+                        ctrl, ocr, yolo_engine_nav, agent="nav", action=action
+                    )
                     if self.agent:
                         self.agent.run()
                 except Exception as e:
                     logger_uma.exception("[AgentNav] Crash: %s", e)
                 finally:
+                    stop_background_services(ctrl)
+                    if recorder is not None:
+                        recorder.close()
                     with self._lock:
                         self.running = False
                         self.current_action = None
@@ -813,6 +1066,11 @@ def hotkey_loop(bot_state: BotState, nav_state: NavState):
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Run Umabot server")
     parser.add_argument("--port", type=int, help="Override FastAPI server port")
+    parser.add_argument(
+        "--devices",
+        help="Comma-separated ADB serials; runs all of them headless from this process "
+        "with one shared OCR/YOLO stack",
+    )
     args = parser.parse_args()
 
     ensure_nav_exists()
@@ -843,6 +1101,10 @@ if __name__ == "__main__":
     
     setup_uma_logging(debug=Settings.DEBUG)
 
+    if args.devices:
+        run_multi_device([d.strip() for d in args.devices.split(",") if d.strip()], cfg0)
+        sys.exit(0)
+
     try:
         cleanup_debug_training_if_needed()
     except Exception as e:
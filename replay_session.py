@@ -0,0 +1,127 @@
+"""
+Replay a recorded session (Settings.SESSION_RECORD_DIR / SessionRecorder) into
+the real agents, without a game window, and report end-to-end timings.
+
+  python replay_session.py recordings/20250101_120000_ura
+  python replay_session.py <dir> --pace fast --live-yolo      # re-run detection
+"""
+from __future__ import annotations
+
+import argparse
+import threading
+import time
+
+from core.controllers.replay import ReplayController
+from core.perception.ocr.ocr_replay import ReplayOCREngine
+from core.perception.yolo.yolo_replay import ReplayYOLOEngine
+from core.settings import Settings
+from core.utils.abort import clear_abort, request_abort
+from core.utils.event_processor import UserPrefs
+from core.utils.logger import logger_uma, setup_uma_logging
+from core.utils.pacer import pacer
+from core.utils.session_recorder import SessionLog
+
+
+def _build_agent(kind: str, action: str | None, ctrl, ocr, yolo_engine, cfg: dict):
+    if kind == "nav":
+        from core.agent_nav import AgentNav
+
+        return AgentNav(ctrl, ocr, yolo_engine, action=action or "")
+
+    preset_opts = Settings.extract_runtime_preset(cfg or {})
+    kwargs = dict(
+        ctrl=ctrl,
+        ocr=ocr,
+        yolo_engine=yolo_engine,
+        interval_stats_refresh=1,
+        minimum_skill_pts=preset_opts.get("minimum_skill_pts", Settings.MINIMUM_SKILL_PTS),
+        prioritize_g1=False,
+        auto_rest_minimum=Settings.AUTO_REST_MINIMUM,
+        plan_races=preset_opts["plan_races"],
+        skill_list=preset_opts["skill_list"],
+        select_style=preset_opts["select_style"],
+        event_prefs=UserPrefs.from_config(cfg or {}),
+    )
+    if kind == "unity_cup":
+        from core.actions.unity_cup.agent import AgentUnityCup
+
+        return AgentUnityCup(**kwargs)
+    from core.actions.ura.agent import AgentURA
+
+    return AgentURA(**kwargs)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("session", help="Recorded session directory")
+    ap.add_argument("--agent", choices=["ura", "unity_cup", "nav"], default=None,
+                    help="Agent to drive (default: the one recorded)")
+    ap.add_argument("--action", default=None, help="AgentNav action (default: recorded)")
+    ap.add_argument("--pace", default="normal", help="Pacer profile for the replay")
+    ap.add_argument("--live-yolo", action="store_true",
+                    help="Run the local YOLO model instead of recorded detections")
+    ap.add_argument("--timeout", type=float, default=0.0,
+                    help="Stop after this many seconds (0 = until the log ends)")
+    args = ap.parse_args()
+
+    setup_uma_logging(debug=Settings.DEBUG)
+    session = SessionLog(args.session)
+    header = session.header
+    cfg = header.get("config") or {}
+    Settings.apply_config(cfg)
+
+    kind = args.agent or header.get("agent") or Settings.ACTIVE_SCENARIO
+    if kind not in ("ura", "unity_cup", "nav"):
+        kind = "ura"
+    action = args.action or header.get("action")
+
+    ctrl = ReplayController(session, on_exhausted=request_abort)
+    if args.live_yolo:
+        from core.perception.yolo.yolo_local import LocalYOLOEngine
+
+        yolo_engine = LocalYOLOEngine(ctrl=ctrl)
+    else:
+        yolo_engine = ReplayYOLOEngine(ctrl, session)
+    ocr = ReplayOCREngine(session)
+
+    agent = _build_agent(kind, action, ctrl, ocr, yolo_engine, cfg)
+    pacer.set_profile(args.pace)
+    pacer.reset()
+    clear_abort()
+
+    if args.timeout > 0:
+        timer = threading.Timer(args.timeout, request_abort)
+        timer.daemon = True
+        timer.start()
+
+    t0 = time.perf_counter()
+    try:
+        if kind == "nav":
+            agent.run()
+        else:
+            agent.run(
+                delay=getattr(Settings, "MAIN_LOOP_DELAY", 0.4),
+                max_iterations=getattr(Settings, "MAX_ITERATIONS", None),
+            )
+    except KeyboardInterrupt:
+        pass
+    finally:
+        clear_abort()
+    elapsed = time.perf_counter() - t0
+
+    waited = sum(st["total_s"] for st in pacer.stats().values())
+    recorded_s = session.events[-1].get("t", 0.0) if session.events else 0.0
+    print(f"\nReplay of {session.dir} ({kind}{' ' + action if action else ''})")
+    print(f"  wall time      : {elapsed:8.2f}s  (recorded {recorded_s:.2f}s)")
+    print(f"  paced waits    : {waited:8.2f}s  profile={pacer.profile}")
+    print(f"  frames served  : {ctrl.frames_served}")
+    print(f"  inputs         : {len(ctrl.inputs)} replayed, "
+          f"{len(session.of('input'))} recorded, {ctrl.divergences} divergences")
+    if isinstance(yolo_engine, ReplayYOLOEngine):
+        print(f"  detections     : {yolo_engine.hits} replayed, {yolo_engine.misses} missed")
+    print(f"  ocr            : {ocr.hits} replayed, {ocr.misses} missed")
+    logger_uma.info("[replay] done in %.2fs", elapsed)
+
+
+if __name__ == "__main__":
+    main()
@@ -331,6 +331,17 @@ async def force_update(request: Request):
     return {"status": "ok", "branch": branch, "steps": steps}
 
 
+# ----------------------------
+# Perception readiness
+# ----------------------------
+@app.get("/api/warmup")
+def warmup_status():
+    """Model warmup progress of the running bot: readiness plus cold/warm latency per input."""
+    from core.perception import warmup
+
+    return warmup.status()
+
+
 # ----------------------------
 # Version & update info
 # ----------------------------
@@ -5,7 +5,6 @@ import base64
 import io
 import threading
 from typing import Any, Dict, List, Literal, Optional, Tuple
-from pathlib import Path
 
 import cv2
 import numpy as np
@@ -14,13 +13,17 @@ from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel, Field, validator
 import time
 from collections import OrderedDict
+from functools import partial
 import hashlib
 
 # Local OCR implementation (host has Paddle installed)
 from core.perception.ocr.ocr_local import LocalOCREngine
 from core.perception.yolo.yolo_local import LocalYOLOEngine
+from core.perception.yolo.yolo_onnx import ONNXYOLOEngine, onnx_path_for
+from core.perception.model_registry import MB, ModelRegistry, ModelSpec
 from PIL import Image, ImageOps
 from core.settings import Settings
+from core.utils.logger import logger_uma
 from core.perception.analyzers.matching.base import (
     PreparedTemplate,
     TemplateEntry,
@@ -28,18 +31,67 @@ from core.perception.analyzers.matching.base import (
     TemplateMatcherBase,
 )
 from core.perception.unity_cup_spirit_classifier import UnityCupSpiritClassifier
+from core.perception import warmup
 
 app = FastAPI()
-engine = LocalOCREngine()  # load once; keeps models on CPU/GPU as configured
 
 # run: uvicorn server.main_inference:app --host 0.0.0.0 --port 8001
 
 
+def _build_registry() -> ModelRegistry:
+    """
+    Every model this server can serve, by id. Detectors are "yolo/<name>" with
+    "@onnx" / "@int8" variants when those exports sit next to the weights.
+    """
+    reg = ModelRegistry(budget_bytes=Settings.INFERENCE_MEMORY_BUDGET_MB * MB)
+    reg.register(ModelSpec("ocr", LocalOCREngine, kind="ocr", pinned=True))
+    reg.register(
+        ModelSpec(
+            "spirit/unity_cup",
+            UnityCupSpiritClassifier.load_from_settings,
+            kind="classifier",
+            weights=str(Settings.UNITY_CUP_SPIRIT_COLOR_CLASS_PATH),
+        )
+    )
+    for name, weights, agent in (
+        ("ura", Settings.YOLO_WEIGHTS_URA, Settings.AGENT_NAME_URA),
+        ("unity_cup", Settings.YOLO_WEIGHTS_UNITY_CUP, Settings.AGENT_NAME_UNITY_CUP),
+        ("nav", Settings.YOLO_WEIGHTS_NAV, Settings.AGENT_NAME_NAV),
+    ):
+        info = {"agent": agent}
+        reg.register(
+            ModelSpec(
+                f"yolo/{name}",
+                partial(LocalYOLOEngine, ctrl=None, weights=weights),
+                weights=str(weights),
+                aliases=(name,),
+                info=info,
+            )
+        )
+        for suffix, int8 in (("onnx", False), ("int8", True)):
+            path = onnx_path_for(weights, int8=int8)
+            if path.exists():
+                reg.register(
+                    ModelSpec(
+                        f"yolo/{name}@{suffix}",
+                        partial(ONNXYOLOEngine, None, weights=str(weights), int8=int8),
+                        weights=str(path),
+                        info=info,
+                    )
+                )
+    return reg
+
+
+registry = _build_registry()
+
+
 @app.get("/health")
 def health():
     return {
         "ok": True,
+        "ready": warmup.status()["ready"],
         "cuda": torch.cuda.is_available(),
+        "models": {"loaded": registry.loaded(), "used_mb": registry.stats()["used_mb"]},
         "template_cache": {
             "size": len(_TEMPLATE_CACHE),
             "hits": _TEMPLATE_CACHE_STATS["hits"],
@@ -50,7 +102,7 @@ def health():
 
 # -------- OCR endpoint --------
 class OCRRequest(BaseModel):
-    mode: Literal["raw", "text", "digits", "batch_text", "batch_digits"] = Field(
+    mode: Literal["raw", "text", "digits", "batch_text", "batch_digits", "batch_rec"] = Field(
         ..., description="OCR operation"
     )
     img: Optional[str] = Field(
@@ -108,6 +160,7 @@ def ocr(req: OCRRequest) -> Dict[str, Any]:
                     status_code=400, detail="Field 'img' is required for this mode."
                 )
             img, pil_img = _decode_b64_to_bgr(req.img)
+            engine = registry.get("ocr")
             if req.mode == "raw":
                 data = engine.raw(img)
             elif req.mode == "text":
@@ -117,14 +170,18 @@ def ocr(req: OCRRequest) -> Dict[str, Any]:
             sha = hashlib.sha256(img.tobytes()).hexdigest()[:12]
             return {"mode": req.mode, "data": data, "meta": {"checksum": sha}}
 
-        elif req.mode in ("batch_text", "batch_digits"):
+        elif req.mode in ("batch_text", "batch_digits", "batch_rec"):
             if not req.imgs:
                 raise HTTPException(
                     status_code=400, detail="Field 'imgs' is required for this mode."
                 )
-            imgs = [_decode_b64_to_bgr(b) for b in req.imgs]
+            imgs = [_decode_b64_to_bgr(b)[0] for b in req.imgs]
+            engine = registry.get("ocr")
             if req.mode == "batch_text":
                 data = engine.batch_text(imgs, joiner=req.joiner, min_conf=req.min_conf)
+            elif req.mode == "batch_rec":
+                # single-line crops: recognizer only, [[text, score], ...]
+                data = [[t, s] for t, s in engine.batch_rec(imgs)]
             else:
                 data = engine.batch_digits(imgs)
             return {"mode": req.mode, "data": data}
@@ -138,22 +195,39 @@ def ocr(req: OCRRequest) -> Dict[str, Any]:
         raise HTTPException(status_code=500, detail=f"OCR failure: {e}")
 
 
-# Instantiate YOLO engines for each scenario/mode (no controller needed here)
-yolo_engine_ura = LocalYOLOEngine(ctrl=None, weights=Settings.YOLO_WEIGHTS_URA)
-yolo_engine_unity_cup = LocalYOLOEngine(ctrl=None, weights=Settings.YOLO_WEIGHTS_UNITY_CUP)
-yolo_engine_nav = LocalYOLOEngine(ctrl=None, weights=Settings.YOLO_WEIGHTS_NAV)
-
-
 class YoloRequest(BaseModel):
-    img: str = Field(..., description="Base64-encoded PNG/JPEG image (BGR compatible)")
+    img: Optional[str] = Field(None, description="Base64-encoded PNG/JPEG image (BGR compatible)")
+    imgs: Optional[List[str]] = Field(
+        None, description="Base64-encoded images detected as one batch"
+    )
     imgsz: int = Field(832, ge=64, le=3072)
     conf: float = Field(0.66, ge=0.0, le=1.0)
     iou: float = Field(0.45, ge=0.0, le=1.0)
     weights_path: Optional[str] = None
+    model: Optional[str] = Field(
+        None, description="Registry model id (e.g. 'yolo/ura@int8'); overrides weights_path"
+    )
     agent: Optional[str] = Field(None, description="Caller agent identifier for debug storage")
     tag: Optional[str] = Field(None, description="Detection tag used for debug capture folders")
 
 
+def _select_yolo_engine(w_str: str, model: Optional[str] = None) -> Tuple[Any, str]:
+    """Resolve the request's model id (or weights path) in the registry -> (engine, default agent)."""
+    if model:
+        try:
+            spec = registry.spec(model)
+        except KeyError as e:
+            raise HTTPException(status_code=404, detail=str(e.args[0]))
+    else:
+        try:
+            spec = registry.spec(w_str)
+        except KeyError:
+            spec = registry.spec("yolo/ura")  # default fallback
+    if spec.kind != "yolo":
+        raise HTTPException(status_code=400, detail=f"'{spec.model_id}' is not a detector")
+    return registry.get(spec.model_id), spec.info.get("agent", Settings.AGENT_NAME_URA)
+
+
 @app.post("/yolo")
 def yolo_detect(req: YoloRequest):
     try:
@@ -163,38 +237,40 @@ def yolo_detect(req: YoloRequest):
             w_str = str(w_in)
         except Exception:
             w_str = ""
-        
-        # Check which engine matches the requested weights
-        yolo_engine_req = yolo_engine_ura  # default fallback
-        default_agent = Settings.AGENT_NAME_URA
-        
-        try:
-            nav_str = str(Settings.YOLO_WEIGHTS_NAV)
-            if (w_str == nav_str) or (Path(w_str).name == Path(nav_str).name):
-                yolo_engine_req = yolo_engine_nav
-                default_agent = Settings.AGENT_NAME_NAV
-        except Exception:
-            pass
-        
-        try:
-            unity_cup_str = str(Settings.YOLO_WEIGHTS_UNITY_CUP)
-            if (w_str == unity_cup_str) or (Path(w_str).name == Path(unity_cup_str).name):
-                yolo_engine_req = yolo_engine_unity_cup
-                default_agent = Settings.AGENT_NAME_UNITY_CUP
-        except Exception:
-            pass
-        
-        try:
-            ura_str = str(Settings.YOLO_WEIGHTS_URA)
-            if (w_str == ura_str) or (Path(w_str).name == Path(ura_str).name):
-                yolo_engine_req = yolo_engine_ura
-                default_agent = Settings.AGENT_NAME_URA
-        except Exception:
-            pass
+
+        yolo_engine_req, default_agent = _select_yolo_engine(w_str, req.model)
         agent_name = (req.agent or default_agent or "").strip()
         default_tag = "yolo_endpoint"
         tag_name = (req.tag or default_tag or "").strip() or default_tag
+        backend = type(getattr(yolo_engine_req, "model", yolo_engine_req)).__module__
+
+        if req.imgs:
+            decoded = [_decode_b64_to_bgr(b) for b in req.imgs]
+            results = yolo_engine_req.detect_batch(
+                [pil for _, pil in decoded],
+                imgsz=req.imgsz,
+                conf=req.conf,
+                iou=req.iou,
+                tag=tag_name,
+                agent=agent_name,
+            )
+            out = []
+            for (bgr, _), (meta, dets) in zip(decoded, results):
+                meta.update(
+                    {
+                        "shape": tuple(int(x) for x in bgr.shape),
+                        "checksum": hashlib.sha256(bgr.tobytes()).hexdigest()[:12],
+                        "weights": w_str,
+                        "agent": agent_name,
+                        "tag": tag_name,
+                        "ultralytics": backend,
+                    }
+                )
+                out.append({"meta": meta, "dets": dets})
+            return {"results": out}
 
+        if not req.img:
+            raise HTTPException(status_code=400, detail="Field 'img' or 'imgs' is required.")
         bgr, pil_img = _decode_b64_to_bgr(req.img)
         meta, dets = yolo_engine_req.detect_bgr(
             bgr,
@@ -214,9 +290,7 @@ def yolo_detect(req: YoloRequest):
                 "weights": w_str,
                 "agent": agent_name,
                 "tag": tag_name,
-                "ultralytics": getattr(
-                    type(yolo_engine_req.model), "__module__", "ultralytics"
-                ),
+                "ultralytics": backend,
             }
         )
         return {"meta": meta, "dets": dets}
@@ -294,23 +368,14 @@ class SpiritClassifyRequest(BaseModel):
     threshold: float = Field(0.0, ge=0.0, le=1.0)
 
 
-_SPIRIT_CLF: Optional[UnityCupSpiritClassifier] = None
-_SPIRIT_CLF_LOCK = threading.Lock()
-
-
 def _get_spirit_classifier() -> UnityCupSpiritClassifier:
-    global _SPIRIT_CLF
-    if _SPIRIT_CLF is None:
-        with _SPIRIT_CLF_LOCK:
-            if _SPIRIT_CLF is None:
-                try:
-                    _SPIRIT_CLF = UnityCupSpiritClassifier.load_from_settings()
-                except Exception as e:
-                    raise HTTPException(
-                        status_code=500,
-                        detail=f"Failed to load spirit classifier: {e}",
-                    )
-    return _SPIRIT_CLF
+    try:
+        return registry.get("spirit/unity_cup")
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to load spirit classifier: {e}",
+        )
 
 
 def _template_cache_key(mode: str, descriptor: TemplateDescriptor) -> str:
@@ -492,3 +557,45 @@ def classify_spirit(req: SpiritClassifyRequest) -> Dict[str, Any]:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Spirit classification failure: {e}")
+
+
+# -------- Warmup / readiness --------
+@app.on_event("startup")
+def _preload_models() -> None:
+    """Load (and with WARMUP, warm) Settings.INFERENCE_PRELOAD in the background."""
+    ids = []
+    for key in Settings.INFERENCE_PRELOAD:
+        try:
+            ids.append(registry.resolve(key))
+        except KeyError as e:
+            logger_uma.warning("[models] preload skipped: %s", e.args[0])
+    if not Settings.WARMUP:
+        threading.Thread(
+            target=lambda: [registry.get(mid) for mid in ids], name="model-preload", daemon=True
+        ).start()
+        return
+    w = warmup.Warmup()
+    for mid in ids:
+        spec = registry.spec(mid)
+        get = partial(registry.get, mid)
+        jobs = [("load", get)]
+        if spec.kind == "yolo":
+            jobs += warmup.yolo_jobs(get, warmup.yolo_sizes(spec.weights))
+        elif spec.kind == "ocr":
+            jobs += warmup.ocr_jobs(get)
+        else:
+            jobs += warmup.classifier_jobs(get)
+        w.add(mid, jobs)
+    w.start()
+
+
+@app.get("/models")
+def models() -> Dict[str, Any]:
+    """Registered models: loaded state, footprint and usage."""
+    return registry.stats()
+
+
+@app.get("/ready")
+def ready() -> Dict[str, Any]:
+    """Warmup status; clients can poll this before sending the first real request."""
+    return warmup.status()
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import io
+import struct
+import subprocess
+from pathlib import Path
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from core.controllers.adb import ADBController, parse_raw_screencap
+
+DATA_DIR = Path("tests/data")
+FIXTURE = DATA_DIR / "lobby_stats_01_high_res.png"
+
+
+def _fixture_rgba() -> np.ndarray:
+    return np.array(Image.open(FIXTURE).convert("RGBA"))
+
+
+def _raw_blob(rgba: np.ndarray, *, fmt: int = 1, colorspace: bool = True) -> bytes:
+    """Byte-for-byte what `adb exec-out screencap` emits for this frame."""
+    h, w = rgba.shape[:2]
+    header = struct.pack("<III", w, h, fmt)
+    if colorspace:
+        header += struct.pack("<I", 0)
+    if fmt == 5:
+        rgba = rgba[..., [2, 1, 0, 3]]
+    return header + np.ascontiguousarray(rgba).tobytes()
+
+
+def _png_blob(rgba: np.ndarray) -> bytes:
+    buf = io.BytesIO()
+    Image.fromarray(rgba).save(buf, format="PNG")
+    return buf.getvalue()
+
+
+def _controller(blob: bytes, mode: str, monkeypatch) -> ADBController:
+    ctrl = ADBController(
+        None, screen_width=1, screen_height=1, auto_connect=False, capture_mode=mode
+    )
+
+    def fake_adb(*args, text=True):
+        return subprocess.CompletedProcess(args, 0, stdout=blob, stderr=b"")
+
+    monkeypatch.setattr(ctrl, "_adb_command", fake_adb)
+    return ctrl
+
+
+@pytest.mark.parametrize("colorspace", [True, False])
+@pytest.mark.parametrize("fmt", [1, 5])
+def test_parse_raw_screencap_header(fmt, colorspace):
+    rgba = _fixture_rgba()
+    frame = parse_raw_screencap(_raw_blob(rgba, fmt=fmt, colorspace=colorspace))
+
+    assert (frame.width, frame.height) == (rgba.shape[1], rgba.shape[0])
+    assert frame.format == fmt
+    assert np.array_equal(frame.rgb, rgba[..., :3])
+
+
+def test_parse_raw_screencap_rejects_truncated_payload():
+    blob = _raw_blob(_fixture_rgba())
+    with pytest.raises(ValueError):
+        parse_raw_screencap(blob[:-100])
+
+
+def test_raw_capture_matches_png_capture(monkeypatch):
+    rgba = _fixture_rgba()
+    raw_ctrl = _controller(_raw_blob(rgba), "raw", monkeypatch)
+    png_ctrl = _controller(_png_blob(rgba), "png", monkeypatch)
+
+    region = (40, 120, 300, 200)
+    raw_img = raw_ctrl.screenshot(region=region)
+    png_img = png_ctrl.screenshot(region=region)
+
+    assert raw_img.size == png_img.size == (300, 200)
+    assert np.array_equal(np.array(raw_img), np.array(png_img))
+    assert raw_ctrl.capture_bbox() == png_ctrl.capture_bbox() == region
+    assert raw_ctrl.last_framebuffer is not None
+    assert raw_ctrl.last_framebuffer.format_name == "RGBA_8888"
+
+
+def test_raw_capture_falls_back_to_png(monkeypatch):
+    ctrl = _controller(b"\x00" * 8, "raw", monkeypatch)
+    monkeypatch.setattr(
+        ctrl, "_screenshot_png", lambda region: Image.new("RGB", (4, 4))
+    )
+    assert ctrl.screenshot().size == (4, 4)
+    assert ctrl.capture_mode == "png"
+
+
+def test_raw_capture_serves_full_frame_without_png(monkeypatch):
+    rgba = _fixture_rgba()
+    ctrl = _controller(_raw_blob(rgba), "raw", monkeypatch)
+
+    def no_png(region):
+        raise AssertionError("raw capture must not go through the PNG path")
+
+    monkeypatch.setattr(ctrl, "_screenshot_png", no_png)
+    img = ctrl.screenshot()
+
+    assert ctrl.capture_mode == "raw"
+    assert img.size == (rgba.shape[1], rgba.shape[0])
+    assert np.array_equal(np.array(img), rgba[..., :3])
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import os
+import stat
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from core.controllers.adb import ADBController
+from core.controllers.adb_shell import ADBShellSession
+
+pytestmark = pytest.mark.skipif(
+    os.name != "posix", reason="fake adb stand-in relies on /bin/sh"
+)
+
+
+@pytest.fixture
+def fake_adb(tmp_path: Path, monkeypatch) -> Path:
+    """
+    Put a fake `adb` on PATH. `adb [-s dev] shell` becomes a local /bin/sh whose
+    PATH provides stand-ins for `input`, `wm` and `screencap`; each spawn and
+    each input event is appended to log files under tmp_path.
+    """
+    bin_dir = tmp_path / "bin"
+    dev_dir = tmp_path / "device"
+    bin_dir.mkdir()
+    dev_dir.mkdir()
+
+    def _script(path: Path, body: str) -> None:
+        path.write_text(textwrap.dedent(body).lstrip())
+        path.chmod(path.stat().st_mode | stat.S_IEXEC)
+
+    _script(
+        bin_dir / "adb",
+        f"""
+        #!{sys.executable}
+        import os, sys
+        args = sys.argv[1:]
+        if args[:1] == ["-s"]:
+            args = args[2:]
+        with open({str(tmp_path / "spawns.log")!r}, "a") as fh:
+            fh.write(" ".join(args) + "\\n")
+        if args[:1] == ["devices"]:
+            print("List of devices attached")
+            sys.exit(0)
+        if args[:1] != ["shell"]:
+            sys.exit(1)
+        env = dict(os.environ, PATH={str(dev_dir)!r} + os.pathsep + os.environ["PATH"])
+        if len(args) == 1:
+            os.execve("/bin/sh", ["sh"], env)
+        os.execve("/bin/sh", ["sh", "-c", " ".join(args[1:])], env)
+        """,
+    )
+    _script(
+        dev_dir / "input",
+        f"""
+        #!/bin/sh
+        echo "$@" >> {tmp_path / "input.log"}
+        """,
+    )
+    _script(
+        dev_dir / "wm",
+        """
+        #!/bin/sh
+        echo "Physical size: 1080x1920"
+        """,
+    )
+    _script(
+        dev_dir / "screencap",
+        """
+        #!/bin/sh
+        printf 'PNG\\000\\001\\n\\377end'
+        """,
+    )
+    monkeypatch.setenv("PATH", str(bin_dir) + os.pathsep + os.environ["PATH"])
+    return tmp_path
+
+
+def _lines(path: Path) -> list[str]:
+    return path.read_text().splitlines() if path.exists() else []
+
+
+def test_session_reuses_one_process(fake_adb):
+    session = ADBShellSession(timeout=5.0)
+    try:
+        assert session.run_text("echo hello").strip() == "hello"
+        assert session.run_text("echo a; echo b").split() == ["a", "b"]
+        assert session.run_args("screencap", "-p") == b"PNG\x00\x01\n\xffend"
+        assert session.spawn_count == 1
+        assert session.command_count == 3
+        assert _lines(fake_adb / "spawns.log") == ["shell"]
+    finally:
+        session.close()
+
+
+def test_session_raises_on_failure_and_keeps_running(fake_adb):
+    session = ADBShellSession(timeout=5.0)
+    try:
+        with pytest.raises(RuntimeError, match="rc=3"):
+            session.run("exit_code() { return 3; }; exit_code")
+        assert session.run_text("echo ok").strip() == "ok"
+        assert session.spawn_count == 1
+    finally:
+        session.close()
+
+
+def test_session_timeout_then_reconnects(fake_adb):
+    session = ADBShellSession(timeout=5.0)
+    try:
+        with pytest.raises(RuntimeError, match="timed out"):
+            session.run("sleep 3", timeout=0.3)
+        assert not session.alive
+        assert session.run_text("echo back").strip() == "back"
+        assert session.spawn_count == 2
+    finally:
+        session.close()
+
+
+def test_session_reconnects_after_shell_dies(fake_adb):
+    session = ADBShellSession(timeout=5.0)
+    try:
+        session.run("true")
+        assert session._proc is not None
+        session._proc.kill()
+        session._proc.wait()
+        assert session.run_text("echo again").strip() == "again"
+        assert session.spawn_count == 2
+    finally:
+        session.close()
+
+
+def test_controller_routes_gestures_through_session(fake_adb):
+    ctrl = ADBController(
+        "emulator-5554", auto_connect=False, use_shell_session=True
+    )
+    try:
+        assert (ctrl._screen_width, ctrl._screen_height) == (1080, 1920)
+
+        ctrl.click(100, 200, jitter=0, use_organic_move=False)
+        ctrl.scroll(-300, steps=3, jitter=0, pause_range=(0.0, 0.0), end_hold_range=(0.0, 0.0))
+
+        events = _lines(fake_adb / "input.log")
+        assert events[0] == "tap 100 200"
+        assert len([e for e in events if e.startswith("swipe 540 1110 540 810")]) == 3
+        # wm size + tap + a single framed script for the 3-step scroll
+        assert _lines(fake_adb / "spawns.log") == ["shell"]
+        assert ctrl._session is not None and ctrl._session.command_count == 3
+    finally:
+        ctrl.close()
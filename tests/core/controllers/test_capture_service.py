@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import threading
+import time
+
+from PIL import Image
+
+from core.controllers.static_image import StaticImageController
+
+
+class _TickingController(StaticImageController):
+    """Each capture returns a new frame whose red channel is the grab number."""
+
+    def __init__(self, grab_s: float = 0.005) -> None:
+        super().__init__(Image.new("RGB", (40, 30)))
+        self.grab_s = grab_s
+        self.grabs = 0
+        self.clicks = 0
+        self._grab_lock = threading.Lock()
+
+    def screenshot(self, region=None) -> Image.Image:
+        time.sleep(self.grab_s)
+        with self._grab_lock:
+            self.grabs += 1
+            n = self.grabs
+        self._last_origin = (0, 0)
+        self._last_bbox = (0, 0, 40, 30)
+        return Image.new("RGB", (40, 30), (n % 256, 0, 0))
+
+    def click(self, x, y, **kwargs) -> None:
+        self.clicks += 1
+
+
+def test_screenshot_serves_freshest_buffered_frame():
+    ctrl = _TickingController()
+    service = ctrl.start_capture_service(buffer_size=2)
+    try:
+        img = ctrl.screenshot()
+        assert img.size == (40, 30)
+        assert "capture_ts" in img.info
+        assert ctrl.last_frame is not None and ctrl.last_frame.age_s < 1.0
+
+        crop = ctrl.screenshot(region=(10, 5, 20, 10))
+        assert crop.size == (20, 10)
+        assert ctrl.capture_bbox() == (10, 5, 20, 10)
+        assert ctrl.capture_origin() == (10, 5)
+
+        time.sleep(0.1)
+        assert len(service.frames()) == 2
+        frame = ctrl.latest_frame()
+        assert frame is not None and frame.seq == service.frames()[-1].seq
+    finally:
+        stats = ctrl.stop_capture_service()
+
+    assert stats is not None
+    assert stats["captured"] >= stats["delivered"] >= 2
+    assert stats["dropped"] > 0  # capture outpaced the reader while it slept
+    assert "screenshot" not in ctrl.__dict__
+    assert "click" not in ctrl.__dict__
+    assert ctrl.capture_service is None
+
+
+def test_read_after_input_waits_for_new_frame():
+    ctrl = _TickingController(grab_s=0.03)
+    ctrl.start_capture_service()
+    try:
+        ctrl.screenshot()
+        ctrl.click(1, 1)
+        clicked_at = time.time()
+        ctrl.screenshot()
+        assert ctrl.clicks == 1
+        assert ctrl.last_frame is not None
+        assert ctrl.last_frame.started_at >= clicked_at
+    finally:
+        ctrl.stop_capture_service()
+
+
+def test_slow_capture_reports_reused_frames():
+    ctrl = _TickingController(grab_s=0.2)
+    service = ctrl.start_capture_service()
+    try:
+        first = ctrl.screenshot()
+        t0 = time.perf_counter()
+        for _ in range(5):
+            again = ctrl.screenshot()
+        fetch_ms = (time.perf_counter() - t0) / 5 * 1000.0
+        assert again.info["capture_seq"] == first.info["capture_seq"]
+        assert fetch_ms < 20.0  # reads never block on the 200ms grab
+        assert service.stats()["reused"] >= 5
+    finally:
+        ctrl.stop_capture_service()
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+from PIL import Image
+
+from core.controllers.static_image import StaticImageController
+
+
+class _SlowTapController(StaticImageController):
+    """Taps take `tap_s` (like an organic pyautogui move) and are logged."""
+
+    def __init__(self, tap_s: float = 0.05) -> None:
+        super().__init__(Image.new("RGB", (100, 100)))
+        self.tap_s = tap_s
+        self.taps: list = []
+        self.threads: set = set()
+
+    def click(self, x, y, *, clicks=1, jitter=0, **kwargs) -> None:
+        time.sleep(self.tap_s)
+        self.threads.add(threading.get_ident())
+        self.taps.append((x, y, clicks))
+
+
+def test_actions_run_in_order_off_the_caller_thread():
+    ctrl = _SlowTapController()
+    dispatcher = ctrl.start_input_dispatcher()
+    try:
+        t0 = time.perf_counter()
+        futures = [dispatcher.click(i, i) for i in range(3)]
+        submit_ms = (time.perf_counter() - t0) * 1000.0
+        assert submit_ms < 20.0  # the caller is free while taps are delivered
+
+        assert ctrl.wait_input(timeout=2.0)
+        assert all(f.done() for f in futures)
+        assert [t[0] for t in ctrl.taps] == [0, 1, 2]
+        assert threading.get_ident() not in ctrl.threads
+    finally:
+        stats = ctrl.stop_input_dispatcher()
+
+    assert stats is not None
+    click = stats["click"]
+    assert click["count"] == 3
+    assert click["delivery_ms_avg"] >= 40.0
+    # the third tap waited behind the first two
+    assert click["queue_ms_max"] >= 80.0
+
+
+def test_xyxy_target_resolved_at_submit_time():
+    ctrl = _SlowTapController()
+    ctrl._last_origin = (1000, 500)
+    dispatcher = ctrl.start_input_dispatcher()
+    try:
+        fut = dispatcher.click_xyxy_center((0, 0, 10, 20), jitter=0)
+        ctrl._last_origin = (0, 0)  # caller already took the next screenshot
+        fut.result(timeout=2.0)
+    finally:
+        ctrl.stop_input_dispatcher()
+    assert ctrl.taps == [(1005, 510, 1)]
+
+
+def test_errors_surface_on_future_and_in_stats():
+    ctrl = _SlowTapController(tap_s=0.0)
+    dispatcher = ctrl.start_input_dispatcher()
+    try:
+        fut = dispatcher.submit("boom", lambda: 1 / 0)
+        with pytest.raises(ZeroDivisionError):
+            fut.result(timeout=2.0)
+        assert dispatcher.click(1, 2).result(timeout=2.0) is None
+    finally:
+        stats = ctrl.stop_input_dispatcher()
+    assert stats["boom"]["errors"] == 1
+    assert stats["click"]["count"] == 1
+
+
+def test_wait_input_reports_failed_action():
+    ctrl = _SlowTapController(tap_s=0.0)
+    dispatcher = ctrl.start_input_dispatcher()
+    try:
+        dispatcher.submit("tap", lambda: 1 / 0)
+        dispatcher.click(1, 2)
+        assert ctrl.wait_input(timeout=2.0) is False
+        assert isinstance(dispatcher.last_error, ZeroDivisionError)
+        # the failure is reported once; later deliveries are judged on their own
+        dispatcher.click(3, 4)
+        assert ctrl.wait_input(timeout=2.0) is True
+    finally:
+        ctrl.stop_input_dispatcher()
+    assert ctrl.taps == [(1, 2, 1), (3, 4, 1)]
+
+
+def test_without_dispatcher_wait_input_is_noop():
+    ctrl = _SlowTapController()
+    assert ctrl.input_dispatcher is None
+    assert ctrl.wait_input() is True
+    assert ctrl.stop_input_dispatcher() is None
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from PIL import Image, ImageDraw
+
+from core.controllers.replay import ReplayController
+from core.controllers.static_image import StaticImageController
+from core.perception.ocr.ocr_replay import ReplayOCREngine
+from core.perception.yolo.yolo_replay import ReplayYOLOEngine
+from core.utils.geometry import crop_pil
+from core.utils.session_recorder import SessionLog, SessionRecorder
+from core.utils.waiter import PollConfig, Waiter
+
+BUTTON = (20, 60, 80, 80)
+
+
+def _screen(n: int) -> Image.Image:
+    img = Image.new("RGB", (100, 100), (10 * n, 0, 0))
+    ImageDraw.Draw(img).rectangle(BUTTON, fill=(0, 200, 0))
+    return img
+
+
+class _LiveGame(StaticImageController):
+    """Stand-in for a device: each click moves to the next screen."""
+
+    def __init__(self) -> None:
+        super().__init__(_screen(0))
+        self.screen = 0
+
+    def screenshot(self, region=None) -> Image.Image:
+        return _screen(self.screen)
+
+    def click(self, x, y, **kwargs) -> None:
+        self.screen += 1
+
+
+class _LiveYOLO:
+    def __init__(self, ctrl) -> None:
+        self.ctrl = ctrl
+        self.calls = 0
+
+    def recognize(self, **kwargs):
+        self.calls += 1
+        img = self.ctrl.screenshot()
+        dets = [{"idx": 0, "name": "button_green", "conf": 0.9, "xyxy": BUTTON}]
+        return img, {"screen": self.ctrl.screen}, dets
+
+
+class _LiveOCR:
+    def text(self, img, joiner=" ", min_conf=0.2) -> str:
+        return f"NEXT {img.getpixel((0, 0))[0]}"
+
+
+def _play(ctrl, ocr, yolo, *, turns: int, polls: int) -> list:
+    waiter = Waiter(ctrl, ocr, yolo, PollConfig(poll_interval_s=0.0, timeout_s=1.0))
+    seen = []
+    for _ in range(turns):
+        for _ in range(polls):
+            img, meta, dets = yolo.recognize(tag="screen")
+        seen.append((meta.get("screen"), ocr.text(crop_pil(img, (0, 0, 10, 10)))))
+        assert waiter.click_when(classes=("button_green",), tag="next")
+    return seen
+
+
+def test_record_then_replay_without_live_engines(tmp_path: Path):
+    live = _LiveGame()
+    live_ocr, live_yolo = _LiveOCR(), _LiveYOLO(live)
+    rec = SessionRecorder(tmp_path / "s1")
+    rec.emit("start", agent="ura", config={})
+    rec.attach(live, live_yolo, live_ocr)
+    recorded = _play(live, live_ocr, live_yolo, turns=3, polls=2)
+    rec.close()
+
+    # attach() is undone on close
+    assert "screenshot" not in vars(live) and "recognize" not in vars(live_yolo)
+    # 3 screens x (2 polls + waiter snap) frames, stored once per screen
+    assert rec.frames_total == 9 and rec.frames_unique == 3
+    assert len(list((tmp_path / "s1" / "frames").glob("*.png"))) == 3
+    events = [json.loads(x) for x in (tmp_path / "s1" / "session.jsonl").read_text().splitlines()]
+    assert [e["kind"] for e in events if e["ev"] == "input"] == ["click"] * 3
+
+    session = SessionLog(tmp_path / "s1")
+    ended = []
+    ctrl = ReplayController(session, on_exhausted=lambda: ended.append(True))
+    yolo = ReplayYOLOEngine(ctrl, session)
+    ocr = ReplayOCREngine(session)
+
+    # poll more often than during recording: screens still line up with inputs
+    replayed = _play(ctrl, ocr, yolo, turns=3, polls=4)
+    assert replayed == recorded
+    assert ctrl.divergences == 0
+    assert yolo.misses == 0 and ocr.misses == 0
+    assert ctrl.inputs and ctrl.inputs[0][0] == "click"
+
+    ctrl.screenshot()
+    assert ended == [True] and ctrl.exhausted
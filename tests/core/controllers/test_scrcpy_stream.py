@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from core.controllers.adb import ADBController
+from core.controllers.scrcpy_stream import H264StreamDecoder, ScrcpyServerStream
+
+av = pytest.importorskip("av")
+
+W, H = 320, 576
+N_FRAMES = 12
+
+
+def _record_h264(path: Path) -> list[np.ndarray]:
+    """Write a raw Annex-B .h264 recording, like scrcpy-server's raw_stream output."""
+    frames: list[np.ndarray] = []
+    with av.open(str(path), "w", format="h264") as out:
+        stream = out.add_stream("libx264", rate=30)
+        stream.width, stream.height = W, H
+        stream.pix_fmt = "yuv420p"
+        stream.options = {"tune": "zerolatency", "qp": "10"}
+        for i in range(N_FRAMES):
+            rgb = np.full((H, W, 3), 40, dtype=np.uint8)
+            rgb[:, :, 0] = 20 * i
+            rgb[100:200, 10 + 20 * i : 60 + 20 * i] = (255, 255, 255)
+            frames.append(rgb)
+            for packet in stream.encode(av.VideoFrame.from_ndarray(rgb, format="rgb24")):
+                out.mux(packet)
+        for packet in stream.encode():
+            out.mux(packet)
+    return frames
+
+
+@pytest.fixture
+def recording(tmp_path: Path):
+    path = tmp_path / "capture.h264"
+    frames = _record_h264(path)
+    return path, frames
+
+
+def test_decoder_serves_newest_frame_from_recording(recording):
+    path, frames = recording
+    dec = H264StreamDecoder.from_file(path, chunk_size=4096).start()
+    try:
+        assert dec.wait_frame(5.0, after_seq=N_FRAMES - 1)
+        dec.stop()
+
+        rgb, ts, seq = dec.latest()
+        assert seq == N_FRAMES
+        assert rgb.shape == (H, W, 3)
+        assert ts <= time.time()
+        diff = np.abs(rgb.astype(int) - frames[-1].astype(int)).mean()
+        assert diff < 6.0
+        assert dec.error is None
+    finally:
+        dec.stop()
+
+
+def test_stream_capture_through_controller(recording, monkeypatch):
+    path, frames = recording
+    dec = H264StreamDecoder.from_file(path).start()
+    assert dec.wait_frame(5.0, after_seq=N_FRAMES - 1)
+    dec.stop()
+
+    def no_wait(*args, **kwargs):
+        raise AssertionError("screenshot() must not wait once a frame is decoded")
+
+    monkeypatch.setattr(dec, "wait_frame", no_wait)
+    monkeypatch.setattr(ScrcpyServerStream, "alive", property(lambda self: True))
+    stream = ScrcpyServerStream(None, None, server_path="scrcpy-server", server_version="2.4")
+    stream.decoder = dec
+
+    ctrl = ADBController(
+        None, screen_width=1, screen_height=1, auto_connect=False, capture_mode="stream"
+    )
+    ctrl._stream = stream  # type: ignore[assignment]
+
+    region = (0, 100, 200, 100)
+    img = ctrl.screenshot(region=region)
+
+    assert img.size == (200, 100)
+    assert (ctrl._screen_width, ctrl._screen_height) == (W, H)
+    assert ctrl.capture_bbox() == region
+    assert ctrl.capture_mode == "stream"
+    # the newest decoded frame, cropped to the region
+    want = frames[-1][100:200, 0:200]
+    assert np.abs(np.asarray(img).astype(int) - want.astype(int)).mean() < 6.0
+
+
+def test_stream_capture_falls_back_without_server(monkeypatch):
+    ctrl = ADBController(
+        None, screen_width=1, screen_height=1, auto_connect=False, capture_mode="stream"
+    )
+    monkeypatch.setattr(ctrl, "_screenshot_png", lambda region: Image.new("RGB", (4, 4)))
+    assert ctrl.screenshot().size == (4, 4)
+    assert ctrl.capture_mode == "png"
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import base64
+import sys
+
+import cv2
+import numpy as np
+import pytest
+from PIL import Image
+
+from core.perception.hub import PerceptionHub
+from core.perception.yolo.interface import IDetector
+
+
+class _OneByOne(IDetector):
+    ctrl = None
+
+    def detect_bgr(self, bgr, *, imgsz=None, conf=None, iou=None):
+        return {"kind": "bgr"}, [{"name": "x", "conf": 1.0, "xyxy": (0, 0, *bgr.shape[1::-1])}]
+
+    def detect_pil(self, pil_img, *, imgsz=None, conf=None, iou=None):
+        return {"kind": "pil"}, [{"name": "x", "conf": 1.0, "xyxy": (0, 0, *pil_img.size)}]
+
+
+class _Response:
+    def __init__(self, data):
+        self.data = data
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.data
+
+
+class _Session:
+    def __init__(self):
+        self.posts = []
+
+    def post(self, url, json=None, timeout=None):
+        self.posts.append((url, json))
+        results = []
+        for b64 in json["imgs"]:
+            arr = cv2.imdecode(np.frombuffer(base64.b64decode(b64), np.uint8), cv2.IMREAD_COLOR)
+            results.append({"meta": {"shape": list(arr.shape)}, "dets": []})
+        return _Response({"results": results})
+
+
+def test_default_detect_batch_keeps_order_and_input_kind():
+    out = _OneByOne().detect_batch([Image.new("RGB", (4, 3)), np.zeros((5, 6, 3), np.uint8)])
+    assert [m["kind"] for m, _ in out] == ["pil", "bgr"]
+    assert [d[0]["xyxy"] for _, d in out] == [(0, 0, 4, 3), (0, 0, 6, 5)]
+    assert _OneByOne().detect_batch([]) == []
+
+
+@pytest.mark.skipif(sys.platform != "win32", reason="engine imports pygetwindow (Windows only)")
+def test_remote_detect_batch_is_one_request():
+    from core.perception.yolo.yolo_remote import RemoteYOLOEngine
+
+    session = _Session()
+    eng = RemoteYOLOEngine(None, "http://srv", session=session, weights="models/uma_nav.pt")
+    imgs = [Image.new("RGB", (8 + i, 4)) for i in range(3)]
+    out = eng.detect_batch(imgs, imgsz=640, tag="training")
+
+    assert len(session.posts) == 1
+    url, payload = session.posts[0]
+    assert url == "http://srv/yolo" and len(payload["imgs"]) == 3 and payload["imgsz"] == 640
+    assert [m["shape"][:2] for m, _ in out] == [[4, 8], [4, 9], [4, 10]]
+    assert all(m["tag"] == "training" for m, _ in out)
+
+
+def test_shared_client_sends_a_batch_as_one_hub_request():
+    calls = []
+
+    class _Engine(_OneByOne):
+        def detect_batch(self, images, **kw):
+            calls.append(len(images))
+            return super().detect_batch(images, **kw)
+
+    hub = PerceptionHub(None, _Engine()).start()
+    try:
+        client = hub.detector_for("a", None)
+        out = client.detect_batch([Image.new("RGB", (2, 2))] * 4)
+    finally:
+        hub.stop()
+    assert calls == [4] and len(out) == 4
+    assert hub.stats()["devices"]["a"]["requests"] == 1
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import numpy as np
+
+from core.perception.yolo.detection_cache import DetectionCache
+
+
+class _Engine:
+    """Counts real detections; detect_pil goes through self.detect_bgr like the engines."""
+
+    def __init__(self):
+        self.ctrl = None
+        self.calls = 0
+
+    def detect_bgr(self, bgr, *, imgsz=None, conf=None, iou=None, tag="general", agent=None):
+        self.calls += 1
+        return {"imgsz": imgsz}, [
+            {"idx": 0, "name": "button", "conf": 0.9, "xyxy": (1.0, 2.0, 3.0, 4.0)}
+        ]
+
+    def detect_pil(self, bgr, **kwargs):
+        return self.detect_bgr(bgr, **kwargs)
+
+
+def _frame(value: int = 100) -> np.ndarray:
+    img = np.full((360, 640, 3), value, dtype=np.uint8)
+    img[100:200, 200:400] = 30
+    return img
+
+
+def test_identical_and_near_identical_frames_hit():
+    engine = DetectionCache(ttl_s=60.0, threshold=0.5, log_every_s=0).attach(_Engine())
+    meta, dets = engine.detect_pil(_frame(), tag="waiter")
+    assert "cache" not in meta
+
+    meta2, dets2 = engine.detect_pil(_frame(), tag="waiter")
+    assert meta2["cache"] == "hit" and dets2 == dets
+    dets2[0]["name"] = "changed"  # callers get copies
+
+    noisy = _frame()
+    noisy[0, 0] = 101  # vanishes in the thumbnail
+    _, dets3 = engine.detect_pil(noisy, tag="waiter")
+    assert dets3[0]["name"] == "button"
+    assert engine.calls == 1
+
+    stats = engine.detection_cache.stats()["waiter"]
+    assert stats["calls"] == 3 and stats["hits"] == 2
+    assert abs(stats["hit_rate"] - 2 / 3) < 1e-9
+
+
+def test_changed_frame_params_and_ttl_miss():
+    cache = DetectionCache(ttl_s=60.0, threshold=0.5, log_every_s=0)
+    engine = cache.attach(_Engine())
+    engine.detect_bgr(_frame(), tag="a")
+
+    engine.detect_bgr(_frame(160), tag="a")  # screen changed
+    engine.detect_bgr(_frame(160), imgsz=320, tag="a")  # other input size
+    assert engine.calls == 3
+
+    changed = _frame(160)
+    changed[300:340, 560:620] = 255  # small local change, e.g. a button lighting up
+    engine.detect_bgr(changed, tag="b")
+    assert engine.calls == 4
+
+    cache.ttl_s = 0.0
+    engine.detect_bgr(changed, tag="b")
+    assert engine.calls == 5
+
+
+def test_detach_restores_engine():
+    cache = DetectionCache(ttl_s=60.0, log_every_s=0)
+    engine = cache.attach(_Engine())
+    cache.detach()
+    engine.detect_bgr(_frame())
+    engine.detect_bgr(_frame())
+    assert engine.calls == 2
+    assert not hasattr(engine, "detection_cache")
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import cv2
+import numpy as np
+
+from core.perception.glyph_digits import GlyphDigitReader
+
+
+def _render(text, scale=1.0, dark=True, pad=6):
+    (w, h), base = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, scale, 2)
+    img = np.full((h + base + 2 * pad, w + 2 * pad, 3), 255 if dark else 60, np.uint8)
+    ink = (20, 20, 20) if dark else (255, 255, 255)
+    cv2.putText(img, text, (pad, pad + h), cv2.FONT_HERSHEY_SIMPLEX, scale, ink, 2)
+    return img
+
+
+def _reader():
+    reader = GlyphDigitReader.empty()
+    for scale in (0.9, 1.2):
+        for text in ("0123", "4567", "89"):
+            assert reader.learn(_render(text, scale), text)
+    return reader
+
+
+def test_reads_numbers_in_both_polarities():
+    reader = _reader()
+    for text in ("416", "796", "1200", "9"):
+        val, conf = reader.read_int(_render(text))
+        assert val == int(text) and conf > 0.8
+        val, conf = reader.read_int(_render(text, dark=False))
+        assert val == int(text) and conf > 0.8
+
+
+def test_range_and_unknown_glyphs_give_no_value():
+    reader = _reader()
+    assert reader.read_int(_render("2034"), lo=90, hi=1200) == (-1, 0.0)
+    assert reader.read_int(_render("Skill")) == (-1, 0.0)
+
+
+def test_tallest_line_wins_over_a_smaller_caption():
+    reader = _reader()
+    big, small = _render("385", 1.2), _render("1200", 0.5)
+    canvas = np.full((big.shape[0] + small.shape[0], max(big.shape[1], small.shape[1]), 3), 255, np.uint8)
+    canvas[: big.shape[0], : big.shape[1]] = big
+    canvas[big.shape[0] :, : small.shape[1]] = small
+    assert reader.read_int(canvas)[0] == 385
+
+
+def test_save_load_roundtrip(tmp_path):
+    reader = _reader()
+    path = tmp_path / "digit_glyphs.npz"
+    reader.save(path)
+    loaded = GlyphDigitReader.load(path)
+    assert loaded.chars == reader.chars
+    assert loaded.read(_render("58")) == reader.read(_render("58"))
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from PIL import Image
+
+from core.perception.yolo.imgsz_profile import (
+    ImgszProfile,
+    frames_by_tag,
+    tune_tag,
+    tuned_imgsz,
+)
+from core.settings import Settings
+
+DATA = Path(__file__).resolve().parents[2] / "data"
+
+
+class _SizeSensitive:
+    """Big objects are found at any size, the small icon only from 512 up."""
+
+    def detect_pil(self, img, *, imgsz=None, **_):
+        dets = [{"idx": 0, "name": "button_green", "conf": 0.9, "xyxy": (10.0, 10.0, 200.0, 60.0)}]
+        if imgsz >= 512:
+            dets.append({"idx": 1, "name": "event_icon", "conf": 0.8, "xyxy": (5.0, 5.0, 12.0, 12.0)})
+        return {"names": {0: "button_green", 1: "event_icon"}}, dets
+
+
+def test_tuned_size_follows_profile_and_never_exceeds_request(tmp_path, monkeypatch):
+    path = tmp_path / "imgsz_profile.json"
+    monkeypatch.setattr(Settings, "YOLO_IMGSZ_PROFILE", path)
+    assert tuned_imgsz("models/uma_ura.pt", "training", None) is None  # no profile yet
+
+    prof = ImgszProfile()
+    prof.update("models/uma_ura.pt", {"training": 640, "default": 768})
+    prof.save(path)
+    assert tuned_imgsz("models/uma_ura.onnx", "training", 832) == 640
+    assert tuned_imgsz("models/uma_ura.int8.onnx", "race_list", None) == 768
+    assert tuned_imgsz("models/uma_ura.pt", "training", 512) == 512
+    assert tuned_imgsz("models/uma_nav.pt", "training", 832) == 832
+
+    monkeypatch.setattr(Settings, "YOLO_IMGSZ_AUTOTUNE", False)
+    assert tuned_imgsz("models/uma_ura.pt", "training", 832) == 832
+
+
+def test_tune_tag_picks_smallest_size_keeping_needed_classes():
+    frames = [DATA / "training_stats_01.png"]
+    rep = tune_tag(_SizeSensitive(), frames, sizes=[320, 448, 512, 640], reference_imgsz=832)
+    assert rep["imgsz"] == 512
+    assert rep["classes"] == ["button_green", "event_icon"]
+    assert rep["sizes"][448]["recall"] == {"button_green": 1.0, "event_icon": 0.0}
+
+    only_button = tune_tag(
+        _SizeSensitive(), frames, sizes=[320, 512], reference_imgsz=832, classes=["button_green"]
+    )
+    assert only_button["imgsz"] == 320
+
+
+def test_frames_by_tag_reads_debug_corpus_layout(tmp_path):
+    for rel in ("player/training/raw/a.png", "player/waiter/raw/b.png", "misc/c.png"):
+        p = tmp_path / rel
+        p.parent.mkdir(parents=True, exist_ok=True)
+        Image.new("RGB", (2, 2)).save(p)
+    groups = frames_by_tag([tmp_path])
+    assert {t: len(v) for t, v in groups.items()} == {"training": 1, "waiter": 1, "misc": 1}
+    assert list(frames_by_tag([tmp_path / "misc"], tag="lobby")) == ["lobby"]
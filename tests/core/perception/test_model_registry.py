@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import pytest
+
+from core.perception.model_registry import MB, ModelRegistry, ModelSpec
+
+
+class _Loader:
+    def __init__(self, name):
+        self.name = name
+        self.loads = 0
+
+    def __call__(self):
+        self.loads += 1
+        return f"{self.name}#{self.loads}"
+
+
+def _registry(budget_mb=0):
+    reg = ModelRegistry(budget_bytes=budget_mb * MB)
+    loaders = {}
+    for mid, size, pinned in (("ocr", 40, True), ("yolo/ura", 50, False), ("yolo/nav", 50, False)):
+        loaders[mid] = _Loader(mid)
+        reg.register(
+            ModelSpec(
+                mid,
+                loaders[mid],
+                weights=f"models/{mid.split('/')[-1]}.pt",
+                aliases=(mid.split("/")[-1],),
+                pinned=pinned,
+                size_bytes=size * MB,
+            )
+        )
+    return reg, loaders
+
+
+def test_resolves_ids_aliases_and_weights_paths():
+    reg, _ = _registry()
+    assert reg.resolve("yolo/ura") == "yolo/ura"
+    assert reg.resolve("NAV") == "yolo/nav"
+    assert reg.resolve("/srv/uma/models/ura.pt") == "yolo/ura"
+    with pytest.raises(KeyError):
+        reg.resolve("yolo/missing")
+
+
+def test_loads_on_demand_once():
+    reg, loaders = _registry()
+    assert reg.loaded() == []
+    assert reg.get("ura") == "yolo/ura#1"
+    assert reg.get("yolo/ura") == "yolo/ura#1"
+    assert loaders["yolo/ura"].loads == 1
+    st = reg.stats()["models"]["yolo/ura"]
+    assert st["requests"] == 2 and st["loads"] == 1 and st["loaded"]
+
+
+def test_evicts_least_recently_used_unpinned_model_over_budget():
+    reg, loaders = _registry(budget_mb=100)
+    reg.get("ocr")
+    reg.get("yolo/ura")
+    assert reg.used_bytes() == 90 * MB
+
+    reg.get("yolo/nav")  # 140 MB > budget: ura is the LRU unpinned model
+    assert reg.loaded() == ["ocr", "yolo/nav"]
+    assert reg.stats()["models"]["yolo/ura"]["evictions"] == 1
+
+    assert reg.get("yolo/ura") == "yolo/ura#2"  # reloaded, nav goes instead
+    assert reg.loaded() == ["ocr", "yolo/ura"]
+    assert loaders["ocr"].loads == 1
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import numpy as np
+from PIL import Image
+
+from core.perception.ocr.ocr_cache import OCRCache
+
+
+class _OCR:
+    def __init__(self):
+        self.seen = []
+
+    def raw(self, img):
+        self.seen.append(("raw", np.asarray(img).shape))
+        return {"res": {"rec_texts": ["123"], "rec_scores": [0.9]}}
+
+    def text(self, img, joiner=" ", min_conf=0.2):
+        return " ".join(self.raw(img)["res"]["rec_texts"])  # nested call, like LocalOCREngine
+
+    def digits(self, img):
+        return int(self.text(img))
+
+    def batch_text(self, imgs, *, joiner=" ", min_conf=0.2):
+        self.seen.append(("batch_text", len(imgs)))
+        return [f"t{np.asarray(im)[0, 0, 0]}" for im in imgs]
+
+    def batch_digits(self, imgs):
+        return [t[1:] for t in self.batch_text(imgs)]
+
+    def batch_rec(self, imgs):
+        self.seen.append(("batch_rec", len(imgs)))
+        return [(f"r{np.asarray(im)[0, 0, 0]}", 0.9) for im in imgs]
+
+
+def _crop(v):
+    return Image.new("RGB", (40, 12), (v, v, v))
+
+
+def test_identical_crops_hit_and_arguments_are_part_of_the_key():
+    ocr = _OCR()
+    cache = OCRCache(max_entries=16, max_bytes=1 << 20)
+    cache.attach(ocr)
+
+    assert ocr.text(_crop(5)) == "123"
+    assert ocr.text(_crop(5)) == "123"
+    assert ocr.text(_crop(5), min_conf=0.0) == "123"  # other arguments: a miss
+    assert ocr.digits(_crop(5)) == 123
+    assert ocr.seen.count(("raw", (12, 40, 3))) == 3
+
+    st = cache.stats()["methods"]
+    assert st["text"]["hits"] == 1 and st["text"]["misses"] == 2
+    assert "raw" not in st  # text()'s own raw() call is not cached separately
+
+    cache.detach()
+    assert "text" not in vars(ocr) and "ocr_cache" not in vars(ocr)
+
+
+def test_batches_only_send_misses_and_share_entries_with_text():
+    ocr = _OCR()
+    cache = OCRCache(max_entries=16, max_bytes=1 << 20).attach(ocr).ocr_cache
+
+    assert ocr.batch_text([_crop(1), _crop(2)]) == ["t1", "t2"]
+    assert ocr.batch_text([_crop(2), _crop(3), _crop(1)]) == ["t2", "t3", "t1"]
+    assert ocr.seen == [("batch_text", 2), ("batch_text", 1)]
+    assert ocr.text(_crop(3)) == "t3"  # same entry as the batch item
+    assert ocr.batch_digits([_crop(1)]) == ["1"]  # digit strings are cached apart
+    assert cache.stats()["methods"]["batch_text"]["hits"] == 2
+
+    ocr.seen.clear()
+    assert ocr.batch_rec([_crop(1), _crop(4)]) == [("r1", 0.9), ("r4", 0.9)]
+    assert ocr.batch_rec([_crop(4)]) == [("r4", 0.9)]  # recognizer results cached apart
+    assert ocr.seen == [("batch_rec", 2)]
+
+
+def test_lru_bounds_entries():
+    ocr = _OCR()
+    cache = OCRCache(max_entries=2, max_bytes=1 << 20).attach(ocr).ocr_cache
+    ocr.batch_text([_crop(1), _crop(2)])
+    ocr.batch_text([_crop(1)])  # 1 is now the most recent
+    ocr.batch_text([_crop(3)])  # evicts 2
+    assert cache.stats()["entries"] == 2
+    ocr.seen.clear()
+    ocr.batch_text([_crop(1), _crop(2)])
+    assert ocr.seen == [("batch_text", 1)]
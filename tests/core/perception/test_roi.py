@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+from PIL import Image
+
+from core.controllers.static_image import StaticImageController
+from core.perception.yolo.roi import detect_in_roi, resolve_roi, roi_imgsz
+from core.settings import Settings
+from core.utils.waiter import PollConfig, Waiter
+
+
+class _Engine:
+    """Finds one 'button' and one 'card' at fixed spots of whatever it is given."""
+
+    def __init__(self, ctrl=None):
+        self.ctrl = ctrl
+        self.calls = []
+
+    def detect_pil(self, img, *, imgsz=None, conf=None, iou=None, tag="general", agent=None):
+        w, h = img.width, img.height
+        self.calls.append(((w, h), imgsz))
+        return {"imgsz": imgsz}, [
+            {"idx": 0, "name": "card", "conf": 0.9, "xyxy": (0.0, 0.0, 10.0, 10.0)},
+            {"idx": 1, "name": "button", "conf": 0.8, "xyxy": (w - 20.0, h - 10.0, w - 0.0, h - 0.0)},
+        ]
+
+    def recognize(self, *, imgsz=None, conf=None, iou=None, tag="general", agent=None, roi=None, classes=None):
+        img = self.ctrl.screenshot()
+        meta, dets = detect_in_roi(
+            self, img, roi, classes=classes, imgsz=imgsz, conf=conf, iou=iou, tag=tag, agent=agent
+        )
+        return img, meta, dets
+
+
+def test_resolve_roi_accepts_relative_and_pixel_boxes():
+    assert resolve_roi((0.0, 0.75, 1.0, 1.0), 400, 800) == (0, 600, 400, 800)
+    assert resolve_roi((10, 20, 500, 900), 400, 800) == (10, 20, 400, 800)
+    with pytest.raises(ValueError):
+        resolve_roi((0.5, 0.5, 0.5, 0.9), 400, 800)
+
+
+def test_roi_imgsz_keeps_scale_within_bounds():
+    assert roi_imgsz((0, 0, 400, 800), 400, 800, 832) == 832
+    assert roi_imgsz((0, 600, 400, 800), 400, 800, 832) == 416  # long side 400/800
+    assert roi_imgsz((0, 0, 20, 20), 400, 800, 832) == Settings.YOLO_ROI_MIN_IMGSZ
+
+
+def test_detect_in_roi_crops_shrinks_and_maps_back():
+    eng = _Engine()
+    img = Image.new("RGB", (400, 800))
+    meta, dets = detect_in_roi(eng, img, (0.0, 0.75, 1.0, 1.0), classes=["button"], imgsz=832)
+
+    assert eng.calls == [((400, 200), 416)]
+    assert meta["roi"] == (0, 600, 400, 800) and meta["imgsz"] == 416
+    assert dets == [{"idx": 0, "name": "button", "conf": 0.8, "xyxy": (380.0, 790.0, 400.0, 800.0)}]
+
+
+def test_waiter_clicks_full_frame_coordinates_from_an_roi():
+    ctrl = StaticImageController(Image.new("RGB", (400, 800)))
+    clicked = []
+    ctrl.click_xyxy_center = lambda xyxy, clicks=1: clicked.append(tuple(xyxy))
+    eng = _Engine(ctrl)
+    waiter = Waiter(ctrl, None, eng, PollConfig(imgsz=832, timeout_s=0.1))
+
+    assert waiter.click_when(classes=["button"], roi=(0, 400, 200, 800))
+    assert clicked == [(180.0, 790.0, 200.0, 800.0)]
+    assert eng.calls == [((200, 400), 416)]
+
+
+class _NamedEngine(_Engine):
+    """_Engine whose 'button' carries a real class name."""
+
+    def __init__(self, ctrl, button: str):
+        super().__init__(ctrl)
+        self.button = button
+
+    def detect_pil(self, img, **kwargs):
+        meta, dets = super().detect_pil(img, **kwargs)
+        return meta, [{**d, "name": self.button} if d["name"] == "button" else d for d in dets]
+
+
+def test_lobby_button_bar_detects_a_cropped_region():
+    from core.actions.lobby import LobbyFlow
+
+    ctrl = StaticImageController(Image.new("RGB", (420, 936)))
+    clicked = []
+    ctrl.click_xyxy_center = lambda xyxy, clicks=1: clicked.append(tuple(xyxy))
+    eng = _NamedEngine(ctrl, "lobby_skills")
+    waiter = Waiter(ctrl, None, eng, PollConfig(imgsz=832, timeout_s=0.1))
+
+    assert LobbyFlow._go_skills(SimpleNamespace(ctrl=ctrl, waiter=waiter))
+    # only the bottom 30% of the frame reaches the model, at a smaller size
+    assert eng.calls[0] == ((420, 281), 384)
+    assert clicked == [(400.0, 926.0, 420.0, 936.0)]
+
+
+def test_skills_scan_detects_the_list_band_only():
+    try:
+        import core.actions.skills as skills_mod
+    except Exception:  # pygetwindow raises NotImplementedError off Windows
+        pytest.skip("engine imports pygetwindow (Windows only)")
+    ctrl = StaticImageController(Image.new("RGB", (420, 936)))
+    eng = _NamedEngine(ctrl, "skills_buy")
+    flow = SimpleNamespace(yolo_engine=eng, waiter=Waiter(ctrl, None, eng, PollConfig()))
+
+    _, dets = skills_mod.SkillsFlow._collect(flow, "skills_scan")
+    ((w, h), imgsz), = eng.calls
+    assert (w, h) == (420, 675) and imgsz < 832
+    assert [d["name"] for d in dets] == ["skills_buy"]
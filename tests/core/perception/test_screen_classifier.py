@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+from core.perception.screen_classifier import ScreenClassifier
+
+
+def _screen(kind: str, seed: int) -> Image.Image:
+    rng = np.random.default_rng(seed)
+    img = Image.new("RGB", (270, 480), (235, 235, 235) if kind == "Lobby" else (40, 90, 160))
+    d = ImageDraw.Draw(img)
+    if kind == "Lobby":
+        d.rectangle((20, 380, 250, 460), fill=(90, 200, 60))  # big bottom button row
+    else:
+        for i in range(5):  # five training tiles
+            d.ellipse((10 + i * 52, 300, 55 + i * 52, 345), fill=(250, 200, 40))
+    noise = rng.integers(-12, 12, size=(480, 270, 3))
+    return Image.fromarray(np.clip(np.asarray(img, dtype=np.int16) + noise, 0, 255).astype(np.uint8))
+
+
+def _trained():
+    images = [_screen(k, s) for k in ("Lobby", "Training") for s in range(6)]
+    labels = ["Lobby"] * 6 + ["Training"] * 6
+    return ScreenClassifier.fit(images, labels, k=3)
+
+
+def test_predicts_seen_screen_types_confidently():
+    clf = _trained()
+    assert clf.evaluate()["accuracy"] == 1.0
+    label, conf = clf.predict(_screen("Training", 99))
+    assert label == "Training" and conf > 0.9
+    label, conf = clf.predict(_screen("Lobby", 98))
+    assert label == "Lobby" and conf > 0.9
+
+
+def test_novel_screen_gets_zero_confidence():
+    clf = _trained()
+    odd = Image.new("RGB", (270, 480), (0, 0, 0))
+    ImageDraw.Draw(odd).rectangle((0, 0, 135, 240), fill=(255, 0, 255))
+    _, conf = clf.predict(odd)
+    assert conf == 0.0
+
+
+def test_save_load_roundtrip(tmp_path):
+    clf = _trained()
+    path = tmp_path / "screen_clf.ura.npz"
+    clf.save(path)
+    loaded = ScreenClassifier.load(path)
+    assert loaded.classes == clf.classes
+    assert loaded.min_similarity == clf.min_similarity
+    img = _screen("Lobby", 7)
+    assert loaded.predict(img) == clf.predict(img)
+
+
+class _FakeYOLO:
+    def __init__(self) -> None:
+        self.detected, self.recognized = [], []
+
+    def detect_pil(self, pil_img, *, imgsz=None, conf=None, iou=None):
+        self.detected.append(imgsz)
+        return {"screen": "from-detector"}, [{"name": "button_white"}]
+
+    def recognize(self, **kwargs):
+        self.recognized.append(kwargs["tag"])
+        return None, {}, []
+
+
+def test_attached_classifier_answers_only_listed_screens():
+    from core.controllers.static_image import StaticImageController
+
+    ctrl = StaticImageController(_screen("Lobby", 11))
+    yolo = _FakeYOLO()
+    clf = _trained()
+    clf.attach(yolo, ctrl, {"Lobby"}, min_conf=0.9)
+
+    _, meta, dets = yolo.recognize(imgsz=640, tag="screen")
+    assert meta["screen"] == "Lobby" and dets == [] and yolo.detected == []
+
+    # a confident label outside the list still goes through the detector, on the same frame
+    ctrl._img = _screen("Training", 12)
+    img, meta, dets = yolo.recognize(imgsz=640, tag="screen")
+    assert meta["screen"] == "from-detector" and dets and yolo.detected == [640]
+    assert img is ctrl.screenshot()
+
+    yolo.recognize(tag="lobby")
+    assert yolo.recognized == ["lobby"]
+    assert (clf.frames, clf.answered) == (2, 1)
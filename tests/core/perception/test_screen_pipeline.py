@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import time
+
+from PIL import Image
+
+from core.perception.screen_pipeline import ScreenPipeline
+
+
+class _Ctrl:
+    def __init__(self):
+        self._last_origin = (0, 0)
+        self._last_bbox = (0, 0, 0, 0)
+        self.shots = 0
+        self.clicks = 0
+
+    def screenshot(self, region=None):
+        self.shots += 1
+        self._last_origin = (self.shots, 0)
+        self._last_bbox = (self.shots, 0, 32, 32)
+        return Image.new("RGB", (32, 32))
+
+    def click(self, x, y, **kwargs):
+        self.clicks += 1
+
+
+class _Engine:
+    def __init__(self, ctrl):
+        self.ctrl = ctrl
+        self.calls = 0
+
+    def detect_bgr(self, bgr, **kwargs):
+        return {}, []
+
+    def recognize(self, **kwargs):
+        img = self.ctrl.screenshot()
+        self.calls += 1
+        meta, dets = self.detect_bgr(None)
+        return img, {"frame": self.ctrl.shots}, dets
+
+
+def _wait_for(cond, timeout=2.0):
+    end = time.monotonic() + timeout
+    while not cond() and time.monotonic() < end:
+        time.sleep(0.005)
+
+
+def test_prefetched_frame_is_used_when_nothing_happened():
+    ctrl = _Ctrl()
+    engine = _Engine(ctrl)
+    pipeline = ScreenPipeline(ctrl, engine).attach()
+    try:
+        _, meta, _ = pipeline.next(0.0)
+        assert meta["frame"] == 1
+        _wait_for(lambda: engine.calls == 2)
+        # the worker's capture does not move the geometry the agent is working with
+        assert ctrl._last_origin == (1, 0)
+
+        _, meta, _ = pipeline.next(0.05)
+        assert meta["frame"] == 2
+        assert ctrl._last_origin == (2, 0)  # geometry of the frame handed over
+        assert pipeline.used == 1
+    finally:
+        pipeline.close()
+    assert "click" not in vars(ctrl) and "screenshot" not in vars(ctrl)
+
+
+def test_input_discards_the_prefetch():
+    ctrl = _Ctrl()
+    engine = _Engine(ctrl)
+    pipeline = ScreenPipeline(ctrl, engine).attach()
+    try:
+        pipeline.next(0.0)
+        _wait_for(lambda: engine.calls == 2)
+        ctrl.click(10, 10)
+        _, meta, _ = pipeline.next(0.0)
+        assert meta["frame"] == 3  # captured after the click
+        assert ctrl.clicks == 1
+        assert pipeline.used == 0 and pipeline.discarded == 1
+    finally:
+        pipeline.close()
+
+
+def test_stale_prefetch_is_recaptured():
+    ctrl = _Ctrl()
+    engine = _Engine(ctrl)
+    pipeline = ScreenPipeline(ctrl, engine).attach()
+    try:
+        pipeline.next(0.0)
+        _wait_for(lambda: engine.calls == 2)
+        time.sleep(0.05)  # agent busy for longer than the loop delay
+        _, meta, _ = pipeline.next(0.0)
+        assert meta["frame"] == 3
+        assert pipeline.stale == 1
+    finally:
+        pipeline.close()
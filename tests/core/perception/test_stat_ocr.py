@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import pytest
+from PIL import Image
+
+pytest.importorskip("sklearn")  # extractors.state loads the active-button classifier
+
+from core.constants import CLASS_UI_STATS
+from core.perception.extractors.state import extract_stats
+
+
+class _OCR:
+    """Segment i reads `loose[i]` at min_conf=0.0 and `strict[i]` otherwise."""
+
+    def __init__(self, loose, strict):
+        self.loose, self.strict = loose, strict
+        self.segs = []
+        self.calls = []
+
+    def batch_text(self, imgs, *, joiner=" ", min_conf=0.2):
+        self.calls.append((len(imgs), min_conf))
+        if min_conf == 0.0:
+            self.segs = list(imgs)
+            return list(self.loose)
+        idx = [next(i for i, s in enumerate(self.segs) if s is im) for im in imgs]
+        return [self.strict[i] for i in idx]
+
+
+def test_stats_are_read_in_two_batched_calls(monkeypatch):
+    import core.perception.extractors.state as state
+
+    monkeypatch.setattr(state, "read_number", lambda *a, **k: None)  # no glyph templates
+    ocr = _OCR(
+        loose=["416", "C 2034", "88", "300", ""],
+        strict=["", "C 203A / 1200", "", "", "S12O / 1200"],
+    )
+    dets = [{"name": CLASS_UI_STATS, "conf": 0.9, "xyxy": (40, 1200, 1040, 1300)}]
+    stats = extract_stats(ocr, Image.new("RGB", (1080, 1920)), dets)
+
+    assert stats == {"SPD": 416, "STA": -1, "PWR": -1, "GUTS": 300, "WIT": 120}
+    # one loose pass over all five, one salvage pass over the three rejected
+    assert ocr.calls == [(5, 0.0), (3, 0.2)]
+
+
+def test_glyph_reads_skip_ocr(monkeypatch):
+    import core.perception.extractors.state as state
+
+    glyphs = iter([416, None, 250, None, 300])
+    monkeypatch.setattr(state, "read_number", lambda *a, **k: next(glyphs))
+    ocr = _OCR(loose=["633", "393"], strict=["", ""])
+    dets = [{"name": CLASS_UI_STATS, "conf": 0.9, "xyxy": (40, 1200, 1040, 1300)}]
+    stats = extract_stats(ocr, Image.new("RGB", (1080, 1920)), dets)
+
+    assert stats == {"SPD": 416, "STA": 633, "PWR": 250, "GUTS": 393, "WIT": 300}
+    assert ocr.calls == [(2, 0.0)]
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import threading
+
+from core.perception import warmup
+from core.perception.yolo.detection_cache import DetectionCache
+from core.settings import Settings
+
+
+class _Engine:
+    weights_path = "models/does_not_exist.pt"
+
+    def __init__(self):
+        self.shapes = []
+
+    def detect_bgr(self, bgr, *, imgsz=None, **kwargs):
+        self.shapes.append((bgr.shape, imgsz))
+        return {}, []
+
+
+class _OCR:
+    def __init__(self):
+        self.calls = 0
+
+    def text(self, img, joiner=" ", min_conf=0.2):
+        self.calls += 1
+        return ""
+
+    def digits(self, img):
+        self.calls += 1
+        return -1
+
+
+def test_warmup_runs_every_size_twice_and_reports_ready():
+    engine, ocr = _Engine(), _OCR()
+    w = warmup.Warmup()
+    w.add("yolo", warmup.yolo_jobs(engine, sizes=[640, 320]))
+    w.add("ocr", warmup.ocr_jobs(ocr))
+    assert w.start().wait(5.0)
+
+    assert engine.shapes == [((640, 640, 3), 640)] * 2 + [((320, 320, 3), 320)] * 2
+    assert ocr.calls == 4
+    st = warmup.status()
+    assert st["ready"] and warmup.current() is w
+    runs = st["components"]["yolo"]["runs"]
+    assert [r["input"] for r in runs] == ["640x640", "320x320"]
+    assert all(r["cold_ms"] is not None and r["warm_ms"] is not None for r in runs)
+
+
+def test_failed_component_does_not_block_readiness():
+    w = warmup.Warmup()
+    w.add("spirit", warmup.classifier_jobs(lambda: None))
+    w.add("ocr", warmup.ocr_jobs(_OCR()))
+    assert w.start().wait(5.0)
+    comps = w.status()["components"]
+    assert comps["spirit"]["state"] == "failed" and comps["spirit"]["error"]
+    assert comps["ocr"]["state"] == "ready"
+
+
+def test_yolo_sizes_include_configured_size():
+    assert Settings.YOLO_IMGSZ in warmup.yolo_sizes("models/does_not_exist.pt")
+
+
+def test_warm_run_is_not_a_detection_cache_hit():
+    engine = DetectionCache(ttl_s=60.0, log_every_s=0).attach(_Engine())
+    w = warmup.Warmup().add("yolo", warmup.yolo_jobs(engine, sizes=[320]))
+    assert w.start().wait(5.0)
+    assert len(engine.shapes) == 2  # both runs reached the model
+    assert engine.detection_cache.stats()["general"]["hits"] == 0
+
+
+def test_cancel_skips_pending_jobs_and_join_waits_for_the_running_one():
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def slow():
+        calls.append(1)
+        started.set()
+        release.wait(5.0)
+
+    w = warmup.Warmup().add("yolo", [("a", slow), ("b", slow)]).start()
+    assert started.wait(5.0) and not w.wait(0.05)
+    w.cancel()
+    release.set()
+    w.join(5.0)
+
+    assert len(calls) == 1
+    comp = w.status()["components"]["yolo"]
+    assert w.ready and comp["state"] == "cancelled"
+    assert [r["input"] for r in comp["runs"]] == ["a"]
+    assert comp["runs"][0]["warm_ms"] is None
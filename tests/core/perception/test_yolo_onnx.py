@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from core.perception.yolo.ops import decode, letterbox, nms, scale_boxes
+from core.settings import Settings
+
+DATA = Path(__file__).resolve().parents[2] / "data"
+
+
+def _pred(rows):
+    """Raw head output (4 + nc, N) from [(cx, cy, w, h, *class_scores), ...]."""
+    return np.asarray(rows, dtype=np.float32).T
+
+
+def test_letterbox_and_scale_boxes_round_trip():
+    bgr = np.zeros((300, 600, 3), np.uint8)
+    lb = letterbox(bgr, (640, 640))
+    assert lb.shape == (640, 640, 3)
+    assert tuple(lb[0, 0]) == (114, 114, 114) and tuple(lb[320, 320]) == (0, 0, 0)
+
+    # box drawn on the original maps to gain*box + pad on the letterboxed input
+    gain, pad = 640 / 600, (640 - 300 * 640 / 600) / 2
+    orig = np.array([[60.0, 30.0, 180.0, 150.0]], np.float32)
+    boxed = orig * gain + np.array([0, pad, 0, pad], np.float32)
+    assert np.allclose(scale_boxes(boxed, lb.shape[:2], bgr.shape[:2]), orig, atol=1.0)
+
+    assert letterbox(bgr, (640, 640), auto=True).shape == (320, 640, 3)
+
+
+def test_decode_is_class_aware_and_thresholded():
+    pred = _pred(
+        [
+            (50, 50, 20, 20, 0.90, 0.00),
+            (52, 50, 20, 20, 0.80, 0.00),  # overlaps the first, same class -> suppressed
+            (51, 50, 20, 20, 0.00, 0.70),  # overlaps, other class -> kept
+            (200, 200, 10, 10, 0.10, 0.05),  # below conf
+        ]
+    )
+    xyxy, conf, cls = decode(pred, conf=0.25, iou=0.45)
+    assert cls.tolist() == [0, 1]
+    assert np.allclose(conf, [0.9, 0.7])
+    assert np.allclose(xyxy[0], [40, 40, 60, 60])
+
+    empty = decode(pred, conf=0.95, iou=0.45)
+    assert all(len(a) == 0 for a in empty)
+
+
+def test_nms_keeps_highest_of_each_cluster():
+    boxes = np.array([[0, 0, 10, 10], [1, 1, 11, 11], [20, 20, 30, 30]], np.float32)
+    keep = nms(boxes, np.array([0.5, 0.9, 0.3], np.float32), 0.5)
+    assert keep.tolist() == [1, 2]
+
+
+def _iou(a, b) -> float:
+    iw = max(0.0, min(a[2], b[2]) - max(a[0], b[0]))
+    ih = max(0.0, min(a[3], b[3]) - max(a[1], b[1]))
+    inter = iw * ih
+    union = (a[2] - a[0]) * (a[3] - a[1]) + (b[2] - b[0]) * (b[3] - b[1]) - inter
+    return inter / union if union > 0 else 0.0
+
+
+@pytest.mark.parametrize("frame", ["training_stats_01.png", "lobby_stats_01_high_res.png"])
+def test_onnx_matches_ultralytics(frame):
+    pytest.importorskip("onnxruntime")
+    pytest.importorskip("ultralytics")
+    weights = Path(Settings.YOLO_WEIGHTS_URA)
+    if not weights.exists() or not weights.with_suffix(".onnx").exists():
+        pytest.skip("needs the .pt weights and their exported .onnx sibling")
+
+    from core.perception.yolo.yolo_local import LocalYOLOEngine
+    from core.perception.yolo.yolo_onnx import ONNXYOLOEngine
+
+    img = Image.open(DATA / frame).convert("RGB")
+    _, ref = LocalYOLOEngine(weights=str(weights)).detect_pil(img)
+    _, got = ONNXYOLOEngine(weights=str(weights)).detect_pil(img)
+
+    # Confident detections must match 1:1; borderline ones may flip across the
+    # threshold because ultralytics letterboxes .pt inference rectangularly.
+    for d in (d for d in ref if d["conf"] >= Settings.YOLO_CONF + 0.1):
+        same = [g for g in got if g["name"] == d["name"]]
+        best = max(same, key=lambda g: _iou(g["xyxy"], d["xyxy"]), default=None)
+        assert best is not None, f"missing {d['name']}"
+        assert _iou(best["xyxy"], d["xyxy"]) > 0.9
+        assert abs(best["conf"] - d["conf"]) < 0.05
+
+
+class _ContentSession:
+    """Fake onnxruntime session: one box around the non-padding pixels of each
+    input, scored by the share of the input they cover (so padding shows)."""
+
+    def __init__(self) -> None:
+        self.runs = []
+
+    def run(self, _outputs, feeds):
+        batch = next(iter(feeds.values()))
+        self.runs.append(batch.shape)
+        preds = []
+        for chw in batch:
+            ys, xs = np.nonzero(np.abs(chw[0] - 114 / 255.0) > 1e-3)
+            x0, x1, y0, y1 = xs.min(), xs.max() + 1, ys.min(), ys.max() + 1
+            share = (x1 - x0) * (y1 - y0) / float(chw.shape[1] * chw.shape[2])
+            preds.append(_pred([((x0 + x1) / 2, (y0 + y1) / 2, x1 - x0, y1 - y0, share)]))
+        return [np.stack(preds)]
+
+
+def test_onnx_detect_batch_matches_single_calls(monkeypatch):
+    from core.perception.yolo.yolo_onnx import ONNXYOLOEngine
+
+    monkeypatch.setattr(Settings, "STORE_FOR_TRAINING", False)
+
+    eng = ONNXYOLOEngine.__new__(ONNXYOLOEngine)
+    eng.session, eng.input_name, eng.input_dtype = _ContentSession(), "images", np.float32
+    eng.batch_dim, eng.static_hw, eng.stride = None, None, 32  # dynamic export
+    eng.names, eng.int8 = {0: "thing"}, False
+
+    rng = np.random.default_rng(0)
+    imgs = [
+        rng.integers(0, 100, size=(h, w, 3), dtype=np.uint8)
+        for h, w in ((300, 600), (600, 300), (290, 600))
+    ]
+    single = [eng.detect_bgr(im, imgsz=640, conf=0.1) for im in imgs]
+    batched = eng.detect_batch(imgs, imgsz=640, conf=0.1)
+
+    for (_, want), (_, got) in zip(single, batched):
+        assert len(got) == len(want) == 1
+        assert np.allclose(got[0]["xyxy"], want[0]["xyxy"])
+        assert abs(got[0]["conf"] - want[0]["conf"]) < 1e-6
+    # the two landscape frames share a rectangular input and one run
+    assert sorted(s[0] for s in eng.session.runs[len(imgs) :]) == [1, 2]
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from core.perception.yolo.evaluate import average_precision, drift_report, per_class_ap
+from core.perception.yolo.quantize import calibration_frames
+from core.settings import Settings
+
+DATA = Path(__file__).resolve().parents[2] / "data"
+
+
+def _det(name, xyxy, conf):
+    return {"idx": 0, "name": name, "conf": conf, "xyxy": xyxy}
+
+
+class _FakeDetector:
+    def __init__(self, dets, drop=()):
+        self.dets, self.drop = dets, set(drop)
+
+    def detect_pil(self, img, *, imgsz=None, conf=None, iou=None, **_):
+        conf = Settings.YOLO_CONF if conf is None else conf
+        out = [d for d in self.dets if d["conf"] >= conf and d["name"] not in self.drop]
+        return {"names": {0: "button_green", 1: "support_card"}}, out
+
+
+def test_average_precision_matches_hand_computed_curve():
+    assert average_precision(np.array([1.0, 1.0]), np.array([0.9, 0.8]), 2) == 1.0
+    # one hit, then a false positive, one of two objects never found -> AP ~ 0.5
+    ap = average_precision(np.array([1.0, 0.0]), np.array([0.9, 0.8]), 2)
+    assert ap == pytest.approx(51 / 101)
+    assert np.isnan(average_precision(np.array([]), np.array([]), 0))
+
+
+def test_per_class_ap_matches_greedily_by_confidence():
+    gts = [[("card", (0, 0, 10, 10)), ("card", (20, 0, 30, 10)), ("btn", (0, 20, 10, 30))]]
+    preds = [
+        [
+            _det("card", (0, 0, 10, 10), 0.9),
+            _det("card", (1, 0, 11, 10), 0.8),  # duplicate of the first -> false positive
+            _det("btn", (40, 40, 50, 50), 0.7),  # wrong place
+        ]
+    ]
+    res = per_class_ap(preds, gts)
+    assert res["card"]["n_gt"] == 2 and res["card"]["n_pred"] == 2
+    assert res["card"]["ap"] == pytest.approx(51 / 101)
+    assert res["btn"]["ap"] == 0.0
+
+
+def test_drift_report_flags_lost_classes_against_reference():
+    dets = [
+        _det("button_green", (10.0, 10.0, 50.0, 30.0), 0.95),
+        _det("support_card", (60.0, 10.0, 90.0, 40.0), 0.9),
+    ]
+    frame = DATA / "training_stats_01.png"
+    rep = drift_report(
+        _FakeDetector(dets), _FakeDetector(dets, drop={"support_card"}), [frame], warmup=0
+    )
+    assert rep["mode"] == "reference" and rep["frames"] == 1
+    assert rep["classes"]["button_green"]["drift"] == 0.0
+    assert rep["classes"]["support_card"]["drift"] == -1.0
+    assert rep["map_drift"] == pytest.approx(-0.5)
+    assert set(rep["latency"]) == {"reference", "candidate"}
+
+
+def test_drift_report_scores_both_models_against_labels(tmp_path):
+    frame = DATA / "training_stats_01.png"
+    w, h = Image.open(frame).size
+    (tmp_path / f"{frame.stem}.txt").write_text(
+        f"0 {30 / w} {20 / h} {40 / w} {20 / h}\n", encoding="utf-8"
+    )
+    ref = _FakeDetector([_det("button_green", (10.0, 10.0, 50.0, 30.0), 0.95)])
+    cand = _FakeDetector([_det("button_green", (10.0, 10.0, 50.0, 30.0), 0.3)])
+    rep = drift_report(ref, cand, [frame], labels_dir=tmp_path, warmup=0)
+    assert rep["mode"] == "labels"
+    # below the operating conf but still ranked first: mAP is unaffected
+    assert rep["classes"]["button_green"] == pytest.approx(
+        {"n_gt": 1, "ap_ref": 1.0, "ap_cand": 1.0, "drift": 0.0}
+    )
+    assert rep["per_frame"][0]["n_cand"] == 0
+
+
+def test_calibration_frames_are_a_stable_sample(tmp_path):
+    for tag in ("training", "race"):
+        raw = tmp_path / tag / "raw"
+        raw.mkdir(parents=True)
+        for i in range(6):
+            Image.new("RGB", (4, 4)).save(raw / f"{tag}_{i}.png")
+    (tmp_path / "notes.txt").write_text("x")
+
+    assert len(calibration_frames([tmp_path], limit=100)) == 12
+    sample = calibration_frames([tmp_path], limit=5, seed=3)
+    assert len(sample) == 5 and sample == calibration_frames([tmp_path], limit=5, seed=3)
+
+
+def test_int8_models_are_selected_per_model_key():
+    assert Settings.yolo_model_key(Settings.YOLO_WEIGHTS_NAV) == "nav"
+    assert Settings.yolo_model_key(Settings.YOLO_WEIGHTS_URA.with_suffix(".int8.onnx")) == "ura"
+    assert Settings.yolo_model_key("models/other.pt") is None
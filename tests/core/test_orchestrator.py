@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import threading
+import time
+
+from PIL import Image
+
+from core.controllers.static_image import StaticImageController
+from core.orchestrator import MultiDeviceOrchestrator
+from core.perception.hub import PerceptionHub
+
+
+class _FakeYOLO:
+    def __init__(self) -> None:
+        self.threads = set()
+        self.tags = []
+
+    def detect_pil(self, pil_img, *, imgsz=None, conf=None, iou=None, tag="general", agent=None):
+        self.threads.add(threading.current_thread().name)
+        self.tags.append((tag, agent))
+        time.sleep(0.002)
+        return {"red": pil_img.getpixel((0, 0))[0]}, []
+
+
+class _FakeOCR:
+    def text(self, img, joiner=" ", min_conf=0.2) -> str:
+        return f"R{img.getpixel((0, 0))[0]}"
+
+
+class _FakeAgent:
+    def __init__(self, ctrl, ocr, yolo_engine, turns: int) -> None:
+        self.ctrl, self.ocr, self.yolo_engine = ctrl, ocr, yolo_engine
+        self.turns = turns
+        self.seen = []
+        self.is_running = True
+
+    def run(self, delay: float = 0.0, max_iterations=None) -> None:
+        for _ in range(self.turns):
+            if not self.is_running:
+                break
+            img, meta, _ = self.yolo_engine.recognize(tag="screen")
+            self.seen.append((meta["device"], meta["red"], self.ocr.text(img)))
+
+    def emergency_stop(self) -> None:
+        self.is_running = False
+
+
+def _device(red: int) -> StaticImageController:
+    return StaticImageController(Image.new("RGB", (32, 32), (red, 0, 0)))
+
+
+def test_devices_share_one_engine_and_keep_their_own_frames():
+    yolo, agents = _FakeYOLO(), {}
+
+    def factory(ctrl, ocr, yolo_engine):
+        agent = _FakeAgent(ctrl, ocr, yolo_engine, turns=5)
+        agents[yolo_engine.device] = agent
+        return agent
+
+    orch = MultiDeviceOrchestrator(
+        {"a": _device(10), "b": _device(20), "c": _device(30)}, _FakeOCR(), yolo, factory
+    )
+    orch.start()
+    assert orch.join(timeout=5.0)
+
+    assert agents["a"].seen == [("a", 10, "R10")] * 5
+    assert agents["c"].seen == [("c", 30, "R30")] * 5
+    # every model call ran on the single hub worker
+    assert yolo.threads == {"perception-hub"}
+
+    st = orch.stats()
+    assert {d: s["requests"] for d, s in st["devices"].items()} == {"a": 10, "b": 10, "c": 10}
+    assert all(s["error"] is None and not s["alive"] for s in st["devices"].values())
+    assert st["fairness"] > 0.9
+
+
+def test_hub_serves_devices_round_robin():
+    order = []
+    gate = threading.Event()
+    hub = PerceptionHub(_FakeOCR(), _FakeYOLO()).start()
+    try:
+        hub.submit("a", "yolo", gate.wait)  # hold the worker while queues fill up
+        futs = [hub.submit("a", "yolo", order.append, f"a{i}") for i in range(4)]
+        futs += [hub.submit("b", "yolo", order.append, f"b{i}") for i in range(2)]
+        gate.set()
+        for f in futs:
+            f.result(timeout=2.0)
+    finally:
+        hub.stop()
+    # device "b" is not starved behind the backlog of "a"
+    assert order == ["b0", "a0", "b1", "a1", "a2", "a3"]
+    assert hub.stats()["devices"]["b"]["requests"] == 2
+
+
+def test_shared_client_applies_tuned_input_size(tmp_path, monkeypatch):
+    from core.perception.yolo.imgsz_profile import ImgszProfile
+    from core.settings import Settings
+
+    path = tmp_path / "imgsz_profile.json"
+    prof = ImgszProfile()
+    prof.update("models/uma_ura.pt", {"screen": 640})
+    prof.save(path)
+    monkeypatch.setattr(Settings, "YOLO_IMGSZ_PROFILE", path)
+
+    sizes = []
+    yolo = _FakeYOLO()
+    yolo.weights_path = "models/uma_ura.pt"
+    yolo.detect_pil = lambda img, *, imgsz=None, conf=None, iou=None, **kw: (
+        sizes.append(imgsz) or {},
+        [],
+    )
+    hub = PerceptionHub(_FakeOCR(), yolo).start()
+    try:
+        client = hub.detector_for("a", _device(10))
+        client.recognize(imgsz=832, tag="screen")
+        client.recognize(imgsz=832, tag="lobby")
+    finally:
+        hub.stop()
+    assert sizes == [640, 832]
+
+
+def test_shared_client_forwards_tag_and_agent():
+    yolo = _FakeYOLO()
+    hub = PerceptionHub(_FakeOCR(), yolo).start()
+    try:
+        client = hub.detector_for("a", _device(10))
+        client.recognize(tag="screen", agent="ura")
+        client.detect_pil(Image.new("RGB", (4, 4)), tag="lobby", agent="ura")
+    finally:
+        hub.stop()
+    assert yolo.tags == [("screen", "ura"), ("lobby", "ura")]
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from PIL import Image
+
+from core.utils import preprocessors
+from core.utils.preprocessors import date_text_accepted, read_date_pill_robust
+
+
+class _OCR:
+    """Answers per variant, told apart by the crop width (raw / x2 / x3 upscale)."""
+
+    def __init__(self, pill: Image.Image, by_variant: dict) -> None:
+        scale = {"raw": 1, "x2": 2, "x3": 3}
+        self.by_width = {pill.width * f: by_variant.get(v, "") for v, f in scale.items()}
+        self.calls = []
+
+    def batch_text(self, imgs, *, joiner=" ", min_conf=0.2):
+        self.calls.append(len(imgs))
+        return [self.by_width[im.width] for im in imgs]
+
+
+def _pill(h: int) -> Image.Image:
+    return Image.new("RGB", (6 * h, h), (230, 230, 230))
+
+
+def test_accepts_only_complete_dates():
+    assert date_text_accepted("Classic Year Late Mar")
+    assert date_text_accepted("Finale Season") and date_text_accepted("Pre-Debut")
+    assert date_text_accepted("Junior Year Pre-Debut")  # the pill before the debut race
+    assert not date_text_accepted("Classic Year Late")
+    assert not date_text_accepted("Year Early") and not date_text_accepted("")
+
+
+def test_stops_at_first_accepted_variant_and_remembers_it(monkeypatch):
+    monkeypatch.setattr(preprocessors, "_date_pill_winner", {})
+    pill = _pill(24)
+    answers = {"x2": "Clasic Yeer", "x3": "Classic Year Late Mar", "raw": "Senior Year Early Dec"}
+
+    ocr = _OCR(pill, answers)
+    assert read_date_pill_robust(ocr, pill) == "Classic Year Late Mar"
+    assert ocr.calls == [1, 2]  # x2 alone, then x3 + raw in one batch; x3 wins over raw
+
+    ocr = _OCR(pill, answers)
+    assert read_date_pill_robust(ocr, pill) == "Classic Year Late Mar"
+    assert ocr.calls == [1]  # x3 is tried first at this pill size
+
+    # another resolution keeps its own winner
+    small = _pill(12)
+    ocr = _OCR(small, {"raw": "Junior Year Early Nov"})
+    assert read_date_pill_robust(ocr, small) == "Junior Year Early Nov"
+    assert preprocessors._date_pill_winner == {3: "x3", 2: "raw"}
+
+
+def test_without_an_accepted_read_returns_the_most_date_like(monkeypatch):
+    monkeypatch.setattr(preprocessors, "_date_pill_winner", {})
+    pill = _pill(24)
+    ocr = _OCR(pill, {"x2": "zzz", "x3": "Junior Year Ear", "raw": ""})
+    assert read_date_pill_robust(ocr, pill) == "Junior Year Ear"
+    assert preprocessors._date_pill_winner == {}
+
+
+def test_pre_debut_pill_is_remembered(monkeypatch):
+    monkeypatch.setattr(preprocessors, "_date_pill_winner", {})
+    pill = _pill(24)
+    ocr = _OCR(pill, {"x2": "Junior Year Pre-Debut"})
+    assert read_date_pill_robust(ocr, pill) == "Junior Year Pre-Debut"
+    assert ocr.calls == [1]
+    assert preprocessors._date_pill_winner == {3: "x2"}
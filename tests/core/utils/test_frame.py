@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import cv2
+import numpy as np
+import pytest
+from PIL import Image
+
+from core.utils.analyzers import analyze_support_crop
+from core.utils.frame import Frame, as_frame
+
+DATA = Path(__file__).resolve().parents[2] / "data"
+
+
+@pytest.fixture()
+def capture() -> Image.Image:
+    return Image.open(DATA / "training_stats_01.png").convert("RGB")
+
+
+def test_views_match_opencv_and_are_shared_per_capture(capture):
+    rgb = np.array(capture)
+    bgr = cv2.cvtColor(rgb, cv2.COLOR_RGB2BGR)
+    frame = as_frame(capture)
+    assert as_frame(capture) is frame
+
+    assert np.array_equal(frame.rgb, rgb)
+    assert np.array_equal(frame.bgr, bgr)
+    assert np.array_equal(frame.hsv, cv2.cvtColor(bgr, cv2.COLOR_BGR2HSV))
+    assert np.array_equal(frame.gray, cv2.cvtColor(bgr, cv2.COLOR_BGR2GRAY))
+    assert frame.bgr is frame.bgr and not frame.bgr.flags.writeable
+    assert frame.downscaled(100).width == 100
+
+
+def test_crops_slice_parent_views_or_convert_only_their_pixels(capture):
+    bgr = cv2.cvtColor(np.array(capture), cv2.COLOR_RGB2BGR)
+    frame = as_frame(capture)
+    box = (20, 30, 120, 90)
+
+    crop = frame.crop(box)
+    assert frame.crop(box) is crop
+    expected = cv2.cvtColor(bgr[30:90, 20:120], cv2.COLOR_BGR2HSV)
+    assert np.array_equal(crop.hsv, expected)
+    assert "hsv" not in frame._views  # parent was not converted for the crop
+
+    frame.hsv
+    other = frame.crop((0, 0, 50, 50))
+    assert np.shares_memory(other.hsv, frame.hsv)
+    assert frame.crop((-10, -10, 10_000, 5)).shape == (5, frame.width, 3)
+
+
+def test_arrays_are_taken_as_bgr_without_touching_the_caller():
+    arr = np.zeros((8, 8, 3), np.uint8)
+    arr[..., 2] = 255  # red in BGR
+    frame = Frame(arr)
+    assert tuple(frame.rgb[0, 0]) == (255, 0, 0)
+    arr[0, 0] = 1  # still writable
+    assert tuple(Frame(arr[..., 0]).bgr.shape) == (8, 8, 3)
+
+
+def test_support_analyzers_agree_on_arrays_and_frames(capture):
+    bgr = cv2.cvtColor(np.array(capture), cv2.COLOR_RGB2BGR)
+    frame = as_frame(capture)
+    card, bar = (40, 60, 200, 260), (50, 230, 190, 250)
+
+    def _sl(b):
+        return bgr[b[1] : b[3], b[0] : b[2]].copy()
+
+    from_arrays = analyze_support_crop(
+        "support_card", _sl(card), piece_bar_bgr=_sl(bar), piece_type_bgr=None
+    )
+    from_frames = analyze_support_crop(
+        "support_card", frame.crop(card), piece_bar_bgr=frame.crop(bar), piece_type_bgr=None
+    )
+    assert from_frames == from_arrays
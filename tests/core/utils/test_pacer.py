@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from core.utils.abort import clear_abort, request_abort
+from core.utils.pacer import PROFILES, Pacer
+
+
+@pytest.fixture
+def fake_sleep(monkeypatch):
+    """Record requested sleeps without waiting (and advance a fake clock)."""
+    clock = {"t": 1000.0}
+    slept: list = []
+
+    def _sleep(s):
+        slept.append(s)
+        clock["t"] += s
+
+    monkeypatch.setattr("core.utils.pacer.time.sleep", _sleep)
+    monkeypatch.setattr("core.utils.pacer.time.monotonic", lambda: clock["t"])
+    return slept
+
+
+def test_profiles_scale_per_category(fake_sleep):
+    p = Pacer("fast")
+    p.sleep("ui", 0.2)
+    p.sleep("animation", 4.0)
+    assert fake_sleep[0] == pytest.approx(0.2 * PROFILES["fast"]["ui"])
+    assert sum(fake_sleep[1:]) == pytest.approx(4.0 * PROFILES["fast"]["animation"])
+
+    p.set_profile("normal")
+    assert p.delay_for("ui", 0.2) == pytest.approx(0.2)
+    p.set_profile("turbo")  # unknown → normal
+    assert p.profile == "normal"
+
+
+def test_stats_and_turn_report(fake_sleep):
+    p = Pacer()
+    p.sleep("ui", 0.2)
+    p.sleep("ui", 0.1)
+    p.sleep("transition", 1.5)
+
+    stats = p.stats()
+    assert stats["ui"]["count"] == 2
+    assert stats["ui"]["total_s"] == pytest.approx(0.3)
+
+    report = p.turn_report("Y1-07-1")
+    assert report["total"] == pytest.approx(1.8)
+    assert report["transition"] == pytest.approx(1.5)
+    # per-turn counters reset, cumulative stats do not
+    assert p.turn_report("Y1-07-2") == {"total": 0.0}
+    assert p.stats()["transition"]["count"] == 1
+
+
+def test_abort_cuts_long_waits_short():
+    p = Pacer()
+    clear_abort()
+    threading.Timer(0.1, request_abort).start()
+    try:
+        t0 = time.monotonic()
+        p.sleep("animation", 5.0)
+        assert time.monotonic() - t0 < 1.0
+    finally:
+        clear_abort()
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import List
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from core.controllers.static_image import StaticImageController
+from core.settings import Settings
+from core.utils.settle import frame_diff, wait_for_settle
+
+DATA = Path(__file__).resolve().parents[2] / "data"
+
+
+class _SequenceController(StaticImageController):
+    """Plays back a recorded frame sequence, one frame per screenshot; holds the last."""
+
+    def __init__(self, frames: List[Image.Image]) -> None:
+        super().__init__(frames[0])
+        self.frames = [f.convert("RGB") for f in frames]
+        self.calls = 0
+
+    def screenshot(self, region=None) -> Image.Image:
+        idx = min(self.calls, len(self.frames) - 1)
+        self.calls += 1
+        self._img = self.frames[idx]
+        return self._img
+
+
+def _crossfade(a: Image.Image, b: Image.Image, steps: int) -> List[Image.Image]:
+    return [Image.blend(a, b, i / steps) for i in range(steps + 1)]
+
+
+@pytest.fixture
+def lobby_to_training() -> List[Image.Image]:
+    lobby = Image.open(DATA / "lobby_stats_01_high_res.png").convert("RGB")
+    training = Image.open(DATA / "training_stats_01.png").convert("RGB").resize(lobby.size)
+    return _crossfade(lobby, training, steps=6)
+
+
+def test_returns_once_transition_settles(lobby_to_training):
+    ctrl = _SequenceController(lobby_to_training)
+    res = wait_for_settle(ctrl, timeout_s=3.0, min_wait_s=0.0, poll_s=0.0)
+
+    assert res.settled
+    # 7 transition frames, then two identical comparisons of the final frame
+    assert res.frames == len(lobby_to_training) + 2
+    assert res.elapsed_s < 1.0
+    assert frame_diff(res.image, lobby_to_training[-1]) == 0.0
+
+
+def test_roi_ignores_motion_outside_it(lobby_to_training):
+    still = lobby_to_training[0]
+    w, h = still.size
+    frames = []
+    for i in range(40):  # idle animation in the top-left corner, forever
+        f = still.copy()
+        arr = np.asarray(f).copy()
+        arr[: h // 4, : w // 4] = (i * 37) % 256
+        frames.append(Image.fromarray(arr))
+
+    whole = wait_for_settle(_SequenceController(frames), timeout_s=0.3, poll_s=0.01)
+    assert not whole.settled
+
+    roi = (w // 2, h // 2, w, h)
+    scoped = wait_for_settle(
+        _SequenceController(frames), timeout_s=0.3, roi=roi, min_wait_s=0.0, poll_s=0.0
+    )
+    assert scoped.settled and scoped.frames == 3
+
+
+def test_disabled_falls_back_to_fixed_sleep(monkeypatch, lobby_to_training):
+    monkeypatch.setattr(Settings, "VISUAL_SETTLE", False)
+    ctrl = _SequenceController(lobby_to_training)
+    res = wait_for_settle(ctrl, timeout_s=0.05)
+    assert not res.settled and res.frames == 0 and ctrl.calls == 0
+
+
+def test_rebuffered_frame_is_not_counted_as_stable(lobby_to_training):
+    """A CaptureService re-serving the same frame (same capture_seq) is not motion-free."""
+    mid = lobby_to_training[3]
+
+    class _BufferedController(_SequenceController):
+        def screenshot(self, region=None) -> Image.Image:
+            self.calls += 1
+            img = mid.copy()
+            img.info["capture_seq"] = 1  # no new frame captured yet
+            return img
+
+    ctrl = _BufferedController([mid])
+    res = wait_for_settle(ctrl, timeout_s=0.2, min_wait_s=0.0, poll_s=0.01)
+
+    assert not res.settled
+    assert res.frames == 1 and ctrl.calls > 2
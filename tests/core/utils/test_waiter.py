@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import pytest
+from PIL import Image, ImageDraw
+
+from core.controllers.static_image import StaticImageController
+from core.settings import Settings
+from core.utils.waiter import PollConfig, Waiter
+
+BUTTONS = {"CANCEL": (10, 10, 50, 20), "OK": (10, 40, 50, 50), "RACE": (10, 70, 50, 80)}
+
+
+def _screen() -> Image.Image:
+    img = Image.new("RGB", (100, 100), (0, 0, 0))
+    draw = ImageDraw.Draw(img)
+    for i, box in enumerate(BUTTONS.values(), 1):
+        draw.rectangle(box, fill=(40 * i, 0, 0))
+    return img
+
+
+class _Game(StaticImageController):
+    def __init__(self) -> None:
+        super().__init__(_screen())
+        self.clicked = []
+
+    def click_xyxy_center(self, xyxy, clicks: int = 1, **kwargs) -> None:
+        self.clicked.append(tuple(xyxy))
+
+
+class _YOLO:
+    def __init__(self, ctrl) -> None:
+        self.ctrl = ctrl
+
+    def recognize(self, **kwargs):
+        dets = [
+            {"idx": i, "name": "button_white", "conf": 0.9, "xyxy": box}
+            for i, box in enumerate(BUTTONS.values())
+        ]
+        return self.ctrl.screenshot(), {}, dets
+
+
+def _label(img) -> str:
+    red = img.getpixel((img.width // 2, img.height // 2))[0]
+    return list(BUTTONS)[red // 40 - 1]
+
+
+class _RecOCR:
+    """Recognizer-only engine: one batch_rec call per snapshot, scores per crop."""
+
+    def __init__(self, scores=None) -> None:
+        self.calls = []
+        self.scores = scores or {}
+
+    def text(self, img, joiner=" ", min_conf=0.2) -> str:
+        raise AssertionError("button labels should go through batch_rec")
+
+    def batch_rec(self, imgs):
+        self.calls.append(len(imgs))
+        return [(_label(im), self.scores.get(_label(im), 0.95)) for im in imgs]
+
+
+class _TextOCR:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def text(self, img, joiner=" ", min_conf=0.2) -> str:
+        self.calls += 1
+        return _label(img)
+
+
+class _FlakyOCR(_TextOCR):
+    """batch_rec always fails; text() fails on the CANCEL box only."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches = 0
+
+    def text(self, img, joiner=" ", min_conf=0.2) -> str:
+        if _label(img) == "CANCEL":
+            raise RuntimeError("ocr failed")
+        return super().text(img)
+
+    def batch_rec(self, imgs):
+        self.batches += 1
+        raise RuntimeError("recognizer failed")
+
+
+def _waiter(ctrl, ocr) -> Waiter:
+    return Waiter(ctrl, ocr, _YOLO(ctrl), PollConfig(poll_interval_s=0.0, timeout_s=0.0))
+
+
+@pytest.fixture
+def batch_rec(monkeypatch):
+    monkeypatch.setattr(Settings, "WAITER_BATCH_REC", True)
+
+
+def test_batch_rec_is_off_by_default():
+    ctrl, ocr = _Game(), _FlakyOCR()
+    waiter = _waiter(ctrl, ocr)
+    assert waiter.seen(classes=("button_white",), texts=("ok",))
+    assert ocr.batches == 0 and ocr.calls == 1  # stops at OK, RACE is never read
+
+
+def test_seen_skips_only_the_box_that_fails_ocr(batch_rec):
+    ctrl, ocr = _Game(), _FlakyOCR()
+    waiter = _waiter(ctrl, ocr)
+    # the failed batch is read box by box; CANCEL raises, OK still counts and
+    # reading stops there (RACE is not OCR'd)
+    assert waiter.seen(classes=("button_white",), texts=("ok",))
+    assert ocr.calls == 1
+    assert not waiter.seen(classes=("button_white",), texts=("cancel",))
+    assert ocr.batches == 2 and ocr.calls == 3
+
+
+def test_candidates_are_read_in_one_recognizer_batch(batch_rec):
+    ctrl, ocr = _Game(), _RecOCR()
+    waiter = _waiter(ctrl, ocr)
+
+    assert waiter.click_when(classes=("button_white",), texts=("race",), tag="t")
+    assert ctrl.clicked == [BUTTONS["RACE"]]
+    assert ocr.calls == [3]
+
+    assert waiter.seen(classes=("button_white",), texts=("ok",))
+    assert ocr.calls == [3, 3]
+
+
+def test_low_recognizer_scores_read_as_empty(batch_rec):
+    ctrl, ocr = _Game(), _RecOCR(scores={"RACE": 0.1})
+    assert not _waiter(ctrl, ocr).click_when(classes=("button_white",), texts=("race",))
+    assert ctrl.clicked == []
+
+
+def test_engines_without_batch_rec_fall_back_to_text(batch_rec):
+    ctrl, ocr = _Game(), _TextOCR()
+    assert _waiter(ctrl, ocr).click_when(
+        classes=("button_white",), texts=("ok",), forbid_texts=("cancel",)
+    )
+    assert ctrl.clicked == [BUTTONS["OK"]]
+    assert ocr.calls == 3
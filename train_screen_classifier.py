@@ -0,0 +1,150 @@
+"""
+Train the screen-type classifier the agents consult before the detector
+(Settings.SCREEN_CLASSIFIER) from the debug corpus or recorded sessions.
+
+  python train_screen_classifier.py                                  # DEBUG_DIR, URA labels
+  python train_screen_classifier.py --scenario unity_cup --frames debug/ recordings/
+  python train_screen_classifier.py --frames datasets/screens --no-teacher   # <Label>/*.png
+
+Frames inside a folder named exactly after a screen (Lobby/, Training/, ...)
+keep that label. Every other frame is labelled by the teacher: the scenario's YOLO model
+plus classify_screen_ura / classify_screen_unity_cup, exactly as the agent
+loop would label it.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from PIL import Image
+
+from core.perception.screen_classifier import ScreenClassifier
+from core.settings import Settings
+from core.utils.logger import logger_uma, setup_uma_logging
+
+IMAGE_EXTS = (".png", ".jpg", ".jpeg")
+SCREENS = {
+    "ura": (
+        "Event", "EventStale", "Inspiration", "Raceday", "Training", "LobbySummer", "Lobby",
+        "FinalScreen", "ClawMachine", "Unknown",
+    ),
+}
+SCREENS["unity_cup"] = SCREENS["ura"] + ("KashimotoTeam", "UnityCupRaceday")
+
+
+def _frame_paths(roots: List[Path]) -> List[Path]:
+    out: List[Path] = []
+    for root in roots:
+        paths = [root] if root.is_file() else sorted(root.rglob("*"))
+        out.extend(p for p in paths if p.suffix.lower() in IMAGE_EXTS)
+    return out
+
+
+def _folder_label(path: Path, known: Tuple[str, ...]) -> Optional[str]:
+    # exact case: debug-corpus tag folders are lower case ("training" is a call-site tag)
+    return path.parent.name if path.parent.name in known else None
+
+
+def _teacher(scenario: str, weights: Optional[str]) -> Callable[[Image.Image], str]:
+    from core.perception.analyzers.screen import classify_screen_unity_cup, classify_screen_ura
+    from core.perception.yolo.yolo_local import LocalYOLOEngine
+
+    if weights is None:
+        weights = Settings.YOLO_WEIGHTS_UNITY_CUP if scenario == "unity_cup" else Settings.YOLO_WEIGHTS_URA
+    engine = LocalYOLOEngine(ctrl=None, weights=str(weights))
+    classify = classify_screen_unity_cup if scenario == "unity_cup" else classify_screen_ura
+
+    def label(img: Image.Image) -> str:
+        _, dets = engine.detect_pil(
+            img, imgsz=Settings.YOLO_IMGSZ, conf=Settings.YOLO_CONF, iou=Settings.YOLO_IOU, tag="screen"
+        )
+        # same arguments as the agent loops
+        screen, _ = classify(
+            dets, lobby_conf=0.5, require_infirmary=True, training_conf=0.50, names_map=None
+        )
+        return screen
+
+    return label
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--scenario", choices=sorted(SCREENS), default=None,
+                    help="Label set and teacher model (default: ACTIVE_SCENARIO)")
+    ap.add_argument("--frames", nargs="*", default=[],
+                    help="Frame dirs/files (default: Settings.DEBUG_DIR)")
+    ap.add_argument("--weights", default=None, help="Teacher YOLO weights (default: scenario's)")
+    ap.add_argument("--no-teacher", action="store_true",
+                    help="Only use frames whose folder names the screen")
+    ap.add_argument("--per-label", type=int, default=300, help="Max frames kept per label")
+    ap.add_argument("--k", type=int, default=5, help="Neighbours that vote")
+    ap.add_argument("--min-similarity", type=float, default=0.8,
+                    help="Below this similarity to every training frame a screen is novel "
+                         "(confidence 0, the agent runs the detector)")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--out", default=None,
+                    help="Model path (default: Settings.resolve_screen_classifier_path)")
+    ap.add_argument("--json", default=None, help="Write the leave-one-out report here")
+    args = ap.parse_args()
+    setup_uma_logging(debug=Settings.DEBUG)
+
+    scenario = Settings.normalize_scenario(args.scenario or Settings.ACTIVE_SCENARIO)
+    known = SCREENS[scenario]
+    paths = _frame_paths([Path(p) for p in (args.frames or [Settings.DEBUG_DIR])])
+    if not paths:
+        raise SystemExit("No frames found")
+
+    teacher = None
+    by_label: Dict[str, List[Path]] = defaultdict(list)
+    for i, p in enumerate(paths, 1):
+        label = _folder_label(p, known)
+        if label is None:
+            if args.no_teacher:
+                continue
+            if teacher is None:
+                teacher = _teacher(scenario, args.weights)
+            with Image.open(p) as im:
+                label = teacher(im.convert("RGB"))
+        by_label[label].append(p)
+        if i % 100 == 0:
+            logger_uma.info("[screenclf] labelled %d/%d frames", i, len(paths))
+
+    rng = random.Random(args.seed)
+    images: List[Image.Image] = []
+    labels: List[str] = []
+    for label, group in sorted(by_label.items()):
+        if len(group) > args.per_label:
+            group = rng.sample(group, args.per_label)
+        for p in group:
+            with Image.open(p) as im:
+                im = im.convert("RGB")
+            im.thumbnail((256, 256))  # features() only needs a thumbnail; keeps memory flat
+            images.append(im)
+            labels.append(label)
+    if not images:
+        raise SystemExit("No labelled frames")
+
+    clf = ScreenClassifier.fit(images, labels, k=args.k, min_similarity=args.min_similarity)
+    report = clf.evaluate()
+    counts = Counter(labels)
+    for label, r in sorted(report["per_label"].items()):
+        acc = r["correct"] / r["frames"] if r["frames"] else 0.0
+        print(f"  {label:<18} {counts[label]:>5} frame(s)  leave-one-out {acc:.3f}")
+    print(
+        f"  overall {report['accuracy']:.3f} on {report['frames']} frames, "
+        f"min similarity {clf.min_similarity:.3f}"
+    )
+
+    out = Path(args.out or Settings.resolve_screen_classifier_path(scenario))
+    clf.save(out)
+    print(f"model -> {out}")
+    if args.json:
+        Path(args.json).write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -286,6 +286,22 @@ export default function GeneralForm() {
           info="Lower-latency settings (might reduce accuracy in edge cases)."
         />
 
+        <FieldRow
+          label="Speed profile"
+          control={
+            <Select
+              size="small"
+              value={g.paceProfile}
+              onChange={(e) => setGeneral({ paceProfile: e.target.value as any })}
+            >
+              {['safe', 'normal', 'fast'].map((p) => (
+                <MenuItem key={p} value={p}>{p}</MenuItem>
+              ))}
+            </Select>
+          }
+          info="Scales the waits between actions: safe waits longer, fast shortens UI and transition delays."
+        />
+
         <FieldRow
           label="Try again on failed goal"
           control={
@@ -112,6 +112,7 @@ export const generalSchema = z.object({
   useAdb: z.boolean().default(false),
   adbDevice: z.string().default('localhost:5555'),
   fastMode: z.boolean().default(false),
+  paceProfile: z.enum(['safe', 'normal', 'fast']).default('normal'),
   tryAgainOnFailedGoal: z.boolean().default(true),
   maxFailure: z.number().int().min(0).max(99).default(20),
   acceptConsecutiveRace: z.boolean().default(true),
@@ -144,6 +145,7 @@ export const generalSchema = z.object({
   useAdb: false,
   adbDevice: 'localhost:5555',
   fastMode: false,
+  paceProfile: 'normal',
   tryAgainOnFailedGoal: true,
   maxFailure: 20,
   acceptConsecutiveRace: true,
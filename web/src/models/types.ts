@@ -2,6 +2,7 @@ import type { EventSetup } from "@/types/events"
 
 export type Mode = 'steam' | 'scrcpy' | 'bluestack' | 'adb'
 export type Hotkey = 'F1' | 'F2' | 'F3' | 'F4'
+export type PaceProfile = 'safe' | 'normal' | 'fast'
 
 export type StatKey = 'SPD' | 'STA' | 'PWR' | 'GUTS' | 'WIT'
 export type MoodName = 'AWFUL' | 'BAD' | 'NORMAL' | 'GOOD' | 'GREAT'
@@ -43,6 +44,7 @@ export interface GeneralConfig {
   useAdb?: boolean
   adbDevice?: string
   fastMode: boolean
+  paceProfile: PaceProfile
   tryAgainOnFailedGoal: boolean
   maxFailure: number
   acceptConsecutiveRace: boolean
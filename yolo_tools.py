@@ -0,0 +1,321 @@
+"""
+YOLO model tooling: export weights to ONNX and benchmark detector backends.
+
+  python yolo_tools.py export models/uma_ura.pt                 # -> models/uma_ura.onnx
+  python yolo_tools.py export models/uma_ura.pt --dynamic
+  python yolo_tools.py bench models/uma_ura.pt --runs 50        # ultralytics vs onnx
+  python yolo_tools.py batch --backends ultralytics onnx       # per-image ms at batch 1/2/4/8
+                                                                # (onnx needs export --dynamic)
+  python yolo_tools.py quantize models/uma_ura.pt models/uma_nav.pt --calib debug/
+  python yolo_tools.py imgsz-tune models/uma_ura.pt --merge     # per-tag imgsz from debug/
+  python yolo_tools.py imgsz-tune models/uma_ura.pt --frames tests/data --tag training --merge
+  python yolo_tools.py drift models/uma_ura.pt --frames datasets/uma/images/val \
+      --labels datasets/uma/labels/val                          # fp32 vs int8 mAP + latency
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from PIL import Image
+
+from core.perception.yolo.evaluate import latency_stats
+from core.perception.yolo.interface import IDetector
+from core.settings import Settings
+from core.utils.logger import logger_uma, setup_uma_logging
+
+DEFAULT_FRAMES = Path(__file__).resolve().parent / "tests" / "data"
+BACKENDS = ["ultralytics", "onnx", "onnx-int8", "remote"]
+
+
+def _load_paths(src: Path, limit: int) -> List[Path]:
+    paths = [src] if src.is_file() else sorted(
+        p for p in src.iterdir() if p.suffix.lower() in (".png", ".jpg", ".jpeg")
+    )
+    if not paths:
+        raise SystemExit(f"No frames found in {src}")
+    return paths[:limit]
+
+
+def _load_frames(src: Path, limit: int) -> List[Image.Image]:
+    return [Image.open(p).convert("RGB") for p in _load_paths(src, limit)]
+
+
+def _time_backend(
+    detect: Callable[[Image.Image], object], frames: List[Image.Image], *, warmup: int, runs: int
+) -> Dict[str, float]:
+    for i in range(warmup):
+        detect(frames[i % len(frames)])
+    samples: List[float] = []
+    for i in range(runs):
+        img = frames[i % len(frames)]
+        t0 = time.perf_counter()
+        detect(img)
+        samples.append((time.perf_counter() - t0) * 1000.0)
+    return latency_stats(samples)
+
+
+def cmd_export(args: argparse.Namespace) -> None:
+    from core.perception.yolo.yolo_onnx import export_onnx
+
+    export_onnx(
+        args.weights,
+        imgsz=args.imgsz,
+        dynamic=args.dynamic,
+        half=args.half,
+        opset=args.opset,
+    )
+
+
+def cmd_quantize(args: argparse.Namespace) -> None:
+    from core.perception.yolo.quantize import calibration_frames, quantize_onnx
+
+    frames = None
+    if args.mode == "static":
+        frames = calibration_frames(args.calib or None, limit=args.limit, seed=args.seed)
+        print(f"calibrating on {len(frames)} frame(s)")
+    for weights in args.weights:
+        out = quantize_onnx(
+            weights,
+            mode=args.mode,
+            frames=frames,
+            imgsz=args.imgsz,
+            per_channel=not args.per_tensor,
+            keep_head_fp32=not args.quantize_head,
+        )
+        print(f"  {weights} -> {out}")
+
+
+def cmd_drift(args: argparse.Namespace) -> None:
+    from core.perception.yolo.evaluate import drift_report
+    from core.perception.yolo.yolo_onnx import ONNXYOLOEngine, onnx_path_for
+
+    if not onnx_path_for(args.weights, int8=True).exists():
+        raise SystemExit(f"No INT8 model for {args.weights}; run `yolo_tools.py quantize` first")
+    if args.reference == "ultralytics":
+        from core.perception.yolo.yolo_local import LocalYOLOEngine
+
+        reference = LocalYOLOEngine(weights=args.weights)
+    else:
+        reference = ONNXYOLOEngine(weights=args.weights, threads=args.threads, int8=False)
+    candidate = ONNXYOLOEngine(weights=args.weights, threads=args.threads, int8=True)
+
+    frames = _load_paths(Path(args.frames), args.limit)
+    rep = drift_report(
+        reference, candidate, frames, labels_dir=args.labels, imgsz=args.imgsz, iou_thr=args.iou
+    )
+
+    print(
+        f"{rep['frames']} frame(s), mode={rep['mode']}, AP@{rep['iou_thr']:.2f}  "
+        f"mAP {rep['map_ref']:.3f} -> {rep['map_cand']:.3f} (drift {rep['map_drift']:+.3f})"
+    )
+    for name, c in sorted(rep["classes"].items(), key=lambda kv: kv[1]["drift"]):
+        print(
+            f"  {name:<28} n={c['n_gt']:<4d} AP {c['ap_ref']:.3f} -> {c['ap_cand']:.3f}  "
+            f"({c['drift']:+.3f})"
+        )
+    for label, st in rep["latency"].items():
+        print(f"  {label:<12} mean {st['mean']:7.1f}ms  p50 {st['p50']:7.1f}ms  p95 {st['p95']:7.1f}ms")
+    if args.json:
+        Path(args.json).write_text(json.dumps(rep, indent=2), encoding="utf-8")
+        print(f"report -> {args.json}")
+
+
+def _make_engine(name: str, args: argparse.Namespace) -> IDetector:
+    t0 = time.perf_counter()
+    if name == "ultralytics":
+        from core.perception.yolo.yolo_local import LocalYOLOEngine
+
+        eng: IDetector = LocalYOLOEngine(weights=args.weights)
+    elif name == "remote":
+        from core.perception.yolo.yolo_remote import RemoteYOLOEngine
+
+        eng = RemoteYOLOEngine(None, args.url or Settings.EXTERNAL_PROCESSOR_URL, weights=args.weights)
+    else:
+        from core.perception.yolo.yolo_onnx import ONNXYOLOEngine
+
+        eng = ONNXYOLOEngine(
+            weights=args.weights, threads=args.threads, int8=(name == "onnx-int8")
+        )
+    logger_uma.info("[bench] %s load: %.0fms", name, (time.perf_counter() - t0) * 1000)
+    return eng
+
+
+def cmd_bench(args: argparse.Namespace) -> None:
+    frames = _load_frames(Path(args.frames), args.limit)
+    imgsz = args.imgsz or Settings.YOLO_IMGSZ
+
+    print(f"{len(frames)} frame(s), imgsz={imgsz}, warmup={args.warmup}, runs={args.runs}")
+    for name in args.backends:
+        eng = _make_engine(name, args)
+        st = _time_backend(
+            lambda img: eng.detect_pil(img, imgsz=imgsz), frames, warmup=args.warmup, runs=args.runs
+        )
+        print(f"  {name:<12} mean {st['mean']:7.1f}ms  p50 {st['p50']:7.1f}ms  p95 {st['p95']:7.1f}ms")
+
+
+def cmd_batch(args: argparse.Namespace) -> None:
+    """Per-image latency of detect_batch at each batch size."""
+    frames = _load_frames(Path(args.frames), args.limit)
+    imgsz = args.imgsz or Settings.YOLO_IMGSZ
+
+    print(f"{len(frames)} frame(s), imgsz={imgsz}, warmup={args.warmup}, runs={args.runs}")
+    for name in args.backends:
+        eng = _make_engine(name, args)
+        base = None
+        for bs in args.sizes:
+            batch = [frames[i % len(frames)] for i in range(bs)]
+            st = _time_backend(
+                lambda _: eng.detect_batch(batch, imgsz=imgsz),
+                frames,
+                warmup=args.warmup,
+                runs=args.runs,
+            )
+            per_img = st["mean"] / bs
+            base = base or per_img
+            print(
+                f"  {name:<12} batch {bs:<2d} {st['mean']:7.1f}ms/call  "
+                f"{per_img:7.1f}ms/img  p95 {st['p95'] / bs:7.1f}ms/img  x{base / per_img:.2f}"
+            )
+
+
+def cmd_imgsz_tune(args: argparse.Namespace) -> None:
+    from core.perception.yolo.imgsz_profile import ImgszProfile, frames_by_tag, tune_tag
+
+    groups = frames_by_tag(args.frames or [Settings.DEBUG_DIR], tag=args.tag)
+    if not groups:
+        raise SystemExit("No frames found")
+    eng = _make_engine(args.backend, args)
+    out = Path(args.out or Settings.YOLO_IMGSZ_PROFILE)
+    profile = ImgszProfile.load(out) if args.merge else ImgszProfile()
+    ref = args.reference_imgsz or Settings.YOLO_IMGSZ
+
+    tuned: Dict[str, int] = {}
+    reports: Dict[str, object] = {}
+    for tag, paths in sorted(groups.items()):
+        paths = paths[: args.limit]
+        rep = tune_tag(
+            eng,
+            paths,
+            sizes=args.sizes,
+            reference_imgsz=ref,
+            min_recall=args.min_recall,
+            classes=args.classes,
+            labels_dir=args.labels,
+        )
+        reports[tag] = rep
+        if not rep["classes"]:
+            print(f"  {tag:<24} {len(paths):>4} frame(s)  no detections; left at {ref}")
+            continue
+        tuned[tag] = rep["imgsz"]
+        last = rep["sizes"].get(rep["imgsz"], {})
+        print(
+            f"  {tag:<24} {len(paths):>4} frame(s)  imgsz {rep['imgsz']:>4}  "
+            f"min recall {last.get('min_recall', 1.0):.3f}  {last.get('ms', 0.0):6.1f}ms/img  "
+            f"({', '.join(rep['classes'])})"
+        )
+
+    profile.update(args.weights, tuned)
+    profile.save(out)
+    print(f"profile -> {out}")
+    if args.json:
+        Path(args.json).write_text(json.dumps(reports, indent=2, default=str), encoding="utf-8")
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    sub = ap.add_subparsers(dest="cmd", required=True)
+
+    ex = sub.add_parser("export", help="Export .pt weights to ONNX (needs ultralytics)")
+    ex.add_argument("weights", help="Path to ultralytics .pt weights")
+    ex.add_argument("--imgsz", type=int, default=None, help="Input size (default: YOLO_IMGSZ)")
+    ex.add_argument("--dynamic", action="store_true", help="Dynamic input shape")
+    ex.add_argument("--half", action="store_true", help="FP16 weights (GPU only)")
+    ex.add_argument("--opset", type=int, default=None)
+    ex.set_defaults(func=cmd_export)
+
+    be = sub.add_parser("bench", help="Detector latency per backend")
+    be.add_argument("weights", nargs="?", default=Settings.YOLO_WEIGHTS_URA,
+                    help="Weights (.pt; the .onnx sibling is used for onnx)")
+    be.add_argument("--frames", default=str(DEFAULT_FRAMES), help="Image or directory of frames")
+    be.add_argument("--limit", type=int, default=16, help="Max frames to load")
+    be.add_argument("--backends", nargs="+", default=["ultralytics", "onnx"], choices=BACKENDS)
+    be.add_argument("--imgsz", type=int, default=None)
+    be.add_argument("--threads", type=int, default=None, help="onnxruntime intra-op threads")
+    be.add_argument("--url", default=None, help="Inference server for the remote backend")
+    be.add_argument("--warmup", type=int, default=3)
+    be.add_argument("--runs", type=int, default=30)
+    be.set_defaults(func=cmd_bench)
+
+    ba = sub.add_parser("batch", help="Per-image latency of detect_batch by batch size")
+    ba.add_argument("weights", nargs="?", default=Settings.YOLO_WEIGHTS_URA)
+    ba.add_argument("--frames", default=str(DEFAULT_FRAMES), help="Image or directory of frames")
+    ba.add_argument("--limit", type=int, default=16, help="Max frames to load")
+    ba.add_argument("--backends", nargs="+", default=["ultralytics"], choices=BACKENDS)
+    ba.add_argument("--sizes", nargs="+", type=int, default=[1, 2, 4, 8])
+    ba.add_argument("--imgsz", type=int, default=None)
+    ba.add_argument("--threads", type=int, default=None, help="onnxruntime intra-op threads")
+    ba.add_argument("--url", default=None, help="Inference server for the remote backend")
+    ba.add_argument("--warmup", type=int, default=2)
+    ba.add_argument("--runs", type=int, default=10)
+    ba.set_defaults(func=cmd_batch)
+
+    qu = sub.add_parser("quantize", help="INT8-quantize exported ONNX models")
+    qu.add_argument("weights", nargs="+", help=".pt or .onnx paths (the .onnx must exist)")
+    qu.add_argument("--mode", choices=["static", "dynamic"], default="static")
+    qu.add_argument("--calib", nargs="*", default=[],
+                    help="Calibration frame dirs/files (default: Settings.DEBUG_DIR)")
+    qu.add_argument("--limit", type=int, default=256, help="Max calibration frames")
+    qu.add_argument("--seed", type=int, default=0)
+    qu.add_argument("--imgsz", type=int, default=None, help="Calibration size for dynamic models")
+    qu.add_argument("--per-tensor", action="store_true", help="Per-tensor instead of per-channel")
+    qu.add_argument("--quantize-head", action="store_true",
+                    help="Also quantize the Detect head decoding (usually hurts boxes)")
+    qu.set_defaults(func=cmd_quantize)
+
+    dr = sub.add_parser("drift", help="Per-class mAP drift and latency: fp32 vs INT8")
+    dr.add_argument("weights", help="Model weights (.pt; .onnx and .int8.onnx siblings used)")
+    dr.add_argument("--frames", default=str(DEFAULT_FRAMES), help="Image or directory of frames")
+    dr.add_argument("--labels", default=None,
+                    help="YOLO labels dir; without it the fp32 output is the ground truth")
+    dr.add_argument("--reference", choices=["onnx", "ultralytics"], default="onnx")
+    dr.add_argument("--limit", type=int, default=500)
+    dr.add_argument("--imgsz", type=int, default=None)
+    dr.add_argument("--iou", type=float, default=0.5, help="IoU threshold for a match")
+    dr.add_argument("--threads", type=int, default=None)
+    dr.add_argument("--json", default=None, help="Write the full report (incl. per frame) here")
+    dr.set_defaults(func=cmd_drift)
+
+    it = sub.add_parser("imgsz-tune", help="Smallest safe imgsz per call-site tag")
+    it.add_argument("weights", nargs="?", default=Settings.YOLO_WEIGHTS_URA)
+    it.add_argument("--frames", nargs="*", default=[],
+                    help="Frame dirs/files (default: Settings.DEBUG_DIR; <tag>/raw folders "
+                         "give the tag)")
+    it.add_argument("--tag", default=None, help="Tag for every frame (e.g. for tests/data)")
+    it.add_argument("--labels", default=None,
+                    help="YOLO labels dir; without it the full-size output is the ground truth")
+    it.add_argument("--classes", nargs="*", default=None, help="Only keep recall on these")
+    it.add_argument("--sizes", nargs="+", type=int,
+                    default=[320, 384, 448, 512, 576, 640, 704, 768, 832])
+    it.add_argument("--reference-imgsz", type=int, default=None)
+    it.add_argument("--min-recall", type=float, default=0.98)
+    it.add_argument("--limit", type=int, default=200, help="Max frames per tag")
+    it.add_argument("--backend", choices=BACKENDS, default="ultralytics",
+                    help="onnx needs a dynamic export to change imgsz")
+    it.add_argument("--threads", type=int, default=None)
+    it.add_argument("--url", default=None)
+    it.add_argument("--out", default=None, help="Profile path (default: YOLO_IMGSZ_PROFILE)")
+    it.add_argument("--merge", action="store_true", help="Update the existing profile")
+    it.add_argument("--json", default=None, help="Write per-size recall/latency here")
+    it.set_defaults(func=cmd_imgsz_tune)
+
+    args = ap.parse_args()
+    setup_uma_logging(debug=Settings.DEBUG)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()